@@ -5,9 +5,13 @@ from typing import Optional
 import jwt
 from datetime import datetime, timedelta
 import os
+import logging
 
 from backend.database import get_db
 from backend.service import UserService
+from backend.service.user_principal_cache import UserPrincipal, user_principal_cache
+
+logger = logging.getLogger(__name__)
 
 # JWT 설정
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
@@ -36,47 +40,42 @@ def verify_token(token: str) -> Optional[dict]:
     except jwt.PyJWTError:
         return None
 
+def _credentials_exception(detail: str = "Could not validate credentials") -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-):
-    """현재 인증된 사용자를 가져옵니다."""
-    print(f"get_current_user called with token: {credentials.credentials[:20]}...")  # 디버깅 로그
-    
-    token = credentials.credentials
-    payload = verify_token(token)
-    
+    db: Session = Depends(get_db, scope="function")
+) -> UserPrincipal:
+    """
+    현재 인증된 사용자를 가져옵니다.
+
+    사용자 정보는 user_principal_cache에서 가져오므로, 캐시 적중 시 DB를 조회하지 않습니다.
+    (요청 단위 세션은 첫 쿼리 때만 커넥션을 가져옵니다)
+    """
+    payload = verify_token(credentials.credentials)
+
     if payload is None:
-        print("Token verification failed")  # 디버깅 로그
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    user_id: int = payload.get("sub")
-    print(f"Token payload user_id: {user_id}")  # 디버깅 로그
-    
-    if user_id is None:
-        print("No user_id in token payload")  # 디버깅 로그
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    user_service = UserService(db)
-    user = user_service.get_user_by_id(user_id)
-    
+        logger.debug("Token verification failed")
+        raise _credentials_exception()
+
+    try:
+        user_id = int(payload.get("sub"))
+    except (TypeError, ValueError):
+        logger.debug("Invalid subject in token payload")
+        raise _credentials_exception()
+
+    user = user_principal_cache.get(user_id, UserService(db).get_user_by_id)
+
     if user is None:
-        print(f"User not found for ID: {user_id}")  # 디버깅 로그
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    print(f"User authenticated: {user.username} (ID: {user.id})")  # 디버깅 로그
+        logger.info(f"User not found for ID: {user_id}")
+        raise _credentials_exception("User not found")
+
+    logger.debug(f"User authenticated: ID {user.id}")
     return user
 
 def get_current_admin_user(current_user = Depends(get_current_user)):
@@ -4,13 +4,25 @@ Analytics API Endpoints
 이 모듈은 분석 데이터를 조회하는 REST API를 제공합니다.
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta
 
 from backend.database import get_db
+from backend.database.database import SessionLocal
 from backend.service.analytics_service import AnalyticsService
+from backend.service.analytics_ingest import analytics_ingest_queue
+from backend.service.analytics_rollup import analytics_rollup_worker, get_rollup_lag
+from backend.service.analytics_export import (
+    export_filename,
+    export_media_type,
+    stream_export,
+    validate_export_options
+)
+from backend.database.dao.analytics_dao import resolve_analytics_backend
 from backend.api.auth import get_current_admin_user
-from backend.database.model import User
+from backend.database.model import User, EventType
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
@@ -19,7 +31,7 @@ router = APIRouter(prefix="/analytics", tags=["analytics"])
 def get_top_search_keywords(
     limit: int = Query(10, ge=1, le=100, description="조회할 키워드 수"),
     days: int = Query(7, ge=1, le=365, description="분석 기간 (일)"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     current_admin: User = Depends(get_current_admin_user)  # Admin only
 ):
     """
@@ -36,7 +48,7 @@ def get_top_search_keywords(
 def get_most_viewed_servers(
     limit: int = Query(10, ge=1, le=100, description="조회할 서버 수"),
     days: int = Query(7, ge=1, le=365, description="분석 기간 (일)"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     current_admin: User = Depends(get_current_admin_user)  # Admin only
 ):
     """
@@ -54,7 +66,7 @@ def get_trending_servers(
     limit: int = Query(10, ge=1, le=100, description="조회할 서버 수"),
     days: int = Query(7, ge=1, le=30, description="최근 기간 (일)"),
     comparison_days: int = Query(7, ge=1, le=30, description="비교 기간 (일)"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     current_admin: User = Depends(get_current_admin_user)  # Admin only
 ):
     """
@@ -72,7 +84,7 @@ def get_trending_servers(
 @router.get("/conversion/search-to-view")
 def get_search_to_view_conversion(
     days: int = Query(7, ge=1, le=365, description="분석 기간 (일)"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     current_admin: User = Depends(get_current_admin_user)  # Admin only
 ):
     """
@@ -89,10 +101,33 @@ def get_search_to_view_conversion(
     return analytics_service.get_search_to_view_conversion_rate(days)
 
 
+@router.get("/funnel")
+def get_funnel(
+    days: int = Query(30, ge=1, le=365, description="분석 기간 (일)"),
+    window_hours: int = Query(24, ge=1, le=24 * 30, description="첫 단계 이후 전환 인정 시간 (시간)"),
+    cohort: bool = Query(False, description="첫 검색 주별 코호트 퍼널 포함 여부"),
+    db: Session = Depends(get_db, scope="function"),
+    current_admin: User = Depends(get_current_admin_user)  # Admin only
+):
+    """
+    사용자 단위 퍼널(검색 → 조회 → 즐겨찾기 → 플레이그라운드)을 조회합니다. (관리자 전용)
+
+    Returns:
+        {
+            "period_days": 30,
+            "window_hours": 24,
+            "steps": [{"step": "search", "users": 120, "conversion_from_previous": 1.0, "conversion_from_start": 1.0}, ...],
+            "cohorts": [{"cohort": "2026-10-12", "steps": [...]}, ...]
+        }
+    """
+    analytics_service = AnalyticsService(db)
+    return analytics_service.get_funnel(days, window_hours, cohort)
+
+
 @router.get("/summary")
 def get_analytics_summary(
     days: int = Query(7, ge=1, le=365, description="분석 기간 (일)"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     current_admin: User = Depends(get_current_admin_user)  # Admin only
 ):
     """
@@ -113,7 +148,7 @@ def get_analytics_summary(
             "visitors": {
                 "logged_in_users": 50,
                 "anonymous_users": 200,
-                "total_sessions": 250
+                "total_visitors": 250
             },
             "top_keywords": [...],
             "top_servers": [...],
@@ -124,13 +159,90 @@ def get_analytics_summary(
     return analytics_service.get_analytics_summary(days)
 
 
+@router.get("/ingest/stats")
+def get_ingest_stats(
+    current_admin: User = Depends(get_current_admin_user)  # Admin only
+):
+    """
+    분석 이벤트 적재 큐 상태를 조회합니다. (관리자 전용)
+
+    Returns:
+        {
+            "running": true,
+            "queued": 12,
+            "oldest_queued_age_seconds": 0.4,
+            "dropped_total": 0,
+            "failed_total": 0,
+            "last_batch_lag_seconds": 0.9,
+            ...
+        }
+    """
+    return analytics_ingest_queue.stats()
+
+
+@router.get("/rollup/status")
+def get_rollup_status(
+    db: Session = Depends(get_db, scope="function"),
+    current_admin: User = Depends(get_current_admin_user)  # Admin only
+):
+    """
+    집계 백엔드 및 롤업 진행 상태를 조회합니다. (관리자 전용)
+
+    Returns:
+        {
+            "backend": "rollup",
+            "watermark_event_id": 10234,
+            "pending_events": 15,
+            "worker": {"running": true, "last_run_at": "...", ...}
+        }
+    """
+    backend = resolve_analytics_backend(db)
+    return {
+        "backend": backend,
+        **get_rollup_lag(db, aggregate_tables=backend == 'rollup'),
+        "worker": analytics_rollup_worker.stats()
+    }
+
+
+@router.get("/export")
+def export_events(
+    start: Optional[datetime] = Query(None, description="시작 시각 (포함, 기본: 7일 전)"),
+    end: Optional[datetime] = Query(None, description="종료 시각 (미포함, 기본: 현재)"),
+    format: str = Query("csv", description="csv | parquet | arrow"),
+    compression: str = Query("none", description="none | gzip | zstd"),
+    event_type: Optional[List[EventType]] = Query(None, description="이벤트 타입 필터 (여러 개 지정 가능)"),
+    current_admin: User = Depends(get_current_admin_user)  # Admin only
+):
+    """
+    원본 분석 이벤트를 파일로 내보냅니다. (관리자 전용)
+
+    서버 측 커서로 청크 단위로 읽어 바로 스트리밍하므로 기간이 길어도 메모리 사용량이 일정합니다.
+    """
+    end = end or datetime.utcnow()
+    start = start or end - timedelta(days=7)
+    if start >= end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start는 end보다 이전이어야 합니다.")
+    try:
+        validate_export_options(format, compression)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return StreamingResponse(
+        stream_export(SessionLocal, start, end, format, compression, event_type),
+        media_type=export_media_type(format, compression),
+        headers={
+            "Content-Disposition": f'attachment; filename="{export_filename(start, end, format, compression)}"'
+        }
+    )
+
+
 # Public endpoints (no auth required) - for frontend display
 
 @router.get("/public/trending-servers")
 def get_public_trending_servers(
     limit: int = Query(5, ge=1, le=20, description="조회할 서버 수"),
     days: int = Query(7, ge=1, le=30, description="분석 기간"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """
     급상승 중인 서버를 조회합니다. (공개 API)
@@ -145,7 +257,7 @@ def get_public_trending_servers(
 def get_public_popular_searches(
     limit: int = Query(5, ge=1, le=20, description="조회할 키워드 수"),
     days: int = Query(7, ge=1, le=30, description="분석 기간"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """
     인기 검색어를 조회합니다. (공개 API)
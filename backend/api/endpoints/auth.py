@@ -7,11 +7,21 @@ from backend.database import get_db
 from backend.service import UserService
 from backend.api.schemas import UserCreate, UserLogin, UserResponse, ADLoginRequest
 from backend.api.auth import create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES, get_current_user
+from backend.utils.password_hashing import PasswordHasherBusy
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
+logger = logging.getLogger(__name__)
+
+# 비밀번호 해시 작업 풀이 가득 찬 경우 응답
+def _hasher_busy_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
 
 @router.post("/register", response_model=UserResponse)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+def register(user_data: UserCreate, db: Session = Depends(get_db, scope="function")):
     """새 사용자를 등록합니다."""
     user_service = UserService(db)
     
@@ -22,6 +32,8 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
             password=user_data.password
         )
         return user
+    except PasswordHasherBusy:
+        raise _hasher_busy_exception()
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -29,31 +41,23 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
 
 @router.post("/login")
-def login(user_data: UserLogin, db: Session = Depends(get_db)):
+def login(user_data: UserLogin, db: Session = Depends(get_db, scope="function")):
     """사용자 로그인을 수행합니다."""
-    print(f"Login attempt for username: {user_data.username}")  # 디버깅 로그
-    
     user_service = UserService(db)
     
-    # 사용자 조회 시도
-    user = user_service.get_user_by_username(user_data.username)
-    if user:
-        print(f"User found: {user.username}, stored password: {user.password_hash}")  # 디버깅 로그
-        print(f"Attempting to verify password: {user_data.password}")  # 디버깅 로그
-    else:
-        print(f"User not found: {user_data.username}")  # 디버깅 로그
-    
-    user = user_service.authenticate_user(user_data.username, user_data.password)
+    try:
+        user = user_service.authenticate_user(user_data.username, user_data.password)
+    except PasswordHasherBusy:
+        raise _hasher_busy_exception()
     
     if not user:
-        print("Authentication failed")  # 디버깅 로그
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    print(f"Authentication successful for user: {user.username}")  # 디버깅 로그
+    logger.info(f"Authentication successful for user ID {user.id}")
     
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
@@ -67,7 +71,7 @@ def login(user_data: UserLogin, db: Session = Depends(get_db)):
     }
 
 @router.post("/ad-login")
-def ad_login(ad_data: ADLoginRequest, db: Session = Depends(get_db)):
+def ad_login(ad_data: ADLoginRequest, db: Session = Depends(get_db, scope="function")):
     """AD 로그인을 수행합니다."""
     print(f"AD Login attempt for username: {ad_data.username}, email: {ad_data.email}")
     
@@ -87,6 +91,8 @@ def ad_login(ad_data: ADLoginRequest, db: Session = Depends(get_db)):
                 password="ad_user_temp_password_123"
             )
             print(f"New AD user created: {user.username}")
+        except PasswordHasherBusy:
+            raise _hasher_busy_exception()
         except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,14 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from pydantic import BaseModel
 from typing import Optional
 
-from backend.database import get_db
-from backend.database.model import User, Comment
-from backend.database.dao.comment_dao import CommentDAO
-from backend.service.notification_service import NotificationService
-from backend.service.analytics_service import AnalyticsService
+from backend.database.async_database import get_async_db
+from backend.database.model import User, Comment, EventType
+from backend.database.dao.comment_dao import AsyncCommentDAO
+from backend.service.notification_service import AsyncNotificationService
+from backend.service.analytics_service import track_event_async
 from backend.api.auth import get_current_user
 import logging
 
@@ -44,10 +44,10 @@ async def create_comment(
     mcp_server_id: int,
     comment_data: CommentCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """MCP 서버에 댓글을 생성합니다."""
-    comment_dao = CommentDAO(db)
+    comment_dao = AsyncCommentDAO(db)
     
     # rating 검증 (0~5, 0.5 단위)
     if comment_data.rating < 0 or comment_data.rating > 5:
@@ -56,7 +56,7 @@ async def create_comment(
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="rating must be in 0.5 increments")
 
     # 댓글 생성
-    comment = comment_dao.create_comment(
+    comment = await comment_dao.create_comment(
         mcp_server_id=mcp_server_id,
         user_id=current_user.id,
         content=comment_data.content,
@@ -65,24 +65,22 @@ async def create_comment(
 
     # 알림 생성 (MCP 소유자에게)
     try:
-        notification_service = NotificationService(db)
-        notification_service.create_comment_notification(
+        notification_service = AsyncNotificationService(db)
+        await notification_service.create_comment_notification(
             mcp_server_id=mcp_server_id,
             commenter_user_id=current_user.id
         )
     except Exception as e:
-        print(f"Failed to create comment notification: {e}")
+        await db.rollback()
+        logger.error(f"Failed to create comment notification: {e}")
         # 알림 생성 실패해도 댓글은 성공으로 처리
 
     # Analytics: 댓글 추가 이벤트 추적
-    try:
-        analytics_service = AnalyticsService(db)
-        analytics_service.track_comment_add(
-            mcp_server_id=mcp_server_id,
-            user_id=current_user.id
-        )
-    except Exception as e:
-        logger.error(f"Failed to track comment add event: {e}")
+    await track_event_async(
+        EventType.COMMENT_ADD,
+        user_id=current_user.id,
+        metadata={"mcp_server_id": mcp_server_id}
+    )
 
     return CommentResponse(
         id=comment.id,
@@ -101,12 +99,12 @@ async def get_comments(
     mcp_server_id: int,
     limit: int = 50,
     offset: int = 0,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """특정 MCP 서버의 댓글 목록을 조회합니다."""
-    comment_dao = CommentDAO(db)
+    comment_dao = AsyncCommentDAO(db)
     
-    comments = comment_dao.get_comments_by_mcp_server(
+    comments = await comment_dao.get_comments_by_mcp_server(
         mcp_server_id=mcp_server_id,
         limit=limit,
         offset=offset
@@ -132,10 +130,10 @@ async def update_comment(
     comment_id: int,
     comment_data: CommentUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """댓글을 수정합니다. (작성자만 수정 가능)"""
-    comment_dao = CommentDAO(db)
+    comment_dao = AsyncCommentDAO(db)
     
     # rating 검증 (선택 입력)
     if comment_data.rating is not None:
@@ -145,7 +143,7 @@ async def update_comment(
             raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="rating must be in 0.5 increments")
 
     # 댓글 수정
-    comment = comment_dao.update_comment(
+    comment = await comment_dao.update_comment(
         comment_id=comment_id,
         content=comment_data.content,
         user_id=current_user.id,
@@ -174,13 +172,13 @@ async def update_comment(
 async def delete_comment(
     comment_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """댓글을 삭제합니다. (작성자만 삭제 가능)"""
-    comment_dao = CommentDAO(db)
+    comment_dao = AsyncCommentDAO(db)
 
     # 삭제 전에 댓글 정보 조회 (mcp_server_id 필요)
-    comment = comment_dao.get_comment_by_id(comment_id)
+    comment = await comment_dao.get_comment_by_id(comment_id)
     if not comment or comment.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -190,7 +188,7 @@ async def delete_comment(
     mcp_server_id = comment.mcp_server_id
 
     # 댓글 삭제
-    success = comment_dao.delete_comment(
+    success = await comment_dao.delete_comment(
         comment_id=comment_id,
         user_id=current_user.id
     )
@@ -202,25 +200,22 @@ async def delete_comment(
         )
 
     # Analytics: 댓글 삭제 이벤트 추적
-    try:
-        analytics_service = AnalyticsService(db)
-        analytics_service.track_comment_delete(
-            mcp_server_id=mcp_server_id,
-            user_id=current_user.id
-        )
-    except Exception as e:
-        logger.error(f"Failed to track comment delete event: {e}")
+    await track_event_async(
+        EventType.COMMENT_DELETE,
+        user_id=current_user.id,
+        metadata={"mcp_server_id": mcp_server_id}
+    )
 
     return {"message": "댓글이 성공적으로 삭제되었습니다."}
 
 @router.get("/mcp-servers/{mcp_server_id}/count")
 async def get_comment_count(
     mcp_server_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """특정 MCP 서버의 댓글 수를 조회합니다."""
-    comment_dao = CommentDAO(db)
+    comment_dao = AsyncCommentDAO(db)
     
-    count = comment_dao.get_comment_count_by_mcp_server(mcp_server_id)
+    count = await comment_dao.get_comment_count_by_mcp_server(mcp_server_id)
     
     return {"count": count}
\ No newline at end of file
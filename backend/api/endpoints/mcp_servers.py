@@ -1,31 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, BackgroundTasks
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import logging
 import asyncio
 
 from backend.database import get_db
+from backend.database.database import SessionLocal, optional_write
 
 logger = logging.getLogger(__name__)
 from backend.service import MCPServerService, UserService, MCPProxyService, AnalyticsService
+from backend.service.analytics_service import visitor_fingerprint
 from backend.service.notification_service import NotificationService
+from backend.service.catalog_search_index import (
+    catalog_search_index, is_memory_search_enabled, check_catalog_search_index,
+    ensure_catalog_search_index_fresh, tokenize
+)
+from backend.service.suggest_index import get_suggestions
+from backend.service.semantic_search import is_semantic_search_available
 from backend.database.model import User
 from backend.api.schemas import (
     MCPServerCreate, MCPServerResponse, MCPServerUpdate,
     SearchRequest, SearchResponse, FavoriteRequest, FavoriteResponse,
     AdminApprovalRequest, TagResponse, PreviewToolsRequest, PreviewToolsResponse,
     AnnouncementRequest, PreviewPromptsRequest, PreviewPromptsResponse,
-    PreviewResourcesRequest, PreviewResourcesResponse, TopUserResponse
+    PreviewResourcesRequest, PreviewResourcesResponse, TopUserResponse,
+    SuggestionResponse, FacetedSearchRequest, FacetedSearchResponse
 )
 from backend.api.auth import get_current_user, get_current_admin_user
+from backend.api.etag import compute_etag, compute_rows_etag, if_none_match, not_modified, set_etag_headers
+from backend.utils.query_budget import query_budget
 
 router = APIRouter(prefix="/mcp-servers", tags=["mcp-servers"])
 
+
+def _visitor_id(request: Request) -> Optional[str]:
+    """비로그인 방문자 지문 (프록시 뒤에서는 X-Forwarded-For의 첫 번째 IP 사용)"""
+    forwarded_for = request.headers.get("x-forwarded-for")
+    client_ip = forwarded_for.split(",")[0].strip() if forwarded_for else (request.client.host if request.client else None)
+    return visitor_fingerprint(client_ip, request.headers.get("user-agent"))
+
+
 @router.post("/", response_model=MCPServerResponse)
 def create_mcp_server(
     mcp_server_data: MCPServerCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """새 MCP 서버를 생성합니다."""
     
@@ -43,7 +62,7 @@ def create_mcp_server(
         )
 
 @router.post("/preview")
-def preview_mcp_server(github_link: dict, db: Session = Depends(get_db)):
+def preview_mcp_server(github_link: dict, db: Session = Depends(get_db, scope="function")):
     """GitHub 링크에서 도구 정보를 미리보기합니다."""
     try:
         mcp_service = MCPServerService(db)
@@ -130,13 +149,15 @@ async def preview_mcp_resources(request: PreviewResourcesRequest):
 
 @router.get("/", response_model=List[MCPServerResponse])
 def get_mcp_servers(
+    request: Request,
+    response: Response,
     status: str = Query("approved", description="서버 상태 (approved, pending)"),
     category: Optional[str] = Query(None, description="카테고리"),
     sort: str = Query("favorites", description="정렬 기준 (favorites, created_at)"),
     order: str = Query("desc", description="정렬 순서 (asc, desc)"),
     limit: int = Query(20, description="조회 개수"),
     offset: int = Query(0, description="오프셋"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """
     MCP 서버 목록을 조회합니다.
@@ -146,12 +167,29 @@ def get_mcp_servers(
     - order=desc: 내림차순 (기본값)
     - order=asc: 오름차순
 
+    응답에는 ETag가 포함되며, If-None-Match가 일치하면 304를 반환합니다.
+
     Examples:
     - GET /?sort=favorites&limit=3  # Top 3 인기 서버
     - GET /?sort=created_at&limit=3 # Latest 3 서버
     """
     mcp_service = MCPServerService(db)
 
+    # 가벼운 버전 조회로 ETag를 먼저 계산 (관계 로딩/직렬화 전)
+    versions = mcp_service.get_mcp_servers_versions(
+        status=status,
+        category=category,
+        sort=sort,
+        order=order,
+        limit=limit,
+        offset=offset
+    )
+    etag = compute_rows_etag(
+        ("list", status, category, sort, order, limit, offset), versions
+    )
+    if if_none_match(request, etag):
+        return not_modified(etag)
+
     # sort와 order 파라미터로 통합 조회
     mcps = mcp_service.get_mcp_servers(
         status=status,
@@ -162,23 +200,40 @@ def get_mcp_servers(
         offset=offset
     )
 
-    # 각 MCP 서버에 favorites_count 추가
+    # 버전 조회 결과의 즐겨찾기 수를 재사용 (서버별 개별 COUNT 쿼리 제거)
+    favorites_counts = {row.id: row.favorites_count for row in versions}
     for mcp in mcps:
-        mcp.favorites_count = mcp_service.get_mcp_server_favorites_count(mcp.id)
+        mcp.favorites_count = favorites_counts.get(mcp.id, 0)
 
+    set_etag_headers(response, etag)
     return mcps
 
+@router.get("/suggest", response_model=List[SuggestionResponse])
+def suggest(
+    q: str = Query(..., min_length=1, max_length=100, description="입력 중인 검색어"),
+    limit: int = Query(10, ge=1, le=20, description="조회 개수"),
+    db: Session = Depends(get_db, scope="function")
+):
+    """
+    검색어 자동완성 후보를 조회합니다.
+
+    서버 이름, 태그, 도구 이름, 인기 검색어 중 접두사가 일치하는 항목을
+    즐겨찾기/조회 수/사용 빈도 가중치 순으로 반환합니다.
+    인메모리 인덱스에서 응답하며 TTL이 지난 경우에만 DB에서 재구축합니다.
+    """
+    return get_suggestions(db, q, limit)
+
 @router.get("/top-users", response_model=List[TopUserResponse])
 def get_top_users(
     limit: int = Query(3, description="조회 개수", le=10),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """Top Contributors를 조회합니다. (등록한 MCP 서버 수 기준)"""
     user_service = UserService(db)
     return user_service.get_top_users(limit)
 
 @router.get("/{mcp_server_id}/favorites/count")
-def get_mcp_server_favorites_count(mcp_server_id: int, db: Session = Depends(get_db)):
+def get_mcp_server_favorites_count(mcp_server_id: int, db: Session = Depends(get_db, scope="function")):
     """특정 MCP 서버의 즐겨찾기 수를 조회합니다."""
     mcp_service = MCPServerService(db)
     count = mcp_service.get_mcp_server_favorites_count(mcp_server_id)
@@ -188,11 +243,15 @@ def get_mcp_server_favorites_count(mcp_server_id: int, db: Session = Depends(get
 def get_mcp_server(
     mcp_server_id: int,
     request: Request,
+    response: Response,
     source: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """특정 MCP 서버의 상세 정보를 조회합니다.
 
+    응답에는 ETag가 포함되며, If-None-Match가 일치하면 도구/파라미터를
+    로딩하지 않고 304를 반환합니다.
+
     Args:
         mcp_server_id: MCP 서버 ID
         source: 유입 경로 (search, list, direct 등)
@@ -200,9 +259,9 @@ def get_mcp_server(
 
     mcp_service = MCPServerService(db)
     analytics_service = AnalyticsService(db)
-    mcp_server = mcp_service.get_mcp_server_with_tools(mcp_server_id)
+    version = mcp_service.get_mcp_server_version(mcp_server_id)
 
-    if not mcp_server:
+    if not version:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="MCP Server not found"
@@ -214,34 +273,72 @@ def get_mcp_server(
         analytics_service.track_server_view(
             mcp_server_id=mcp_server_id,
             referrer=referrer,
-            source=source
+            source=source,
+            visitor_id=_visitor_id(request)
         )
     except Exception as e:
         logger.error(f"Failed to track server view event: {e}")
 
+    # 조회 이벤트는 304 응답이어도 기록한 뒤 ETag 비교
+    etag = compute_etag("detail", *version)
+    if if_none_match(request, etag):
+        return not_modified(etag)
+
+    mcp_server = mcp_service.get_mcp_server_with_tools(mcp_server_id)
+    if not mcp_server:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="MCP Server not found"
+        )
+    mcp_server.favorites_count = version.favorites_count
+
+    set_etag_headers(response, etag)
     return mcp_server
 
 @router.post("/search", response_model=SearchResponse)
 def search_mcp_servers(
     search_request: SearchRequest,
     request: Request,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
-    """MCP 서버를 검색합니다. (키워드로 이름, 설명, 태그 검색)"""
+    """MCP 서버를 검색합니다. (키워드로 이름, 설명, 태그 검색)
+
+    SEARCH_INDEX_MODE=memory 이고 인메모리 인덱스가 준비되어 있으면
+    승인된 서버 검색을 DB 조회 없이 인덱스에서 응답합니다.
+    (검색어에 토큰이 없으면 DB 경로와 같이 승인된 전체 서버 목록을 반환)
+    mode=semantic 이면 서버/도구 설명 임베딩 유사도로 검색합니다. (numpy 미설치 시 키워드 검색)
+    """
     mcp_service = MCPServerService(db)
     analytics_service = AnalyticsService(db)
 
-    # keyword로 name, description, tags 검색
-    mcp_servers = mcp_service.search_mcp_servers(
-        search_request.keyword, search_request.status
-    )
+    if (
+        search_request.mode == 'semantic'
+        and is_semantic_search_available()
+        and search_request.status == 'approved'
+    ):
+        mcp_servers = mcp_service.semantic_search(search_request.keyword)
+    elif (
+        is_memory_search_enabled()
+        and catalog_search_index.ready
+        and search_request.status == 'approved'
+        and tokenize(search_request.keyword)
+    ):
+        ensure_catalog_search_index_fresh(db)
+        ranked = catalog_search_index.search(search_request.keyword)
+        mcp_servers = catalog_search_index.get_payloads(doc_id for doc_id, _ in ranked)
+    else:
+        # keyword로 name, description, tags 검색
+        mcp_servers = mcp_service.search_mcp_servers(
+            search_request.keyword, search_request.status
+        )
 
     # Analytics: 검색 이벤트 추적
     try:
         analytics_service.track_search(
             keyword=search_request.keyword,
             results_count=len(mcp_servers),
-            tags=None
+            tags=None,
+            visitor_id=_visitor_id(request)
         )
     except Exception as e:
         logger.error(f"Failed to track search event: {e}")
@@ -251,12 +348,53 @@ def search_mcp_servers(
         total_count=len(mcp_servers)
     )
 
+@router.post("/search/faceted", response_model=FacetedSearchResponse)
+def faceted_search_mcp_servers(
+    search_request: FacetedSearchRequest,
+    request: Request,
+    db: Session = Depends(get_db, scope="function")
+):
+    """
+    승인된 MCP 서버를 패싯 필터로 검색하고, 결과와 패싯별 카운트를 함께 반환합니다.
+
+    - 같은 패싯 내 여러 값은 OR, 서로 다른 패싯은 AND 조건
+    - 각 패싯 카운트는 해당 패싯을 제외한 나머지 선택 조건 기준 (필터 사이드바용)
+    """
+    mcp_service = MCPServerService(db)
+    analytics_service = AnalyticsService(db)
+
+    result = mcp_service.faceted_search(
+        keyword=search_request.keyword,
+        filters={
+            'tags': search_request.tags,
+            'category': search_request.categories,
+            'protocol': search_request.protocols,
+            'health_status': search_request.health_statuses
+        },
+        limit=search_request.limit,
+        offset=search_request.offset
+    )
+
+    # Analytics: 키워드/태그 검색 이벤트 추적
+    if search_request.keyword or search_request.tags:
+        try:
+            analytics_service.track_search(
+                keyword=search_request.keyword or "",
+                results_count=result["total_count"],
+                tags=search_request.tags or None,
+                visitor_id=_visitor_id(request)
+            )
+        except Exception as e:
+            logger.error(f"Failed to track search event: {e}")
+
+    return FacetedSearchResponse(**result)
+
 @router.post("/{mcp_server_id}/favorite", response_model=FavoriteResponse)
 def add_favorite(
     mcp_server_id: int,
     request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """MCP 서버를 즐겨찾기에 추가합니다."""
     user_service = UserService(db)
@@ -264,16 +402,13 @@ def add_favorite(
     success = user_service.add_favorite(current_user.id, mcp_server_id)
 
     if success:
-        # 알림 생성 (MCP 소유자에게)
-        try:
+        # 알림 생성 (MCP 소유자에게) - 실패해도 즐겨찾기는 성공으로 처리
+        with optional_write(db, "Favorite notification"):
             notification_service = NotificationService(db)
             notification_service.create_favorite_notification(
                 mcp_server_id=mcp_server_id,
                 favoriter_user_id=current_user.id
             )
-        except Exception as e:
-            logger.error(f"Failed to create favorite notification: {e}")
-            # 알림 생성 실패해도 즐겨찾기는 성공으로 처리
 
         # Analytics: 즐겨찾기 추가 이벤트 추적
         try:
@@ -293,7 +428,7 @@ def remove_favorite(
     mcp_server_id: int,
     request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """MCP 서버를 즐겨찾기에서 제거합니다."""
     user_service = UserService(db)
@@ -315,9 +450,10 @@ def remove_favorite(
         return FavoriteResponse(success=False, message="즐겨찾기에 존재하지 않습니다.")
 
 @router.get("/user/favorites", response_model=List[MCPServerResponse])
+@query_budget(10)
 def get_user_favorites(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """사용자의 즐겨찾기 목록을 조회합니다."""
     user_service = UserService(db)
@@ -326,7 +462,7 @@ def get_user_favorites(
 @router.get("/user/my-servers", response_model=List[MCPServerResponse])
 def get_user_mcp_servers(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """사용자가 등록한 MCP 서버 목록을 조회합니다. (mypage용 - pending 포함)"""
     user_service = UserService(db)
@@ -335,18 +471,28 @@ def get_user_mcp_servers(
 @router.get("/user/{username}", response_model=List[MCPServerResponse])
 def get_user_mcp_servers_by_username(
     username: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db, scope="function")
 ):
-    """특정 사용자가 등록한 MCP 서버 목록을 조회합니다."""
+    """특정 사용자가 등록한 MCP 서버 목록을 조회합니다. (ETag 지원)"""
     user_service = UserService(db)
-    servers = user_service.get_user_mcp_servers_by_username(username)
-    
-    if not servers and not user_service.get_user_by_username(username):
+    mcp_service = MCPServerService(db)
+    user = user_service.get_user_by_username(username)
+
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    
+
+    versions = mcp_service.get_mcp_servers_versions_by_owner(user.id)
+    etag = compute_rows_etag(("user", user.id), versions)
+    if if_none_match(request, etag):
+        return not_modified(etag)
+
+    servers = user_service.get_user_mcp_servers(user.id)
+    set_etag_headers(response, etag)
     return servers
 
 # 관리자 전용 엔드포인트
@@ -354,7 +500,7 @@ def get_user_mcp_servers_by_username(
 def approve_mcp_server(
     approval_request: AdminApprovalRequest,
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """MCP 서버를 승인하거나 거부합니다."""
     mcp_service = MCPServerService(db)
@@ -384,7 +530,7 @@ def approve_mcp_server(
 @router.post("/admin/approve-all", response_model=dict)
 def approve_all_pending_servers(
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """모든 승인 대기중인 MCP 서버를 일괄 승인합니다."""
     mcp_service = MCPServerService(db)
@@ -394,11 +540,25 @@ def approve_all_pending_servers(
         "approved_count": result['approved_count']
     }
 
+@router.get("/admin/search-index/consistency")
+def check_search_index_consistency(
+    repair: bool = Query(False, description="불일치 항목을 DB 기준으로 복구할지 여부"),
+    current_user: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db, scope="function")
+):
+    """인메모리 검색 인덱스와 DB의 일관성을 검사합니다. (관리자 전용)"""
+    if not catalog_search_index.ready:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="In-memory search index is not enabled"
+        )
+    return check_catalog_search_index(db, repair=repair)
+
 @router.delete("/admin/{mcp_server_id}")
 def delete_mcp_server(
     mcp_server_id: int,
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """MCP 서버를 삭제합니다."""
     mcp_service = MCPServerService(db)
@@ -415,14 +575,14 @@ def delete_mcp_server(
 @router.get("/tags/popular", response_model=List[TagResponse])
 def get_popular_tags(
     limit: int = Query(10, description="조회 개수"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """인기 태그 목록을 조회합니다."""
     mcp_service = MCPServerService(db)
     return mcp_service.get_popular_tags(limit)
 
 @router.get("/categories", response_model=List[str])
-def get_categories(db: Session = Depends(get_db)):
+def get_categories(db: Session = Depends(get_db, scope="function")):
     """모든 카테고리 목록을 조회합니다."""
     mcp_service = MCPServerService(db)
     return mcp_service.get_categories()
@@ -432,7 +592,7 @@ def update_mcp_server(
     mcp_server_id: int,
     mcp_server_data: MCPServerUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """MCP 서버를 수정합니다. 등록자만 수정 가능합니다."""
     
@@ -469,7 +629,7 @@ def update_mcp_server(
 def delete_mcp_server_by_owner(
     mcp_server_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """MCP 서버를 삭제합니다. 등록자만 삭제 가능합니다."""
     mcp_service = MCPServerService(db)
@@ -504,7 +664,7 @@ def update_mcp_server_announcement(
     mcp_server_id: int,
     announcement_data: AnnouncementRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """MCP 서버의 공지사항을 추가하거나 수정합니다. 소유자만 가능합니다. 최대 1000자까지 입력 가능합니다."""
     mcp_service = MCPServerService(db)
@@ -540,7 +700,7 @@ def update_mcp_server_announcement(
 def delete_mcp_server_announcement(
     mcp_server_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """MCP 서버의 공지사항을 삭제합니다. 소유자만 가능합니다."""
     mcp_service = MCPServerService(db)
@@ -574,7 +734,7 @@ def delete_mcp_server_announcement(
 async def check_server_health(
     background_tasks: BackgroundTasks,
     mcp_server_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ):
     """
     MCP 서버의 헬스 체크를 백그라운드에서 시작합니다.
@@ -597,7 +757,6 @@ async def check_server_health(
         async def run_health_check():
             logger.info(f"Starting background health check for server {mcp_server_id}")
             # 새로운 DB 세션 생성 (백그라운드 태스크용)
-            from backend.database import SessionLocal
             bg_db = SessionLocal()
             try:
                 bg_service = MCPServerService(bg_db)
@@ -0,0 +1,80 @@
+"""
+Metrics API Endpoint
+
+Prometheus 텍스트 형식의 /metrics 엔드포인트를 제공합니다.
+
+요청 경로에서는 스레드별 카운터/히스토그램에만 기록하고(잠금 없음),
+커넥션 풀 / 큐 / 캐시 상태는 스크레이프 시점에만 읽습니다.
+
+SHARED_STATE_BACKEND=redis이면 어느 워커가 스크레이프를 받아도 모든 워커의 지표를
+worker 레이블과 함께 반환합니다. (local이면 요청을 받은 워커의 지표만 반환)
+"""
+from typing import List
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from backend.database.database import engine
+from backend.api.endpoints.playground import playground_slots
+from backend.service.analytics_ingest import analytics_ingest_queue
+from backend.service.analytics_summary import analytics_summary_cache
+from backend.service.funnel_engine import funnel_cache
+from backend.service.user_principal_cache import user_principal_cache
+from backend.utils.metrics import GaugeFamily, cache_families, metrics_publisher, metrics_registry
+from backend.utils.password_hashing import password_hasher
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _pool_families() -> List[GaugeFamily]:
+    """SQLAlchemy 커넥션 풀 상태 (QueuePool 계열만 제공)"""
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return []
+    return [
+        GaugeFamily("db_pool_size", "Configured pool size", [({}, pool.size())]),
+        GaugeFamily("db_pool_checked_out", "Connections currently checked out", [({}, pool.checkedout())]),
+        GaugeFamily("db_pool_checked_in", "Idle connections in the pool", [({}, pool.checkedin())]),
+        GaugeFamily("db_pool_overflow", "Connections open beyond pool_size", [({}, max(pool.overflow(), 0))]),
+    ]
+
+
+def _queue_families() -> List[GaugeFamily]:
+    """플레이그라운드 대기열, 분석 적재 큐, 비밀번호 해시 작업 풀 상태"""
+    ingest = analytics_ingest_queue.stats()
+    hasher = password_hasher.stats()
+    return [
+        GaugeFamily("playground_queue_depth", "Playground requests waiting for a slot", [({}, playground_slots.waiting)]),
+        GaugeFamily("playground_active", "Playground requests currently running", [({}, playground_slots.active)]),
+        GaugeFamily("analytics_ingest_queued", "Analytics events waiting to be written", [({}, ingest["queued"])]),
+        GaugeFamily("analytics_ingest_dropped", "Analytics events dropped since start", [({}, ingest["dropped_total"])]),
+        GaugeFamily("password_hash_in_flight", "Password hash jobs running or queued", [({}, hasher["in_flight"])]),
+        GaugeFamily("password_hash_rejected", "Password hash jobs rejected since start", [({}, hasher["rejected_total"])]),
+        GaugeFamily("password_hash_timeouts", "Password hash jobs timed out since start", [({}, hasher["timeouts_total"])]),
+    ]
+
+
+def _cache_families() -> List[GaugeFamily]:
+    return cache_families({
+        "user_principal": user_principal_cache.stats,
+        "analytics_summary": analytics_summary_cache.stats,
+        "funnel": funnel_cache.stats,
+    })
+
+
+metrics_registry.register_collector(_pool_families)
+metrics_registry.register_collector(_queue_families)
+metrics_registry.register_collector(_cache_families)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics():
+    """
+    Prometheus 스크레이프용 지표를 반환합니다.
+
+    커넥션 풀, 라우트별 응답 시간 히스토그램, MCP 원격 호출 시간, 플레이그라운드 대기열,
+    캐시 적중률 등을 포함합니다.
+    """
+    return PlainTextResponse(metrics_publisher.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from pydantic import BaseModel
 from datetime import datetime
 
-from backend.database import get_db
+from backend.database.async_database import get_async_db
 from backend.database.model import User
-from backend.service.notification_service import NotificationService
+from backend.service.notification_service import AsyncNotificationService
 from backend.api.auth import get_current_user
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
@@ -40,12 +40,12 @@ async def get_notifications(
     offset: int = Query(0, description="오프셋"),
     unread_only: bool = Query(False, description="읽지 않은 알림만 조회"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """사용자의 알림 목록을 조회합니다."""
-    notification_service = NotificationService(db)
+    notification_service = AsyncNotificationService(db)
 
-    notifications = notification_service.get_user_notifications(
+    notifications = await notification_service.get_user_notifications(
         user_id=current_user.id,
         limit=limit,
         offset=offset,
@@ -69,11 +69,11 @@ async def get_notifications(
 @router.get("/unread-count", response_model=UnreadCountResponse)
 async def get_unread_count(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """읽지 않은 알림 개수를 조회합니다."""
-    notification_service = NotificationService(db)
-    count = notification_service.get_unread_count(current_user.id)
+    notification_service = AsyncNotificationService(db)
+    count = await notification_service.get_unread_count(current_user.id)
     return UnreadCountResponse(count=count)
 
 
@@ -81,11 +81,11 @@ async def get_unread_count(
 async def mark_as_read(
     notification_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """알림을 읽음으로 표시합니다."""
-    notification_service = NotificationService(db)
-    success = notification_service.mark_as_read(notification_id, current_user.id)
+    notification_service = AsyncNotificationService(db)
+    success = await notification_service.mark_as_read(notification_id, current_user.id)
 
     if success:
         return MarkReadResponse(success=True, message="알림이 읽음으로 표시되었습니다.")
@@ -99,11 +99,11 @@ async def mark_as_read(
 @router.post("/read-all", response_model=MarkReadResponse)
 async def mark_all_as_read(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """모든 알림을 읽음으로 표시합니다."""
-    notification_service = NotificationService(db)
-    count = notification_service.mark_all_as_read(current_user.id)
+    notification_service = AsyncNotificationService(db)
+    count = await notification_service.mark_all_as_read(current_user.id)
     return MarkReadResponse(
         success=True,
         message=f"{count}개의 알림이 읽음으로 표시되었습니다."
@@ -114,11 +114,11 @@ async def mark_all_as_read(
 async def delete_notification(
     notification_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """알림을 삭제합니다."""
-    notification_service = NotificationService(db)
-    success = notification_service.delete_notification(notification_id, current_user.id)
+    notification_service = AsyncNotificationService(db)
+    success = await notification_service.delete_notification(notification_id, current_user.id)
 
     if success:
         return {"message": "알림이 삭제되었습니다."}
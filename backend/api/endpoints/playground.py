@@ -2,7 +2,9 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 import asyncio
 import os
+import uuid
 import logging
+from contextlib import asynccontextmanager
 
 from backend.api.schemas import (
     PlaygroundChatRequest,
@@ -10,25 +12,79 @@ from backend.api.schemas import (
     PlaygroundRateLimitResponse
 )
 from backend.api.auth import get_current_user
-from backend.database.database import get_db
+from backend.database.database import get_db, release_connection
 from backend.database.dao.mcp_server_dao import MCPServerDAO
 from backend.service.playground_service import PlaygroundService
 from backend.service.analytics_service import AnalyticsService
 from backend.database.model.user import User
+from backend.utils.shared_state import shared_state
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Semaphore to limit concurrent LLM requests to prevent server overload
-# Only allow 5 concurrent playground requests at a time
-_playground_semaphore = asyncio.Semaphore(5)
+# Maximum number of concurrent playground requests
+# (across all workers when SHARED_STATE_BACKEND=redis, otherwise per worker process)
+PLAYGROUND_CONCURRENCY = 5
+# A shared slot held longer than this (crashed worker) is released automatically
+PLAYGROUND_SLOT_LEASE_SECONDS = 240
+PLAYGROUND_SLOT_POLL_SECONDS = 0.25
+
+
+class _PlaygroundSlots:
+    """
+    Semaphore limiting concurrent LLM requests to prevent server overload
+    Tracks waiting/active counts for /metrics (only touched on the event loop, so no locking)
+
+    With a shared state backend the limit is global: after the per-process semaphore,
+    each request also leases one of `limit` slots in shared state, polling until one frees up.
+    """
+
+    def __init__(self, limit: int, state=shared_state):
+        self.limit = limit
+        self.state = state
+        self.waiting = 0
+        self.active = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    @asynccontextmanager
+    async def slot(self):
+        token = uuid.uuid4().hex
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+            try:
+                if self.state.is_shared:
+                    await self._acquire_shared(token)
+            except BaseException:
+                self._semaphore.release()
+                raise
+        finally:
+            self.waiting -= 1
+
+        self.active += 1
+        try:
+            yield self
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+            if self.state.is_shared:
+                await asyncio.to_thread(self.state.release_slot, "playground", token)
+
+    async def _acquire_shared(self, token: str) -> None:
+        while not await asyncio.to_thread(
+            self.state.acquire_slot, "playground", token, self.limit, PLAYGROUND_SLOT_LEASE_SECONDS
+        ):
+            await asyncio.sleep(PLAYGROUND_SLOT_POLL_SECONDS)
+
+
+playground_slots = _PlaygroundSlots(PLAYGROUND_CONCURRENCY)
 
 
 @router.get("/mcp-servers/{server_id}/playground/rate-limit")
 async def get_rate_limit(
     server_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ) -> PlaygroundRateLimitResponse:
     """
     Get rate limit status for current user and MCP server
@@ -50,7 +106,7 @@ async def playground_chat(
     chat_request: PlaygroundChatRequest,
     request: Request,  # Add Request object for disconnect detection
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db, scope="function")
 ) -> PlaygroundChatResponse:
     """
     Send a chat message to the playground with MCP integration
@@ -118,6 +174,10 @@ async def playground_chat(
 
         # Create playground service
         playground_service = PlaygroundService(api_key=api_key, model=model)
+        protocol = mcp_server.protocol
+
+        # Return the DB connection to the pool while waiting on the LLM / MCP server
+        release_connection(db)
 
         # Convert conversation history to dict format
         conversation_history = [
@@ -126,7 +186,7 @@ async def playground_chat(
         ]
 
         # Use semaphore to limit concurrent LLM requests
-        async with _playground_semaphore:
+        async with playground_slots.slot():
             logger.info(f"[Playground] Acquired semaphore. Starting chat for user_id={user_id}, server_id={server_id}")
 
             # Send chat message with timeout (3 minutes max for entire operation)
@@ -135,7 +195,7 @@ async def playground_chat(
                     playground_service.chat(
                         message=chat_request.message,
                         mcp_server_url=server_url,
-                        protocol=mcp_server.protocol,
+                        protocol=protocol,
                         conversation_history=conversation_history,
                         user_token=chat_request.mcp_auth_token
                     ),
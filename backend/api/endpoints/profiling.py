@@ -0,0 +1,81 @@
+"""
+Profiling API Endpoints
+
+ProfilingMiddleware가 수집한 요청 프로파일을 조회/다운로드하는 관리자 전용 API를 제공합니다.
+"""
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from backend.api.auth import get_current_admin_user
+from backend.database.model import User
+from backend.utils.profiling import profile_store
+from backend.utils.startup_profiler import startup_profiler
+
+router = APIRouter(prefix="/profiles", tags=["profiling"])
+
+
+def _get_profile_or_404(profile_id: str):
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    return profile
+
+
+@router.get("")
+def list_profiles(current_admin: User = Depends(get_current_admin_user)):  # Admin only
+    """
+    최근 수집된 프로파일 요약 목록을 조회합니다. (관리자 전용, 최신순)
+
+    Returns:
+        [{"id": "...", "route": "/api/v1/...", "total_ms": 120.5, "sql_count": 12, "sql_ms": 80.1, ...}, ...]
+    """
+    return profile_store.list()
+
+
+@router.get("/startup")
+def get_startup_report(current_admin: User = Depends(get_current_admin_user)):  # Admin only
+    """
+    현재 프로세스의 시작 시간 리포트를 조회합니다. (관리자 전용)
+
+    Returns:
+        {"total_seconds": 1.3, "phases": [...], "heavy_modules_loaded": [...], "lazy_imports": {"openai": 0.41, ...}}
+    """
+    return startup_profiler.report()
+
+
+@router.get("/{profile_id}")
+def get_profile(
+    profile_id: str,
+    current_admin: User = Depends(get_current_admin_user)  # Admin only
+):
+    """
+    프로파일 상세(가장 느린 SQL 문 포함)를 조회합니다. (관리자 전용)
+    """
+    return _get_profile_or_404(profile_id).detail()
+
+
+@router.get("/{profile_id}/download")
+def download_profile(
+    profile_id: str,
+    format: str = Query("speedscope", pattern="^(speedscope|collapsed)$", description="speedscope 또는 collapsed"),
+    current_admin: User = Depends(get_current_admin_user)  # Admin only
+):
+    """
+    스택 샘플을 파일로 다운로드합니다. (관리자 전용)
+
+    - speedscope: https://www.speedscope.app 에서 바로 열 수 있는 JSON
+    - collapsed: flamegraph.pl / inferno 입력용 collapsed-stack 텍스트
+    """
+    profile = _get_profile_or_404(profile_id)
+    if format == "collapsed":
+        return PlainTextResponse(
+            profile.collapsed(),
+            headers={"Content-Disposition": f'attachment; filename="profile-{profile.id}.folded"'}
+        )
+    return JSONResponse(
+        profile.speedscope(),
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile.id}.speedscope.json"'}
+    )
@@ -0,0 +1,87 @@
+"""
+ETag / 조건부 GET 유틸리티
+
+무거운 직렬화(MCPServerResponse) 전에 가벼운 버전 정보만으로 ETag를 계산하고,
+클라이언트의 If-None-Match 헤더와 일치하면 304 Not Modified로 응답합니다.
+"""
+import hashlib
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+from fastapi import Request, Response
+
+NOT_MODIFIED_STATUS = 304
+
+# 클라이언트가 항상 재검증하도록 설정 (ETag가 일치하면 304로 본문 없이 응답)
+CACHE_CONTROL = "no-cache"
+
+
+def _normalize(part: Any) -> str:
+    """ETag 계산용 값을 문자열로 정규화합니다."""
+    if part is None:
+        return "-"
+    if isinstance(part, datetime):
+        return part.isoformat()
+    if isinstance(part, (list, tuple)):
+        return "(" + ",".join(_normalize(p) for p in part) + ")"
+    return str(part)
+
+
+def compute_etag(*parts: Any) -> str:
+    """
+    버전 정보로부터 strong ETag를 계산합니다.
+
+    Args:
+        parts: updated_at, 카운터 값, 조회 파라미터 등 응답 내용을 결정하는 값들
+
+    Returns:
+        따옴표로 감싼 strong ETag 문자열 (예: '"3f2a..."')
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(_normalize(part).encode())
+        digest.update(b"\x1f")
+    return f'"{digest.hexdigest()}"'
+
+
+def compute_rows_etag(prefix: Iterable[Any], rows: Iterable[Iterable[Any]]) -> str:
+    """목록 응답의 ETag를 계산합니다. (조회 파라미터 + 각 행의 버전 정보)"""
+    return compute_etag(*prefix, *(tuple(row) for row in rows))
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    """
+    If-None-Match 헤더가 주어진 ETag와 일치하는지 확인합니다.
+
+    RFC 9110에 따라 If-None-Match는 weak 비교를 사용하므로 W/ 접두사는 무시합니다.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    header = header.strip()
+    if header == "*":
+        return True
+
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    """본문 없는 304 응답을 생성합니다."""
+    return Response(
+        status_code=NOT_MODIFIED_STATUS,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
+
+
+def set_etag_headers(response: Response, etag: Optional[str]) -> None:
+    """200 응답에 ETag 및 Cache-Control 헤더를 설정합니다."""
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CACHE_CONTROL
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, HttpUrl, validator
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, HttpUrl, validator
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 
 class UserCreate(BaseModel):
@@ -158,6 +158,7 @@ class MCPServerResponse(BaseModel):
     tags: List['TagResponse'] = []
     owner: Optional[UserResponse] = None
     favorites_count: int = 0
+    matched_tools: List[str] = []  # 시맨틱 검색에서 질의와 매칭된 도구 이름
 
     class Config:
         from_attributes = True
@@ -172,11 +173,36 @@ class TagResponse(BaseModel):
 class SearchRequest(BaseModel):
     keyword: str
     status: str = 'approved'
+    mode: Literal['keyword', 'semantic'] = 'keyword'
 
 class SearchResponse(BaseModel):
     mcp_servers: List[MCPServerResponse]
     total_count: int
 
+class FacetedSearchRequest(BaseModel):
+    keyword: Optional[str] = None
+    tags: List[str] = []
+    categories: List[str] = []
+    protocols: List[str] = []
+    health_statuses: List[str] = []
+    limit: int = Field(20, ge=1, le=100)
+    offset: int = Field(0, ge=0)
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+class FacetedSearchResponse(BaseModel):
+    mcp_servers: List[MCPServerResponse]
+    total_count: int
+    facets: Dict[str, List[FacetCount]]
+
+class SuggestionResponse(BaseModel):
+    text: str
+    kind: str  # server, tag, tool, query
+    mcp_server_id: Optional[int] = None
+    score: float
+
 class FavoriteRequest(BaseModel):
     mcp_server_id: int
 
@@ -0,0 +1,135 @@
+"""
+Multi-worker throughput benchmark
+
+Starts the app with 1, 2, 4 ... uvicorn workers, drives a fixed load against one
+path with several client processes and reports requests/second and scaling
+efficiency relative to one worker.
+
+    python -m backend.benchmark_workers --workers 1,2,4,8 --path /api/v1/mcp-servers --duration 20
+
+Run it on the deployment host shape (dedicated cores, the real database, and the
+same SHARED_STATE_BACKEND). The load generator runs on the same machine, so keep
+--clients at or below half the cores, or run it from another host with --url.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from typing import List, Optional, Tuple
+
+import httpx
+
+
+def _client_loop(url: str, duration: float, concurrency: int, queue) -> None:
+    """One load-generator process: `concurrency` keep-alive connections for `duration` seconds"""
+
+    async def worker(client: httpx.AsyncClient, deadline: float, counts: List[int]) -> None:
+        while time.monotonic() < deadline:
+            try:
+                response = await client.get(url)
+                counts[0 if response.status_code < 500 else 1] += 1
+            except httpx.HTTPError:
+                counts[1] += 1
+
+    async def main() -> Tuple[int, int]:
+        counts = [0, 0]
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+            deadline = time.monotonic() + duration
+            await asyncio.gather(*(worker(client, deadline, counts) for _ in range(concurrency)))
+        return counts[0], counts[1]
+
+    queue.put(asyncio.run(main()))
+
+
+def _wait_until_ready(base_url: str, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(base_url + "/", timeout=2).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"Server at {base_url} did not become ready")
+
+
+def run_load(url: str, duration: float, clients: int, concurrency: int) -> Tuple[float, int]:
+    """Returns (requests/second, error count)"""
+    queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=_client_loop, args=(url, duration, concurrency, queue))
+        for _ in range(clients)
+    ]
+    started = time.monotonic()
+    for process in processes:
+        process.start()
+    results = [queue.get() for _ in processes]
+    for process in processes:
+        process.join()
+    elapsed = time.monotonic() - started
+    ok = sum(result[0] for result in results)
+    errors = sum(result[1] for result in results)
+    return ok / elapsed, errors
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "SERVER_WORKERS": str(workers),
+        "SERVER_PORT": str(port),
+        # The benchmark must not be throttled by the per-worker connection cap,
+        # nor cut short by worker recycling (a single worker has no supervisor to restart it)
+        "SERVER_LIMIT_CONCURRENCY": os.getenv("SERVER_LIMIT_CONCURRENCY", "1000"),
+        "SERVER_MAX_REQUESTS": "0",
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "backend.main"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4", help="comma-separated worker counts")
+    parser.add_argument("--path", default="/api/v1/mcp-servers", help="path to request")
+    parser.add_argument("--duration", type=float, default=20, help="seconds per run")
+    parser.add_argument("--warmup", type=float, default=3, help="warm-up seconds per run (not measured)")
+    parser.add_argument("--clients", type=int, default=max(multiprocessing.cpu_count() // 2, 1), help="load-generator processes")
+    parser.add_argument("--concurrency", type=int, default=16, help="connections per load-generator process")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--url", help="benchmark an already running server instead (single run)")
+    args = parser.parse_args(argv)
+
+    if args.url:
+        rps, errors = run_load(args.url, args.duration, args.clients, args.concurrency)
+        print(f"{args.url}: {rps:.1f} req/s, {errors} errors")
+        return
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    print(f"cores={multiprocessing.cpu_count()} clients={args.clients}x{args.concurrency} path={args.path}")
+    print(f"{'workers':>8} {'req/s':>10} {'speedup':>8} {'efficiency':>10} {'errors':>7}")
+
+    baseline = None
+    for workers in [int(value) for value in args.workers.split(",")]:
+        server = start_server(workers, args.port)
+        try:
+            _wait_until_ready(base_url)
+            run_load(base_url + args.path, args.warmup, args.clients, args.concurrency)
+            rps, errors = run_load(base_url + args.path, args.duration, args.clients, args.concurrency)
+        finally:
+            server.terminate()
+            server.wait(30)
+
+        baseline = baseline or rps
+        speedup = rps / baseline
+        print(f"{workers:>8} {rps:>10.1f} {speedup:>7.2f}x {speedup / workers:>9.0%} {errors:>7}")
+
+
+if __name__ == "__main__":
+    main()
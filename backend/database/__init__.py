@@ -1,4 +1,5 @@
 from .database import database, get_db
+from .async_database import get_async_db
 from .model import (
     Base, User, Tag, MCPServer, MCPServerTool, 
     MCPServerProperty, UserFavorite, mcp_server_tags
@@ -10,6 +11,7 @@ from .init_db import init_database
 __all__ = [
     'database',
     'get_db',
+    'get_async_db',
     'Base',
     'User',
     'Tag', 
@@ -0,0 +1,80 @@
+"""
+비동기 데이터베이스 엔진 / 세션
+
+async def 엔드포인트가 이벤트 루프를 막지 않도록 AsyncEngine/AsyncSession을 제공합니다.
+
+- 드라이버: PostgreSQL은 asyncpg, SQLite는 aiosqlite
+- ASYNC_DATABASE_URL이 없으면 DATABASE_URL의 드라이버만 바꿔서 사용
+- 엔진은 첫 사용 시 생성 (드라이버가 없는 환경에서도 동기 경로는 그대로 동작)
+- expire_on_commit=False: 커밋 후 속성 접근이 암묵적인 I/O를 일으키지 않도록 함
+"""
+import os
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from .database import DATABASE_URL
+
+
+def to_async_url(url: str) -> str:
+    """동기 DB URL을 비동기 드라이버 URL로 변환합니다."""
+    scheme, separator, rest = url.partition("://")
+    if scheme in ("postgresql", "postgresql+psycopg2", "postgres"):
+        return f"postgresql+asyncpg{separator}{rest}"
+    if scheme in ("sqlite", "sqlite+pysqlite"):
+        return f"sqlite+aiosqlite{separator}{rest}"
+    return url
+
+
+# 비동기 데이터베이스 URL 설정
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+
+_async_engine: Optional[AsyncEngine] = None
+_async_sessionmaker: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """비동기 엔진을 반환합니다. (첫 호출 시 생성)"""
+    global _async_engine
+    if _async_engine is None:
+        if ASYNC_DATABASE_URL.startswith("sqlite"):
+            _async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=False)
+        else:
+            _async_engine = create_async_engine(
+                ASYNC_DATABASE_URL,
+                pool_size=10,
+                max_overflow=20,
+                pool_recycle=3600,
+                pool_pre_ping=True,
+                echo=False
+            )
+    return _async_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    """비동기 세션 팩토리를 반환합니다."""
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        _async_sessionmaker = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False
+        )
+    return _async_sessionmaker
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI Depends에서 사용할 비동기 데이터베이스 세션 의존성
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """애플리케이션 종료 시 비동기 커넥션 풀을 정리합니다."""
+    global _async_engine, _async_sessionmaker
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_sessionmaker = None
@@ -1,5 +1,8 @@
 from .user_dao import UserDAO
 from .mcp_server_dao import MCPServerDAO
 from .analytics_dao import AnalyticsDAO
+from .mcp_server_search_dao import MCPServerSearchDAO
+from .analytics_rollup_dao import AnalyticsRollupDAO
+from .analytics_partition_dao import AnalyticsPartitionDAO
 
-__all__ = ['UserDAO', 'MCPServerDAO', 'AnalyticsDAO']
+__all__ = ['UserDAO', 'MCPServerDAO', 'AnalyticsDAO', 'MCPServerSearchDAO', 'AnalyticsRollupDAO', 'AnalyticsPartitionDAO']
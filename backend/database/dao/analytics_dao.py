@@ -2,20 +2,91 @@
 Analytics DAO - Data Access Layer for Analytics
 
 이 DAO는 분석 이벤트의 저장 및 조회를 담당합니다.
-TimescaleDB continuous aggregates를 사용하여 빠른 집계 쿼리 제공.
+집계 쿼리는 TimescaleDB continuous aggregates가 있으면 그 뷰를,
+없으면 analytics_rollup 서비스가 유지하는 집계 테이블을 사용합니다.
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, desc, distinct
-from typing import Optional, List, Dict, Any
+from sqlalchemy import and_, cast, func, desc, distinct, inspect, literal_column, select, text, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from typing import Optional, List, Dict, Any, Iterator, Sequence
 from datetime import datetime, timedelta
+import logging
+import os
 
 from backend.database.model import (
     AnalyticsEvent,
     EventType,
     HourlyEventsView,
     DailySearchKeywordsView,
-    DailyServerViewsView
+    DailyServerViewsView,
+    AnalyticsHourlyEvents,
+    AnalyticsDailySearchKeywords,
+    AnalyticsDailyServerViews,
+    AnalyticsHourlyVisitorSketch
 )
+from backend.database.model.analytics_event import ANALYTICS_METADATA_JSONB
+from backend.utils.hyperloglog import HyperLogLog
+
+logger = logging.getLogger(__name__)
+
+# 집계 백엔드: auto (자동 감지) | timescale | rollup
+ANALYTICS_BACKEND = os.getenv("ANALYTICS_BACKEND", "auto").lower()
+
+# 데이터베이스 URL별 감지 결과 캐시
+_detected_backends: Dict[str, str] = {}
+
+# 표현식 인덱스가 있는 메타데이터 키와 비교 타입
+INDEXED_METADATA_KEYS = {
+    'mcp_server_id': Integer,
+    'keyword': String,
+}
+
+# PostgreSQL JSONB 표현식 인덱스 (migrations/convert_analytics_metadata_jsonb.sql 과 동일)
+METADATA_INDEX_DDL = (
+    """
+    CREATE INDEX IF NOT EXISTS ix_analytics_events_metadata_server
+    ON analytics_events (((event_metadata->>'mcp_server_id')::integer), created_at)
+    WHERE ((event_metadata->>'mcp_server_id')::integer) IS NOT NULL
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_analytics_events_metadata_keyword
+    ON analytics_events ((event_metadata->>'keyword'), created_at)
+    WHERE (event_metadata->>'keyword') IS NOT NULL
+    """,
+)
+
+
+def resolve_analytics_backend(db: Session) -> str:
+    """
+    집계 쿼리에 사용할 백엔드를 결정합니다.
+
+    ANALYTICS_BACKEND가 지정되어 있으면 그대로 사용하고, auto이면
+    PostgreSQL에 TimescaleDB 확장과 hourly_events continuous aggregate가 있을 때만 timescale,
+    그 외(일반 PostgreSQL, SQLite 등)는 rollup을 사용합니다.
+    """
+    if ANALYTICS_BACKEND in ('timescale', 'rollup'):
+        return ANALYTICS_BACKEND
+
+    bind = db.get_bind()
+    key = str(bind.url)
+    if key not in _detected_backends:
+        backend = 'rollup'
+        if bind.dialect.name == 'postgresql':
+            try:
+                has_extension = db.execute(
+                    text("SELECT 1 FROM pg_extension WHERE extname = 'timescaledb'")
+                ).first() is not None
+                if has_extension and db.execute(text(
+                    "SELECT 1 FROM timescaledb_information.continuous_aggregates "
+                    "WHERE view_name = 'hourly_events'"
+                )).first() is not None:
+                    backend = 'timescale'
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"Failed to detect TimescaleDB, using rollup tables: {e}")
+        _detected_backends[key] = backend
+        logger.info(f"Analytics backend: {backend}")
+    return _detected_backends[key]
 
 
 class AnalyticsDAO:
@@ -23,6 +94,17 @@ class AnalyticsDAO:
 
     def __init__(self, db: Session):
         self.db = db
+        self.backend = resolve_analytics_backend(db)
+
+        # 집계 모델 (뷰와 롤업 테이블은 컬럼 이름이 같음)
+        if self.backend == 'timescale':
+            self.hourly_model = HourlyEventsView
+            self.search_keywords_model = DailySearchKeywordsView
+            self.server_views_model = DailyServerViewsView
+        else:
+            self.hourly_model = AnalyticsHourlyEvents
+            self.search_keywords_model = AnalyticsDailySearchKeywords
+            self.server_views_model = AnalyticsDailyServerViews
 
     # ==================== Event Creation ====================
 
@@ -93,6 +175,108 @@ class AnalyticsDAO:
             AnalyticsEvent.user_id == user_id
         ).order_by(desc(AnalyticsEvent.created_at)).limit(limit).offset(offset).all()
 
+    def _metadata_field(self, key: str):
+        """
+        메타데이터 필드 추출 식
+        PostgreSQL에서는 표현식 인덱스와 같은 (event_metadata->>'key')::type 형태로 생성합니다.
+        """
+        value_type = INDEXED_METADATA_KEYS[key]
+        if self.db.get_bind().dialect.name == 'postgresql':
+            field = AnalyticsEvent.event_metadata.op('->>', return_type=String)(literal_column(f"'{key}'"))
+            return cast(field, value_type) if value_type is Integer else field
+        return cast(func.json_extract(AnalyticsEvent.event_metadata, literal_column(f"'$.{key}'")), value_type)
+
+    def get_events_by_metadata(
+        self,
+        key: str,
+        value: Any,
+        event_types: Optional[List[EventType]] = None,
+        start_date: Optional[datetime] = None,
+        limit: int = 100
+    ) -> List[AnalyticsEvent]:
+        """
+        메타데이터 값(mcp_server_id, keyword)으로 원본 이벤트를 조회합니다.
+        PostgreSQL에서는 JSONB 표현식 인덱스를 사용하므로 전체 스캔이 발생하지 않습니다.
+        """
+        if key not in INDEXED_METADATA_KEYS:
+            raise ValueError(f"Unsupported metadata key: {key}")
+
+        query = self.db.query(AnalyticsEvent).filter(self._metadata_field(key) == value)
+
+        if event_types:
+            query = query.filter(AnalyticsEvent.event_type.in_(event_types))
+        if start_date:
+            query = query.filter(AnalyticsEvent.created_at >= start_date)
+
+        return query.order_by(desc(AnalyticsEvent.created_at)).limit(limit).all()
+
+    def iter_event_chunks(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        event_types: Optional[List[EventType]] = None,
+        chunk_size: int = 5000
+    ) -> Iterator[Sequence[Any]]:
+        """
+        기간 내 원본 이벤트를 chunk_size 행씩 스트리밍합니다.
+        서버 측 커서(yield_per)를 사용하므로 전체 결과를 메모리에 올리지 않습니다.
+
+        Yields:
+            (id, event_type, user_id, referrer, event_metadata, created_at) 행 목록
+        """
+        query = select(
+            AnalyticsEvent.id,
+            AnalyticsEvent.event_type,
+            AnalyticsEvent.user_id,
+            AnalyticsEvent.referrer,
+            AnalyticsEvent.event_metadata,
+            AnalyticsEvent.created_at
+        ).where(
+            AnalyticsEvent.created_at >= start_date,
+            AnalyticsEvent.created_at < end_date
+        )
+
+        if event_types:
+            query = query.where(AnalyticsEvent.event_type.in_(event_types))
+
+        result = self.db.execute(
+            query.order_by(AnalyticsEvent.created_at, AnalyticsEvent.id).execution_options(yield_per=chunk_size)
+        )
+        try:
+            for partition in result.partitions():
+                yield partition
+        finally:
+            result.close()
+
+    def iter_user_event_chunks(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        event_types: List[EventType],
+        chunk_size: int = 10000
+    ) -> Iterator[Sequence[Any]]:
+        """
+        로그인 사용자의 지정 타입 이벤트를 (user_id, event_type, created_at)만 스트리밍합니다.
+        퍼널 분석용이며 (user_id, event_type, created_at) 복합 인덱스 범위를 읽습니다.
+        """
+        query = select(
+            AnalyticsEvent.user_id,
+            AnalyticsEvent.event_type,
+            AnalyticsEvent.created_at
+        ).where(
+            AnalyticsEvent.user_id.isnot(None),
+            AnalyticsEvent.event_type.in_(event_types),
+            AnalyticsEvent.created_at >= start_date,
+            AnalyticsEvent.created_at < end_date
+        )
+
+        result = self.db.execute(query.execution_options(yield_per=chunk_size))
+        try:
+            for partition in result.partitions():
+                yield partition
+        finally:
+            result.close()
+
     # ==================== Aggregation Queries ====================
 
     def count_events_by_type(
@@ -103,24 +287,47 @@ class AnalyticsDAO:
     ) -> int:
         """
         특정 타입의 이벤트 수를 집계합니다.
-        TimescaleDB hourly_events를 사용하여 빠른 집계.
+        시간별 집계(hourly_events 또는 롤업 테이블)를 사용하여 빠른 집계.
         """
         if start_date is None:
             start_date = datetime.utcnow() - timedelta(days=7)
 
-        # Continuous aggregate 사용 (ORM 스타일)
         query = self.db.query(
-            func.coalesce(func.sum(HourlyEventsView.event_count), 0)
+            func.coalesce(func.sum(self.hourly_model.event_count), 0)
         ).filter(
-            HourlyEventsView.event_type == event_type.value,
-            HourlyEventsView.hour >= start_date
+            self.hourly_model.event_type == event_type.value,
+            self.hourly_model.hour >= start_date
         )
 
         if end_date:
-            query = query.filter(HourlyEventsView.hour <= end_date)
+            query = query.filter(self.hourly_model.hour <= end_date)
 
         return query.scalar() or 0
 
+    def count_events_grouped(
+        self,
+        start_date: datetime,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """
+        기간 내 이벤트 타입별 건수를 한 번의 GROUP BY 쿼리로 집계합니다.
+
+        Returns:
+            {"search": 1500, "server_view": 300, ...} (이벤트가 없는 타입은 포함되지 않음)
+        """
+        query = self.db.query(
+            self.hourly_model.event_type,
+            func.sum(self.hourly_model.event_count).label('event_count')
+        ).filter(
+            self.hourly_model.hour >= start_date
+        )
+
+        if end_date:
+            query = query.filter(self.hourly_model.hour <= end_date)
+
+        results = query.group_by(self.hourly_model.event_type).all()
+        return {row.event_type: int(row.event_count or 0) for row in results}
+
     def get_top_search_keywords(
         self,
         limit: int = 10,
@@ -128,22 +335,21 @@ class AnalyticsDAO:
     ) -> List[Dict[str, Any]]:
         """
         가장 많이 검색된 키워드를 조회합니다.
-        TimescaleDB continuous aggregate를 사용하여 빠른 조회.
+        일별 키워드 집계를 사용하여 빠른 조회.
 
         Returns:
             [{"keyword": "weather", "count": 150}, ...]
         """
         start_date = datetime.utcnow() - timedelta(days=days)
 
-        # Continuous aggregate 사용 (ORM 스타일)
         results = self.db.query(
-            DailySearchKeywordsView.keyword,
-            func.sum(DailySearchKeywordsView.search_count).label('count')
+            self.search_keywords_model.keyword,
+            func.sum(self.search_keywords_model.search_count).label('count')
         ).filter(
-            DailySearchKeywordsView.day >= start_date,
-            DailySearchKeywordsView.keyword.isnot(None)
+            self.search_keywords_model.day >= start_date,
+            self.search_keywords_model.keyword.isnot(None)
         ).group_by(
-            DailySearchKeywordsView.keyword
+            self.search_keywords_model.keyword
         ).order_by(
             desc('count')
         ).limit(limit).all()
@@ -157,58 +363,95 @@ class AnalyticsDAO:
     ) -> List[Dict[str, Any]]:
         """
         가장 많이 조회된 서버를 조회합니다.
-        TimescaleDB continuous aggregate를 사용하여 빠른 조회.
+        일별 서버 조회 집계를 사용하여 빠른 조회.
 
         Returns:
             [{"mcp_server_id": 123, "view_count": 500}, ...]
         """
         start_date = datetime.utcnow() - timedelta(days=days)
 
-        # Continuous aggregate 사용 (ORM 스타일)
         results = self.db.query(
-            DailyServerViewsView.mcp_server_id,
-            func.sum(DailyServerViewsView.view_count).label('view_count')
+            self.server_views_model.mcp_server_id,
+            func.sum(self.server_views_model.view_count).label('view_count')
         ).filter(
-            DailyServerViewsView.day >= start_date,
-            DailyServerViewsView.mcp_server_id.isnot(None)
+            self.server_views_model.day >= start_date,
+            self.server_views_model.mcp_server_id.isnot(None)
         ).group_by(
-            DailyServerViewsView.mcp_server_id
+            self.server_views_model.mcp_server_id
         ).order_by(
             desc('view_count')
         ).limit(limit).all()
 
         return [{"mcp_server_id": row.mcp_server_id, "view_count": row.view_count} for row in results]
 
+    def get_daily_server_views(
+        self,
+        start_date: datetime
+    ) -> List[Dict[str, Any]]:
+        """
+        start_date 이후 서버별/일별 조회수를 한 번의 GROUP BY 쿼리로 조회합니다.
+        (조회 유입 경로별 행을 합산, 상위 N개 제한 없이 모든 서버 포함)
+
+        Returns:
+            [{"mcp_server_id": 123, "day": datetime, "view_count": 10}, ...]
+        """
+        results = self.db.query(
+            self.server_views_model.mcp_server_id,
+            self.server_views_model.day,
+            func.sum(self.server_views_model.view_count).label('view_count')
+        ).filter(
+            self.server_views_model.day >= start_date,
+            self.server_views_model.mcp_server_id.isnot(None)
+        ).group_by(
+            self.server_views_model.mcp_server_id,
+            self.server_views_model.day
+        ).all()
+
+        return [
+            {"mcp_server_id": row.mcp_server_id, "day": row.day, "view_count": row.view_count}
+            for row in results
+        ]
+
     def get_unique_visitors_count(
         self,
         days: int = 7
     ) -> Dict[str, int]:
         """
-        고유 방문자 수를 집계합니다.
-        TimescaleDB hourly_events를 사용하여 빠른 집계.
+        고유 방문자 수를 추정합니다.
+        시간별 HyperLogLog 스케치(로그인 사용자 / 비로그인 방문자 지문)를 병합하므로
+        기간 길이와 관계없이 메모리는 스케치 몇 개 분량이고 비용은 시간 버킷 수에 비례합니다. (오차 약 1.6%)
 
         Returns:
-            {"logged_in_users": 50}
+            {"logged_in_users": 50, "anonymous_users": 200, "total_visitors": 250}
         """
         start_date = datetime.utcnow() - timedelta(days=days)
 
-        # Continuous aggregate 사용 (ORM 스타일)
-        # user_id별 고유 카운트를 위해 서브쿼리 사용
-        subquery = self.db.query(
-            distinct(HourlyEventsView.user_id),
-            HourlyEventsView.hour
+        merged: Dict[str, HyperLogLog] = {}
+        rows = self.db.query(
+            AnalyticsHourlyVisitorSketch.visitor_kind,
+            AnalyticsHourlyVisitorSketch.sketch
         ).filter(
-            HourlyEventsView.hour >= start_date,
-            HourlyEventsView.unique_users > 0,
-            HourlyEventsView.user_id.isnot(None)
-        ).subquery()
-
-        logged_in_count = self.db.query(
-            func.count(distinct(subquery.c.user_id))
-        ).scalar() or 0
+            AnalyticsHourlyVisitorSketch.hour >= start_date.replace(minute=0, second=0, microsecond=0)
+        ).yield_per(500)
+
+        for visitor_kind, data in rows:
+            sketch = HyperLogLog.from_bytes(data)
+            if visitor_kind in merged:
+                merged[visitor_kind].merge(sketch)
+            else:
+                merged[visitor_kind] = sketch
+
+        logged_in = merged.get('user')
+        anonymous = merged.get('anonymous')
+        if logged_in and anonymous:
+            total = HyperLogLog(logged_in.precision, bytearray(logged_in.registers)).merge(anonymous).count()
+        else:
+            total = (logged_in or anonymous).count() if (logged_in or anonymous) else 0
 
         return {
-            "logged_in_users": logged_in_count
+            "logged_in_users": logged_in.count() if logged_in else 0,
+            "anonymous_users": anonymous.count() if anonymous else 0,
+            "total_visitors": total
         }
 
     def get_conversion_rate(
@@ -233,3 +476,31 @@ class AnalyticsDAO:
             return 0.0
 
         return min(1.0, to_count / from_count)
+
+    # ==================== PostgreSQL Setup ====================
+
+    def ensure_postgres_metadata_indexes(self) -> bool:
+        """
+        PostgreSQL에서 event_metadata JSONB 표현식 인덱스를 생성합니다. (멱등)
+        컬럼이 아직 TEXT이면 migrations/convert_analytics_metadata_jsonb.sql 적용이 필요합니다.
+
+        Returns:
+            JSONB 메타데이터 인덱스 사용 가능 여부
+        """
+        bind = self.db.get_bind()
+        if bind.dialect.name != 'postgresql' or not ANALYTICS_METADATA_JSONB:
+            return False
+
+        columns = inspect(bind).get_columns(AnalyticsEvent.__tablename__)
+        metadata_column = next((c for c in columns if c['name'] == 'event_metadata'), None)
+        if metadata_column is None or not isinstance(metadata_column['type'], JSONB):
+            logger.warning(
+                "analytics_events.event_metadata is not JSONB; "
+                "run migrations/convert_analytics_metadata_jsonb.sql"
+            )
+            return False
+
+        for ddl in METADATA_INDEX_DDL:
+            self.db.execute(text(ddl))
+        self.db.commit()
+        return True
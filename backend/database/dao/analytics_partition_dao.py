@@ -0,0 +1,78 @@
+"""
+Analytics Partition DAO - analytics_events 월별 파티션 관리
+
+PostgreSQL 선언적 범위 파티셔닝(PARTITION BY RANGE (created_at))으로 전환된
+analytics_events의 파티션을 조회/생성/삭제합니다.
+(전환: migrations/convert_analytics_events_partitioned.sql, TimescaleDB hypertable은 대상 아님)
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from typing import List, Optional, Tuple
+from datetime import datetime
+import re
+
+from backend.database.model import AnalyticsEvent
+
+PARENT_TABLE = AnalyticsEvent.__tablename__
+
+# pg_get_expr(relpartbound) 예: FOR VALUES FROM ('2026-10-01 00:00:00') TO ('2026-11-01 00:00:00')
+_UPPER_BOUND_PATTERN = re.compile(r"TO \('([^']+)'\)")
+
+
+def partition_name(month_start: datetime) -> str:
+    """월별 파티션 테이블 이름 (analytics_events_p2026_10)"""
+    return f"{PARENT_TABLE}_p{month_start.year:04d}_{month_start.month:02d}"
+
+
+class AnalyticsPartitionDAO:
+    """analytics_events 파티션 데이터 접근 객체"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _quote(self, name: str) -> str:
+        return self.db.get_bind().dialect.identifier_preparer.quote(name)
+
+    def is_partitioned(self) -> bool:
+        """analytics_events가 선언적 파티션 테이블인지 확인합니다. (PostgreSQL 전용)"""
+        if self.db.get_bind().dialect.name != 'postgresql':
+            return False
+        return self.db.execute(text(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table)"
+        ), {"table": PARENT_TABLE}).first() is not None
+
+    def list_partitions(self) -> List[Tuple[str, Optional[datetime]]]:
+        """
+        파티션 목록을 조회합니다.
+
+        Returns:
+            [(파티션 이름, 상한 시각), ...] (DEFAULT/MAXVALUE 파티션은 상한 None)
+        """
+        rows = self.db.execute(text("""
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass(:table)
+            ORDER BY c.relname
+        """), {"table": PARENT_TABLE}).all()
+
+        partitions = []
+        for name, bound in rows:
+            match = _UPPER_BOUND_PATTERN.search(bound or '')
+            upper = datetime.fromisoformat(match.group(1)[:19]) if match else None
+            partitions.append((name, upper))
+        return partitions
+
+    def create_month_partition(self, month_start: datetime, month_end: datetime) -> str:
+        """[month_start, month_end) 범위 파티션을 생성합니다. (멱등, 커밋하지 않음)"""
+        name = partition_name(month_start)
+        self.db.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {self._quote(name)} PARTITION OF {self._quote(PARENT_TABLE)} "
+            f"FOR VALUES FROM ('{month_start.isoformat(sep=' ')}') TO ('{month_end.isoformat(sep=' ')}')"
+        ))
+        return name
+
+    def drop_partition(self, name: str) -> None:
+        """파티션을 분리한 뒤 삭제합니다. (DELETE 없이 파일 단위로 제거, 커밋하지 않음)"""
+        self.db.execute(text(f"ALTER TABLE {self._quote(PARENT_TABLE)} DETACH PARTITION {self._quote(name)}"))
+        self.db.execute(text(f"DROP TABLE {self._quote(name)}"))
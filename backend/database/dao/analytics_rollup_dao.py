@@ -0,0 +1,166 @@
+"""
+Analytics Rollup DAO - 집계 테이블 증분 갱신
+
+analytics_events를 워터마크(last_event_id) 이후분만 읽어
+시간별/일별 집계 테이블에 누적 upsert 합니다.
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from typing import Any, Dict, List, Tuple
+from datetime import datetime
+
+from backend.database.model import (
+    AnalyticsEvent,
+    AnalyticsHourlyEvents,
+    AnalyticsDailySearchKeywords,
+    AnalyticsDailyServerViews,
+    AnalyticsHourlyVisitorSketch,
+    AnalyticsTrendingServer,
+    AnalyticsRollupWatermark
+)
+from backend.utils.hyperloglog import HyperLogLog
+
+# 집계 테이블별 (PK 컬럼, 누적 컬럼)
+ROLLUP_TABLES = {
+    AnalyticsHourlyEvents: (('hour', 'event_type', 'user_id'), 'event_count'),
+    AnalyticsDailySearchKeywords: (('day', 'keyword'), 'search_count'),
+    AnalyticsDailyServerViews: (('day', 'mcp_server_id', 'event_type'), 'view_count'),
+}
+
+
+class AnalyticsRollupDAO:
+    """Analytics 집계 테이블 데이터 접근 객체"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ==================== Watermark ====================
+
+    def get_watermark(self, name: str, lock: bool = False) -> int:
+        """워터마크를 조회합니다. lock=True면 트랜잭션 종료까지 행을 잠급니다. (SELECT ... FOR UPDATE)"""
+        query = self.db.query(AnalyticsRollupWatermark).filter(
+            AnalyticsRollupWatermark.name == name
+        )
+        if lock:
+            query = query.with_for_update()
+        watermark = query.first()
+        return watermark.last_event_id if watermark else 0
+
+    def set_watermark(self, name: str, last_event_id: int) -> None:
+        """워터마크를 갱신합니다. (커밋하지 않음 - 집계 upsert와 같은 트랜잭션)"""
+        watermark = self.db.query(AnalyticsRollupWatermark).filter(
+            AnalyticsRollupWatermark.name == name
+        ).first()
+        if watermark is None:
+            watermark = AnalyticsRollupWatermark(name=name)
+            self.db.add(watermark)
+        watermark.last_event_id = last_event_id
+        watermark.updated_at = datetime.utcnow()
+        self.db.flush()
+
+    # ==================== Source Events ====================
+
+    def get_events_after(self, last_event_id: int, limit: int) -> List[Tuple[int, str, Any, str, datetime]]:
+        """워터마크 이후 이벤트를 id 순으로 조회합니다. (id, event_type, user_id, event_metadata, created_at)"""
+        return self.db.query(
+            AnalyticsEvent.id,
+            AnalyticsEvent.event_type,
+            AnalyticsEvent.user_id,
+            AnalyticsEvent.event_metadata,
+            AnalyticsEvent.created_at
+        ).filter(
+            AnalyticsEvent.id > last_event_id
+        ).order_by(AnalyticsEvent.id).limit(limit).all()
+
+    def get_max_event_id(self) -> int:
+        return self.db.query(func.coalesce(func.max(AnalyticsEvent.id), 0)).scalar() or 0
+
+    # ==================== Upsert ====================
+
+    def increment(self, model, counts: Dict[Tuple, int]) -> None:
+        """
+        집계 행의 누적 컬럼에 counts를 더합니다. (없으면 생성)
+
+        PostgreSQL/SQLite는 INSERT ... ON CONFLICT DO UPDATE 한 번으로 처리하고,
+        그 외 DB는 조회 후 갱신합니다. 커밋하지 않습니다.
+        """
+        if not counts:
+            return
+
+        key_columns, count_column = ROLLUP_TABLES[model]
+        rows = [
+            {**dict(zip(key_columns, key)), count_column: count}
+            for key, count in counts.items()
+        ]
+
+        dialect = self.db.get_bind().dialect.name
+        if dialect in ('postgresql', 'sqlite'):
+            if dialect == 'postgresql':
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+
+            table = model.__table__
+            statement = insert(table)
+            statement = statement.on_conflict_do_update(
+                index_elements=list(key_columns),
+                set_={count_column: table.c[count_column] + statement.excluded[count_column]}
+            )
+            self.db.execute(statement, rows)
+            return
+
+        for row in rows:
+            existing = self.db.get(model, tuple(row[column] for column in key_columns))
+            if existing is None:
+                self.db.add(model(**row))
+            else:
+                setattr(existing, count_column, getattr(existing, count_column) + row[count_column])
+        self.db.flush()
+
+    def merge_visitor_sketches(self, sketches: Dict[Tuple[datetime, str], HyperLogLog]) -> None:
+        """
+        (hour, visitor_kind)별 HyperLogLog 스케치를 저장된 스케치에 병합합니다.
+
+        병합은 레지스터별 최대값이라 같은 이벤트를 다시 반영해도 결과가 변하지 않습니다. 커밋하지 않습니다.
+        """
+        for (hour, visitor_kind), sketch in sketches.items():
+            row = self.db.query(AnalyticsHourlyVisitorSketch).filter(
+                AnalyticsHourlyVisitorSketch.hour == hour,
+                AnalyticsHourlyVisitorSketch.visitor_kind == visitor_kind
+            ).with_for_update().first()
+            if row is None:
+                self.db.add(AnalyticsHourlyVisitorSketch(
+                    hour=hour, visitor_kind=visitor_kind, sketch=sketch.to_bytes()
+                ))
+            else:
+                row.sketch = HyperLogLog.from_bytes(row.sketch).merge(sketch).to_bytes()
+                row.updated_at = datetime.utcnow()
+        self.db.flush()
+
+    # ==================== Trending ====================
+
+    def replace_trending_servers(self, window_days: int, comparison_days: int, rankings: List[Dict[str, Any]]) -> None:
+        """해당 기간 조합의 급상승 순위를 통째로 교체합니다. (커밋하지 않음)"""
+        self.db.query(AnalyticsTrendingServer).filter(
+            AnalyticsTrendingServer.window_days == window_days,
+            AnalyticsTrendingServer.comparison_days == comparison_days
+        ).delete(synchronize_session=False)
+
+        computed_at = datetime.utcnow()
+        self.db.add_all([
+            AnalyticsTrendingServer(
+                window_days=window_days,
+                comparison_days=comparison_days,
+                rank=rank,
+                computed_at=computed_at,
+                **ranking
+            )
+            for rank, ranking in enumerate(rankings, start=1)
+        ])
+        self.db.flush()
+
+    def get_trending_servers(self, window_days: int, comparison_days: int, limit: int) -> List[AnalyticsTrendingServer]:
+        return self.db.query(AnalyticsTrendingServer).filter(
+            AnalyticsTrendingServer.window_days == window_days,
+            AnalyticsTrendingServer.comparison_days == comparison_days
+        ).order_by(AnalyticsTrendingServer.rank).limit(limit).all()
@@ -0,0 +1,30 @@
+from typing import Any, List, Optional
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class AsyncBaseDAO:
+    """
+    AsyncSession 기반 DAO 공통 기능
+
+    AsyncSession은 지연 로딩(lazy load)을 할 수 없으므로, 관계가 필요하면
+    쿼리에서 joinedload/selectinload로 함께 불러와야 합니다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _all(self, statement: Select) -> List[Any]:
+        """ORM 엔티티 목록을 조회합니다."""
+        result = await self.db.scalars(statement)
+        return list(result.unique().all())
+
+    async def _first(self, statement: Select) -> Optional[Any]:
+        """첫 번째 ORM 엔티티를 조회합니다."""
+        result = await self.db.scalars(statement.limit(1))
+        return result.unique().first()
+
+    async def _count(self, statement: Select) -> int:
+        """조건에 맞는 행 수를 조회합니다."""
+        return await self.db.scalar(select(func.count()).select_from(statement.subquery())) or 0
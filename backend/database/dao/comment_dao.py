@@ -1,7 +1,8 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc
+from sqlalchemy import desc, select
 from typing import Optional, List, Dict, Any
 from backend.database.model import Comment, User
+from backend.database.dao.async_base_dao import AsyncBaseDAO
 
 class CommentDAO:
     def __init__(self, db: Session):
@@ -84,3 +85,75 @@ class CommentDAO:
         ).first()
         
         return comment is not None
+
+
+class AsyncCommentDAO(AsyncBaseDAO):
+    """CommentDAO의 AsyncSession 버전 (async def 엔드포인트용)"""
+
+    async def create_comment(self, mcp_server_id: int, user_id: int, content: str, rating: float) -> Comment:
+        """새 댓글을 생성합니다."""
+        comment = Comment(
+            mcp_server_id=mcp_server_id,
+            user_id=user_id,
+            content=content,
+            rating=rating
+        )
+
+        self.db.add(comment)
+        await self.db.commit()
+        await self.db.refresh(comment)
+        return comment
+
+    async def get_comments_by_mcp_server(self, mcp_server_id: int, limit: int = None, offset: int = 0) -> List[Comment]:
+        """특정 MCP 서버의 댓글 목록을 조회합니다. (삭제된 댓글도 포함)"""
+        statement = select(Comment).options(
+            joinedload(Comment.user)
+        ).where(Comment.mcp_server_id == mcp_server_id).order_by(desc(Comment.created_at))
+
+        if limit:
+            statement = statement.limit(limit).offset(offset)
+
+        return await self._all(statement)
+
+    async def get_comment_by_id(self, comment_id: int) -> Optional[Comment]:
+        """ID로 댓글을 조회합니다."""
+        return await self._first(select(Comment).options(
+            joinedload(Comment.user)
+        ).where(Comment.id == comment_id))
+
+    async def update_comment(self, comment_id: int, content: str, user_id: int, rating: Optional[float] = None) -> Optional[Comment]:
+        """댓글을 수정합니다. (작성자만 수정 가능)"""
+        comment = await self._first(select(Comment).where(
+            Comment.id == comment_id,
+            Comment.user_id == user_id,
+            Comment.is_deleted == False  # 삭제된 댓글은 수정 불가
+        ))
+
+        if comment:
+            comment.content = content
+            if rating is not None:
+                comment.rating = rating
+            await self.db.commit()
+            await self.db.refresh(comment)
+
+        return comment
+
+    async def delete_comment(self, comment_id: int, user_id: int) -> bool:
+        """댓글을 소프트 삭제합니다. (작성자만 삭제 가능)"""
+        comment = await self._first(select(Comment).where(
+            Comment.id == comment_id,
+            Comment.user_id == user_id,
+            Comment.is_deleted == False  # 이미 삭제된 댓글은 다시 삭제 불가
+        ))
+
+        if comment:
+            comment.content = None  # 내용을 NULL로 설정
+            comment.is_deleted = True  # 삭제 표시
+            await self.db.commit()
+            return True
+
+        return False
+
+    async def get_comment_count_by_mcp_server(self, mcp_server_id: int) -> int:
+        """특정 MCP 서버의 댓글 수를 조회합니다."""
+        return await self._count(select(Comment.id).where(Comment.mcp_server_id == mcp_server_id))
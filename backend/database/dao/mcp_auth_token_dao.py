@@ -2,7 +2,7 @@
 Data Access Object for MCP Auth Tokens
 """
 
-from typing import Optional
+from typing import Dict, Optional
 from sqlalchemy.orm import Session
 from datetime import datetime
 import logging
@@ -142,3 +142,50 @@ class MCPAuthTokenDAO:
         return self.db.query(MCPAuthToken).filter(
             MCPAuthToken.user_id == user_id
         ).all()
+
+    def get_user_tokens_decrypted(self, user_id: int) -> Dict[int, Optional[str]]:
+        """
+        Get all decrypted tokens for a user in one batch
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Dict of MCP Server ID -> plain text token (None if it cannot be decrypted)
+        """
+        records = self.get_user_tokens(user_id)
+        decrypted = TokenEncryption.decrypt_tokens(record.token_encrypted for record in records)
+        return {record.mcp_server_id: token for record, token in zip(records, decrypted)}
+
+    def rotate_tokens(self, batch_size: int = 500) -> int:
+        """
+        Re-encrypt all stored tokens with the primary key
+        Run after changing TOKEN_ENCRYPTION_SECRET, before removing the old secret
+        from TOKEN_ENCRYPTION_PREVIOUS_SECRETS
+
+        Args:
+            batch_size: Number of records committed per batch
+
+        Returns:
+            Number of rotated tokens
+        """
+        rotated = 0
+        last_id = 0
+        while True:
+            records = self.db.query(MCPAuthToken).filter(
+                MCPAuthToken.id > last_id
+            ).order_by(MCPAuthToken.id).limit(batch_size).all()
+            if not records:
+                break
+
+            for record in records:
+                try:
+                    record.token_encrypted = TokenEncryption.rotate_token(record.token_encrypted)
+                    rotated += 1
+                except Exception as e:
+                    logger.error(f"Failed to rotate token {record.id}: {str(e)}")
+            last_id = records[-1].id
+            self.db.commit()
+
+        logger.info(f"Rotated {rotated} auth tokens")
+        return rotated
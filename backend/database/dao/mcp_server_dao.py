@@ -1,23 +1,18 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, and_, func, desc
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import or_, and_, case, func, desc, select
 from typing import Optional, List, Dict, Any
-from backend.database.model import MCPServer, MCPServerTool, MCPServerProperty, Tag, User, UserFavorite
+from datetime import datetime, timezone
+from backend.database.model import MCPServer, MCPServerTool, MCPServerProperty, MCPServerPrompt, Tag, User, UserFavorite
+from backend.database.dao.mcp_server_search_dao import MCPServerSearchDAO
 
 class MCPServerDAO:
     def __init__(self, db: Session):
         self.db = db
+        self.search_dao = MCPServerSearchDAO(db)
     
     def create_mcp_server(self, mcp_server_data: Dict[str, Any], owner_id: int, tags: List[str] = None) -> MCPServer:
         """새 MCP 서버를 생성합니다."""
-        tag_objects = []
-        if tags:
-            for tag_name in tags:
-                tag = self.db.query(Tag).filter(Tag.name == tag_name).first()
-                if not tag:
-                    tag = Tag(name=tag_name)
-                    self.db.add(tag)
-                    self.db.flush()
-                tag_objects.append(tag)
+        tag_objects = self._get_or_create_tags(tags or [])
         
         mcp_server = MCPServer(
             name=mcp_server_data['name'],
@@ -33,10 +28,32 @@ class MCPServerDAO:
         )
         
         self.db.add(mcp_server)
+        self.db.flush()
+        self.search_dao.index_mcp_server(mcp_server)
         self.db.commit()
         self.db.refresh(mcp_server)
         return mcp_server
     
+    def _get_or_create_tags(self, tag_names: List[str]) -> List[Tag]:
+        """
+        태그 이름 목록을 Tag 객체로 변환합니다. (입력 순서 유지, 중복 제거)
+
+        기존 태그는 IN 쿼리 한 번으로 조회하고, 없는 태그는 세션에만 추가하여
+        서버와 함께 flush 되도록 합니다. (태그별 SELECT/flush 없음)
+        """
+        names = list(dict.fromkeys(tag_names))
+        if not names:
+            return []
+        existing = {tag.name: tag for tag in self.db.query(Tag).filter(Tag.name.in_(names)).all()}
+        tag_objects = []
+        for name in names:
+            tag = existing.get(name)
+            if tag is None:
+                tag = Tag(name=name)
+                self.db.add(tag)
+            tag_objects.append(tag)
+        return tag_objects
+
     def get_mcp_servers(
         self,
         status: str = 'approved',
@@ -63,6 +80,40 @@ class MCPServerDAO:
             joinedload(MCPServer.tools)
         )
 
+        favorites_subquery = None
+        if sort == 'favorites':
+            favorites_subquery = self._favorites_count_subquery()
+            query = query.outerjoin(
+                favorites_subquery, MCPServer.id == favorites_subquery.c.mcp_server_id
+            )
+
+        query = self._apply_list_conditions(
+            query, favorites_subquery, status, category, sort, order, limit, offset
+        )
+        return query.all()
+
+    def _favorites_count_subquery(self):
+        """MCP 서버별 즐겨찾기 수 서브쿼리를 생성합니다."""
+        return self.db.query(
+            UserFavorite.mcp_server_id,
+            func.count(UserFavorite.id).label('favorites_count')
+        ).group_by(UserFavorite.mcp_server_id).subquery()
+
+    def _apply_list_conditions(
+        self,
+        query,
+        favorites_subquery,
+        status: str,
+        category: Optional[str],
+        sort: str,
+        order: str,
+        limit: int,
+        offset: int
+    ):
+        """
+        목록 조회의 필터/정렬/페이지 조건을 적용합니다.
+        (get_mcp_servers와 get_mcp_servers_versions가 동일한 결과 집합을 보도록 공유)
+        """
         # 상태 필터
         query = query.filter(MCPServer.status == status)
 
@@ -73,15 +124,6 @@ class MCPServerDAO:
         # 정렬 처리
         if sort == 'favorites':
             # 즐겨찾기 수 기준 정렬
-            favorites_subquery = self.db.query(
-                UserFavorite.mcp_server_id,
-                func.count(UserFavorite.id).label('favorites_count')
-            ).group_by(UserFavorite.mcp_server_id).subquery()
-
-            query = query.outerjoin(
-                favorites_subquery, MCPServer.id == favorites_subquery.c.mcp_server_id
-            )
-
             if order == 'desc':
                 query = query.order_by(
                     desc(favorites_subquery.c.favorites_count),
@@ -106,8 +148,82 @@ class MCPServerDAO:
         if limit:
             query = query.limit(limit).offset(offset)
 
+        return query
+
+    def _version_columns(self, favorites_subquery):
+        """ETag 계산에 사용하는 가벼운 버전 컬럼 목록입니다."""
+        return (
+            MCPServer.id,
+            MCPServer.updated_at,
+            MCPServer.created_at,
+            MCPServer.last_health_check,
+            func.coalesce(favorites_subquery.c.favorites_count, 0).label('favorites_count'),
+            User.updated_at.label('owner_updated_at')
+        )
+
+    def get_mcp_servers_versions(
+        self,
+        status: str = 'approved',
+        category: Optional[str] = None,
+        sort: str = 'favorites',
+        order: str = 'desc',
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[Any]:
+        """
+        get_mcp_servers와 동일한 조건으로 각 서버의 버전 정보만 조회합니다.
+        (ETag 계산 및 favorites_count 일괄 조회용, 관계 로딩 없음)
+
+        Returns:
+            (id, updated_at, created_at, last_health_check, favorites_count, owner_updated_at) 행 목록
+        """
+        favorites_subquery = self._favorites_count_subquery()
+        query = self.db.query(*self._version_columns(favorites_subquery)).outerjoin(
+            favorites_subquery, MCPServer.id == favorites_subquery.c.mcp_server_id
+        ).outerjoin(User, MCPServer.owner_id == User.id)
+
+        query = self._apply_list_conditions(
+            query, favorites_subquery, status, category, sort, order, limit, offset
+        )
         return query.all()
 
+    def get_mcp_servers_versions_by_owner(self, owner_id: int, status: str = 'approved') -> List[Any]:
+        """특정 사용자가 등록한 서버들의 버전 정보를 조회합니다. (ETag 계산용)"""
+        favorites_subquery = self._favorites_count_subquery()
+        return self.db.query(*self._version_columns(favorites_subquery)).outerjoin(
+            favorites_subquery, MCPServer.id == favorites_subquery.c.mcp_server_id
+        ).outerjoin(User, MCPServer.owner_id == User.id).filter(
+            and_(MCPServer.owner_id == owner_id, MCPServer.status == status)
+        ).order_by(MCPServer.id).all()
+
+    def get_mcp_server_version(self, mcp_server_id: int) -> Optional[Any]:
+        """
+        단일 서버의 버전 정보를 조회합니다. (상세 조회 ETag 계산용)
+
+        updated_at 외에 도구 수/최대 ID를 함께 반환하여, 같은 초 안에 도구가
+        재등록된 경우에도 ETag가 변경되도록 합니다.
+        """
+        favorites_subquery = self._favorites_count_subquery()
+        tools_subquery = self.db.query(
+            MCPServerTool.mcp_server_id,
+            func.count(MCPServerTool.id).label('tools_count'),
+            func.max(MCPServerTool.id).label('tools_max_id')
+        ).filter(
+            MCPServerTool.mcp_server_id == mcp_server_id
+        ).group_by(MCPServerTool.mcp_server_id).subquery()
+
+        return self.db.query(
+            *self._version_columns(favorites_subquery),
+            func.coalesce(tools_subquery.c.tools_count, 0).label('tools_count'),
+            tools_subquery.c.tools_max_id
+        ).outerjoin(
+            favorites_subquery, MCPServer.id == favorites_subquery.c.mcp_server_id
+        ).outerjoin(
+            tools_subquery, MCPServer.id == tools_subquery.c.mcp_server_id
+        ).outerjoin(
+            User, MCPServer.owner_id == User.id
+        ).filter(MCPServer.id == mcp_server_id).first()
+
     def get_mcp_server_by_id(self, mcp_server_id: int) -> Optional[MCPServer]:
         """ID로 MCP 서버를 조회합니다."""
         return self.db.query(MCPServer).filter(MCPServer.id == mcp_server_id).first()
@@ -143,35 +259,29 @@ class MCPServerDAO:
         ).filter(MCPServer.status == 'pending').order_by(MCPServer.created_at.desc()).all()
     
     def search_mcp_servers(self, keyword: str, status: str = 'approved') -> List[MCPServer]:
-        """키워드로 MCP 서버를 검색합니다. (이름, 설명, 태그에서 검색)"""
-        # 태그에서 키워드를 포함하는 서버 ID 찾기
-        servers_with_matching_tags = self.db.query(MCPServer.id).join(
-            MCPServer.tags
-        ).filter(
-            and_(
-                MCPServer.status == status,
-                Tag.name.ilike(f'%{keyword}%')
-            )
-        ).distinct()
-
-        matching_tag_ids = [s.id for s in servers_with_matching_tags.all()]
+        """
+        키워드로 MCP 서버를 검색합니다. (이름 > 태그 > 설명 > 도구 이름 가중치, 관련도 순 정렬)
 
-        # 이름, 설명 또는 태그에서 키워드가 있는 서버 조회
+        검색 인덱스(mcp_server_search_index)의 순위 서브쿼리와 조인하므로
+        태그 일치 서버 ID를 별도로 조회하지 않습니다.
+        """
+        ranked_query = self.search_dao.ranked_ids_query(keyword, status)
         query = self.db.query(MCPServer).options(
             joinedload(MCPServer.owner),
             joinedload(MCPServer.tags)
-        ).filter(
-            and_(
-                MCPServer.status == status,
-                or_(
-                    MCPServer.name.ilike(f'%{keyword}%'),
-                    MCPServer.description.ilike(f'%{keyword}%'),
-                    MCPServer.id.in_(matching_tag_ids) if matching_tag_ids else False
-                )
-            )
-        ).order_by(MCPServer.created_at.desc())
+        )
 
-        return query.all()
+        if ranked_query is None:
+            # 검색 가능한 토큰이 없으면 상태 조건만 적용 (기존 '%%' 검색과 동일)
+            return query.filter(MCPServer.status == status).order_by(MCPServer.created_at.desc()).all()
+
+        ranked = ranked_query.subquery()
+        return query.join(
+            ranked, MCPServer.id == ranked.c.mcp_server_id
+        ).order_by(
+            desc(ranked.c.rank),
+            MCPServer.created_at.desc()
+        ).all()
     
     def get_mcp_servers_by_category(self, category: str, status: str = 'approved') -> List[MCPServer]:
         """카테고리별 MCP 서버 목록을 조회합니다."""
@@ -199,14 +309,11 @@ class MCPServerDAO:
             MCPServer.status == status
         ]
 
-        # keyword가 있으면 추가 필터
-        if keyword:
-            conditions.append(
-                or_(
-                    MCPServer.name.ilike(f'%{keyword}%'),
-                    MCPServer.description.ilike(f'%{keyword}%')
-                )
-            )
+        # keyword가 있으면 검색 인덱스로 추가 필터
+        ranked_query = self.search_dao.ranked_ids_query(keyword, status) if keyword else None
+        if ranked_query is not None:
+            ranked = ranked_query.subquery()
+            conditions.append(MCPServer.id.in_(select(ranked.c.mcp_server_id)))
 
         return query.filter(and_(*conditions)).distinct().order_by(MCPServer.created_at.desc()).all()
     
@@ -225,16 +332,14 @@ class MCPServerDAO:
             if isinstance(tags, str):
                 tags = [tag.strip() for tag in tags.split(',') if tag.strip()]
             
-            mcp_server.tags.clear()
-            
-            for tag_name in tags:
-                tag = self.db.query(Tag).filter(Tag.name == tag_name).first()
-                if not tag:
-                    tag = Tag(name=tag_name)
-                    self.db.add(tag)
-                    self.db.flush()
-                mcp_server.tags.append(tag)
+            mcp_server.tags = self._get_or_create_tags(tags)
         
+        # 태그/도구만 변경된 경우에도 ETag가 바뀌도록 updated_at 갱신 (마이크로초 단위)
+        mcp_server.updated_at = datetime.now(timezone.utc)
+
+        self.db.flush()
+        self.db.expire(mcp_server, ['tools'])
+        self.search_dao.index_mcp_server(mcp_server)
         self.db.commit()
         self.db.refresh(mcp_server)
         return mcp_server
@@ -244,6 +349,7 @@ class MCPServerDAO:
         mcp_server = self.get_mcp_server_by_id(mcp_server_id)
         if mcp_server:
             self.db.query(UserFavorite).filter(UserFavorite.mcp_server_id == mcp_server_id).delete()
+            self.search_dao.remove_mcp_server(mcp_server_id)
             
             self.db.delete(mcp_server)
             self.db.commit()
@@ -275,6 +381,10 @@ class MCPServerDAO:
                 )
                 self.db.add(param)
         
+        # 도구 이름을 검색 인덱스에 반영
+        self.db.flush()
+        self.db.expire(mcp_server, ['tools'])
+        self.search_dao.index_mcp_server(mcp_server)
         self.db.commit()
         return True
     
@@ -284,6 +394,108 @@ class MCPServerDAO:
             joinedload(MCPServer.tools).joinedload(MCPServerTool.parameters)
         ).filter(MCPServer.id == mcp_server_id).first()
     
+    def get_mcp_servers_with_details(
+        self,
+        status: Optional[str] = 'approved',
+        mcp_server_ids: Optional[List[int]] = None
+    ) -> List[MCPServer]:
+        """
+        응답 직렬화에 필요한 모든 관계(소유자, 태그, 도구/파라미터, 프롬프트/인자, 리소스)를
+        selectinload로 한 번에 로딩하여 조회합니다. (인메모리 인덱스 구축용)
+        """
+        query = self.db.query(MCPServer).options(
+            selectinload(MCPServer.owner),
+            selectinload(MCPServer.tags),
+            selectinload(MCPServer.tools).selectinload(MCPServerTool.parameters),
+            selectinload(MCPServer.prompts).selectinload(MCPServerPrompt.arguments),
+            selectinload(MCPServer.resources)
+        )
+        if status:
+            query = query.filter(MCPServer.status == status)
+        if mcp_server_ids is not None:
+            query = query.filter(MCPServer.id.in_(mcp_server_ids))
+        return query.order_by(MCPServer.id).all()
+
+    def get_catalog_version(self) -> tuple:
+        """
+        카탈로그 전체의 버전 값을 한 번의 집계 쿼리로 조회합니다. (인메모리 인덱스 최신 여부 확인용)
+        다른 프로세스에서 생성/수정/승인/거절/삭제가 일어나면 값이 달라집니다.
+        (승인 서버 수/ID 합계는 updated_at 해상도와 무관하게 상태 변경을 감지하기 위함)
+        소유자 프로필 변경도 응답 스냅샷에 영향을 주므로 소유자의 최대 updated_at을 포함합니다.
+
+        Returns:
+            (서버 수, 최대 ID, 승인 서버 수, 승인 서버 ID 합계, 최대 updated_at, 최대 last_health_check,
+             소유자 최대 updated_at)
+        """
+        approved_id = case((MCPServer.status == 'approved', MCPServer.id), else_=None)
+        row = self.db.query(
+            func.count(MCPServer.id),
+            func.max(MCPServer.id),
+            func.count(approved_id),
+            func.sum(approved_id),
+            func.max(MCPServer.updated_at),
+            func.max(MCPServer.last_health_check),
+            func.max(User.updated_at)
+        ).outerjoin(User, MCPServer.owner_id == User.id).one()
+        return tuple(row)
+
+    def get_mcp_servers_by_ids(self, mcp_server_ids: List[int], status: Optional[str] = None) -> List[MCPServer]:
+        """
+        ID 목록 순서대로 MCP 서버를 조회합니다. (목록 응답용 관계 포함, 단일 쿼리)
+        status를 지정하면 해당 상태가 아닌 서버는 결과에서 제외됩니다.
+        """
+        if not mcp_server_ids:
+            return []
+        query = self.db.query(MCPServer).options(
+            joinedload(MCPServer.owner),
+            joinedload(MCPServer.tags),
+            joinedload(MCPServer.tools)
+        ).filter(MCPServer.id.in_(mcp_server_ids))
+        if status:
+            query = query.filter(MCPServer.status == status)
+        mcp_servers = query.all()
+        by_id = {mcp_server.id: mcp_server for mcp_server in mcp_servers}
+        return [by_id[mcp_server_id] for mcp_server_id in mcp_server_ids if mcp_server_id in by_id]
+
+    def get_favorites_counts(self, mcp_server_ids: Optional[List[int]] = None) -> Dict[int, int]:
+        """서버별 즐겨찾기 수를 한 번의 GROUP BY 쿼리로 조회합니다. (즐겨찾기가 없는 서버는 제외)"""
+        query = self.db.query(
+            UserFavorite.mcp_server_id,
+            func.count(UserFavorite.id)
+        )
+        if mcp_server_ids is not None:
+            query = query.filter(UserFavorite.mcp_server_id.in_(mcp_server_ids))
+        return dict(query.group_by(UserFavorite.mcp_server_id).all())
+
+    def get_tag_usage_counts(self, status: str = 'approved') -> Dict[str, int]:
+        """태그별 사용 서버 수를 조회합니다."""
+        rows = self.db.query(
+            Tag.name,
+            func.count(MCPServer.id)
+        ).join(
+            MCPServer.tags
+        ).filter(
+            MCPServer.status == status
+        ).group_by(Tag.name).all()
+        return dict(rows)
+
+    def get_mcp_servers_with_tags_and_tools(
+        self,
+        status: Optional[str] = 'approved',
+        mcp_server_ids: Optional[List[int]] = None
+    ) -> List[MCPServer]:
+        """태그, 도구, 소유자(인덱스 버전 비교용)만 selectinload로 함께 로딩하여 서버 목록을 조회합니다."""
+        query = self.db.query(MCPServer).options(
+            selectinload(MCPServer.owner),
+            selectinload(MCPServer.tags),
+            selectinload(MCPServer.tools)
+        )
+        if status:
+            query = query.filter(MCPServer.status == status)
+        if mcp_server_ids is not None:
+            query = query.filter(MCPServer.id.in_(mcp_server_ids))
+        return query.order_by(MCPServer.id).all()
+
     def get_mcp_server_favorites_count(self, mcp_server_id: int) -> int:
         """특정 MCP 서버의 즐겨찾기 수를 조회합니다."""
         return self.db.query(UserFavorite).filter(
@@ -0,0 +1,219 @@
+"""
+MCP Server Search DAO - 전문 검색(Full-text search) 데이터 접근 계층
+
+mcp_server_search_index 테이블을 관리하고 관련도 순으로 정렬된 검색 결과를 제공합니다.
+
+- PostgreSQL: 가중치 tsvector 생성 컬럼(search_vector) + GIN 인덱스
+  (name=A > tags=B > description=C > tool names=D), ts_rank로 순위 계산
+- 그 외(SQLite 테스트 엔진 등): 정규화된 텍스트 컬럼에 대한 가중치 LIKE 점수
+"""
+import re
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, case, desc, func, inspect, literal_column, or_, select, text
+from sqlalchemy.orm import Session
+
+from backend.database.model import MCPServer, MCPServerSearchIndex
+
+# PostgreSQL 텍스트 검색 설정 (한국어/영어 혼합 데이터이므로 형태소 분석 없는 simple 사용)
+TS_CONFIG = 'simple'
+
+SEARCH_VECTOR_COLUMN = 'search_vector'
+
+# 폴백 검색 필드 가중치 (tsvector의 A/B/C/D 가중치와 같은 순서)
+FALLBACK_WEIGHTS = (
+    ('name_text', 8),
+    ('tags_text', 4),
+    ('description_text', 2),
+    ('tools_text', 1),
+)
+
+# 검색어 토큰화 (유니코드 단어 문자)
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# 엔진별 tsvector 컬럼 존재 여부 캐시 (최초 1회만 검사)
+_tsvector_support: Dict[str, bool] = {}
+
+
+def tokenize_query(keyword: Optional[str]) -> List[str]:
+    """검색어를 소문자 토큰 목록으로 변환합니다."""
+    if not keyword:
+        return []
+    return _TOKEN_PATTERN.findall(keyword.lower())
+
+
+def _normalize(value: Optional[str]) -> str:
+    return ' '.join((value or '').lower().split())
+
+
+def _escape_like(term: str) -> str:
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class MCPServerSearchDAO:
+    """MCP 서버 전문 검색 데이터 접근 객체"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ==================== Index Maintenance ====================
+
+    def index_mcp_server(self, mcp_server: MCPServer) -> None:
+        """
+        MCP 서버의 검색 인덱스 행을 생성하거나 갱신합니다.
+        (commit하지 않으므로 호출자의 트랜잭션에 포함됩니다)
+        """
+        entry = self.db.get(MCPServerSearchIndex, mcp_server.id)
+        if entry is None:
+            entry = MCPServerSearchIndex(mcp_server_id=mcp_server.id)
+            self.db.add(entry)
+
+        entry.name_text = _normalize(mcp_server.name)
+        entry.tags_text = _normalize(' '.join(tag.name for tag in mcp_server.tags))
+        entry.description_text = _normalize(mcp_server.description)
+        entry.tools_text = _normalize(' '.join(tool.name for tool in mcp_server.tools))
+
+    def remove_mcp_server(self, mcp_server_id: int) -> None:
+        """검색 인덱스 행을 삭제합니다. (commit하지 않음)"""
+        self.db.query(MCPServerSearchIndex).filter(
+            MCPServerSearchIndex.mcp_server_id == mcp_server_id
+        ).delete(synchronize_session=False)
+
+    def is_index_stale(self) -> bool:
+        """인덱스 행 수가 서버 수와 다른지 확인합니다. (백필 필요 여부)"""
+        servers_count = self.db.query(func.count(MCPServer.id)).scalar() or 0
+        index_count = self.db.query(func.count(MCPServerSearchIndex.mcp_server_id)).scalar() or 0
+        return servers_count != index_count
+
+    def rebuild_index(self, batch_size: int = 500) -> int:
+        """
+        전체 검색 인덱스를 재구성합니다.
+
+        Returns:
+            인덱싱된 서버 수
+        """
+        self.db.query(MCPServerSearchIndex).delete(synchronize_session=False)
+
+        indexed = 0
+        last_id = 0
+        while True:
+            servers = self.db.query(MCPServer).filter(
+                MCPServer.id > last_id
+            ).order_by(MCPServer.id).limit(batch_size).all()
+            if not servers:
+                break
+            for mcp_server in servers:
+                self.index_mcp_server(mcp_server)
+            self.db.flush()
+            indexed += len(servers)
+            last_id = servers[-1].id
+
+        self.db.commit()
+        return indexed
+
+    # ==================== PostgreSQL Setup ====================
+
+    def supports_tsvector(self) -> bool:
+        """현재 엔진에서 search_vector(tsvector) 컬럼을 사용할 수 있는지 확인합니다."""
+        bind = self.db.get_bind()
+        if bind.dialect.name != 'postgresql':
+            return False
+
+        key = str(bind.url)
+        if key not in _tsvector_support:
+            columns = inspect(bind).get_columns(MCPServerSearchIndex.__tablename__)
+            _tsvector_support[key] = any(c['name'] == SEARCH_VECTOR_COLUMN for c in columns)
+        return _tsvector_support[key]
+
+    def ensure_postgres_search_objects(self) -> bool:
+        """
+        PostgreSQL에서 가중치 tsvector 생성 컬럼과 GIN 인덱스를 생성합니다. (멱등)
+        migrations/add_mcp_server_search_index.sql 과 동일한 DDL입니다.
+
+        Returns:
+            tsvector 검색 사용 가능 여부
+        """
+        bind = self.db.get_bind()
+        if bind.dialect.name != 'postgresql':
+            return False
+
+        self.db.execute(text(f"""
+            ALTER TABLE mcp_server_search_index
+            ADD COLUMN IF NOT EXISTS {SEARCH_VECTOR_COLUMN} tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('{TS_CONFIG}', coalesce(name_text, '')), 'A') ||
+                setweight(to_tsvector('{TS_CONFIG}', coalesce(tags_text, '')), 'B') ||
+                setweight(to_tsvector('{TS_CONFIG}', coalesce(description_text, '')), 'C') ||
+                setweight(to_tsvector('{TS_CONFIG}', coalesce(tools_text, '')), 'D')
+            ) STORED
+        """))
+        self.db.execute(text(f"""
+            CREATE INDEX IF NOT EXISTS ix_mcp_server_search_vector
+            ON mcp_server_search_index USING GIN ({SEARCH_VECTOR_COLUMN})
+        """))
+        self.db.commit()
+
+        _tsvector_support.pop(str(bind.url), None)
+        return self.supports_tsvector()
+
+    # ==================== Search ====================
+
+    def ranked_ids_query(self, keyword: str, status: Optional[str] = 'approved'):
+        """
+        검색어와 일치하는 (mcp_server_id, rank) SELECT 문을 생성합니다.
+        다른 쿼리에서 서브쿼리로 조인할 수 있으며, 모든 검색어 토큰이 일치해야 합니다. (AND)
+
+        Returns:
+            Select 객체, 검색어 토큰이 없으면 None
+        """
+        terms = tokenize_query(keyword)
+        if not terms:
+            return None
+
+        index = MCPServerSearchIndex.__table__
+        if self.supports_tsvector():
+            # 각 토큰을 접두사 검색(term:*)으로 AND 결합
+            ts_query = func.to_tsquery(TS_CONFIG, ' & '.join(f'{term}:*' for term in terms))
+            vector = literal_column(f'{index.name}.{SEARCH_VECTOR_COLUMN}')
+            rank = func.ts_rank(vector, ts_query)
+            match = vector.op('@@')(ts_query)
+        else:
+            term_scores = []
+            term_matches = []
+            for term in terms:
+                pattern = f'%{_escape_like(term)}%'
+                conditions = [
+                    (index.c[column].like(pattern, escape='\\'), weight)
+                    for column, weight in FALLBACK_WEIGHTS
+                ]
+                term_matches.append(or_(*(condition for condition, _ in conditions)))
+                term_scores.extend(
+                    case((condition, weight), else_=0) for condition, weight in conditions
+                )
+            rank = sum(term_scores[1:], term_scores[0])
+            match = and_(*term_matches)
+
+        query = select(
+            index.c.mcp_server_id.label('mcp_server_id'),
+            rank.label('rank')
+        ).where(match)
+
+        if status:
+            query = query.join(MCPServer.__table__, MCPServer.id == index.c.mcp_server_id).where(
+                MCPServer.status == status
+            )
+        return query
+
+    def search_ids(self, keyword: str, status: Optional[str] = 'approved', limit: Optional[int] = None) -> List[int]:
+        """관련도 순으로 정렬된 MCP 서버 ID 목록을 반환합니다."""
+        query = self.ranked_ids_query(keyword, status)
+        if query is None:
+            return []
+
+        ranked = query.subquery()
+        ordered = select(ranked.c.mcp_server_id).order_by(
+            desc(ranked.c.rank), desc(ranked.c.mcp_server_id)
+        )
+        if limit:
+            ordered = ordered.limit(limit)
+        return [row.mcp_server_id for row in self.db.execute(ordered)]
@@ -1,7 +1,8 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
+from sqlalchemy import and_, delete, desc, select, update
 from typing import Optional, List
 from backend.database.model.notification import Notification
+from backend.database.dao.async_base_dao import AsyncBaseDAO
 
 class NotificationDAO:
     def __init__(self, db: Session):
@@ -96,3 +97,79 @@ class NotificationDAO:
         ).delete()
         self.db.commit()
         return count
+
+
+class AsyncNotificationDAO(AsyncBaseDAO):
+    """NotificationDAO의 AsyncSession 버전 (async def 엔드포인트용)"""
+
+    async def create_notification(
+        self,
+        user_id: int,
+        notification_type: str,
+        message: str,
+        mcp_server_id: Optional[int] = None,
+        related_user_id: Optional[int] = None
+    ) -> Notification:
+        """새 알림을 생성합니다."""
+        notification = Notification(
+            user_id=user_id,
+            type=notification_type,
+            message=message,
+            mcp_server_id=mcp_server_id,
+            related_user_id=related_user_id,
+            is_read=False
+        )
+        self.db.add(notification)
+        await self.db.commit()
+        await self.db.refresh(notification)
+        return notification
+
+    async def get_user_notifications(
+        self,
+        user_id: int,
+        limit: int = 20,
+        offset: int = 0,
+        unread_only: bool = False
+    ) -> List[Notification]:
+        """사용자의 알림 목록을 조회합니다."""
+        statement = select(Notification).where(Notification.user_id == user_id)
+
+        if unread_only:
+            statement = statement.where(Notification.is_read == False)
+
+        return await self._all(statement.order_by(desc(Notification.created_at)).limit(limit).offset(offset))
+
+    async def get_unread_count(self, user_id: int) -> int:
+        """읽지 않은 알림 개수를 조회합니다."""
+        return await self._count(select(Notification.id).where(
+            and_(Notification.user_id == user_id, Notification.is_read == False)
+        ))
+
+    async def mark_as_read(self, notification_id: int, user_id: int) -> bool:
+        """알림을 읽음으로 표시합니다."""
+        result = await self.db.execute(
+            update(Notification)
+            .where(and_(Notification.id == notification_id, Notification.user_id == user_id))
+            .values(is_read=True)
+        )
+        await self.db.commit()
+        return result.rowcount > 0
+
+    async def mark_all_as_read(self, user_id: int) -> int:
+        """사용자의 모든 알림을 읽음으로 표시합니다."""
+        result = await self.db.execute(
+            update(Notification)
+            .where(and_(Notification.user_id == user_id, Notification.is_read == False))
+            .values(is_read=True)
+        )
+        await self.db.commit()
+        return result.rowcount
+
+    async def delete_notification(self, notification_id: int, user_id: int) -> bool:
+        """알림을 삭제합니다."""
+        result = await self.db.execute(
+            delete(Notification)
+            .where(and_(Notification.id == notification_id, Notification.user_id == user_id))
+        )
+        await self.db.commit()
+        return result.rowcount > 0
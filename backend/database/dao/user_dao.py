@@ -1,11 +1,8 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_, func, desc
 from typing import Optional, List, Dict, Any
-from backend.database.model import User, MCPServer, UserFavorite
-from passlib.context import CryptContext
-
-# bcrypt 버전 문제 해결을 위한 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__default_rounds=12)
+from backend.database.model import User, MCPServer, MCPServerTool, MCPServerPrompt, UserFavorite
+from backend.utils.password_hashing import password_hasher
 
 class UserDAO:
     def __init__(self, db: Session):
@@ -13,7 +10,7 @@ class UserDAO:
     
     def create_user(self, username: str, email: str, password: str, nickname: str = None, is_admin: str = "user") -> User:
         """새 사용자를 생성합니다."""
-        hashed_password = pwd_context.hash(password)
+        hashed_password = password_hasher.hash(password)
         # nickname이 제공되지 않으면 username을 사용
         if nickname is None:
             nickname = username
@@ -43,11 +40,19 @@ class UserDAO:
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """비밀번호를 검증합니다."""
-        try:
-            return pwd_context.verify(plain_password, hashed_password)
-        except Exception:
-            # bcrypt 검증 실패 시 평문 비교 (개발용)
-            return hashed_password == plain_password
+        is_valid, _ = password_hasher.verify_and_update(plain_password, hashed_password)
+        return is_valid
+
+    def verify_and_upgrade_password(self, user: User, plain_password: str) -> bool:
+        """
+        비밀번호를 검증하고, 저장된 해시가 현재 설정(방식, rounds)보다 오래되었으면 새 해시로 교체합니다.
+        (평문으로 저장된 개발용 비밀번호도 로그인 시 해시로 교체됨)
+        """
+        is_valid, new_hash = password_hasher.verify_and_update(plain_password, user.password_hash)
+        if is_valid and new_hash:
+            user.password_hash = new_hash
+            self.db.commit()
+        return is_valid
     
     def update_user(self, user_id: int, **kwargs) -> Optional[User]:
         """사용자 정보를 업데이트합니다."""
@@ -71,8 +76,14 @@ class UserDAO:
         return self.db.query(MCPServer).filter(MCPServer.owner_id == user_id).all()
     
     def get_user_favorites(self, user_id: int) -> List[MCPServer]:
-        """사용자가 즐겨찾기한 MCP 서버 목록을 조회합니다."""
-        return self.db.query(MCPServer).join(UserFavorite).filter(UserFavorite.user_id == user_id).all()
+        """사용자가 즐겨찾기한 MCP 서버 목록을 조회합니다. (응답 직렬화에 필요한 관계를 selectinload로 일괄 로딩)"""
+        return self.db.query(MCPServer).options(
+            selectinload(MCPServer.owner),
+            selectinload(MCPServer.tags),
+            selectinload(MCPServer.tools).selectinload(MCPServerTool.parameters),
+            selectinload(MCPServer.prompts).selectinload(MCPServerPrompt.arguments),
+            selectinload(MCPServer.resources)
+        ).join(UserFavorite).filter(UserFavorite.user_id == user_id).all()
     
     def add_favorite(self, user_id: int, mcp_server_id: int) -> bool:
         """즐겨찾기를 추가합니다."""
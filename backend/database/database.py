@@ -1,8 +1,26 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
+import logging
 import os
-from typing import Generator
+import time
+from contextlib import contextmanager
+from typing import Callable, Generator, Iterator, List
+
+from backend.utils.metrics import db_pool_checkouts, db_pool_connects, db_pool_wait
+
+logger = logging.getLogger(__name__)
+
+
+class TimedQueuePool(QueuePool):
+    """풀에서 커넥션을 얻기까지의 대기 시간을 기록하는 QueuePool (/metrics의 db_pool_wait_seconds)"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_wait.observe(time.perf_counter() - started)
 
 # 데이터베이스 URL 설정
 DATABASE_URL = os.getenv(
@@ -18,9 +36,20 @@ engine = create_engine(
     pool_recycle=3600,
     pool_pre_ping=True,  # 연결 풀에서 세션을 가져올 때 연결 상태 확인
     echo=False,  # SQL 로그 출력 여부
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    **({} if "sqlite" in DATABASE_URL else {"poolclass": TimedQueuePool})
 )
 
+
+@event.listens_for(engine, "checkout")
+def _count_pool_checkout(dbapi_connection, connection_record, connection_proxy):
+    db_pool_checkouts.inc()
+
+
+@event.listens_for(engine, "connect")
+def _count_pool_connect(dbapi_connection, connection_record):
+    db_pool_connects.inc()
+
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(
     autocommit=False, 
@@ -29,6 +58,100 @@ SessionLocal = sessionmaker(
     expire_on_commit=True  # 커밋 후 세션 객체를 만료시켜 최신 데이터 조회
 )
 
+class RequestSession(Session):
+    """
+    요청 단위 세션 (Unit of Work)
+
+    - 커넥션은 첫 쿼리 때 풀에서 가져옴 (쿼리가 없는 요청은 커넥션을 점유하지 않음)
+    - DAO/서비스의 commit()은 flush만 수행하고, 실제 커밋은 요청이 끝날 때 get_db에서 한 번 수행
+    - 외부 호출처럼 오래 기다리기 전에는 release()로 지금까지의 변경을 커밋하고 커넥션을 반환
+    - after_commit()으로 등록한 작업(인메모리 인덱스 동기화 등)은 실제 커밋 후에 실행
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._after_commit_callbacks: List[Callable[[], None]] = []
+
+    def commit(self) -> None:
+        """요청 중간의 커밋은 flush로 대체합니다. (요청 종료 시 한 번만 커밋)"""
+        self.flush()
+
+    def commit_request(self) -> None:
+        """변경 사항을 실제로 커밋하고 커넥션을 풀에 반환합니다."""
+        super().commit()
+        callbacks, self._after_commit_callbacks = self._after_commit_callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"After-commit callback failed: {e}")
+
+    def release(self) -> None:
+        """긴 await 전에 호출: 지금까지의 변경을 커밋하고 커넥션을 반환합니다. (이후 쿼리 시 다시 가져옴)"""
+        self.commit_request()
+
+    def rollback(self) -> None:
+        self._after_commit_callbacks = []
+        super().rollback()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """요청이 커밋된 뒤 실행할 작업을 등록합니다."""
+        self._after_commit_callbacks.append(callback)
+
+
+# 요청 단위 세션 팩토리 (get_db 전용)
+RequestSessionLocal = sessionmaker(
+    class_=RequestSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    expire_on_commit=False  # release() 이후 속성 접근으로 커넥션을 다시 가져오지 않도록
+)
+
+
+def release_connection(db: Session) -> None:
+    """
+    긴 await 전에 현재 트랜잭션을 끝내고 커넥션을 풀에 반환합니다.
+    RequestSession은 지금까지의 변경을 커밋하며, 일반 Session은 commit()으로 트랜잭션을 종료합니다.
+    """
+    if isinstance(db, RequestSession):
+        db.release()
+    else:
+        db.commit()
+
+
+@contextmanager
+def optional_write(db: Session, description: str) -> Iterator[None]:
+    """
+    실패해도 요청을 실패시키지 않는 부가 쓰기(알림 등)를 감쌉니다.
+
+    RequestSession은 메인 쓰기와 같은 트랜잭션을 사용하므로 SAVEPOINT 안에서 실행하고,
+    실패하면 그 SAVEPOINT만 롤백해 메인 쓰기는 요청 종료 시 그대로 커밋됩니다.
+    일반 Session은 메인 쓰기가 이미 커밋되어 있으므로 실패 시 세션만 롤백합니다.
+    """
+    if isinstance(db, RequestSession):
+        try:
+            with db.begin_nested():
+                yield
+        except Exception as e:
+            logger.error(f"{description} failed: {e}")
+        return
+
+    try:
+        yield
+    except Exception as e:
+        db.rollback()
+        logger.error(f"{description} failed: {e}")
+
+
+def run_after_commit(db: Session, callback: Callable[[], None]) -> None:
+    """RequestSession이면 요청 커밋 후에, 아니면 즉시 callback을 실행합니다."""
+    if isinstance(db, RequestSession):
+        db.after_commit(callback)
+    else:
+        callback()
+
+
 class Database:
     def __init__(self):
         self.engine = engine
@@ -71,10 +194,17 @@ database = Database()
 # 의존성 주입을 위한 함수
 def get_db():
     """
-    FastAPI Depends에서 사용할 데이터베이스 세션 의존성
+    FastAPI Depends에서 사용할 요청 단위 데이터베이스 세션 의존성
+
+    응답 전에 커밋되도록 Depends(get_db, scope="function")로 선언합니다.
+    핸들러가 정상 종료되면 한 번 커밋하고, 예외가 발생하면 롤백합니다.
     """
-    db = SessionLocal()
+    db = RequestSessionLocal()
     try:
         yield db
+        db.commit_request()
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
@@ -1,15 +1,98 @@
+import hashlib
+import os
+from typing import Optional
+
 from sqlalchemy.orm import Session
 from backend.database.database import database
-from backend.database.model import User, Tag
+from backend.database.model import Base, User, Tag, SchemaVersion
 from backend.database.dao.user_dao import UserDAO
+from backend.database.dao.mcp_server_search_dao import MCPServerSearchDAO
+from backend.database.dao.analytics_dao import AnalyticsDAO
+
+# 스키마 지문이 저장된 값과 같으면 테이블 생성/시딩/인덱스 준비를 건너뜀
+FAST_BOOT = os.getenv("FAST_BOOT", "false").lower() == "true"
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+SCHEMA_VERSION_NAME = 'app'
+
+DEFAULT_TAGS = [
+    "AI", "Automation", "Productivity", "Development", "Tools",
+    "API", "Integration", "Data", "Analysis", "Machine Learning"
+]
+
+
+def schema_fingerprint() -> str:
+    """
+    모델 메타데이터(테이블/컬럼/인덱스), 마이그레이션 SQL 파일, 기본 시드 데이터로 계산한 SHA-256 지문
+    이 중 하나라도 바뀌면 값이 달라져 다음 부팅에서 전체 초기화가 실행됩니다.
+    """
+    digest = hashlib.sha256()
+    for table in sorted(Base.metadata.tables.values(), key=lambda table: table.name):
+        digest.update(f"table:{table.name}\n".encode())
+        for column in table.columns:
+            digest.update(
+                f"column:{column.name}:{column.type!r}:{column.nullable}:{column.primary_key}\n".encode()
+            )
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            columns = ",".join(column.name for column in index.columns)
+            digest.update(f"index:{index.name}:{columns}:{index.unique}\n".encode())
+
+    if os.path.isdir(MIGRATIONS_DIR):
+        for filename in sorted(os.listdir(MIGRATIONS_DIR)):
+            if filename.endswith(".sql"):
+                with open(os.path.join(MIGRATIONS_DIR, filename), "rb") as f:
+                    digest.update(f"migration:{filename}:".encode() + hashlib.sha256(f.read()).digest())
+
+    digest.update(f"seed:{','.join(DEFAULT_TAGS)}".encode())
+    return digest.hexdigest()
+
+
+def get_stored_fingerprint(db: Session) -> Optional[str]:
+    """마지막 전체 초기화 때 기록한 지문 (테이블이 아직 없으면 None)"""
+    try:
+        row = db.get(SchemaVersion, SCHEMA_VERSION_NAME)
+        return row.fingerprint if row else None
+    except Exception:
+        db.rollback()
+        return None
+
+
+def store_fingerprint(db: Session, fingerprint: str) -> None:
+    row = db.get(SchemaVersion, SCHEMA_VERSION_NAME)
+    if row is None:
+        db.add(SchemaVersion(name=SCHEMA_VERSION_NAME, fingerprint=fingerprint))
+    else:
+        row.fingerprint = fingerprint
+    db.commit()
+
+
+def init_database(fast_boot: bool = FAST_BOOT) -> bool:
+    """
+    데이터베이스를 초기화하고 기본 데이터를 생성합니다.
+
+    fast_boot가 켜져 있고 저장된 스키마 지문이 현재 지문과 같으면 아무것도 하지 않습니다.
+    (지문 조회 쿼리 1회) 모든 단계가 성공한 전체 초기화 후에만 지문을 기록합니다.
+
+    Returns:
+        전체 초기화를 실행했으면 True, FAST_BOOT로 건너뛰었으면 False
+    """
+    fingerprint = schema_fingerprint()
+    if fast_boot:
+        db = database.SessionLocal()
+        try:
+            if get_stored_fingerprint(db) == fingerprint:
+                print("FAST_BOOT: 스키마 지문이 일치하여 테이블 생성/기본 데이터 준비를 건너뜁니다.")
+                return False
+        finally:
+            db.close()
 
-def init_database():
-    """데이터베이스를 초기화하고 기본 데이터를 생성합니다."""
     # 테이블 생성
     database.create_tables()
     
     # 세션 생성
     db = next(database.get_db())
+    # 선택 단계(PostgreSQL 인덱스/파티션)가 하나라도 실패하면 지문을 기록하지 않아 다음 부팅에서 재시도
+    complete = True
     
     try:
         # 기본 관리자 계정 생성
@@ -28,12 +111,7 @@ def init_database():
             print(f"관리자 계정이 생성되었습니다: {admin.username}")
         
         # 기본 태그 생성
-        default_tags = [
-            "AI", "Automation", "Productivity", "Development", "Tools",
-            "API", "Integration", "Data", "Analysis", "Machine Learning"
-        ]
-        
-        for tag_name in default_tags:
+        for tag_name in DEFAULT_TAGS:
             existing_tag = db.query(Tag).filter(Tag.name == tag_name).first()
             if not existing_tag:
                 tag = Tag(name=tag_name)
@@ -41,6 +119,44 @@ def init_database():
                 print(f"기본 태그가 생성되었습니다: {tag_name}")
         
         db.commit()
+
+        # 검색 인덱스 준비 (PostgreSQL tsvector/GIN 생성, 누락된 인덱스 백필)
+        search_dao = MCPServerSearchDAO(db)
+        try:
+            if search_dao.ensure_postgres_search_objects():
+                print("PostgreSQL 전문 검색(tsvector) 인덱스가 준비되었습니다.")
+        except Exception as e:
+            db.rollback()
+            complete = False
+            print(f"tsvector 검색 인덱스 생성에 실패하여 LIKE 검색으로 동작합니다: {e}")
+
+        # 분석 이벤트 메타데이터 JSONB 표현식 인덱스 (PostgreSQL)
+        try:
+            if AnalyticsDAO(db).ensure_postgres_metadata_indexes():
+                print("분석 이벤트 메타데이터(JSONB) 인덱스가 준비되었습니다.")
+        except Exception as e:
+            db.rollback()
+            complete = False
+            print(f"분석 이벤트 메타데이터 인덱스 생성에 실패했습니다: {e}")
+
+        # analytics_events 월별 파티션 (파티션 테이블로 전환된 PostgreSQL만 해당)
+        try:
+            from backend.service.analytics_partitions import maintain_analytics_partitions
+            partitions = maintain_analytics_partitions(db)
+            if partitions["created"]:
+                print(f"분석 이벤트 파티션이 생성되었습니다: {', '.join(partitions['created'])}")
+        except Exception as e:
+            db.rollback()
+            complete = False
+            print(f"분석 이벤트 파티션 준비에 실패했습니다: {e}")
+
+        if search_dao.is_index_stale():
+            indexed = search_dao.rebuild_index()
+            print(f"검색 인덱스가 재구성되었습니다: {indexed}개 서버")
+
+        if complete:
+            store_fingerprint(db, fingerprint)
+
         print("데이터베이스 초기화가 완료되었습니다.")
         
     except Exception as e:
@@ -48,6 +164,7 @@ def init_database():
         db.rollback()
     finally:
         db.close()
+    return True
 
 if __name__ == "__main__":
     init_database() 
\ No newline at end of file
@@ -0,0 +1,64 @@
+-- Migration: Add portable analytics rollup tables
+-- Date: 2026-10-19
+--
+-- TimescaleDB continuous aggregate(hourly_events, daily_search_keywords, daily_server_views)가
+-- 없는 환경에서 사용하는 집계 테이블입니다. (init_database의 create_all로도 생성됨)
+-- 데이터는 backend.service.analytics_rollup 워커가 워터마크 이후 이벤트만 증분 집계합니다.
+-- 기존 이벤트 백필: python -m backend.service.analytics_rollup
+
+CREATE TABLE IF NOT EXISTS analytics_hourly_events (
+    hour TIMESTAMP NOT NULL,
+    event_type VARCHAR(50) NOT NULL,
+    user_id INTEGER NOT NULL DEFAULT 0,    -- 0: 비로그인
+    event_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (hour, event_type, user_id)
+);
+
+CREATE TABLE IF NOT EXISTS analytics_daily_search_keywords (
+    day TIMESTAMP NOT NULL,
+    keyword VARCHAR(255) NOT NULL,
+    search_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, keyword)
+);
+
+CREATE TABLE IF NOT EXISTS analytics_daily_server_views (
+    day TIMESTAMP NOT NULL,
+    mcp_server_id INTEGER NOT NULL,
+    event_type VARCHAR(50) NOT NULL,
+    view_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, mcp_server_id, event_type)
+);
+
+-- 마지막으로 집계에 반영한 analytics_events.id
+CREATE TABLE IF NOT EXISTS analytics_rollup_watermarks (
+    name VARCHAR(50) PRIMARY KEY,
+    last_event_id INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP
+);
+
+-- 시간별 고유 방문자 HyperLogLog 스케치 (user: 로그인 사용자, anonymous: 방문자 지문)
+-- PostgreSQL은 BYTEA, SQLite는 BLOB
+CREATE TABLE IF NOT EXISTS analytics_hourly_visitor_sketches (
+    hour TIMESTAMP NOT NULL,
+    visitor_kind VARCHAR(20) NOT NULL,
+    sketch BYTEA NOT NULL,
+    updated_at TIMESTAMP,
+    PRIMARY KEY (hour, visitor_kind)
+);
+
+-- 사전 계산된 급상승 서버 순위 (롤업 워커가 TRENDING_REFRESH_SECONDS마다 교체)
+CREATE TABLE IF NOT EXISTS analytics_trending_servers (
+    window_days INTEGER NOT NULL,
+    comparison_days INTEGER NOT NULL,
+    mcp_server_id INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    recent_views INTEGER NOT NULL DEFAULT 0,
+    previous_views INTEGER NOT NULL DEFAULT 0,
+    growth_rate DOUBLE PRECISION NOT NULL DEFAULT 0,
+    score DOUBLE PRECISION NOT NULL DEFAULT 0,
+    computed_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (window_days, comparison_days, mcp_server_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_trending_window_rank
+    ON analytics_trending_servers (window_days, comparison_days, rank);
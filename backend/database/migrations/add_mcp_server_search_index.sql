@@ -0,0 +1,40 @@
+-- Migration: Add full-text search index for MCP servers (PostgreSQL)
+-- Date: 2026-10-18
+--
+-- mcp_server_search_index 테이블은 SQLAlchemy create_all로 생성됩니다.
+-- 이 스크립트는 PostgreSQL 전용 가중치 tsvector 생성 컬럼과 GIN 인덱스를 추가합니다.
+-- (init_database()가 시작 시 동일한 DDL을 멱등하게 실행하므로 수동 적용은 선택 사항입니다)
+--
+-- 가중치: name(A) > tags(B) > description(C) > tool names(D)
+
+CREATE TABLE IF NOT EXISTS mcp_server_search_index (
+    mcp_server_id INTEGER PRIMARY KEY REFERENCES mcp_servers(id) ON DELETE CASCADE,
+    name_text TEXT NOT NULL DEFAULT '',
+    tags_text TEXT NOT NULL DEFAULT '',
+    description_text TEXT NOT NULL DEFAULT '',
+    tools_text TEXT NOT NULL DEFAULT '',
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+);
+
+ALTER TABLE mcp_server_search_index
+ADD COLUMN IF NOT EXISTS search_vector tsvector
+GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', coalesce(name_text, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(tags_text, '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce(description_text, '')), 'C') ||
+    setweight(to_tsvector('simple', coalesce(tools_text, '')), 'D')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_mcp_server_search_vector
+ON mcp_server_search_index USING GIN (search_vector);
+
+-- 기존 서버 백필 (init_database()도 인덱스 행 수가 다르면 자동으로 재구성합니다)
+INSERT INTO mcp_server_search_index (mcp_server_id, name_text, tags_text, description_text, tools_text)
+SELECT
+    s.id,
+    lower(coalesce(s.name, '')),
+    lower(coalesce((SELECT string_agg(t.name, ' ') FROM mcp_server_tags st JOIN tags t ON t.id = st.tag_id WHERE st.mcp_server_id = s.id), '')),
+    lower(coalesce(s.description, '')),
+    lower(coalesce((SELECT string_agg(tool.name, ' ') FROM mcp_server_tools tool WHERE tool.mcp_server_id = s.id), ''))
+FROM mcp_servers s
+ON CONFLICT (mcp_server_id) DO NOTHING;
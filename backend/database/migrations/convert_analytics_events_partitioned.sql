@@ -0,0 +1,80 @@
+-- Migration: Convert analytics_events to monthly range partitions (PostgreSQL without TimescaleDB)
+-- Date: 2026-10-19
+--
+-- 기존 analytics_events를 analytics_events_legacy로 이름을 바꾸고, 같은 이름의 파티션 테이블
+-- (PARTITION BY RANGE (created_at))을 만든 뒤 기존 테이블을 "전환 기준일 이전" 파티션으로 붙입니다.
+-- 데이터 복사가 없고, 범위 CHECK 제약을 미리 검증해 두므로 ATTACH 시 전체 스캔도 없습니다.
+--
+-- 이후에는 analytics_partitions 서비스(롤업 워커, init_database)가
+-- 미래 월 파티션을 미리 만들고 ANALYTICS_RETENTION_MONTHS가 지난 파티션을 DROP 합니다.
+-- (analytics_events_legacy는 가장 최근 행이 보관 기간을 지나면 통째로 삭제됩니다)
+--
+-- 사전 조건: convert_analytics_metadata_jsonb.sql 적용 (event_metadata JSONB + 표현식 인덱스)
+-- 아래 '2026-11-01'(전환 기준일 = 적용 시점의 다음 달 1일)을 실제 값으로 바꿔 psql에서 단계별로 실행하세요.
+
+-- 1) 기존 테이블 준비 (쓰기를 막지 않음)
+--    파티션 키를 포함한 PK 인덱스와 범위 제약을 미리 만들어 ATTACH가 즉시 끝나도록 함
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS analytics_events_legacy_id_created_at
+    ON analytics_events (id, created_at);
+
+ALTER TABLE analytics_events
+    ADD CONSTRAINT analytics_events_legacy_range CHECK (created_at < '2026-11-01') NOT VALID;
+ALTER TABLE analytics_events VALIDATE CONSTRAINT analytics_events_legacy_range;
+
+-- 2) 테이블 교체 (짧은 락)
+BEGIN;
+LOCK TABLE analytics_events IN ACCESS EXCLUSIVE MODE;
+
+ALTER TABLE analytics_events RENAME TO analytics_events_legacy;
+
+-- 새 부모 테이블이 같은 인덱스 이름을 쓸 수 있도록 기존 인덱스 이름 변경
+DO $$
+DECLARE
+    idx RECORD;
+BEGIN
+    FOR idx IN
+        SELECT indexname FROM pg_indexes
+        WHERE tablename = 'analytics_events_legacy' AND indexname NOT LIKE '%\_legacy%'
+    LOOP
+        EXECUTE format('ALTER INDEX %I RENAME TO %I', idx.indexname, idx.indexname || '_legacy');
+    END LOOP;
+END $$;
+
+-- 파티션 테이블의 PK는 파티션 키(created_at)를 포함해야 함
+-- (대용량 이벤트 테이블 쓰기 비용을 줄이기 위해 users FK는 두지 않음)
+CREATE TABLE analytics_events (
+    LIKE analytics_events_legacy INCLUDING DEFAULTS,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- id 시퀀스가 legacy 파티션 삭제 시 함께 삭제되지 않도록 소유자 변경
+ALTER SEQUENCE analytics_events_id_seq OWNED BY analytics_events.id;
+
+-- 부모 인덱스 (각 파티션에 자동 생성, legacy는 같은 정의의 기존 인덱스를 그대로 사용)
+CREATE INDEX ix_analytics_events_event_type ON analytics_events (event_type);
+CREATE INDEX ix_analytics_events_user_id ON analytics_events (user_id);
+CREATE INDEX ix_analytics_events_created_at ON analytics_events (created_at);
+CREATE INDEX ix_event_type_created_at ON analytics_events (event_type, created_at);
+CREATE INDEX ix_user_event_created_at ON analytics_events (user_id, event_type, created_at);
+CREATE INDEX ix_analytics_events_metadata_server
+    ON analytics_events (((event_metadata->>'mcp_server_id')::integer), created_at)
+    WHERE ((event_metadata->>'mcp_server_id')::integer) IS NOT NULL;
+CREATE INDEX ix_analytics_events_metadata_keyword
+    ON analytics_events ((event_metadata->>'keyword'), created_at)
+    WHERE (event_metadata->>'keyword') IS NOT NULL;
+
+ALTER TABLE analytics_events
+    ATTACH PARTITION analytics_events_legacy FOR VALUES FROM (MINVALUE) TO ('2026-11-01');
+
+-- 첫 월 파티션 (이후 파티션은 서비스가 미리 생성)
+CREATE TABLE analytics_events_p2026_11 PARTITION OF analytics_events
+    FOR VALUES FROM ('2026-11-01') TO ('2026-12-01');
+
+-- 미리 만든 파티션 범위를 벗어난 이벤트가 유실되지 않도록 DEFAULT 파티션 (평소에는 비어 있어야 함)
+CREATE TABLE analytics_events_default PARTITION OF analytics_events DEFAULT;
+COMMIT;
+
+-- 3) 확인
+-- SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+-- FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+-- WHERE i.inhparent = 'analytics_events'::regclass;
@@ -0,0 +1,80 @@
+-- Migration: Convert analytics_events.event_metadata from TEXT to JSONB (PostgreSQL)
+-- Date: 2026-10-19
+--
+-- 기존 TEXT(JSON 문자열) 컬럼을 JSONB로 바꾸고 mcp_server_id / keyword 표현식 인덱스를 추가합니다.
+-- 대용량 테이블에서도 쓰기를 막지 않도록 새 컬럼에 배치 단위로 백필한 뒤 짧은 락 안에서 컬럼을 교체합니다.
+-- 애플리케이션(ANALYTICS_METADATA_JSONB=true)은 교체 전후 모두 정상 동작하므로 무중단으로 적용할 수 있습니다.
+-- 새로 생성하는 데이터베이스는 create_all이 처음부터 JSONB로 만들고 init_database()가 인덱스를 생성합니다.
+--
+-- PostgreSQL 11+ (프로시저 내 COMMIT) 필요. psql에서 단계별로 실행하세요.
+
+-- 1) 새 JSONB 컬럼 추가 (기본값 없는 컬럼 추가는 테이블을 재작성하지 않음)
+ALTER TABLE analytics_events ADD COLUMN IF NOT EXISTS event_metadata_jsonb JSONB;
+
+-- 잘못된 JSON 문자열은 NULL로 변환
+CREATE OR REPLACE FUNCTION analytics_try_jsonb(value TEXT) RETURNS JSONB AS $$
+BEGIN
+    RETURN value::jsonb;
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+-- 2) id 구간별 배치 백필 (배치마다 COMMIT, 진행 위치는 analytics_rollup_watermarks에 기록 → 중단 후 재실행 시 이어서 진행)
+CREATE OR REPLACE PROCEDURE analytics_backfill_metadata_jsonb(batch_size INTEGER DEFAULT 10000)
+LANGUAGE plpgsql AS $$
+DECLARE
+    last_id INTEGER;
+    max_id INTEGER;
+BEGIN
+    INSERT INTO analytics_rollup_watermarks (name, last_event_id, updated_at)
+    VALUES ('metadata_jsonb_backfill', 0, now())
+    ON CONFLICT (name) DO NOTHING;
+
+    SELECT last_event_id INTO last_id FROM analytics_rollup_watermarks WHERE name = 'metadata_jsonb_backfill';
+    SELECT coalesce(max(id), 0) INTO max_id FROM analytics_events;
+
+    WHILE last_id < max_id LOOP
+        UPDATE analytics_events
+        SET event_metadata_jsonb = analytics_try_jsonb(event_metadata)
+        WHERE id > last_id AND id <= last_id + batch_size
+          AND event_metadata IS NOT NULL;
+
+        last_id := least(last_id + batch_size, max_id);
+        UPDATE analytics_rollup_watermarks
+        SET last_event_id = last_id, updated_at = now()
+        WHERE name = 'metadata_jsonb_backfill';
+        COMMIT;
+    END LOOP;
+END;
+$$;
+
+CALL analytics_backfill_metadata_jsonb(10000);
+
+-- 3) 백필 이후 들어온 이벤트를 반영하고 컬럼 교체 (짧은 쓰기 락)
+BEGIN;
+LOCK TABLE analytics_events IN SHARE ROW EXCLUSIVE MODE;
+
+UPDATE analytics_events
+SET event_metadata_jsonb = analytics_try_jsonb(event_metadata)
+WHERE id > (SELECT last_event_id FROM analytics_rollup_watermarks WHERE name = 'metadata_jsonb_backfill')
+  AND event_metadata IS NOT NULL;
+
+ALTER TABLE analytics_events RENAME COLUMN event_metadata TO event_metadata_text;
+ALTER TABLE analytics_events RENAME COLUMN event_metadata_jsonb TO event_metadata;
+COMMIT;
+
+-- 4) 표현식 인덱스 (운영 중 쓰기를 막지 않도록 CONCURRENTLY, 트랜잭션 밖에서 실행)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_analytics_events_metadata_server
+ON analytics_events (((event_metadata->>'mcp_server_id')::integer), created_at)
+WHERE ((event_metadata->>'mcp_server_id')::integer) IS NOT NULL;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_analytics_events_metadata_keyword
+ON analytics_events ((event_metadata->>'keyword'), created_at)
+WHERE (event_metadata->>'keyword') IS NOT NULL;
+
+-- 5) 확인 후 정리
+-- ALTER TABLE analytics_events DROP COLUMN event_metadata_text;
+DELETE FROM analytics_rollup_watermarks WHERE name = 'metadata_jsonb_backfill';
+DROP PROCEDURE IF EXISTS analytics_backfill_metadata_jsonb(INTEGER);
+DROP FUNCTION IF EXISTS analytics_try_jsonb(TEXT);
@@ -5,6 +5,7 @@ from .mcp_server import (
     MCPServerPrompt, MCPServerPromptArgument, MCPServerResource
 )
 from .tag import Tag, mcp_server_tags
+from .mcp_server_search_index import MCPServerSearchIndex
 from .comment import Comment
 from .playground_usage import PlaygroundUsage
 from .notification import Notification
@@ -15,6 +16,15 @@ from .analytics_views import (
     DailyServerViewsView,
     DailyUserActionsView
 )
+from .analytics_rollup import (
+    AnalyticsHourlyEvents,
+    AnalyticsDailySearchKeywords,
+    AnalyticsDailyServerViews,
+    AnalyticsHourlyVisitorSketch,
+    AnalyticsTrendingServer,
+    AnalyticsRollupWatermark
+)
+from .schema_version import SchemaVersion
 
 __all__ = [
     'Base',
@@ -28,6 +38,7 @@ __all__ = [
     'MCPServerResource',
     'Tag',
     'mcp_server_tags',
+    'MCPServerSearchIndex',
     'Comment',
     'PlaygroundUsage',
     'Notification',
@@ -36,5 +47,12 @@ __all__ = [
     'HourlyEventsView',
     'DailySearchKeywordsView',
     'DailyServerViewsView',
-    'DailyUserActionsView'
+    'DailyUserActionsView',
+    'AnalyticsHourlyEvents',
+    'AnalyticsDailySearchKeywords',
+    'AnalyticsDailyServerViews',
+    'AnalyticsHourlyVisitorSketch',
+    'AnalyticsTrendingServer',
+    'AnalyticsRollupWatermark',
+    'SchemaVersion'
 ]
@@ -5,13 +5,58 @@ Analytics Event Models for User Behavior Tracking
 새로운 분석 타입을 추가할 때는 EventType enum에 타입만 추가하면 됩니다.
 """
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
 from datetime import datetime
 import enum
 import json
+import os
 
 from .base import Base
 
+# PostgreSQL에서 event_metadata를 JSONB로 다룰지 여부
+# (기존 TEXT 컬럼도 읽기/쓰기는 가능하지만 ->> 집계와 표현식 인덱스는
+#  migrations/convert_analytics_metadata_jsonb.sql 적용 후에 동작)
+ANALYTICS_METADATA_JSONB = os.getenv("ANALYTICS_METADATA_JSONB", "true").lower() not in ("0", "false", "no")
+
+
+class EventMetadataType(TypeDecorator):
+    """
+    이벤트 메타데이터 컬럼 타입
+
+    Python 쪽 값은 항상 dict(또는 None)입니다.
+    - PostgreSQL: JSONB (드라이버가 직렬화/역직렬화)
+    - 그 외 (SQLite 등): JSON 문자열을 담는 TEXT
+    마이그레이션 전 TEXT 컬럼에서 읽은 문자열도 dict로 변환합니다.
+    """
+    impl = Text
+    cache_ok = True
+
+    @staticmethod
+    def _uses_jsonb(dialect) -> bool:
+        return ANALYTICS_METADATA_JSONB and dialect.name == 'postgresql'
+
+    def load_dialect_impl(self, dialect):
+        if self._uses_jsonb(dialect):
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = json.loads(value)
+        return value if self._uses_jsonb(dialect) else json.dumps(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None or not isinstance(value, str):
+            return value
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
+
 
 class EventType(str, enum.Enum):
     """
@@ -69,9 +114,9 @@ class AnalyticsEvent(Base):
     # Referrer (유입 경로 분석용)
     referrer = Column(String(512), nullable=True)
 
-    # 추가 메타데이터 (JSON 형식으로 유연하게 저장)
+    # 추가 메타데이터 (PostgreSQL은 JSONB, 그 외는 JSON 문자열로 저장)
     # 예: {"keyword": "weather", "tags": ["api"], "results_count": 5}
-    event_metadata = Column(Text, nullable=True)  # JSON string
+    event_metadata = Column(EventMetadataType, nullable=True)
 
     # 타임스탬프
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
@@ -86,17 +131,12 @@ class AnalyticsEvent(Base):
     )
 
     def set_metadata(self, data: dict):
-        """메타데이터를 JSON 문자열로 저장"""
-        self.event_metadata = json.dumps(data) if data else None
+        """메타데이터를 저장 (직렬화는 컬럼 타입이 처리)"""
+        self.event_metadata = dict(data) if data else None
 
     def get_metadata(self) -> dict:
         """메타데이터를 딕셔너리로 반환"""
-        if self.event_metadata:
-            try:
-                return json.loads(self.event_metadata)
-            except json.JSONDecodeError:
-                return {}
-        return {}
+        return self.event_metadata if isinstance(self.event_metadata, dict) else {}
 
     def __repr__(self):
         return f"<AnalyticsEvent(id={self.id}, type={self.event_type}, user_id={self.user_id}, created_at={self.created_at})>"
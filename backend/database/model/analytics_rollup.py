@@ -0,0 +1,124 @@
+"""
+Analytics Rollup Tables - Portable Aggregates
+
+TimescaleDB continuous aggregate 뷰(analytics_views.py)와 같은 컬럼 구성의 일반 테이블입니다.
+TimescaleDB가 없는 환경(일반 PostgreSQL, SQLite)에서 analytics_rollup 서비스가
+analytics_events를 워터마크 이후분만 읽어 증분 집계(upsert)합니다.
+
+컬럼 이름을 뷰와 맞춰 두어 AnalyticsDAO가 모델만 바꿔 동일한 쿼리를 사용합니다.
+"""
+from sqlalchemy import Column, Integer, String, DateTime, LargeBinary, Float, Index
+from datetime import datetime
+
+from .base import Base
+
+# 비로그인 이벤트의 user_id (PK에 NULL을 쓸 수 없으므로 0으로 집계)
+ANONYMOUS_USER_ID = 0
+
+
+class AnalyticsHourlyEvents(Base):
+    """
+    시간별 이벤트 집계 (hourly_events 대응)
+
+    user_id = 0 은 비로그인 이벤트입니다.
+    """
+    __tablename__ = 'analytics_hourly_events'
+
+    hour = Column(DateTime, primary_key=True)
+    event_type = Column(String(50), primary_key=True)
+    user_id = Column(Integer, primary_key=True, default=ANONYMOUS_USER_ID)
+    event_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<AnalyticsHourlyEvents(hour={self.hour}, type={self.event_type}, count={self.event_count})>"
+
+
+class AnalyticsDailySearchKeywords(Base):
+    """일별 검색 키워드 집계 (daily_search_keywords 대응)"""
+    __tablename__ = 'analytics_daily_search_keywords'
+
+    day = Column(DateTime, primary_key=True)
+    keyword = Column(String(255), primary_key=True)
+    search_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<AnalyticsDailySearchKeywords(day={self.day}, keyword={self.keyword}, count={self.search_count})>"
+
+
+class AnalyticsDailyServerViews(Base):
+    """일별 서버 조회수 집계 (daily_server_views 대응)"""
+    __tablename__ = 'analytics_daily_server_views'
+
+    day = Column(DateTime, primary_key=True)
+    mcp_server_id = Column(Integer, primary_key=True)
+    event_type = Column(String(50), primary_key=True)
+    view_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<AnalyticsDailyServerViews(day={self.day}, server={self.mcp_server_id}, count={self.view_count})>"
+
+
+class AnalyticsHourlyVisitorSketch(Base):
+    """
+    시간별 고유 방문자 HyperLogLog 스케치
+
+    visitor_kind:
+    - user: 로그인 사용자 (user_id)
+    - anonymous: 비로그인 방문자 (IP + User-Agent 지문 해시)
+
+    스케치는 레지스터별 최대값으로 병합되므로 임의 기간의 고유 방문자 수를
+    원본 이벤트 없이 시간 버킷 수에 비례하는 비용으로 계산할 수 있습니다.
+    """
+    __tablename__ = 'analytics_hourly_visitor_sketches'
+
+    hour = Column(DateTime, primary_key=True)
+    visitor_kind = Column(String(20), primary_key=True)
+    sketch = Column(LargeBinary, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<AnalyticsHourlyVisitorSketch(hour={self.hour}, kind={self.visitor_kind})>"
+
+
+class AnalyticsTrendingServer(Base):
+    """
+    사전 계산된 급상승 서버 순위
+
+    (window_days, comparison_days) 조합별로 trending 엔진이 주기적으로 통째로 교체합니다.
+    공개 트렌딩 API는 이 테이블을 rank 순으로 조회하기만 합니다.
+    """
+    __tablename__ = 'analytics_trending_servers'
+
+    window_days = Column(Integer, primary_key=True)
+    comparison_days = Column(Integer, primary_key=True)
+    mcp_server_id = Column(Integer, primary_key=True)
+    rank = Column(Integer, nullable=False)
+    recent_views = Column(Integer, nullable=False, default=0)
+    previous_views = Column(Integer, nullable=False, default=0)
+    growth_rate = Column(Float, nullable=False, default=0.0)
+    score = Column(Float, nullable=False, default=0.0)
+    computed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index('ix_trending_window_rank', 'window_days', 'comparison_days', 'rank'),
+    )
+
+    def __repr__(self):
+        return f"<AnalyticsTrendingServer(window={self.window_days}, rank={self.rank}, server={self.mcp_server_id})>"
+
+
+class AnalyticsRollupWatermark(Base):
+    """
+    롤업 진행 위치
+
+    last_event_id 까지의 analytics_events가 집계 테이블에 반영되었음을 의미합니다.
+    집계 upsert와 같은 트랜잭션에서 갱신되므로 재실행해도 중복 집계되지 않습니다.
+    """
+    __tablename__ = 'analytics_rollup_watermarks'
+
+    name = Column(String(50), primary_key=True)
+    last_event_id = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<AnalyticsRollupWatermark(name={self.name}, last_event_id={self.last_event_id})>"
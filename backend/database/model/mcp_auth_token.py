@@ -5,7 +5,7 @@ Stores encrypted authentication tokens for MCP servers per user
 
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
 from sqlalchemy.sql import func
-from backend.database.database import Base
+from .base import Base
 
 
 class MCPAuthToken(Base):
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from .base import Base
+
+class MCPServerSearchIndex(Base):
+    """
+    MCP 서버 검색용 비정규화 테이블
+
+    검색 대상 필드(이름 > 태그 > 설명 > 도구 이름)를 소문자로 정규화하여 저장합니다.
+    PostgreSQL에서는 마이그레이션(add_mcp_server_search_index.sql)으로 추가되는
+    가중치 tsvector 생성 컬럼(search_vector)과 GIN 인덱스를 사용하고,
+    그 외 DB(SQLite 테스트 등)에서는 이 텍스트 컬럼들에 대한 가중치 LIKE 검색으로 동작합니다.
+    """
+    __tablename__ = 'mcp_server_search_index'
+
+    mcp_server_id = Column(Integer, ForeignKey('mcp_servers.id', ondelete='CASCADE'), primary_key=True)
+    name_text = Column(Text, nullable=False, default='')
+    tags_text = Column(Text, nullable=False, default='')
+    description_text = Column(Text, nullable=False, default='')
+    tools_text = Column(Text, nullable=False, default='')
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
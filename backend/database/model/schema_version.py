@@ -0,0 +1,22 @@
+"""
+Schema Version
+
+init_database가 마지막으로 스키마 생성/시딩을 완료한 시점의 스키마 지문을 기록합니다.
+FAST_BOOT=true 이면 현재 모델/마이그레이션 지문과 일치할 때 해당 단계를 건너뜁니다.
+"""
+from sqlalchemy import Column, String, DateTime
+from datetime import datetime
+
+from .base import Base
+
+
+class SchemaVersion(Base):
+    """스키마 지문 (name='app' 한 행)"""
+    __tablename__ = 'schema_versions'
+
+    name = Column(String(50), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    applied_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<SchemaVersion(name='{self.name}', fingerprint='{self.fingerprint[:12]}')>"
@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration for multi-worker production deployments
+
+    gunicorn -c backend/gunicorn.conf.py backend.main:app
+
+Process-shared limits (rate limits, playground concurrency, analytics caches,
+rollup leader) need SHARED_STATE_BACKEND=redis and REDIS_URL; with the default
+local backend they apply per worker. See backend/DEPLOYMENT_GUIDE.md.
+"""
+import multiprocessing
+import os
+
+bind = os.getenv("SERVER_BIND", f"0.0.0.0:{os.getenv('SERVER_PORT', '8000')}")
+workers = int(os.getenv("SERVER_WORKERS", str(multiprocessing.cpu_count())))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Playground requests may take up to 180s
+timeout = int(os.getenv("SERVER_WORKER_TIMEOUT", "240"))
+graceful_timeout = 30
+keepalive = 180
+
+# Recycle workers periodically to bound memory growth (jitter avoids restarting all at once)
+max_requests = 1000
+max_requests_jitter = 100
+
+# Each worker imports the app and opens its own DB pool after fork (engines are not fork-safe)
+preload_app = False
+
+accesslog = "-"
+loglevel = os.getenv("SERVER_LOG_LEVEL", "info")
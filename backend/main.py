@@ -8,6 +8,7 @@ import sys
 import logging
 from logging.handlers import RotatingFileHandler
 from dotenv import load_dotenv
+from backend.utils.startup_profiler import startup_profiler
 
 # Load environment variables from .env file
 load_dotenv()
@@ -69,9 +70,29 @@ from backend.database import init_database
 from backend.api import auth_router, mcp_servers_router, comments_router, playground_router
 from backend.api.endpoints.notifications import router as notifications_router
 from backend.api.endpoints.analytics import router as analytics_router
+from backend.api.endpoints.metrics import router as metrics_router
+from backend.api.endpoints.profiling import router as profiling_router
+from backend.database.database import SessionLocal
+from backend.database.async_database import dispose_async_engine
+from backend.service.catalog_search_index import is_memory_search_enabled, build_catalog_search_index
+from backend.service.analytics_ingest import analytics_ingest_queue, is_async_ingest_enabled
+from backend.service.analytics_rollup import analytics_rollup_worker
+from backend.utils.metrics import MetricsMiddleware, metrics_publisher
+from backend.utils.profiling import ProfilingMiddleware
+from backend.utils.query_budget import QueryBudgetMiddleware
+from backend.utils.shared_state import shared_state
 
-# Rate limiter 설정
-limiter = Limiter(key_func=get_remote_address)
+startup_profiler.checkpoint("imports")
+
+# 워커 프로세스 수 (python -m backend.main 및 gunicorn 설정에서 공통 사용)
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "1"))
+
+# Rate limiter 설정 (SHARED_STATE_BACKEND=redis 이면 모든 워커가 같은 카운터를 공유)
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=shared_state.rate_limit_storage_uri(),
+    storage_options=shared_state.rate_limit_storage_options()
+)
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -93,6 +114,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우트별 응답 시간 지표 (/metrics)
+app.add_middleware(MetricsMiddleware)
+
+# 요청 단위 프로파일링 (PROFILING_ENABLED=true 일 때만 동작)
+app.add_middleware(ProfilingMiddleware)
+
+# 요청별 쿼리 수 예산 경고 (개발 모드: QUERY_BUDGET_ENABLED=true)
+app.add_middleware(QueryBudgetMiddleware)
+
 # 라우터 등록
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(mcp_servers_router, prefix="/api/v1")
@@ -100,6 +130,8 @@ app.include_router(comments_router, prefix="/api/v1")
 app.include_router(playground_router, prefix="/api/v1")
 app.include_router(notifications_router, prefix="/api/v1")
 app.include_router(analytics_router, prefix="/api/v1")
+app.include_router(profiling_router, prefix="/api/v1/admin")
+app.include_router(metrics_router)
 
 @app.on_event("startup")
 async def startup_event():
@@ -109,12 +141,55 @@ async def startup_event():
     logger.info(f"Log file: {log_file_path}")
     logger.info("=" * 80)
 
+    if SERVER_WORKERS > 1 and not shared_state.is_shared:
+        logger.warning(
+            f"SERVER_WORKERS={SERVER_WORKERS} 이지만 SHARED_STATE_BACKEND=local 입니다. "
+            "rate limit, playground 동시 실행 제한, 캐시가 워커별로 따로 적용됩니다."
+        )
+
     logger.info("데이터베이스를 초기화합니다...")
-    init_database()
+    with startup_profiler.phase("init_database"):
+        # FAST_BOOT=true 이고 스키마 지문이 같으면 테이블 생성/시딩을 건너뜀
+        init_database()
     logger.info("데이터베이스 초기화 완료")
 
+    # 인메모리 검색 인덱스 구축 (SEARCH_INDEX_MODE=memory)
+    if is_memory_search_enabled():
+        with startup_profiler.phase("search_index"):
+            db = SessionLocal()
+            try:
+                count = build_catalog_search_index(db)
+                logger.info(f"인메모리 검색 인덱스 구축 완료: {count}개 서버")
+            finally:
+                db.close()
+
+    with startup_profiler.phase("background_workers"):
+        # 분석 이벤트 배치 적재 워커 (ANALYTICS_INGEST_MODE=sync 이면 요청마다 즉시 기록)
+        if is_async_ingest_enabled():
+            analytics_ingest_queue.start()
+
+        # 집계 롤업 워커 (TimescaleDB가 없으면 집계 테이블, 항상 고유 방문자 스케치 갱신)
+        analytics_rollup_worker.start()
+
+        # 워커별 지표 스냅샷을 shared_state에 게시 (redis 백엔드일 때만 동작)
+        metrics_publisher.start()
+
+    startup_profiler.finish()
+    startup_profiler.log_report()
     logger.info("애플리케이션이 성공적으로 시작되었습니다.")
 
+@app.on_event("shutdown")
+def shutdown_event():
+    """애플리케이션 종료 시 큐에 남은 분석 이벤트 플러시 및 롤업 워커 중지"""
+    analytics_ingest_queue.stop()
+    analytics_rollup_worker.stop()
+    metrics_publisher.stop()
+
+@app.on_event("shutdown")
+async def dispose_async_database():
+    """애플리케이션 종료 시 비동기 커넥션 풀 정리"""
+    await dispose_async_engine()
+
 @app.get("/")
 async def root():
     """루트 엔드포인트"""
@@ -124,15 +199,21 @@ async def root():
         "docs": "/docs"
     }
 
+# cpu_percent(interval=None)는 같은 Process 객체의 직전 호출 기준으로 계산하므로 재사용
+_health_process = None
+
 @app.get("/health")
 async def health_check():
     """
     Enhanced health check endpoint with resource monitoring
     Useful for monitoring backend stability and resource usage
     """
+    global _health_process
     try:
         import psutil
-        process = psutil.Process()
+        if _health_process is None:
+            _health_process = psutil.Process()
+        process = _health_process
         memory_info = process.memory_info()
 
         return {
@@ -142,7 +223,8 @@ async def health_check():
                 "vms_mb": round(memory_info.vms / 1024 / 1024, 2),  # Virtual Memory Size
                 "percent": round(process.memory_percent(), 2)
             },
-            "cpu_percent": round(process.cpu_percent(interval=0.1), 2),
+            # interval=None: 직전 호출 이후의 사용률 (대기 없이 즉시 반환, 첫 호출은 0.0)
+            "cpu_percent": round(process.cpu_percent(interval=None), 2),
             "num_threads": process.num_threads(),
             "connections": len(process.connections())
         }
@@ -177,14 +259,17 @@ if __name__ == "__main__":
     signal.signal(signal.SIGTERM, handle_shutdown)
     signal.signal(signal.SIGINT, handle_shutdown)
 
-    logger.info("Starting FastAPI application with Uvicorn...")
+    logger.info(f"Starting FastAPI application with Uvicorn ({SERVER_WORKERS} worker(s))...")
 
+    # Multiple workers need an import string so each worker process imports the app itself
+    # (production: gunicorn -c backend/gunicorn.conf.py backend.main:app)
     uvicorn.run(
-        app,
+        "backend.main:app" if SERVER_WORKERS > 1 else app,
         host="0.0.0.0",
-        port=8000,
+        port=int(os.getenv("SERVER_PORT", "8000")),
+        workers=SERVER_WORKERS,
         timeout_keep_alive=180,   # Keep-alive timeout for long-running requests
-        limit_concurrency=50,      # Max concurrent connections to prevent resource exhaustion
-        limit_max_requests=1000,   # Restart worker after N requests to prevent memory leaks
+        limit_concurrency=int(os.getenv("SERVER_LIMIT_CONCURRENCY", "50")),  # Per worker
+        limit_max_requests=int(os.getenv("SERVER_MAX_REQUESTS", "1000")) or None,  # Restart worker after N requests to prevent memory leaks (0: never)
         log_level="info"
     ) 
\ No newline at end of file
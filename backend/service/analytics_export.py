@@ -0,0 +1,263 @@
+"""
+분석 이벤트 대량 내보내기
+
+analytics_events를 기간 단위로 서버 측 커서(yield_per)로 읽어 청크마다 바로 출력합니다.
+행 수와 관계없이 메모리 사용량은 청크 하나 분량으로 일정합니다.
+
+- csv: 청크별 CSV, 스트림 전체를 gzip 또는 zstd로 압축 가능
+- parquet: 청크마다 row group 하나 (컬럼 압축 codec: gzip / zstd)
+- arrow: Arrow IPC 스트림, 청크마다 record batch 하나 (zstd만 지원)
+
+pyarrow(parquet/arrow), zstandard(csv + zstd)가 설치되어 있지 않으면 해당 옵션만 사용할 수 없습니다.
+
+CLI:
+    python -m backend.service.analytics_export --start 2026-10-01 --end 2026-11-01 \\
+        --format parquet --compression zstd --output events.parquet
+"""
+import csv
+import io
+import json
+import logging
+import os
+import zlib
+from datetime import datetime
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from backend.database.dao.analytics_dao import AnalyticsDAO
+from backend.database.model import EventType
+from backend.utils.lazy_import import lazy_module, module_available
+
+# pyarrow/zstandard는 첫 내보내기 요청 시 import (앱 시작 시간에 포함되지 않음)
+PYARROW_AVAILABLE = module_available("pyarrow")
+pa = lazy_module("pyarrow")
+pq = lazy_module("pyarrow.parquet")
+ZSTANDARD_AVAILABLE = module_available("zstandard")
+zstandard = lazy_module("zstandard")
+
+logger = logging.getLogger(__name__)
+
+# 서버 측 커서에서 한 번에 가져올 행 수 (= CSV 청크 / Parquet row group 크기)
+ANALYTICS_EXPORT_CHUNK_SIZE = int(os.getenv("ANALYTICS_EXPORT_CHUNK_SIZE", "10000"))
+
+EXPORT_FORMATS = ('csv', 'parquet', 'arrow')
+EXPORT_COMPRESSIONS = ('none', 'gzip', 'zstd')
+EXPORT_COLUMNS = ('id', 'event_type', 'user_id', 'referrer', 'event_metadata', 'created_at')
+
+_FORMAT_EXTENSIONS = {'csv': 'csv', 'parquet': 'parquet', 'arrow': 'arrows'}
+_FORMAT_MEDIA_TYPES = {
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+    'arrow': 'application/vnd.apache.arrow.stream',
+}
+
+
+def validate_export_options(format: str, compression: str) -> None:
+    """지원하지 않는 형식/압축 조합이거나 필요한 패키지가 없으면 ValueError"""
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {format} ({', '.join(EXPORT_FORMATS)})")
+    if compression not in EXPORT_COMPRESSIONS:
+        raise ValueError(f"지원하지 않는 압축 방식입니다: {compression} ({', '.join(EXPORT_COMPRESSIONS)})")
+    if format in ('parquet', 'arrow') and not PYARROW_AVAILABLE:
+        raise ValueError(f"{format} 형식을 사용하려면 pyarrow 패키지가 필요합니다.")
+    if format == 'arrow' and compression == 'gzip':
+        raise ValueError("arrow 형식은 zstd 압축만 지원합니다.")
+    if format == 'csv' and compression == 'zstd' and not ZSTANDARD_AVAILABLE:
+        raise ValueError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다.")
+
+
+def export_filename(start_date: datetime, end_date: datetime, format: str, compression: str) -> str:
+    name = f"analytics_events_{start_date:%Y%m%d}_{end_date:%Y%m%d}.{_FORMAT_EXTENSIONS[format]}"
+    if format == 'csv' and compression != 'none':
+        name += '.gz' if compression == 'gzip' else '.zst'
+    return name
+
+
+def export_media_type(format: str, compression: str) -> str:
+    if format == 'csv' and compression == 'gzip':
+        return 'application/gzip'
+    if format == 'csv' and compression == 'zstd':
+        return 'application/zstd'
+    return _FORMAT_MEDIA_TYPES[format]
+
+
+def _row_values(row: Sequence[Any]) -> List[Any]:
+    """DB 행을 내보내기 값으로 변환 (메타데이터는 JSON 문자열)"""
+    event_id, event_type, user_id, referrer, metadata, created_at = row
+    return [
+        event_id,
+        event_type.value if isinstance(event_type, EventType) else event_type,
+        user_id,
+        referrer,
+        json.dumps(metadata, ensure_ascii=False) if metadata is not None else None,
+        created_at,
+    ]
+
+
+class _ChunkSink(io.RawIOBase):
+    """pyarrow writer 출력을 모아 두었다가 청크 단위로 꺼내는 파일 객체"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _compress_stream(chunks: Iterator[bytes], compression: str) -> Iterator[bytes]:
+    if compression == 'none':
+        yield from chunks
+        return
+
+    if compression == 'gzip':
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip 헤더
+    else:
+        compressor = zstandard.ZstdCompressor(level=3).compressobj()
+
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _iter_csv(row_chunks: Iterator[Sequence[Any]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in row_chunks:
+        for row in rows:
+            values = _row_values(row)
+            values[-1] = values[-1].isoformat(sep=' ')
+            writer.writerow(values)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def _arrow_schema():
+    return pa.schema([
+        ('id', pa.int64()),
+        ('event_type', pa.string()),
+        ('user_id', pa.int64()),
+        ('referrer', pa.string()),
+        ('event_metadata', pa.string()),
+        ('created_at', pa.timestamp('us')),
+    ])
+
+
+def _iter_arrow(row_chunks: Iterator[Sequence[Any]], format: str, compression: str) -> Iterator[bytes]:
+    schema = _arrow_schema()
+    sink = _ChunkSink()
+    codec = None if compression == 'none' else compression
+
+    if format == 'parquet':
+        writer = pq.ParquetWriter(sink, schema, compression=codec or 'none')
+    else:
+        writer = pa.ipc.new_stream(sink, schema, options=pa.ipc.IpcWriteOptions(compression=codec))
+
+    try:
+        for rows in row_chunks:
+            columns = list(zip(*(_row_values(row) for row in rows)))
+            batch = pa.record_batch([pa.array(values, type=field.type) for values, field in zip(columns, schema)], schema=schema)
+            if format == 'parquet':
+                writer.write_batch(batch)
+            else:
+                writer.write(batch)
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def iter_export(
+    db: Session,
+    start_date: datetime,
+    end_date: datetime,
+    format: str = 'csv',
+    compression: str = 'none',
+    event_types: Optional[List[EventType]] = None,
+    chunk_size: int = ANALYTICS_EXPORT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    기간 내 이벤트를 지정한 형식의 바이트 청크로 생성합니다.
+
+    Yields:
+        파일 내용 바이트 조각 (순서대로 이어 붙이면 완전한 파일)
+    """
+    validate_export_options(format, compression)
+    row_chunks = AnalyticsDAO(db).iter_event_chunks(start_date, end_date, event_types, chunk_size)
+
+    if format == 'csv':
+        return _compress_stream(_iter_csv(row_chunks), compression)
+    return _iter_arrow(row_chunks, format, compression)
+
+
+def stream_export(session_factory: Callable[[], Session], *args, **kwargs) -> Iterator[bytes]:
+    """
+    전용 세션으로 iter_export를 실행합니다. (StreamingResponse용)
+    요청 세션은 응답 전송 전에 닫힐 수 있으므로 스트림이 끝날 때 직접 세션을 닫습니다.
+    """
+    db = session_factory()
+    try:
+        yield from iter_export(db, *args, **kwargs)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    from backend.database.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="analytics_events 내보내기")
+    parser.add_argument("--start", required=True, type=datetime.fromisoformat, help="시작 시각 (포함, ISO 8601)")
+    parser.add_argument("--end", required=True, type=datetime.fromisoformat, help="종료 시각 (미포함, ISO 8601)")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default='csv')
+    parser.add_argument("--compression", choices=EXPORT_COMPRESSIONS, default='none')
+    parser.add_argument("--event-type", action='append', choices=[e.value for e in EventType], help="여러 번 지정 가능")
+    parser.add_argument("--chunk-size", type=int, default=ANALYTICS_EXPORT_CHUNK_SIZE)
+    parser.add_argument("--output", help="출력 파일 (생략 시 표준 출력)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        validate_export_options(args.format, args.compression)
+    except ValueError as e:
+        parser.error(str(e))
+
+    event_types = [EventType(value) for value in args.event_type] if args.event_type else None
+    output = open(args.output, 'wb') if args.output else sys.stdout.buffer
+    written = 0
+    try:
+        for chunk in stream_export(
+            SessionLocal, args.start, args.end, args.format, args.compression, event_types, args.chunk_size
+        ):
+            output.write(chunk)
+            written += len(chunk)
+    finally:
+        if args.output:
+            output.close()
+    logger.info(f"Exported {written} bytes")
@@ -0,0 +1,307 @@
+"""
+Analytics 이벤트 비동기 배치 적재 (write-behind)
+
+요청 처리 중에는 이벤트를 메모리 큐에 O(1)로 넣기만 하고,
+백그라운드 워커 스레드가 자체 DB 세션으로 배치 INSERT(대량이면 PostgreSQL COPY)를 수행합니다.
+- 요청 세션을 공유하지 않으므로 분석 적재 실패가 메인 트랜잭션에 영향을 주지 않음
+- 큐 크기 상한 + 초과 정책(drop_oldest / drop_newest)으로 메모리 사용량 제한
+- 배치 크기 또는 플러시 주기 중 먼저 도달하는 조건으로 플러시
+- 종료 시 남은 이벤트 플러시, 적재 지연(lag)/드롭/실패 지표 제공
+
+워커가 실행 중이 아니면 (ANALYTICS_INGEST_MODE=sync, 테스트 등) 호출한 쪽 엔진에
+별도 세션을 열어 즉시 기록합니다.
+"""
+import io
+import json
+import logging
+import os
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from backend.database.model import AnalyticsEvent, EventType
+
+logger = logging.getLogger(__name__)
+
+# async: 백그라운드 배치 적재, sync: 요청마다 즉시 기록
+ANALYTICS_INGEST_MODE = os.getenv("ANALYTICS_INGEST_MODE", "async").lower()
+
+# 큐 최대 이벤트 수 (메모리 상한)
+ANALYTICS_QUEUE_MAX_SIZE = int(os.getenv("ANALYTICS_QUEUE_MAX_SIZE", "10000"))
+
+# 한 번에 적재할 최대 이벤트 수
+ANALYTICS_BATCH_SIZE = int(os.getenv("ANALYTICS_BATCH_SIZE", "500"))
+
+# 배치가 차지 않아도 플러시하는 주기 (초)
+ANALYTICS_FLUSH_INTERVAL_SECONDS = float(os.getenv("ANALYTICS_FLUSH_INTERVAL_SECONDS", "1.0"))
+
+# 큐가 가득 찼을 때 정책: drop_oldest (오래된 이벤트 버림) / drop_newest (새 이벤트 버림)
+ANALYTICS_OVERFLOW_POLICY = os.getenv("ANALYTICS_OVERFLOW_POLICY", "drop_oldest").lower()
+
+# 이 크기 이상 배치는 PostgreSQL에서 COPY로 적재
+COPY_MIN_BATCH_SIZE = 200
+
+_COPY_COLUMNS = ('event_type', 'user_id', 'referrer', 'event_metadata', 'created_at')
+
+# COPY text 형식 이스케이프 (백슬래시를 먼저 치환)
+_COPY_ESCAPES = (('\\', '\\\\'), ('\t', '\\t'), ('\n', '\\n'), ('\r', '\\r'))
+
+
+def is_async_ingest_enabled() -> bool:
+    """백그라운드 배치 적재 사용 여부"""
+    return ANALYTICS_INGEST_MODE != 'sync'
+
+
+def build_event_row(
+    event_type: EventType,
+    user_id: Optional[int] = None,
+    referrer: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    created_at: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """analytics_events INSERT용 행을 만듭니다. (발생 시각은 큐 적재 시점이 아닌 호출 시점)"""
+    event = AnalyticsEvent()
+    event.set_metadata(metadata)
+    return {
+        "event_type": event_type,
+        "user_id": user_id,
+        "referrer": referrer,
+        "event_metadata": event.event_metadata,
+        "created_at": created_at or datetime.utcnow(),
+    }
+
+
+def _copy_metadata(value: Any) -> Optional[str]:
+    """COPY용 메타데이터 JSON 텍스트 (이미 직렬화된 문자열은 다시 인코딩하지 않음)"""
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def _copy_field(value: Any) -> str:
+    """COPY text 형식 필드 (NULL은 \\N, 빈 문자열은 빈 필드로 구분)"""
+    if value is None:
+        return '\\N'
+    text = str(value)
+    for char, escaped in _COPY_ESCAPES:
+        text = text.replace(char, escaped)
+    return text
+
+
+def _copy_buffer(rows: List[Dict[str, Any]]) -> io.StringIO:
+    """COPY FROM STDIN에 보낼 text 형식(탭 구분) 버퍼를 만듭니다."""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write('\t'.join(_copy_field(value) for value in (
+            row["event_type"].value,
+            row["user_id"],
+            row["referrer"],
+            _copy_metadata(row["event_metadata"]),
+            row["created_at"].isoformat(sep=' '),
+        )) + '\n')
+    buffer.seek(0)
+    return buffer
+
+
+def _copy_rows(session: Session, rows: List[Dict[str, Any]]) -> None:
+    """PostgreSQL COPY FROM STDIN (text 형식)으로 적재합니다."""
+    buffer = _copy_buffer(rows)
+
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {AnalyticsEvent.__tablename__} ({', '.join(_COPY_COLUMNS)}) FROM STDIN WITH (FORMAT text)",
+            buffer
+        )
+    finally:
+        cursor.close()
+
+
+def write_event_rows(session: Session, rows: List[Dict[str, Any]]) -> None:
+    """이벤트 행들을 한 트랜잭션으로 적재합니다. (multi-row INSERT 또는 COPY)"""
+    if not rows:
+        return
+    if session.get_bind().dialect.name == 'postgresql' and len(rows) >= COPY_MIN_BATCH_SIZE:
+        _copy_rows(session, rows)
+    else:
+        session.execute(insert(AnalyticsEvent.__table__), rows)
+    session.commit()
+
+
+class AnalyticsIngestQueue:
+    """
+    메모리 제한 이벤트 큐 + 배치 플러시 워커
+
+    사용법:
+        analytics_ingest_queue.start()      # 애플리케이션 시작 시
+        analytics_ingest_queue.enqueue(row) # 요청 처리 중 (O(1))
+        analytics_ingest_queue.stop()       # 종료 시 남은 이벤트 플러시
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        max_size: int = ANALYTICS_QUEUE_MAX_SIZE,
+        batch_size: int = ANALYTICS_BATCH_SIZE,
+        flush_interval: float = ANALYTICS_FLUSH_INTERVAL_SECONDS,
+        overflow_policy: str = ANALYTICS_OVERFLOW_POLICY
+    ):
+        self.session_factory = session_factory
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+        self.enqueued_total = 0
+        self.written_total = 0
+        self.dropped_total = 0
+        self.failed_total = 0
+        self.batches_total = 0
+        self.last_flush_at: Optional[datetime] = None
+        self.last_batch_lag_seconds: Optional[float] = None
+        self.max_batch_lag_seconds = 0.0
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ==================== Lifecycle ====================
+
+    def start(self) -> None:
+        """플러시 워커 스레드를 시작합니다."""
+        if self.running:
+            return
+        if self.session_factory is None:
+            from backend.database.database import SessionLocal
+            self.session_factory = SessionLocal
+
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="analytics-ingest", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Analytics ingest worker started (batch={self.batch_size}, interval={self.flush_interval}s, "
+            f"max_size={self.max_size}, policy={self.overflow_policy})"
+        )
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """워커를 중지하고 큐에 남은 이벤트를 모두 플러시합니다."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self.session_factory is not None:
+            self.flush()
+        logger.info(f"Analytics ingest worker stopped: {self.stats()}")
+
+    # ==================== Enqueue ====================
+
+    def enqueue(self, row: Dict[str, Any]) -> bool:
+        """
+        이벤트를 큐에 넣습니다.
+
+        Returns:
+            큐에 들어갔으면 True, 초과 정책으로 버려졌으면 False
+        """
+        with self._condition:
+            if len(self._queue) >= self.max_size:
+                self.dropped_total += 1
+                if self.overflow_policy == 'drop_newest':
+                    return False
+                self._queue.popleft()
+
+            self._queue.append(row)
+            self.enqueued_total += 1
+            if len(self._queue) >= self.batch_size:
+                self._condition.notify()
+            return True
+
+    # ==================== Flush ====================
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        with self._condition:
+            count = min(self.batch_size, len(self._queue))
+            return [self._queue.popleft() for _ in range(count)]
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        session = self.session_factory()
+        try:
+            write_event_rows(session, batch)
+            now = datetime.utcnow()
+            lag = (now - min(row["created_at"] for row in batch)).total_seconds()
+            self.written_total += len(batch)
+            self.batches_total += 1
+            self.last_flush_at = now
+            self.last_batch_lag_seconds = round(lag, 3)
+            self.max_batch_lag_seconds = max(self.max_batch_lag_seconds, round(lag, 3))
+        except Exception as e:
+            session.rollback()
+            self.failed_total += len(batch)
+            self.last_error = str(e)
+            logger.error(f"Failed to write analytics batch ({len(batch)} events): {e}")
+        finally:
+            session.close()
+
+    def flush(self) -> int:
+        """큐에 있는 이벤트를 모두 적재합니다. (적재 시도한 이벤트 수 반환)"""
+        total = 0
+        with self._flush_lock:
+            while True:
+                batch = self._take_batch()
+                if not batch:
+                    return total
+                self._write_batch(batch)
+                total += len(batch)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._stopping and len(self._queue) < self.batch_size:
+                    self._condition.wait(self.flush_interval)
+                stopping = self._stopping
+            if stopping:
+                return
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Analytics ingest worker error: {e}")
+
+    # ==================== Metrics ====================
+
+    def stats(self) -> Dict[str, Any]:
+        """큐 상태 및 적재 지표"""
+        with self._condition:
+            queued = len(self._queue)
+            oldest = self._queue[0]["created_at"] if queued else None
+        return {
+            "mode": "async" if self.running else "sync",
+            "running": self.running,
+            "queued": queued,
+            "max_size": self.max_size,
+            "oldest_queued_age_seconds": round((datetime.utcnow() - oldest).total_seconds(), 3) if oldest else 0.0,
+            "enqueued_total": self.enqueued_total,
+            "written_total": self.written_total,
+            "dropped_total": self.dropped_total,
+            "failed_total": self.failed_total,
+            "batches_total": self.batches_total,
+            "last_flush_at": self.last_flush_at,
+            "last_batch_lag_seconds": self.last_batch_lag_seconds,
+            "max_batch_lag_seconds": self.max_batch_lag_seconds,
+            "last_error": self.last_error,
+        }
+
+
+# 프로세스 전역 큐
+analytics_ingest_queue = AnalyticsIngestQueue()
@@ -0,0 +1,84 @@
+"""
+analytics_events 월별 파티션 유지 관리
+
+TimescaleDB가 없는 PostgreSQL에서 analytics_events를 월 단위 범위 파티션으로 운영합니다.
+- 앞으로 ANALYTICS_PARTITION_PREMAKE_MONTHS개월 파티션을 미리 생성 (DEFAULT 파티션으로 떨어지지 않도록)
+- 보관 기간(ANALYTICS_RETENTION_MONTHS)이 지난 파티션은 DELETE 대신 DETACH + DROP
+  → 인덱스/VACUUM 비용이 전체 이력이 아닌 최근 파티션 크기에만 비례
+- 집계 테이블(롤업, 방문자 스케치, 트렌딩)은 원본 파티션 삭제와 무관하게 유지
+
+파티션 테이블이 아니면 (SQLite, 전환 전 PostgreSQL, TimescaleDB hypertable) 아무 작업도 하지 않습니다.
+"""
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from backend.database.dao.analytics_partition_dao import AnalyticsPartitionDAO
+
+logger = logging.getLogger(__name__)
+
+# 원본 이벤트 보관 기간 (개월, 0이면 삭제하지 않음). TimescaleDB retention 정책(365일)과 동일하게 기본 12개월
+ANALYTICS_RETENTION_MONTHS = int(os.getenv("ANALYTICS_RETENTION_MONTHS", "12"))
+
+# 미리 만들어 둘 미래 파티션 수 (개월)
+ANALYTICS_PARTITION_PREMAKE_MONTHS = int(os.getenv("ANALYTICS_PARTITION_PREMAKE_MONTHS", "3"))
+
+# 파티션 유지 관리 주기 (초)
+ANALYTICS_PARTITION_MAINTENANCE_SECONDS = int(os.getenv("ANALYTICS_PARTITION_MAINTENANCE_SECONDS", "3600"))
+
+
+def month_start(value: datetime) -> datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """월 시작 시각에 months개월을 더합니다."""
+    index = value.year * 12 + (value.month - 1) + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def maintain_analytics_partitions(
+    db: Session,
+    now: Optional[datetime] = None,
+    premake_months: int = ANALYTICS_PARTITION_PREMAKE_MONTHS,
+    retention_months: int = ANALYTICS_RETENTION_MONTHS
+) -> Dict[str, Any]:
+    """
+    미래 파티션을 생성하고 보관 기간이 지난 파티션을 삭제합니다. (멱등)
+
+    Returns:
+        {"partitioned": bool, "created": [...], "dropped": [...]}
+    """
+    dao = AnalyticsPartitionDAO(db)
+    result: Dict[str, Any] = {"partitioned": False, "created": [], "dropped": []}
+    if not dao.is_partitioned():
+        return result
+    result["partitioned"] = True
+
+    current = month_start(now or datetime.utcnow())
+    try:
+        existing = {name for name, _ in dao.list_partitions()}
+        for offset in range(premake_months + 1):
+            start = add_months(current, offset)
+            name = dao.create_month_partition(start, add_months(start, 1))
+            if name not in existing:
+                result["created"].append(name)
+
+        if retention_months > 0:
+            # 상한이 보관 기준 이전인 파티션은 모든 행이 보관 기간을 지남
+            cutoff = add_months(current, -retention_months)
+            for name, upper in dao.list_partitions():
+                if upper is not None and upper <= cutoff:
+                    dao.drop_partition(name)
+                    result["dropped"].append(name)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    if result["created"] or result["dropped"]:
+        logger.info(f"Analytics partitions maintained: {result}")
+    return result
@@ -0,0 +1,350 @@
+"""
+Analytics 증분 롤업 엔진
+
+TimescaleDB continuous aggregate가 없는 환경에서 analytics_events를
+시간별/일별 집계 테이블(analytics_rollup 모델)로 주기적으로 요약합니다.
+시간별 고유 방문자 HyperLogLog 스케치는 집계 백엔드와 관계없이 항상 유지합니다.
+
+- 워터마크(마지막으로 반영한 이벤트 id) 이후 이벤트만 배치로 읽어 집계
+- 집계 upsert + 워터마크 갱신을 한 트랜잭션으로 커밋 → 재실행/중복 실행에도 멱등
+- 워터마크 행을 FOR UPDATE로 잠가 여러 워커 프로세스가 동시에 돌아도 중복 집계 방지
+- 멀티 워커 배포에서는 공유 상태(SHARED_STATE_BACKEND=redis)의 리더 임대를 가진 워커만 주기 실행
+- 최근 ANALYTICS_ROLLUP_SAFETY_LAG_SECONDS 이내 이벤트는 다음 주기로 미룸
+  (아직 커밋되지 않은 트랜잭션, 적재 큐에 머무는 이벤트가 더 작은 id로 늦게 들어오는 경우 대비)
+
+수동 실행 (백필):
+    python -m backend.service.analytics_rollup
+"""
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.database.dao.analytics_rollup_dao import AnalyticsRollupDAO
+from backend.database.model import (
+    AnalyticsHourlyEvents,
+    AnalyticsDailySearchKeywords,
+    AnalyticsDailyServerViews,
+    EventType
+)
+from backend.database.model.analytics_rollup import ANONYMOUS_USER_ID
+from backend.utils.hyperloglog import HyperLogLog
+from backend.utils.shared_state import process_token, shared_state
+
+logger = logging.getLogger(__name__)
+
+# 롤업 실행 주기 (초)
+ANALYTICS_ROLLUP_INTERVAL_SECONDS = int(os.getenv("ANALYTICS_ROLLUP_INTERVAL_SECONDS", "60"))
+
+# 이 시간보다 최근 이벤트는 집계하지 않음 (초)
+ANALYTICS_ROLLUP_SAFETY_LAG_SECONDS = int(os.getenv("ANALYTICS_ROLLUP_SAFETY_LAG_SECONDS", "120"))
+
+# 한 트랜잭션에서 처리할 최대 이벤트 수
+ANALYTICS_ROLLUP_BATCH_SIZE = int(os.getenv("ANALYTICS_ROLLUP_BATCH_SIZE", "5000"))
+
+WATERMARK_NAME = 'analytics_events'
+
+# 주기 롤업을 실행할 워커 한 곳을 정하는 공유 상태 슬롯 이름
+ROLLUP_LEADER_SLOT = 'analytics-rollup-leader'
+
+# TimescaleDB 백엔드에서 방문자 스케치만 유지할 때의 워터마크
+VISITOR_WATERMARK_NAME = 'analytics_events_visitors'
+
+SEARCH_EVENT_TYPES = {EventType.SEARCH.value, EventType.SEARCH_NO_RESULTS.value}
+SERVER_VIEW_EVENT_TYPES = {
+    EventType.SERVER_VIEW.value,
+    EventType.SERVER_VIEW_FROM_SEARCH.value,
+    EventType.SERVER_VIEW_FROM_LIST.value,
+    EventType.SERVER_VIEW_DIRECT.value,
+}
+
+# 검색 키워드 컬럼 길이 제한
+MAX_KEYWORD_LENGTH = 255
+
+
+def _event_type_value(event_type: Any) -> str:
+    return event_type.value if isinstance(event_type, EventType) else str(event_type)
+
+
+def _event_metadata(event: Any) -> Dict[str, Any]:
+    """이벤트 메타데이터 dict (컬럼 타입이 역직렬화, 잘못된 값은 빈 dict)"""
+    metadata = event.event_metadata
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def aggregate_events(events: Iterable[Any]) -> Tuple[Dict[Tuple, int], Dict[Tuple, int], Dict[Tuple, int]]:
+    """
+    이벤트 목록을 집계 테이블 키별 건수로 요약합니다.
+
+    Returns:
+        (시간별 이벤트, 일별 검색 키워드, 일별 서버 조회) 각각 {PK 튜플: 건수}
+    """
+    hourly: Dict[Tuple, int] = {}
+    keywords: Dict[Tuple, int] = {}
+    server_views: Dict[Tuple, int] = {}
+
+    for event in events:
+        event_type = _event_type_value(event.event_type)
+        hour = event.created_at.replace(minute=0, second=0, microsecond=0)
+        day = hour.replace(hour=0)
+
+        key = (hour, event_type, event.user_id or ANONYMOUS_USER_ID)
+        hourly[key] = hourly.get(key, 0) + 1
+
+        if event_type not in SEARCH_EVENT_TYPES and event_type not in SERVER_VIEW_EVENT_TYPES:
+            continue
+        metadata = _event_metadata(event)
+
+        if event_type in SEARCH_EVENT_TYPES:
+            keyword = metadata.get("keyword")
+            if keyword:
+                key = (day, str(keyword)[:MAX_KEYWORD_LENGTH])
+                keywords[key] = keywords.get(key, 0) + 1
+        else:
+            try:
+                mcp_server_id = int(metadata.get("mcp_server_id"))
+            except (TypeError, ValueError):
+                continue
+            key = (day, mcp_server_id, event_type)
+            server_views[key] = server_views.get(key, 0) + 1
+
+    return hourly, keywords, server_views
+
+
+def build_visitor_sketches(events: Iterable[Any]) -> Dict[Tuple[datetime, str], HyperLogLog]:
+    """
+    이벤트 목록으로 (hour, visitor_kind)별 HyperLogLog 스케치를 만듭니다.
+
+    로그인 이벤트는 user_id, 비로그인 이벤트는 metadata의 visitor_id(방문자 지문)를 사용합니다.
+    """
+    sketches: Dict[Tuple[datetime, str], HyperLogLog] = {}
+    for event in events:
+        if event.user_id:
+            key, value = 'user', f"u:{event.user_id}"
+        else:
+            visitor_id = _event_metadata(event).get("visitor_id")
+            if not visitor_id:
+                continue
+            key, value = 'anonymous', f"v:{visitor_id}"
+
+        hour = event.created_at.replace(minute=0, second=0, microsecond=0)
+        sketch = sketches.get((hour, key))
+        if sketch is None:
+            sketch = sketches[(hour, key)] = HyperLogLog()
+        sketch.add(value)
+    return sketches
+
+
+def run_rollup_once(
+    db: Session,
+    now: Optional[datetime] = None,
+    batch_size: int = ANALYTICS_ROLLUP_BATCH_SIZE,
+    safety_lag_seconds: int = ANALYTICS_ROLLUP_SAFETY_LAG_SECONDS,
+    aggregate_tables: bool = True
+) -> int:
+    """
+    워터마크 이후 이벤트를 모두 집계 테이블과 방문자 스케치에 반영합니다.
+
+    Args:
+        aggregate_tables: False면 (TimescaleDB 백엔드) 방문자 스케치만 갱신
+
+    Returns:
+        반영한 이벤트 수
+    """
+    dao = AnalyticsRollupDAO(db)
+    watermark_name = WATERMARK_NAME if aggregate_tables else VISITOR_WATERMARK_NAME
+    cutoff = (now or datetime.utcnow()) - timedelta(seconds=safety_lag_seconds)
+    processed = 0
+
+    while True:
+        try:
+            watermark = dao.get_watermark(watermark_name, lock=True)
+            events = dao.get_events_after(watermark, batch_size)
+
+            ready = []
+            for event in events:
+                if event.created_at > cutoff:
+                    break
+                ready.append(event)
+            if not ready:
+                db.rollback()
+                return processed
+
+            if aggregate_tables:
+                hourly, keywords, server_views = aggregate_events(ready)
+                dao.increment(AnalyticsHourlyEvents, hourly)
+                dao.increment(AnalyticsDailySearchKeywords, keywords)
+                dao.increment(AnalyticsDailyServerViews, server_views)
+            dao.merge_visitor_sketches(build_visitor_sketches(ready))
+            dao.set_watermark(watermark_name, ready[-1].id)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        processed += len(ready)
+        if len(ready) < batch_size:
+            return processed
+
+
+def get_rollup_lag(db: Session, aggregate_tables: bool = True) -> Dict[str, Any]:
+    """집계되지 않은 이벤트 수 등 롤업 진행 상태"""
+    dao = AnalyticsRollupDAO(db)
+    watermark = dao.get_watermark(WATERMARK_NAME if aggregate_tables else VISITOR_WATERMARK_NAME)
+    return {
+        "watermark_event_id": watermark,
+        "pending_events": max(0, dao.get_max_event_id() - watermark),
+    }
+
+
+class AnalyticsRollupWorker:
+    """run_rollup_once를 주기적으로 실행하는 백그라운드 스레드 (TimescaleDB 백엔드면 방문자 스케치만 갱신)"""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        interval_seconds: int = ANALYTICS_ROLLUP_INTERVAL_SECONDS
+    ):
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.runs_total = 0
+        self.events_total = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_processed = 0
+        self.last_error: Optional[str] = None
+        self.trending_refreshed_at: Optional[datetime] = None
+        self.partitions_maintained_at: Optional[datetime] = None
+        self.is_leader = False
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        if self.session_factory is None:
+            from backend.database.database import SessionLocal
+            self.session_factory = SessionLocal
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="analytics-rollup", daemon=True)
+        self._thread.start()
+        logger.info(f"Analytics rollup worker started (interval={self.interval_seconds}s)")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self) -> int:
+        from backend.database.dao.analytics_dao import resolve_analytics_backend
+
+        db = self.session_factory()
+        try:
+            processed = run_rollup_once(db, aggregate_tables=resolve_analytics_backend(db) == 'rollup')
+            self.runs_total += 1
+            self.events_total += processed
+            self.last_processed = processed
+            self.last_run_at = datetime.utcnow()
+            self.last_error = None
+            self._refresh_trending(db)
+            self._maintain_partitions(db)
+            return processed
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error(f"Analytics rollup failed: {e}")
+            return 0
+        finally:
+            db.close()
+
+    def _refresh_trending(self, db: Session) -> None:
+        """TRENDING_REFRESH_SECONDS마다 급상승 서버 순위를 다시 계산"""
+        from backend.service.trending_engine import TRENDING_REFRESH_SECONDS, refresh_trending_rankings
+
+        now = datetime.utcnow()
+        if self.trending_refreshed_at and (now - self.trending_refreshed_at).total_seconds() < TRENDING_REFRESH_SECONDS:
+            return
+        try:
+            refresh_trending_rankings(db, now)
+            self.trending_refreshed_at = now
+        except Exception as e:
+            logger.error(f"Trending refresh failed: {e}")
+
+    def _maintain_partitions(self, db: Session) -> None:
+        """ANALYTICS_PARTITION_MAINTENANCE_SECONDS마다 analytics_events 파티션 생성/보관 기간 정리"""
+        from backend.service.analytics_partitions import (
+            ANALYTICS_PARTITION_MAINTENANCE_SECONDS,
+            maintain_analytics_partitions
+        )
+
+        now = datetime.utcnow()
+        if (
+            self.partitions_maintained_at
+            and (now - self.partitions_maintained_at).total_seconds() < ANALYTICS_PARTITION_MAINTENANCE_SECONDS
+        ):
+            return
+        try:
+            maintain_analytics_partitions(db, now)
+            self.partitions_maintained_at = now
+        except Exception as e:
+            logger.error(f"Analytics partition maintenance failed: {e}")
+
+    def _acquire_leadership(self) -> bool:
+        """
+        여러 워커 프로세스 중 하나만 롤업을 실행하도록 공유 상태에서 리더 임대를 획득/갱신
+        (리더 프로세스가 죽으면 임대 만료 후 다른 워커가 이어받음, local 백엔드는 항상 리더)
+        """
+        lease_seconds = max(self.interval_seconds * 3, 60)
+        try:
+            self.is_leader = shared_state.acquire_slot(ROLLUP_LEADER_SLOT, process_token(), 1, lease_seconds)
+        except Exception as e:
+            logger.error(f"Analytics rollup leader election failed: {e}")
+            self.is_leader = False
+        return self.is_leader
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            if self._acquire_leadership():
+                self.run_once()
+            self._stop_event.wait(self.interval_seconds)
+        if self.is_leader:
+            shared_state.release_slot(ROLLUP_LEADER_SLOT, process_token())
+            self.is_leader = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "is_leader": self.is_leader,
+            "interval_seconds": self.interval_seconds,
+            "runs_total": self.runs_total,
+            "events_total": self.events_total,
+            "last_run_at": self.last_run_at,
+            "last_processed": self.last_processed,
+            "last_error": self.last_error,
+            "trending_refreshed_at": self.trending_refreshed_at,
+            "partitions_maintained_at": self.partitions_maintained_at,
+        }
+
+
+# 프로세스 전역 워커
+analytics_rollup_worker = AnalyticsRollupWorker()
+
+
+if __name__ == "__main__":
+    from backend.database.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    session = SessionLocal()
+    try:
+        count = run_rollup_once(session, safety_lag_seconds=0)
+        print(f"집계 테이블에 {count}개 이벤트를 반영했습니다. {get_rollup_lag(session)}")
+    finally:
+        session.close()
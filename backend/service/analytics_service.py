@@ -7,13 +7,58 @@ Analytics Service - Business Logic Layer for Analytics
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import hmac
 import logging
+import os
 
+from backend.database.database import SessionLocal
 from backend.database.dao.analytics_dao import AnalyticsDAO
 from backend.database.model import EventType
+from backend.service.analytics_ingest import analytics_ingest_queue, build_event_row, write_event_rows
+from backend.service.analytics_summary import analytics_summary_cache, conversion_from_counts
+from backend.service.trending_engine import get_trending
+from backend.service.funnel_engine import funnel_cache
 
 logger = logging.getLogger(__name__)
 
+# 비로그인 방문자 지문 해시 키 (원본 IP/User-Agent는 저장하지 않음)
+ANALYTICS_FINGERPRINT_SECRET = os.getenv("ANALYTICS_FINGERPRINT_SECRET") or os.getenv("SECRET_KEY", "your-secret-key-here")
+
+
+def visitor_fingerprint(client_ip: Optional[str], user_agent: Optional[str]) -> Optional[str]:
+    """IP + User-Agent로 비로그인 방문자 지문(HMAC-SHA256 앞 32자)을 만듭니다."""
+    if not client_ip and not user_agent:
+        return None
+    message = f"{client_ip or ''}|{user_agent or ''}".encode("utf-8")
+    return hmac.new(ANALYTICS_FINGERPRINT_SECRET.encode("utf-8"), message, hashlib.sha256).hexdigest()[:32]
+
+
+def _write_event_row(row: Dict[str, Any]) -> None:
+    with SessionLocal() as session:
+        write_event_rows(session, [row])
+
+
+async def track_event_async(
+    event_type: EventType,
+    user_id: Optional[int] = None,
+    metadata: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    async def 엔드포인트용 이벤트 추적
+
+    적재 워커가 실행 중이면 큐에만 넣고, 아니면 별도 스레드에서 기록해 이벤트 루프를 막지 않습니다.
+    """
+    try:
+        row = build_event_row(event_type=event_type, user_id=user_id, metadata=metadata)
+        if analytics_ingest_queue.running:
+            analytics_ingest_queue.enqueue(row)
+        else:
+            await asyncio.to_thread(_write_event_row, row)
+    except Exception as e:
+        logger.error(f"Failed to track event {event_type.value}: {e}")
+
 
 class AnalyticsService:
     """
@@ -42,22 +87,34 @@ class AnalyticsService:
         event_type: EventType,
         user_id: Optional[int] = None,
         referrer: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        visitor_id: Optional[str] = None
     ):
         """
         범용 이벤트 추적 메서드
 
         모든 이벤트는 이 메서드를 통해 기록될 수 있습니다.
         특정 이벤트 타입을 위한 편의 메서드들도 제공됩니다.
+
+        적재 워커가 실행 중이면 큐에만 넣고 즉시 반환하며,
+        아니면 요청 세션과 분리된 별도 세션으로 바로 기록합니다.
+        비로그인 이벤트의 visitor_id(방문자 지문)는 고유 방문자 집계를 위해 metadata에 저장됩니다.
         """
         try:
-            self.dao.create_event(
+            if visitor_id and user_id is None:
+                metadata = {**(metadata or {}), "visitor_id": visitor_id}
+            row = build_event_row(
                 event_type=event_type,
                 user_id=user_id,
                 referrer=referrer,
                 metadata=metadata
             )
-            logger.info(f"Tracked event: {event_type.value}, user_id={user_id}, metadata={metadata}")
+            if analytics_ingest_queue.running:
+                analytics_ingest_queue.enqueue(row)
+            else:
+                with Session(bind=self.db.get_bind()) as session:
+                    write_event_rows(session, [row])
+            logger.debug(f"Tracked event: {event_type.value}, user_id={user_id}, metadata={metadata}")
         except Exception as e:
             logger.error(f"Failed to track event {event_type.value}: {e}")
             # 분석 실패가 메인 기능을 방해하지 않도록 예외를 삼킴
@@ -67,7 +124,8 @@ class AnalyticsService:
         keyword: str,
         results_count: int,
         user_id: Optional[int] = None,
-        tags: Optional[List[str]] = None
+        tags: Optional[List[str]] = None,
+        visitor_id: Optional[str] = None
     ):
         """검색 이벤트를 추적합니다."""
         metadata = {
@@ -82,7 +140,8 @@ class AnalyticsService:
         self.track_event(
             event_type=event_type,
             user_id=user_id,
-            metadata=metadata
+            metadata=metadata,
+            visitor_id=visitor_id
         )
 
     def track_server_view(
@@ -90,7 +149,8 @@ class AnalyticsService:
         mcp_server_id: int,
         user_id: Optional[int] = None,
         referrer: Optional[str] = None,
-        source: Optional[str] = None
+        source: Optional[str] = None,
+        visitor_id: Optional[str] = None
     ):
         """서버 조회 이벤트를 추적합니다.
 
@@ -99,6 +159,7 @@ class AnalyticsService:
             user_id: 사용자 ID (선택)
             referrer: HTTP Referer 헤더
             source: 유입 경로 (search, list, direct 등)
+            visitor_id: 비로그인 방문자 지문 (visitor_fingerprint)
         """
         # source 파라미터 우선, 없으면 referrer로 판단
         if source:
@@ -131,7 +192,8 @@ class AnalyticsService:
             event_type=event_type,
             user_id=user_id,
             referrer=referrer,
-            metadata=metadata
+            metadata=metadata,
+            visitor_id=visitor_id
         )
 
     def track_favorite_add(
@@ -236,42 +298,14 @@ class AnalyticsService:
         """
         급상승 중인 서버를 조회합니다.
 
-        최근 N일의 조회수와 그 이전 N일의 조회수를 비교하여
-        증가율이 높은 서버를 반환합니다.
+        최근 N일의 조회수와 그 이전 기간의 일평균 조회수를 비교한 증가율에
+        시간 감쇠 가중치를 적용한 점수 순으로 반환합니다. (trending_engine 참고)
+        기본 기간 조합은 롤업 워커가 미리 계산해 둔 순위를 조회만 합니다.
 
         Returns:
-            [{"mcp_server_id": 123, "recent_views": 100, "previous_views": 20, "growth_rate": 4.0}, ...]
+            [{"mcp_server_id": 123, "recent_views": 100, "previous_views": 20, "growth_rate": 5.0, "score": 61.2}, ...]
         """
-        # 최근 기간의 조회수
-        recent_servers = self.dao.get_most_viewed_servers(limit=100, days=days)
-        recent_views = {s["mcp_server_id"]: s["view_count"] for s in recent_servers}
-
-        # 비교 기간의 조회수 (days+1 ~ days+comparison_days+1)
-        # 이를 위해 더 긴 기간을 조회한 후 차이를 계산
-        total_days = days + comparison_days
-        total_servers = self.dao.get_most_viewed_servers(limit=100, days=total_days)
-        total_views = {s["mcp_server_id"]: s["view_count"] for s in total_servers}
-
-        # 증가율 계산
-        trending = []
-        for server_id in recent_views.keys():
-            recent = recent_views[server_id]
-            total = total_views.get(server_id, recent)
-            previous = max(1, total - recent)  # 0으로 나누기 방지
-
-            growth_rate = recent / previous
-
-            trending.append({
-                "mcp_server_id": server_id,
-                "recent_views": recent,
-                "previous_views": previous,
-                "growth_rate": round(growth_rate, 2)
-            })
-
-        # 증가율 기준 정렬
-        trending.sort(key=lambda x: x["growth_rate"], reverse=True)
-
-        return trending[:limit]
+        return get_trending(self.db, limit, days, comparison_days)
 
     def get_search_to_view_conversion_rate(
         self,
@@ -288,25 +322,21 @@ class AnalyticsService:
             }
         """
         start_date = datetime.utcnow() - timedelta(days=days)
+        return conversion_from_counts(self.dao.count_events_grouped(start_date))
 
-        searches = self.dao.count_events_by_type(EventType.SEARCH, start_date)
-
-        # 모든 타입의 서버 조회 합산
-        views = sum([
-            self.dao.count_events_by_type(EventType.SERVER_VIEW, start_date),
-            self.dao.count_events_by_type(EventType.SERVER_VIEW_FROM_SEARCH, start_date),
-            self.dao.count_events_by_type(EventType.SERVER_VIEW_FROM_LIST, start_date),
-            self.dao.count_events_by_type(EventType.SERVER_VIEW_DIRECT, start_date)
-        ])
-
-        conversion_rate = (views / searches) if searches > 0 else 0.0
-
-        return {
-            "searches": searches,
-            "views": views,
-            "conversion_rate": round(conversion_rate, 4)
-        }
+    def get_funnel(
+        self,
+        days: int = 30,
+        window_hours: int = 24,
+        by_cohort: bool = False
+    ) -> Dict[str, Any]:
+        """
+        검색 → 조회 → 즐겨찾기 → 플레이그라운드 사용자 단위 퍼널을 조회합니다.
 
+        같은 사용자가 첫 단계 이후 window_hours 이내에 순서대로 진행한 경우만 전환으로 셉니다.
+        결과는 짧은 TTL 동안 캐시됩니다. (funnel_engine 참고)
+        """
+        return funnel_cache.get(self.db, days, window_hours, by_cohort)
 
     def get_analytics_summary(
         self,
@@ -316,42 +346,6 @@ class AnalyticsService:
         전체 분석 요약 정보를 반환합니다.
 
         대시보드에 표시할 수 있는 종합 정보를 제공합니다.
+        기간별로 짧은 TTL 동안 캐시됩니다. (analytics_summary 참고)
         """
-        start_date = datetime.utcnow() - timedelta(days=days)
-
-        # 각종 이벤트 수 집계
-        searches = self.dao.count_events_by_type(EventType.SEARCH, start_date)
-        server_views = sum([
-            self.dao.count_events_by_type(EventType.SERVER_VIEW, start_date),
-            self.dao.count_events_by_type(EventType.SERVER_VIEW_FROM_SEARCH, start_date),
-            self.dao.count_events_by_type(EventType.SERVER_VIEW_FROM_LIST, start_date),
-            self.dao.count_events_by_type(EventType.SERVER_VIEW_DIRECT, start_date)
-        ])
-        favorites = self.dao.count_events_by_type(EventType.FAVORITE_ADD, start_date)
-        comments = self.dao.count_events_by_type(EventType.COMMENT_ADD, start_date)
-        playground_queries = self.dao.count_events_by_type(EventType.PLAYGROUND_QUERY, start_date)
-
-        # 방문자 통계
-        visitors = self.dao.get_unique_visitors_count(days)
-
-        # 인기 컨텐츠
-        top_keywords = self.get_top_search_keywords(limit=5, days=days)
-        top_servers = self.get_most_viewed_servers(limit=5, days=days)
-
-        # 전환율
-        conversion = self.get_search_to_view_conversion_rate(days)
-
-        return {
-            "period_days": days,
-            "events": {
-                "searches": searches,
-                "server_views": server_views,
-                "favorites": favorites,
-                "comments": comments,
-                "playground_queries": playground_queries
-            },
-            "visitors": visitors,
-            "top_keywords": top_keywords,
-            "top_servers": top_servers,
-            "conversion_rate": conversion
-        }
+        return analytics_summary_cache.get(self.db, days)
@@ -0,0 +1,128 @@
+"""
+관리자 대시보드용 분석 요약 엔진
+
+- 이벤트 타입별 건수를 시간별 집계에 대한 GROUP BY 한 번으로 가져와
+  이벤트 요약과 검색 → 조회 전환율 계산에 함께 사용
+  (타입별 count 쿼리 약 10회 → 1회)
+- 요약 전체는 기간(days)별로 ANALYTICS_SUMMARY_TTL_SECONDS 동안 캐시
+  → 캐시가 비어 있을 때 4회(타입별 건수, 방문자 스케치, 인기 키워드, 인기 서버), 이후 0회 쿼리
+- SHARED_STATE_BACKEND=redis 이면 워커 간에도 계산 결과를 공유
+"""
+import copy
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.database.dao.analytics_dao import AnalyticsDAO
+from backend.database.model import EventType
+from backend.utils.shared_state import shared_state
+
+logger = logging.getLogger(__name__)
+
+# 요약 캐시 유효 시간 (초). 집계 자체가 롤업 주기만큼 지연되므로 짧게 유지
+ANALYTICS_SUMMARY_TTL_SECONDS = int(os.getenv("ANALYTICS_SUMMARY_TTL_SECONDS", "30"))
+
+SERVER_VIEW_EVENT_TYPES = (
+    EventType.SERVER_VIEW,
+    EventType.SERVER_VIEW_FROM_SEARCH,
+    EventType.SERVER_VIEW_FROM_LIST,
+    EventType.SERVER_VIEW_DIRECT,
+)
+
+
+def conversion_from_counts(counts: Dict[str, int]) -> Dict[str, Any]:
+    """이벤트 타입별 건수로 검색 → 서버 조회 전환율을 계산합니다."""
+    searches = counts.get(EventType.SEARCH.value, 0)
+    views = sum(counts.get(event_type.value, 0) for event_type in SERVER_VIEW_EVENT_TYPES)
+    conversion_rate = (views / searches) if searches > 0 else 0.0
+
+    return {
+        "searches": searches,
+        "views": views,
+        "conversion_rate": round(conversion_rate, 4)
+    }
+
+
+def build_analytics_summary(db: Session, days: int = 7) -> Dict[str, Any]:
+    """캐시 없이 분석 요약을 계산합니다."""
+    dao = AnalyticsDAO(db)
+    start_date = datetime.utcnow() - timedelta(days=days)
+
+    counts = dao.count_events_grouped(start_date)
+    conversion = conversion_from_counts(counts)
+
+    return {
+        "period_days": days,
+        "events": {
+            "searches": conversion["searches"],
+            "server_views": conversion["views"],
+            "favorites": counts.get(EventType.FAVORITE_ADD.value, 0),
+            "comments": counts.get(EventType.COMMENT_ADD.value, 0),
+            "playground_queries": counts.get(EventType.PLAYGROUND_QUERY.value, 0)
+        },
+        "visitors": dao.get_unique_visitors_count(days),
+        "top_keywords": dao.get_top_search_keywords(limit=5, days=days),
+        "top_servers": dao.get_most_viewed_servers(limit=5, days=days),
+        "conversion_rate": conversion
+    }
+
+
+class AnalyticsSummaryCache:
+    """(데이터베이스, 기간)별 요약 TTL 캐시"""
+
+    def __init__(self, ttl_seconds: int = ANALYTICS_SUMMARY_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, int], Tuple[float, Dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, db: Session, days: int = 7) -> Dict[str, Any]:
+        key = (str(db.get_bind().url), days)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] <= self.ttl_seconds:
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+
+        # 공유 상태 백엔드(redis)면 다른 워커가 계산한 결과를 재사용
+        shared_key = f"analytics_summary:{key[0]}:{days}"
+        summary = shared_state.cache_get(shared_key) if shared_state.is_shared else None
+        with self._lock:
+            if summary is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if summary is None:
+            # 계산은 락 밖에서 (동시 요청이 같은 기간을 중복 계산할 수는 있음)
+            summary = build_analytics_summary(db, days)
+            if shared_state.is_shared:
+                shared_state.cache_set(shared_key, summary, self.ttl_seconds)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), summary)
+        return copy.deepcopy(summary)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# 프로세스 전역 캐시
+analytics_summary_cache = AnalyticsSummaryCache()
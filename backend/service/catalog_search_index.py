@@ -0,0 +1,544 @@
+"""
+카탈로그 인메모리 검색 인덱스
+
+승인된 MCP 서버(이름, 설명, 태그, 도구 이름, 도구 설명)에 대한 역색인을 프로세스 메모리에 유지합니다.
+- 토큰화 + BM25F 점수 (필드 가중치, 필드 길이 정규화)
+- 정렬된 어휘 목록 + 이진 탐색을 이용한 접두사 매칭
+- 응답 스냅샷을 함께 저장하여 DB 조회 없이 /mcp-servers/search 응답 생성
+
+SEARCH_INDEX_MODE=memory 일 때만 활성화되며, 시작 시 전체 구축 후
+MCPServerService의 승인/수정/삭제 시점에 증분 갱신됩니다.
+다른 워커 프로세스에서 일어난 변경은 조회 전 카탈로그 버전 확인(ensure_catalog_search_index_fresh)으로 반영합니다.
+(패싯/자동완성/시맨틱 인덱스도 CatalogFreshness + refresh_if_catalog_changed로 같은 확인을 사용)
+"""
+import bisect
+import logging
+import math
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.database.model import MCPServer
+
+logger = logging.getLogger(__name__)
+
+# 검색 인덱스 모드 (db: DB 전문 검색, memory: 인메모리 역색인)
+SEARCH_INDEX_MODE = os.getenv("SEARCH_INDEX_MODE", "db").lower()
+
+# 필드별 가중치 (BM25F)
+FIELD_WEIGHTS = {
+    'name': 5.0,
+    'tags': 3.0,
+    'tool_names': 2.0,
+    'description': 1.5,
+    'tool_descriptions': 0.5,
+}
+
+# 접두사로만 일치한 어휘의 점수 배율
+PREFIX_MATCH_BOOST = 0.7
+
+# 검색어 토큰 하나당 확장할 최대 접두사 어휘 수
+MAX_PREFIX_EXPANSIONS = 64
+
+# 카탈로그 버전(DB 집계 쿼리 1회) 확인 최소 간격 (초). 다른 워커의 변경은 최대 이 시간만큼 늦게 반영됨
+CATALOG_FRESHNESS_INTERVAL = float(os.getenv("CATALOG_FRESHNESS_INTERVAL", "1.0"))
+
+# 영문/숫자/한글 단어 단위 (snake_case 도구 이름도 분리)
+_TOKEN_PATTERN = re.compile(r'[^\W_]+', re.UNICODE)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """텍스트를 소문자 토큰 목록으로 변환합니다."""
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def is_memory_search_enabled() -> bool:
+    """인메모리 검색 인덱스 사용 여부를 반환합니다."""
+    return SEARCH_INDEX_MODE == "memory"
+
+
+def _user_snapshot(user) -> Optional[Dict[str, Any]]:
+    if user is None:
+        return None
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "nickname": user.nickname,
+        "is_admin": user.is_admin,
+        "avatar_url": user.avatar_url,
+        "created_at": user.created_at,
+    }
+
+
+def snapshot_mcp_server(mcp_server: MCPServer) -> Dict[str, Any]:
+    """MCPServerResponse 스키마와 동일한 구조의 응답 스냅샷을 생성합니다."""
+    return {
+        "id": mcp_server.id,
+        "name": mcp_server.name,
+        "github_link": mcp_server.github_link,
+        "description": mcp_server.description,
+        "category": mcp_server.category,
+        "status": mcp_server.status,
+        "protocol": mcp_server.protocol,
+        "server_url": mcp_server.server_url,
+        "config": mcp_server.config,
+        "owner_id": mcp_server.owner_id,
+        "created_at": mcp_server.created_at,
+        "updated_at": mcp_server.updated_at,
+        "announcement": mcp_server.announcement,
+        "health_status": mcp_server.health_status or "unknown",
+        "last_health_check": mcp_server.last_health_check,
+        "tools": [
+            {
+                "id": tool.id,
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": [
+                    {
+                        "id": param.id,
+                        "name": param.name,
+                        "description": param.description,
+                        "type": param.type,
+                        "required": bool(param.required),
+                    }
+                    for param in tool.parameters
+                ],
+            }
+            for tool in mcp_server.tools
+        ],
+        "prompts": [
+            {
+                "id": prompt.id,
+                "name": prompt.name,
+                "description": prompt.description,
+                "arguments": [
+                    {
+                        "id": argument.id,
+                        "name": argument.name,
+                        "description": argument.description,
+                        "required": bool(argument.required),
+                    }
+                    for argument in prompt.arguments
+                ],
+            }
+            for prompt in mcp_server.prompts
+        ],
+        "resources": [
+            {
+                "id": resource.id,
+                "uri": resource.uri,
+                "name": resource.name,
+                "description": resource.description,
+                "mime_type": resource.mime_type,
+            }
+            for resource in mcp_server.resources
+        ],
+        "tags": [{"id": tag.id, "name": tag.name} for tag in mcp_server.tags],
+        "owner": _user_snapshot(mcp_server.owner),
+        "favorites_count": 0,
+    }
+
+
+def extract_fields(mcp_server: MCPServer) -> Dict[str, str]:
+    """인덱싱할 필드 텍스트를 추출합니다."""
+    return {
+        'name': mcp_server.name or '',
+        'description': mcp_server.description or '',
+        'tags': ' '.join(tag.name for tag in mcp_server.tags),
+        'tool_names': ' '.join(tool.name for tool in mcp_server.tools),
+        'tool_descriptions': ' '.join(tool.description or '' for tool in mcp_server.tools),
+    }
+
+
+def version_of(mcp_server: Any) -> Tuple[Any, Any, Any]:
+    """
+    DB와 인덱스의 일관성 비교에 사용하는 버전 값입니다.
+
+    응답 스냅샷에 소유자 닉네임/아바타가 포함되므로 소유자의 updated_at도 포함합니다.
+    (버전 조회 행은 owner_updated_at 컬럼, ORM 객체는 owner 관계에서 읽음)
+    """
+    if hasattr(mcp_server, 'owner_updated_at'):
+        owner_updated_at = mcp_server.owner_updated_at
+    else:
+        owner_updated_at = mcp_server.owner.updated_at if mcp_server.owner is not None else None
+    return (mcp_server.updated_at, mcp_server.last_health_check, owner_updated_at)
+
+
+class CatalogFreshness:
+    """
+    인메모리 인덱스가 마지막으로 DB와 맞춰 본 카탈로그 버전과 확인 시각
+
+    인덱스마다 하나씩 두고, 구축 직전에 읽은 버전을 mark()로 기록합니다.
+    """
+
+    def __init__(self):
+        self.catalog_version: Any = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+    def mark(self, catalog_version: Any) -> None:
+        self.catalog_version = catalog_version
+        self.checked_at = time.monotonic()
+
+
+def refresh_if_catalog_changed(db: Session, freshness: CatalogFreshness, repair: Callable[[], bool],
+                               interval: Optional[float] = None) -> bool:
+    """
+    DB의 카탈로그 버전이 마지막으로 확인한 버전과 다르면 repair()로 인덱스를 DB에 맞춥니다.
+
+    확인은 interval(기본 CATALOG_FRESHNESS_INTERVAL)초에 한 번만 하며, 다른 스레드가 확인 중이면 기다리지 않습니다.
+    버전은 repair 전에 읽으므로 repair 도중의 변경은 다음 확인에서 반영됩니다.
+
+    Returns:
+        repair()의 반환값 (버전이 같거나 확인을 건너뛰었으면 False)
+    """
+    interval = CATALOG_FRESHNESS_INTERVAL if interval is None else interval
+    if time.monotonic() - freshness.checked_at < interval:
+        return False
+    if not freshness.lock.acquire(blocking=False):
+        return False
+
+    from backend.database.dao.mcp_server_dao import MCPServerDAO
+
+    try:
+        catalog_version = MCPServerDAO(db).get_catalog_version()
+        freshness.checked_at = time.monotonic()
+        if catalog_version == freshness.catalog_version:
+            return False
+        repaired = repair()
+        freshness.catalog_version = catalog_version
+        return repaired
+    finally:
+        freshness.lock.release()
+
+
+def diff_catalog_versions(db: Session, index_versions: Dict[int, Any]) -> Dict[str, List[int]]:
+    """
+    승인된 서버의 DB 버전(version_of)과 인덱스가 가진 버전을 비교합니다.
+
+    Returns:
+        missing(인덱스에 없는 승인 서버), extra(DB에 없는/미승인 서버), stale(버전 불일치), approved(승인 서버 수)
+    """
+    from backend.database.dao.mcp_server_dao import MCPServerDAO
+
+    db_versions = {
+        row.id: version_of(row)
+        for row in MCPServerDAO(db).get_mcp_servers_versions(status='approved', sort='created_at', limit=None)
+    }
+    return {
+        "missing": sorted(set(db_versions) - set(index_versions)),
+        "extra": sorted(set(index_versions) - set(db_versions)),
+        "stale": sorted(
+            doc_id for doc_id in set(db_versions) & set(index_versions)
+            if db_versions[doc_id] != index_versions[doc_id]
+        ),
+        "approved": len(db_versions),
+    }
+
+
+class _Document:
+    __slots__ = ('doc_id', 'field_lengths', 'term_freqs', 'payload', 'version')
+
+    def __init__(self, doc_id: int, field_lengths: Dict[str, int],
+                 term_freqs: Dict[str, Dict[str, int]], payload: Any, version: Any):
+        self.doc_id = doc_id
+        self.field_lengths = field_lengths
+        self.term_freqs = term_freqs
+        self.payload = payload
+        self.version = version
+
+
+class CatalogSearchIndex:
+    """
+    BM25F 역색인
+
+    postings: 어휘 -> {doc_id: {field: tf}}
+    모든 변경/조회는 RLock으로 보호되며, 조회는 DB에 접근하지 않습니다.
+    """
+
+    def __init__(self, field_weights: Optional[Dict[str, float]] = None, k1: float = 1.2, b: float = 0.75):
+        self.field_weights = dict(field_weights or FIELD_WEIGHTS)
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._docs: Dict[int, _Document] = {}
+        self._postings: Dict[str, Dict[int, Dict[str, int]]] = {}
+        self._vocabulary: List[str] = []
+        self._field_length_totals: Dict[str, int] = {field: 0 for field in self.field_weights}
+        self.ready = False
+        self.freshness = CatalogFreshness()
+
+    # ==================== Index Maintenance ====================
+
+    def build(self, documents: Iterable[Tuple[int, Dict[str, str], Any, Any]]) -> int:
+        """
+        인덱스를 새로 구축합니다.
+
+        Args:
+            documents: (doc_id, fields, payload, version) 목록
+        """
+        with self._lock:
+            self.clear()
+            for doc_id, fields, payload, version in documents:
+                self._add(doc_id, fields, payload, version)
+            self._vocabulary = sorted(self._postings)
+            self.ready = True
+            return len(self._docs)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._docs.clear()
+            self._postings.clear()
+            self._vocabulary = []
+            self._field_length_totals = {field: 0 for field in self.field_weights}
+
+    def upsert(self, doc_id: int, fields: Dict[str, str], payload: Any = None, version: Any = None) -> None:
+        """문서를 추가하거나 교체합니다."""
+        with self._lock:
+            self._remove(doc_id)
+            for term in self._add(doc_id, fields, payload, version):
+                index = bisect.bisect_left(self._vocabulary, term)
+                if index >= len(self._vocabulary) or self._vocabulary[index] != term:
+                    self._vocabulary.insert(index, term)
+
+    def remove(self, doc_id: int) -> bool:
+        """문서를 삭제합니다."""
+        with self._lock:
+            return self._remove(doc_id)
+
+    def _add(self, doc_id: int, fields: Dict[str, str], payload: Any, version: Any) -> List[str]:
+        term_freqs: Dict[str, Dict[str, int]] = {}
+        field_lengths: Dict[str, int] = {}
+        for field in self.field_weights:
+            tokens = tokenize(fields.get(field))
+            field_lengths[field] = len(tokens)
+            self._field_length_totals[field] += len(tokens)
+            for token in tokens:
+                per_field = term_freqs.setdefault(token, {})
+                per_field[field] = per_field.get(field, 0) + 1
+
+        new_terms = []
+        for term, per_field in term_freqs.items():
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = {}
+                new_terms.append(term)
+            posting[doc_id] = per_field
+
+        self._docs[doc_id] = _Document(doc_id, field_lengths, term_freqs, payload, version)
+        return new_terms
+
+    def _remove(self, doc_id: int) -> bool:
+        document = self._docs.pop(doc_id, None)
+        if document is None:
+            return False
+
+        for field, length in document.field_lengths.items():
+            self._field_length_totals[field] -= length
+
+        for term in document.term_freqs:
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(doc_id, None)
+            if not posting:
+                del self._postings[term]
+                index = bisect.bisect_left(self._vocabulary, term)
+                if index < len(self._vocabulary) and self._vocabulary[index] == term:
+                    del self._vocabulary[index]
+        return True
+
+    # ==================== Search ====================
+
+    def _expand(self, token: str) -> List[Tuple[str, float]]:
+        """검색어 토큰을 (어휘, 배율) 목록으로 확장합니다. (정확히 일치 + 접두사 일치)"""
+        expansions = []
+        index = bisect.bisect_left(self._vocabulary, token)
+        while index < len(self._vocabulary) and len(expansions) < MAX_PREFIX_EXPANSIONS:
+            term = self._vocabulary[index]
+            if not term.startswith(token):
+                break
+            expansions.append((term, 1.0 if term == token else PREFIX_MATCH_BOOST))
+            index += 1
+        return expansions
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        검색어의 모든 토큰과 일치하는 문서를 BM25F 점수 순으로 반환합니다. (AND)
+        검색어에 토큰이 없으면 빈 목록을 반환하므로, 전체 목록이 필요한 호출부는 DB 목록 조회로 대체합니다.
+
+        Returns:
+            (doc_id, score) 목록
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+
+        with self._lock:
+            doc_count = len(self._docs)
+            if not doc_count:
+                return []
+            avg_lengths = {
+                field: (total / doc_count) or 1.0
+                for field, total in self._field_length_totals.items()
+            }
+
+            scores: Optional[Dict[int, float]] = None
+            for token in tokens:
+                token_scores: Dict[int, float] = {}
+                for term, boost in self._expand(token):
+                    posting = self._postings[term]
+                    idf = math.log(1 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+                    for doc_id, per_field in posting.items():
+                        field_lengths = self._docs[doc_id].field_lengths
+                        weighted_tf = 0.0
+                        for field, tf in per_field.items():
+                            norm = 1 - self.b + self.b * field_lengths[field] / avg_lengths[field]
+                            weighted_tf += self.field_weights[field] * tf / norm
+                        score = boost * idf * weighted_tf / (self.k1 + weighted_tf)
+                        if score > token_scores.get(doc_id, 0.0):
+                            token_scores[doc_id] = score
+
+                if scores is None:
+                    scores = token_scores
+                else:
+                    scores = {
+                        doc_id: score + token_scores[doc_id]
+                        for doc_id, score in scores.items()
+                        if doc_id in token_scores
+                    }
+                if not scores:
+                    return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+        return ranked[:limit] if limit else ranked
+
+    # ==================== Accessors ====================
+
+    def get_payloads(self, doc_ids: Iterable[int]) -> List[Any]:
+        with self._lock:
+            return [self._docs[doc_id].payload for doc_id in doc_ids if doc_id in self._docs]
+
+    def versions(self) -> Dict[int, Any]:
+        with self._lock:
+            return {doc_id: document.version for doc_id, document in self._docs.items()}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "documents": len(self._docs),
+                "terms": len(self._postings),
+            }
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id: int) -> bool:
+        return doc_id in self._docs
+
+
+# 프로세스 전역 인덱스
+catalog_search_index = CatalogSearchIndex()
+
+
+def _documents_from(mcp_servers: Iterable[MCPServer]):
+    for mcp_server in mcp_servers:
+        yield mcp_server.id, extract_fields(mcp_server), snapshot_mcp_server(mcp_server), version_of(mcp_server)
+
+
+def build_catalog_search_index(db: Session, index: CatalogSearchIndex = catalog_search_index) -> int:
+    """승인된 모든 서버로 인덱스를 구축합니다."""
+    from backend.database.dao.mcp_server_dao import MCPServerDAO
+
+    dao = MCPServerDAO(db)
+    catalog_version = dao.get_catalog_version()
+    mcp_servers = dao.get_mcp_servers_with_details(status='approved')
+    count = index.build(_documents_from(mcp_servers))
+    index.freshness.mark(catalog_version)
+    logger.info(f"Catalog search index built: {index.stats()}")
+    return count
+
+
+def sync_catalog_search_index(db: Session, mcp_server_ids: Iterable[int],
+                              index: CatalogSearchIndex = catalog_search_index) -> None:
+    """
+    지정한 서버들의 인덱스 항목을 DB 상태에 맞춰 갱신합니다.
+    (승인 상태면 추가/교체, 그 외 또는 삭제된 경우 제거)
+    """
+    if not index.ready:
+        return
+
+    from backend.database.dao.mcp_server_dao import MCPServerDAO
+
+    ids = list(mcp_server_ids)
+    if not ids:
+        return
+
+    mcp_servers = MCPServerDAO(db).get_mcp_servers_with_details(status='approved', mcp_server_ids=ids)
+    approved = {mcp_server.id for mcp_server in mcp_servers}
+    for doc_id, fields, payload, version in _documents_from(mcp_servers):
+        index.upsert(doc_id, fields, payload, version)
+    for doc_id in ids:
+        if doc_id not in approved:
+            index.remove(doc_id)
+
+
+def ensure_catalog_search_index_fresh(db: Session, index: CatalogSearchIndex = catalog_search_index,
+                                      interval: Optional[float] = None) -> bool:
+    """
+    DB의 카탈로그 버전이 인덱스가 마지막으로 확인한 버전과 다르면 차이나는 서버만 다시 동기화합니다.
+
+    다른 워커에서 승인/거절/삭제된 서버가 이 프로세스의 인덱스에 남지 않도록 조회 전에 호출합니다.
+
+    Returns:
+        인덱스를 갱신했으면 True
+    """
+    if not index.ready:
+        return False
+
+    def repair() -> bool:
+        result = check_catalog_search_index(db, repair=True, index=index)
+        if result["repaired"]:
+            logger.info(
+                f"Catalog search index refreshed from DB: missing={len(result['missing'])}, "
+                f"extra={len(result['extra'])}, stale={len(result['stale'])}"
+            )
+        return result["repaired"]
+
+    return refresh_if_catalog_changed(db, index.freshness, repair, interval)
+
+
+def check_catalog_search_index(db: Session, repair: bool = False,
+                               index: CatalogSearchIndex = catalog_search_index) -> Dict[str, Any]:
+    """
+    인덱스와 DB의 일관성을 검사합니다.
+
+    Returns:
+        missing(인덱스에 없는 승인 서버), extra(DB에 없는/미승인 서버), stale(버전 불일치) 및 일치 여부
+    """
+    index_versions = index.versions()
+    diff = diff_catalog_versions(db, index_versions)
+    missing, extra, stale = diff["missing"], diff["extra"], diff["stale"]
+
+    result = {
+        "consistent": not (missing or extra or stale),
+        "indexed": len(index_versions),
+        "approved": diff["approved"],
+        "missing": missing,
+        "extra": extra,
+        "stale": stale,
+        "repaired": False,
+    }
+
+    if repair and not result["consistent"]:
+        sync_catalog_search_index(db, missing + extra + stale, index=index)
+        result["repaired"] = True
+    return result
@@ -0,0 +1,276 @@
+"""
+패싯 검색용 비트맵 인덱스
+
+승인된 서버마다 비트 위치를 부여하고, 패싯 값(태그, 카테고리, 프로토콜, 헬스 상태)별로
+해당 서버 집합을 정수 비트셋으로 유지합니다.
+- 같은 패싯 내 선택 값은 OR, 패싯 간에는 AND
+- 패싯 카운트는 "자기 자신을 제외한 나머지 선택 조건"을 적용한 분리(disjunctive) 방식으로 계산
+  → 사이드바에서 다른 값을 추가로 선택했을 때의 결과 수를 그대로 보여줄 수 있음
+- 한 번의 요청에서 결과 + 모든 패싯 카운트를 DB 집계 쿼리 없이 계산
+- 다른 워커의 변경은 조회 전 카탈로그 버전 확인으로 바뀐 서버만 다시 반영 (TTL 재구축을 기다리지 않음)
+"""
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from backend.service.catalog_search_index import (
+    CatalogFreshness, diff_catalog_versions, refresh_if_catalog_changed, version_of
+)
+
+logger = logging.getLogger(__name__)
+
+# 전체 재구축 주기 (초)
+FACET_INDEX_TTL_SECONDS = int(os.getenv("FACET_INDEX_TTL_SECONDS", "300"))
+
+FACETS = ('tags', 'category', 'protocol', 'health_status')
+
+# 패싯별 최대 반환 값 수
+MAX_FACET_VALUES = 50
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:  # pragma: no cover - Python 3.9 (Dockerfile)
+    def _popcount(bits: int) -> int:
+        return bin(bits).count('1')
+
+
+def _iter_bits(bits: int) -> Iterable[int]:
+    """설정된 비트 위치를 순회합니다."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def facet_values_of(mcp_server: Any) -> Dict[str, List[str]]:
+    """서버의 패싯 값을 추출합니다."""
+    return {
+        'tags': [tag.name for tag in mcp_server.tags],
+        'category': [mcp_server.category] if mcp_server.category else [],
+        'protocol': [mcp_server.protocol] if mcp_server.protocol else [],
+        'health_status': [mcp_server.health_status or 'unknown'],
+    }
+
+
+class FacetIndex:
+    """정수 비트셋 기반 패싯 인덱스"""
+
+    def __init__(self, ttl_seconds: int = FACET_INDEX_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.RLock()
+        self._reset()
+        self.built_at: Optional[float] = None
+        self.freshness = CatalogFreshness()
+
+    def _reset(self) -> None:
+        self._positions: Dict[int, int] = {}
+        self._versions: Dict[int, Any] = {}
+        self._doc_ids: List[Optional[int]] = []
+        self._free_positions: List[int] = []
+        self._doc_values: Dict[int, Dict[str, List[str]]] = {}
+        self._sort_keys: Dict[int, float] = {}
+        self._bitmaps: Dict[str, Dict[str, int]] = {facet: {} for facet in FACETS}
+        self._all = 0
+
+    def is_stale(self) -> bool:
+        return self.built_at is None or time.monotonic() - self.built_at > self.ttl_seconds
+
+    # ==================== Maintenance ====================
+
+    def build(self, mcp_servers: Iterable[Any]) -> int:
+        with self._lock:
+            self._reset()
+            for mcp_server in mcp_servers:
+                self._add(mcp_server)
+            self.built_at = time.monotonic()
+            return len(self._positions)
+
+    def upsert(self, mcp_server: Any) -> None:
+        with self._lock:
+            self._remove(mcp_server.id)
+            self._add(mcp_server)
+
+    def remove(self, mcp_server_id: int) -> None:
+        with self._lock:
+            self._remove(mcp_server_id)
+
+    def _add(self, mcp_server: Any) -> None:
+        if self._free_positions:
+            position = self._free_positions.pop()
+            self._doc_ids[position] = mcp_server.id
+        else:
+            position = len(self._doc_ids)
+            self._doc_ids.append(mcp_server.id)
+
+        bit = 1 << position
+        values = facet_values_of(mcp_server)
+        for facet, facet_values in values.items():
+            bitmaps = self._bitmaps[facet]
+            for value in facet_values:
+                bitmaps[value] = bitmaps.get(value, 0) | bit
+
+        self._positions[mcp_server.id] = position
+        self._doc_values[mcp_server.id] = values
+        self._versions[mcp_server.id] = version_of(mcp_server)
+        created_at = mcp_server.created_at
+        self._sort_keys[mcp_server.id] = created_at.timestamp() if created_at else 0.0
+        self._all |= bit
+
+    def _remove(self, mcp_server_id: int) -> None:
+        position = self._positions.pop(mcp_server_id, None)
+        if position is None:
+            return
+
+        mask = ~(1 << position)
+        for facet, facet_values in self._doc_values.pop(mcp_server_id).items():
+            bitmaps = self._bitmaps[facet]
+            for value in facet_values:
+                remaining = bitmaps.get(value, 0) & mask
+                if remaining:
+                    bitmaps[value] = remaining
+                else:
+                    bitmaps.pop(value, None)
+
+        self._sort_keys.pop(mcp_server_id, None)
+        self._versions.pop(mcp_server_id, None)
+        self._doc_ids[position] = None
+        self._free_positions.append(position)
+        self._all &= mask
+
+    # ==================== Query ====================
+
+    def _bits_for_ids(self, mcp_server_ids: Iterable[int]) -> int:
+        bits = 0
+        for mcp_server_id in mcp_server_ids:
+            position = self._positions.get(mcp_server_id)
+            if position is not None:
+                bits |= 1 << position
+        return bits
+
+    def _facet_filter(self, facet: str, values: List[str]) -> int:
+        bitmaps = self._bitmaps[facet]
+        bits = 0
+        for value in values:
+            bits |= bitmaps.get(value, 0)
+        return bits
+
+    def search(
+        self,
+        filters: Dict[str, List[str]],
+        candidate_ids: Optional[Iterable[int]] = None
+    ) -> Dict[str, Any]:
+        """
+        필터를 적용한 결과 ID와 패싯 카운트를 계산합니다.
+
+        Args:
+            filters: {facet: [선택 값, ...]} (빈 목록은 필터 없음)
+            candidate_ids: 키워드 검색 결과 등 후보 ID (None이면 전체)
+
+        Returns:
+            {"ids": [...], "facets": {facet: [{"value", "count"}, ...]}}
+            ids는 candidate_ids 순서(관련도) 또는 등록일 내림차순
+        """
+        with self._lock:
+            base = self._all if candidate_ids is None else self._bits_for_ids(candidate_ids)
+            facet_bits = {
+                facet: self._facet_filter(facet, values)
+                for facet, values in filters.items()
+                if facet in self._bitmaps and values
+            }
+
+            matched = base
+            for bits in facet_bits.values():
+                matched &= bits
+
+            facets: Dict[str, List[Dict[str, Any]]] = {}
+            for facet in FACETS:
+                # 자기 자신을 제외한 선택 조건 적용 (disjunctive faceting)
+                scope = base
+                for other, bits in facet_bits.items():
+                    if other != facet:
+                        scope &= bits
+                counts = []
+                for value, bits in self._bitmaps[facet].items():
+                    count = _popcount(bits & scope)
+                    if count:
+                        counts.append({"value": value, "count": count})
+                counts.sort(key=lambda item: (-item["count"], item["value"]))
+                facets[facet] = counts[:MAX_FACET_VALUES]
+
+            matched_ids = [self._doc_ids[position] for position in _iter_bits(matched)]
+            if candidate_ids is not None:
+                matched_set = set(matched_ids)
+                ordered = [mcp_server_id for mcp_server_id in dict.fromkeys(candidate_ids)
+                           if mcp_server_id in matched_set]
+            else:
+                ordered = sorted(matched_ids, key=lambda mcp_server_id: (-self._sort_keys[mcp_server_id], -mcp_server_id))
+
+            return {"ids": ordered, "facets": facets}
+
+    def versions(self) -> Dict[int, Any]:
+        with self._lock:
+            return dict(self._versions)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "documents": len(self._positions),
+                "values": {facet: len(bitmaps) for facet, bitmaps in self._bitmaps.items()},
+            }
+
+
+# 프로세스 전역 인덱스
+facet_index = FacetIndex()
+
+
+def rebuild_facet_index(db: Session, index: FacetIndex = facet_index) -> int:
+    """승인된 서버로 패싯 인덱스를 재구축합니다."""
+    from backend.database.dao.mcp_server_dao import MCPServerDAO
+
+    mcp_server_dao = MCPServerDAO(db)
+    catalog_version = mcp_server_dao.get_catalog_version()
+    count = index.build(mcp_server_dao.get_mcp_servers_with_tags_and_tools(status='approved'))
+    index.freshness.mark(catalog_version)
+    logger.info(f"Facet index rebuilt: {index.stats()}")
+    return count
+
+
+def ensure_facet_index(db: Session, index: FacetIndex = facet_index,
+                       interval: Optional[float] = None) -> FacetIndex:
+    """TTL이 지났으면 재구축하고, 아니면 다른 워커의 카탈로그 변경만 반영합니다."""
+    if index.is_stale():
+        rebuild_facet_index(db, index=index)
+        return index
+
+    def repair() -> bool:
+        diff = diff_catalog_versions(db, index.versions())
+        changed_ids = diff["missing"] + diff["extra"] + diff["stale"]
+        sync_facet_index(db, changed_ids, index=index)
+        return bool(changed_ids)
+
+    refresh_if_catalog_changed(db, index.freshness, repair, interval)
+    return index
+
+
+def sync_facet_index(db: Session, mcp_server_ids: Iterable[int], index: FacetIndex = facet_index) -> None:
+    """변경된 서버들의 패싯 항목을 갱신합니다. (아직 구축되지 않았으면 무시)"""
+    if index.built_at is None:
+        return
+
+    from backend.database.dao.mcp_server_dao import MCPServerDAO
+
+    ids = list(mcp_server_ids)
+    if not ids:
+        return
+
+    mcp_servers = MCPServerDAO(db).get_mcp_servers_with_tags_and_tools(status='approved', mcp_server_ids=ids)
+    approved = {mcp_server.id for mcp_server in mcp_servers}
+    for mcp_server in mcp_servers:
+        index.upsert(mcp_server)
+    for mcp_server_id in ids:
+        if mcp_server_id not in approved:
+            index.remove(mcp_server_id)
@@ -0,0 +1,279 @@
+"""
+사용자 단위 순서형 퍼널 / 코호트 분석
+
+검색 → 서버 조회 → 즐겨찾기 → 플레이그라운드 단계를 같은 사용자가 순서대로,
+첫 단계 이후 window_hours 이내에 진행했는지를 계산합니다. (전체 건수 비율이 아닌 실제 전환)
+
+- 각 사용자는 여러 번의 시작 중 가장 멀리 진행한 단계로 집계 (windowFunnel 방식)
+- numpy가 있으면 (user_id, created_at) 정렬 키에 대해 단계마다 searchsorted 한 번으로
+  "직전 단계에 도달한 가장 최근 체인"을 찾는 벡터 연산, 없으면 사용자별 순차 스캔
+- 코호트: 사용자의 기간 내 첫 검색 주(월요일 시작)별 퍼널
+- 결과는 (기간, 전환 창, 코호트 여부)별로 ANALYTICS_FUNNEL_TTL_SECONDS 동안 캐시
+
+비로그인 이벤트는 사용자를 연결할 수 없으므로 제외합니다.
+"""
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from itertools import groupby
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.database.dao.analytics_dao import AnalyticsDAO
+from backend.database.model import EventType
+from backend.utils.lazy_import import lazy_module, module_available
+from backend.utils.shared_state import shared_state
+
+# numpy는 첫 퍼널 계산 시 import (앱 시작 시간에 포함되지 않음)
+NUMPY_AVAILABLE = module_available("numpy")
+np = lazy_module("numpy")
+
+logger = logging.getLogger(__name__)
+
+# 퍼널 결과 캐시 유효 시간 (초)
+ANALYTICS_FUNNEL_TTL_SECONDS = int(os.getenv("ANALYTICS_FUNNEL_TTL_SECONDS", "300"))
+
+# (단계 이름, 해당 이벤트 타입)
+FUNNEL_STEPS: List[Tuple[str, Tuple[EventType, ...]]] = [
+    ("search", (EventType.SEARCH, EventType.SEARCH_NO_RESULTS)),
+    ("view", (
+        EventType.SERVER_VIEW,
+        EventType.SERVER_VIEW_FROM_SEARCH,
+        EventType.SERVER_VIEW_FROM_LIST,
+        EventType.SERVER_VIEW_DIRECT,
+    )),
+    ("favorite", (EventType.FAVORITE_ADD,)),
+    ("playground", (EventType.PLAYGROUND_QUERY,)),
+]
+
+_STEP_BY_EVENT_TYPE = {
+    event_type.value: index
+    for index, (_, event_types) in enumerate(FUNNEL_STEPS)
+    for event_type in event_types
+}
+
+
+def _load_events(db: Session, start_date: datetime, end_date: datetime) -> Tuple[List[int], List[int], List[int]]:
+    """(user_id, 단계 번호, 기간 시작 기준 경과 ms) 컬럼 목록"""
+    users: List[int] = []
+    steps: List[int] = []
+    times: List[int] = []
+    event_types = [event_type for _, types in FUNNEL_STEPS for event_type in types]
+
+    for rows in AnalyticsDAO(db).iter_user_event_chunks(start_date, end_date, event_types):
+        for user_id, event_type, created_at in rows:
+            users.append(user_id)
+            steps.append(_STEP_BY_EVENT_TYPE[event_type.value if isinstance(event_type, EventType) else event_type])
+            times.append(int((created_at - start_date).total_seconds() * 1000))
+    return users, steps, times
+
+
+def funnel_levels_numpy(
+    users: Sequence[int],
+    steps: Sequence[int],
+    times: Sequence[int],
+    window_ms: int,
+    step_count: int = len(FUNNEL_STEPS)
+) -> Dict[int, Tuple[int, int]]:
+    """
+    사용자별 (도달한 최대 단계, 첫 시작 시각 ms)를 벡터 연산으로 계산합니다.
+
+    단계 k 이벤트마다 같은 사용자의 단계 k-1 도달 기록 중 더 이른 가장 최근 기록을 searchsorted로 찾고,
+    그 체인의 시작 시각에서 window_ms 이내이면 단계 k 도달 기록이 됩니다.
+    """
+    if not len(users):
+        return {}
+
+    user_ids, user_index = np.unique(np.asarray(users, dtype=np.int64), return_inverse=True)
+    steps_array = np.asarray(steps, dtype=np.int8)
+    times_array = np.asarray(times, dtype=np.int64)
+
+    # 사용자 → 시간 순 정렬 키 (사용자 구간이 겹치지 않도록 시간 범위만큼 간격)
+    span = int(times_array.max()) + 1
+    keys = user_index.astype(np.int64) * span + times_array
+    order = np.argsort(keys, kind='stable')
+    keys, user_index, steps_array, times_array = keys[order], user_index[order], steps_array[order], times_array[order]
+
+    max_level = np.full(len(user_ids), -1, dtype=np.int8)
+    first_start = np.full(len(user_ids), np.iinfo(np.int64).max, dtype=np.int64)
+
+    mask = steps_array == 0
+    level_keys, level_users, level_starts = keys[mask], user_index[mask], times_array[mask]
+    max_level[level_users] = 0
+    np.minimum.at(first_start, level_users, level_starts)
+
+    for step in range(1, step_count):
+        if not len(level_keys):
+            break
+        mask = steps_array == step
+        event_keys, event_users, event_times = keys[mask], user_index[mask], times_array[mask]
+
+        previous = np.searchsorted(level_keys, event_keys, side='left') - 1
+        valid = previous >= 0
+        previous = np.where(valid, previous, 0)
+        valid &= level_users[previous] == event_users
+        starts = level_starts[previous]
+        valid &= event_times - starts <= window_ms
+
+        level_keys, level_users, level_starts = event_keys[valid], event_users[valid], starts[valid]
+        max_level[level_users] = step
+
+    reached = np.nonzero(max_level >= 0)[0]
+    return {
+        int(user_ids[index]): (int(max_level[index]), int(first_start[index]))
+        for index in reached
+    }
+
+
+def funnel_levels_python(
+    users: Sequence[int],
+    steps: Sequence[int],
+    times: Sequence[int],
+    window_ms: int,
+    step_count: int = len(FUNNEL_STEPS)
+) -> Dict[int, Tuple[int, int]]:
+    """funnel_levels_numpy와 같은 결과를 사용자별 순차 스캔으로 계산합니다. (numpy 미설치 시)"""
+    events_by_user: Dict[int, List[Tuple[int, int]]] = {}
+    for user_id, step, event_time in zip(users, steps, times):
+        events_by_user.setdefault(user_id, []).append((event_time, step))
+
+    levels: Dict[int, Tuple[int, int]] = {}
+    for user_id, events in events_by_user.items():
+        events.sort(key=lambda item: item[0])
+        # chain_starts[k]: 단계 k에 가장 최근 도달한 체인의 시작 시각
+        chain_starts: List[Optional[int]] = [None] * step_count
+        max_level, first_start = -1, None
+
+        # 같은 시각의 이벤트는 그 이전 상태만 보고 판단 (직전 단계는 더 이른 시각이어야 함)
+        for event_time, group in groupby(events, key=lambda item: item[0]):
+            updates = []
+            for _, step in group:
+                if step == 0:
+                    updates.append((0, event_time))
+                elif chain_starts[step - 1] is not None and event_time - chain_starts[step - 1] <= window_ms:
+                    updates.append((step, chain_starts[step - 1]))
+            for step, start in updates:
+                chain_starts[step] = start
+                max_level = max(max_level, step)
+            if first_start is None and chain_starts[0] is not None:
+                first_start = chain_starts[0]
+
+        if max_level >= 0:
+            levels[user_id] = (max_level, first_start)
+    return levels
+
+
+def _summarize(levels: Sequence[int], step_count: int) -> List[Dict[str, Any]]:
+    reached = [0] * step_count
+    for level in levels:
+        for step in range(level + 1):
+            reached[step] += 1
+
+    summary = []
+    for step, (name, _) in enumerate(FUNNEL_STEPS[:step_count]):
+        previous = reached[step - 1] if step else reached[0]
+        summary.append({
+            "step": name,
+            "users": reached[step],
+            "conversion_from_previous": round(reached[step] / previous, 4) if previous else 0.0,
+            "conversion_from_start": round(reached[step] / reached[0], 4) if reached[0] else 0.0,
+        })
+    return summary
+
+
+def compute_funnel(
+    db: Session,
+    days: int = 30,
+    window_hours: int = 24,
+    by_cohort: bool = False,
+    now: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    기간 내 사용자 단위 퍼널을 계산합니다.
+
+    Returns:
+        {
+            "period_days": 30,
+            "window_hours": 24,
+            "steps": [{"step": "search", "users": 120, "conversion_from_previous": 1.0, "conversion_from_start": 1.0}, ...],
+            "cohorts": [{"cohort": "2026-10-12", "steps": [...]}, ...]  # by_cohort=True
+        }
+    """
+    end_date = now or datetime.utcnow()
+    start_date = end_date - timedelta(days=days)
+    users, steps, times = _load_events(db, start_date, end_date)
+
+    compute = funnel_levels_numpy if NUMPY_AVAILABLE else funnel_levels_python
+    levels = compute(users, steps, times, window_hours * 3600 * 1000)
+    step_count = len(FUNNEL_STEPS)
+
+    result: Dict[str, Any] = {
+        "period_days": days,
+        "window_hours": window_hours,
+        "steps": _summarize([level for level, _ in levels.values()], step_count),
+    }
+
+    if by_cohort:
+        cohorts: Dict[str, List[int]] = {}
+        for level, first_start in levels.values():
+            first_day = (start_date + timedelta(milliseconds=first_start)).date()
+            cohort = (first_day - timedelta(days=first_day.weekday())).isoformat()
+            cohorts.setdefault(cohort, []).append(level)
+        result["cohorts"] = [
+            {"cohort": cohort, "steps": _summarize(cohort_levels, step_count)}
+            for cohort, cohort_levels in sorted(cohorts.items())
+        ]
+    return result
+
+
+class FunnelCache:
+    """(데이터베이스, 기간, 전환 창, 코호트 여부)별 퍼널 결과 TTL 캐시"""
+
+    def __init__(self, ttl_seconds: int = ANALYTICS_FUNNEL_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, db: Session, days: int = 30, window_hours: int = 24, by_cohort: bool = False) -> Dict[str, Any]:
+        key = (str(db.get_bind().url), days, window_hours, by_cohort)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] <= self.ttl_seconds:
+                self.hits += 1
+                return entry[1]
+
+        # 공유 상태 백엔드(redis)면 다른 워커가 계산한 결과를 재사용
+        shared_key = "funnel:" + ":".join(str(part) for part in key)
+        result = shared_state.cache_get(shared_key) if shared_state.is_shared else None
+        with self._lock:
+            if result is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if result is None:
+            started = time.monotonic()
+            result = compute_funnel(db, days, window_hours, by_cohort)
+            logger.debug(f"Funnel computed in {time.monotonic() - started:.3f}s (days={days}, window={window_hours}h)")
+            if shared_state.is_shared:
+                shared_state.cache_set(shared_key, result, self.ttl_seconds)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# 프로세스 전역 캐시
+funnel_cache = FunnelCache()
@@ -4,7 +4,11 @@ import re
 from typing import List, Optional, Dict, Any
 from urllib.parse import urlparse
 import os
-from bs4 import BeautifulSoup
+
+from backend.utils.lazy_import import lazy_attribute
+
+# bs4 is imported on first use
+BeautifulSoup = lazy_attribute("bs4", "BeautifulSoup")
 
 
 class GitHubAPIService:
@@ -7,13 +7,9 @@ import asyncio
 import logging
 from typing import Dict, Any
 
-try:
-    from mcp import ClientSession
-    from mcp.client.sse import sse_client
-    from mcp.client.streamable_http import streamablehttp_client
-    MCP_SDK_AVAILABLE = True
-except ImportError:
-    MCP_SDK_AVAILABLE = False
+from backend.utils.metrics import observe_mcp_call
+
+from backend.service.mcp_sdk import MCP_SDK_AVAILABLE, ClientSession, sse_client, streamablehttp_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -29,6 +25,7 @@ class MCPHealthChecker:
     CONNECTION_TIMEOUT = 120  # Connection timeout - same as MCPProxyService.DEFAULT_TIMEOUT
     INITIALIZE_TIMEOUT = 120  # Session initialization timeout
 
+    @observe_mcp_call("health_check")
     async def check_server_health(self, server_url: str, transport_type: str) -> Dict[str, Any]:
         """
         Check MCP server health by attempting to connect and initialize.
@@ -8,21 +8,15 @@ import json
 import logging
 from typing import Dict, Any, List, Optional
 
-try:
-    from mcp import ClientSession, StdioServerParameters
-    from mcp.client.stdio import stdio_client
-    from mcp.client.sse import sse_client
-    try:
-        # streamablehttp_client가 없을 수도 있음
-        from mcp.client.streamable_http import streamablehttp_client
-        HAS_STREAMABLE_HTTP = True
-    except ImportError:
-        HAS_STREAMABLE_HTTP = False
-        # SSE로 대체
-    MCP_SDK_AVAILABLE = True
-except ImportError:
-    MCP_SDK_AVAILABLE = False
-    HAS_STREAMABLE_HTTP = False
+from backend.utils.metrics import observe_mcp_call
+
+from backend.service.mcp_sdk import (
+    MCP_SDK_AVAILABLE,
+    ClientSession,
+    has_streamable_http,
+    sse_client,
+    streamablehttp_client
+)
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -57,6 +51,7 @@ class MCPProxyService:
         }
 
     @staticmethod
+    @observe_mcp_call("tools")
     async def fetch_tools(url: str, protocol: str, auth_token: Optional[str] = None) -> Dict[str, Any]:
         """
         MCP 서버에서 tools 목록을 가져옵니다
@@ -189,13 +184,13 @@ class MCPProxyService:
         Improved error handling and resource cleanup
         """
         logger.info(f"[Streamable HTTP] Connecting to: {url}")
-        logger.info(f"[Streamable HTTP] HAS_STREAMABLE_HTTP = {HAS_STREAMABLE_HTTP}")
+        logger.info(f"[Streamable HTTP] has_streamable_http() = {has_streamable_http()}")
 
         try:
             if not url.startswith("http://") and not url.startswith("https://"):
                 return MCPProxyService._create_error_response(f"Invalid URL: {url}")
 
-            if not HAS_STREAMABLE_HTTP:
+            if not has_streamable_http():
                 # Streamable HTTP가 없으면 SSE로 시도
                 logger.warning("[Streamable HTTP] Not available, trying SSE")
                 return await MCPProxyService._fetch_sse(url, auth_token)
@@ -318,6 +313,7 @@ class MCPProxyService:
     # ==================== PROMPTS METHODS ====================
 
     @staticmethod
+    @observe_mcp_call("prompts")
     async def fetch_prompts(url: str, protocol: str) -> Dict[str, Any]:
         """
         MCP 서버에서 prompts 목록을 가져옵니다
@@ -407,7 +403,7 @@ class MCPProxyService:
             if not url.startswith("http://") and not url.startswith("https://"):
                 return MCPProxyService._create_error_response(f"Invalid URL: {url}", data_key="prompts")
 
-            if not HAS_STREAMABLE_HTTP:
+            if not has_streamable_http():
                 logger.warning("[Streamable HTTP] Not available, trying SSE")
                 return await MCPProxyService._fetch_prompts_sse(url)
 
@@ -443,6 +439,7 @@ class MCPProxyService:
     # ==================== RESOURCES METHODS ====================
 
     @staticmethod
+    @observe_mcp_call("resources")
     async def fetch_resources(url: str, protocol: str) -> Dict[str, Any]:
         """
         MCP 서버에서 resources 목록을 가져옵니다
@@ -532,7 +529,7 @@ class MCPProxyService:
             if not url.startswith("http://") and not url.startswith("https://"):
                 return MCPProxyService._create_error_response(f"Invalid URL: {url}", data_key="resources")
 
-            if not HAS_STREAMABLE_HTTP:
+            if not has_streamable_http():
                 logger.warning("[Streamable HTTP] Not available, trying SSE")
                 return await MCPProxyService._fetch_resources_sse(url)
 
@@ -669,7 +666,7 @@ class MCPProxyService:
             if not url.startswith("http://") and not url.startswith("https://"):
                 return {"success": False, "error": f"Invalid URL: {url}"}
 
-            if not HAS_STREAMABLE_HTTP:
+            if not has_streamable_http():
                 logger.warning("[Streamable HTTP] Not available, trying SSE")
                 return await MCPProxyService._call_tool_sse(url, tool_name, arguments, auth_token)
 
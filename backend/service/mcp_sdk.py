@@ -0,0 +1,20 @@
+"""
+MCP SDK 지연 로딩
+
+MCPProxyService와 MCPHealthChecker가 함께 사용하는 MCP 클라이언트 SDK 진입점입니다.
+SDK는 import 비용이 커서(약 0.7초) 앱 시작 시가 아니라 첫 MCP 호출 시점에 한 번만 로드합니다.
+"""
+from backend.utils.lazy_import import lazy_attribute, module_available
+
+MCP_SDK_AVAILABLE = module_available("mcp")
+
+ClientSession = lazy_attribute("mcp", "ClientSession")
+StdioServerParameters = lazy_attribute("mcp", "StdioServerParameters")
+stdio_client = lazy_attribute("mcp.client.stdio", "stdio_client")
+sse_client = lazy_attribute("mcp.client.sse", "sse_client")
+streamablehttp_client = lazy_attribute("mcp.client.streamable_http", "streamablehttp_client")
+
+
+def has_streamable_http() -> bool:
+    """설치된 SDK가 Streamable HTTP 클라이언트를 제공하는지 여부 (첫 호출 시 SDK 로드)"""
+    return MCP_SDK_AVAILABLE and streamablehttp_client.available()
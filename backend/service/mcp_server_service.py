@@ -21,14 +21,22 @@ import sys
 from urllib.parse import urlparse
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict, Any
+from backend.database.database import optional_write, release_connection, run_after_commit
 from backend.database.dao.mcp_server_dao import MCPServerDAO
 from backend.database.model import (
     MCPServer, MCPServerTool, MCPServerProperty, Tag,
     MCPServerPrompt, MCPServerPromptArgument, MCPServerResource
 )
+from backend.service.catalog_search_index import sync_catalog_search_index
+from backend.service.suggest_index import sync_suggest_index
+from backend.service.facet_index import ensure_facet_index, sync_facet_index
+from backend.service.semantic_search import ensure_semantic_index, sync_semantic_index
 from datetime import datetime
+import logging
 import pytz
 
+logger = logging.getLogger(__name__)
+
 class MCPServerService:
     """
     Python 기반 MCP 서버의 정적 분석기
@@ -40,6 +48,20 @@ class MCPServerService:
     def __init__(self, db: Session):
         self.db = db
         self.mcp_server_dao = MCPServerDAO(db)
+
+    def _sync_catalog_indexes(self, *mcp_server_ids: int) -> None:
+        """
+        인메모리 카탈로그 인덱스(검색, 자동완성, 패싯, 시맨틱)를 DB 상태와 동기화합니다. (구축되지 않은 인덱스는 무시)
+        요청 단위 세션이면 요청이 커밋된 뒤에 동기화합니다.
+        """
+        def sync_all():
+            for sync in (sync_catalog_search_index, sync_suggest_index, sync_facet_index, sync_semantic_index):
+                try:
+                    sync(self.db, mcp_server_ids)
+                except Exception as e:
+                    logger.error(f"Failed to sync catalog indexes for {mcp_server_ids}: {e}")
+
+        run_after_commit(self.db, sync_all)
     
     def create_mcp_server(self, mcp_server_data: Dict[str, Any], owner_id: int) -> MCPServer:
         """새 MCP 서버를 생성합니다."""
@@ -72,14 +94,11 @@ class MCPServerService:
         if resources_data:
             self._add_resources_to_mcp_server(mcp_server.id, resources_data)
 
-        # 알림 생성 (관리자들에게 새 MCP 등록 알림)
-        try:
+        # 알림 생성 (관리자들에게 새 MCP 등록 알림) - 실패해도 MCP 등록은 성공으로 처리
+        with optional_write(self.db, "New MCP notification"):
             from backend.service.notification_service import NotificationService
             notification_service = NotificationService(self.db)
             notification_service.create_new_mcp_notification_for_admins(mcp_server.id)
-        except Exception as e:
-            print(f"Failed to create new MCP notification: {e}")
-            # 알림 생성 실패해도 MCP 등록은 성공으로 처리
 
         return mcp_server
     
@@ -127,6 +146,33 @@ class MCPServerService:
             offset=offset
         )
 
+    def get_mcp_servers_versions(
+        self,
+        status: str = 'approved',
+        category: Optional[str] = None,
+        sort: str = 'favorites',
+        order: str = 'desc',
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[Any]:
+        """목록 조회 결과의 버전 정보를 조회합니다. (ETag 계산용)"""
+        return self.mcp_server_dao.get_mcp_servers_versions(
+            status=status,
+            category=category,
+            sort=sort,
+            order=order,
+            limit=limit,
+            offset=offset
+        )
+
+    def get_mcp_server_version(self, mcp_server_id: int) -> Optional[Any]:
+        """단일 서버의 버전 정보를 조회합니다. (ETag 계산용)"""
+        return self.mcp_server_dao.get_mcp_server_version(mcp_server_id)
+
+    def get_mcp_servers_versions_by_owner(self, owner_id: int) -> List[Any]:
+        """사용자가 등록한 승인 서버들의 버전 정보를 조회합니다. (ETag 계산용)"""
+        return self.mcp_server_dao.get_mcp_servers_versions_by_owner(owner_id)
+
     def get_approved_mcp_servers(self, limit: int = None, offset: int = 0) -> List[MCPServer]:
         """승인된 MCP 서버 목록을 조회합니다. (레거시 메서드)"""
         return self.mcp_server_dao.get_approved_mcp_servers(limit, offset)
@@ -147,6 +193,25 @@ class MCPServerService:
         """키워드로 MCP 서버를 검색합니다."""
         return self.mcp_server_dao.search_mcp_servers(keyword, status)
     
+    def semantic_search(self, keyword: str, limit: int = 20) -> List[MCPServer]:
+        """
+        임베딩 유사도로 승인된 MCP 서버를 검색합니다.
+
+        서버 설명뿐 아니라 도구 이름/설명과의 유사도도 반영되며,
+        매칭된 도구 이름은 각 서버의 matched_tools 속성에 담깁니다.
+        """
+        hits = ensure_semantic_index(self.db).search(keyword, limit=limit)
+        # 인덱스가 DB보다 늦을 수 있으므로 승인 상태를 DB에서 다시 확인
+        mcp_servers = self.mcp_server_dao.get_mcp_servers_by_ids(
+            [hit["mcp_server_id"] for hit in hits], status='approved'
+        )
+        favorites_counts = self.mcp_server_dao.get_favorites_counts([mcp_server.id for mcp_server in mcp_servers])
+        matched_tools = {hit["mcp_server_id"]: hit["matched_tools"] for hit in hits}
+        for mcp_server in mcp_servers:
+            mcp_server.favorites_count = favorites_counts.get(mcp_server.id, 0)
+            mcp_server.matched_tools = matched_tools.get(mcp_server.id, [])
+        return mcp_servers
+
     def get_mcp_servers_by_category(self, category: str, status: str = 'approved') -> List[MCPServer]:
         """카테고리별 MCP 서버 목록을 조회합니다."""
         return self.mcp_server_dao.get_mcp_servers_by_category(category, status)
@@ -159,6 +224,46 @@ class MCPServerService:
         """키워드와 태그로 MCP 서버를 검색합니다. (AND 조건)"""
         return self.mcp_server_dao.search_mcp_servers_with_tags(keyword, tags, status)
     
+    def faceted_search(
+        self,
+        keyword: Optional[str] = None,
+        filters: Optional[Dict[str, List[str]]] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> Dict[str, Any]:
+        """
+        승인된 서버에 대해 결과와 패싯 카운트(tags, category, protocol, health_status)를 함께 조회합니다.
+
+        패싯 계산은 비트맵 인덱스에서 수행하고, DB는 키워드 검색(검색 인덱스)과
+        현재 페이지 서버 로딩에만 사용합니다.
+        """
+        from backend.service.catalog_search_index import (
+            catalog_search_index, is_memory_search_enabled, ensure_catalog_search_index_fresh
+        )
+
+        candidate_ids = None
+        if keyword and keyword.strip():
+            if is_memory_search_enabled() and catalog_search_index.ready:
+                ensure_catalog_search_index_fresh(self.db)
+                candidate_ids = [doc_id for doc_id, _ in catalog_search_index.search(keyword)]
+            else:
+                candidate_ids = self.mcp_server_dao.search_dao.search_ids(keyword, status='approved')
+
+        result = ensure_facet_index(self.db).search(filters or {}, candidate_ids)
+
+        page_ids = result["ids"][offset:offset + limit] if limit else result["ids"][offset:]
+        # 비트맵이 다른 워커의 거절/삭제를 아직 반영하지 못했어도 미승인 서버는 노출하지 않음
+        mcp_servers = self.mcp_server_dao.get_mcp_servers_by_ids(page_ids, status='approved')
+        favorites_counts = self.mcp_server_dao.get_favorites_counts(page_ids)
+        for mcp_server in mcp_servers:
+            mcp_server.favorites_count = favorites_counts.get(mcp_server.id, 0)
+
+        return {
+            "mcp_servers": mcp_servers,
+            "total_count": len(result["ids"]),
+            "facets": result["facets"]
+        }
+
     def update_mcp_server(self, mcp_server_id: int, mcp_server_data) -> Optional[MCPServer]:
         """MCP 서버를 수정합니다."""
         # Pydantic 모델을 딕셔너리로 변환
@@ -234,11 +339,15 @@ class MCPServerService:
 
         # tools, prompts, resources 키를 제거하고 나머지 데이터로 업데이트
         update_data = {k: v for k, v in data_dict.items() if k not in ['tools', 'prompts', 'resources']}
-        return self.mcp_server_dao.update_mcp_server(mcp_server_id, update_data)
+        updated = self.mcp_server_dao.update_mcp_server(mcp_server_id, update_data)
+        self._sync_catalog_indexes(mcp_server_id)
+        return updated
     
     def delete_mcp_server(self, mcp_server_id: int) -> bool:
         """MCP 서버를 삭제합니다."""
-        return self.mcp_server_dao.delete_mcp_server(mcp_server_id)
+        deleted = self.mcp_server_dao.delete_mcp_server(mcp_server_id)
+        self._sync_catalog_indexes(mcp_server_id)
+        return deleted
     
     def approve_mcp_server(self, mcp_server_id: int) -> Optional[MCPServer]:
         """MCP 서버를 승인합니다."""
@@ -249,8 +358,8 @@ class MCPServerService:
             self.db.commit()
             self.db.refresh(mcp_server)
 
-            # 알림 생성 (pending → approved 변경 시)
-            try:
+            # 알림 생성 (pending → approved 변경 시) - 실패해도 승인은 성공으로 처리
+            with optional_write(self.db, "Status change notification"):
                 from backend.service.notification_service import NotificationService
                 notification_service = NotificationService(self.db)
                 notification_service.create_status_change_notification(
@@ -258,9 +367,8 @@ class MCPServerService:
                     old_status=old_status,
                     new_status='approved'
                 )
-            except Exception as e:
-                print(f"Failed to create status change notification: {e}")
-                # 알림 생성 실패해도 승인은 성공으로 처리
+
+            self._sync_catalog_indexes(mcp_server_id)
         return mcp_server
     
     def reject_mcp_server(self, mcp_server_id: int) -> Optional[MCPServer]:
@@ -270,6 +378,7 @@ class MCPServerService:
             mcp_server.status = 'rejected'
             self.db.commit()
             self.db.refresh(mcp_server)
+            self._sync_catalog_indexes(mcp_server_id)
         return mcp_server
     
     def approve_all_pending_servers(self) -> Dict[str, int]:
@@ -277,11 +386,15 @@ class MCPServerService:
         pending_servers = self.get_pending_mcp_servers()
         approved_count = 0
         
+        approved_ids = []
+        
         for server in pending_servers:
             server.status = 'approved'
+            approved_ids.append(server.id)
             approved_count += 1
         
         self.db.commit()
+        self._sync_catalog_indexes(*approved_ids)
         return {"approved_count": approved_count}
     
     def get_popular_tags(self, limit: int = 10) -> List[Tag]:
@@ -308,7 +421,9 @@ class MCPServerService:
     
     def update_mcp_server_announcement(self, mcp_server_id: int, announcement: Optional[str]) -> Optional[MCPServer]:
         """MCP 서버의 공지사항을 업데이트합니다."""
-        return self.mcp_server_dao.update_mcp_server_announcement(mcp_server_id, announcement)
+        mcp_server = self.mcp_server_dao.update_mcp_server_announcement(mcp_server_id, announcement)
+        self._sync_catalog_indexes(mcp_server_id)
+        return mcp_server
 
     async def check_server_health(self, mcp_server_id: int) -> Dict[str, Any]:
         """
@@ -317,8 +432,6 @@ class MCPServerService:
         - SSE/HTTP 서버만 server_url을 사용하여 체크합니다.
         """
         from backend.service.mcp_health_checker import MCPHealthChecker
-        import logging
-        logger = logging.getLogger(__name__)
 
         mcp_server = self.get_mcp_server_by_id(mcp_server_id)
         if not mcp_server:
@@ -345,10 +458,14 @@ class MCPServerService:
 
         health_status = "unknown"
         error_message = None
+        server_url = mcp_server.server_url
+
+        # 원격 호출을 기다리는 동안 DB 커넥션을 점유하지 않도록 반환
+        release_connection(self.db)
 
         try:
             # server_url이 없으면 체크 불가
-            if not mcp_server.server_url:
+            if not server_url:
                 health_status = "unknown"
                 error_message = "No server URL configured"
                 logger.warning(f"Server {mcp_server_id} has no server_url configured")
@@ -356,11 +473,11 @@ class MCPServerService:
                 # MCP Health Checker 생성 (MCP SDK 사용)
                 health_checker = MCPHealthChecker()
 
-                logger.info(f"Starting health check for {mcp_server.server_url} with transport {transport_type}")
+                logger.info(f"Starting health check for {server_url} with transport {transport_type}")
 
                 # Health check 수행
                 result = await health_checker.check_server_health(
-                    server_url=mcp_server.server_url,
+                    server_url=server_url,
                     transport_type=transport_type
                 )
 
@@ -390,6 +507,7 @@ class MCPServerService:
         mcp_server.last_health_check = korea_time
         self.db.commit()
         self.db.refresh(mcp_server)
+        self._sync_catalog_indexes(mcp_server_id)
 
         logger.info(f"DB updated successfully for server {mcp_server_id}")
 
@@ -1,8 +1,10 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
-from backend.database.dao.notification_dao import NotificationDAO
+from backend.database.dao.notification_dao import NotificationDAO, AsyncNotificationDAO
 from backend.database.dao.user_dao import UserDAO
 from backend.database.dao.mcp_server_dao import MCPServerDAO
+from backend.database.model.mcp_server import MCPServer
 from backend.database.model.notification import Notification
 from backend.database.model.user import User
 
@@ -170,3 +172,68 @@ class NotificationService:
     def delete_notification(self, notification_id: int, user_id: int) -> bool:
         """알림을 삭제합니다."""
         return self.notification_dao.delete_notification(notification_id, user_id)
+
+
+class AsyncNotificationService:
+    """NotificationService의 AsyncSession 버전 (async def 엔드포인트용)"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.notification_dao = AsyncNotificationDAO(db)
+
+    async def create_comment_notification(
+        self,
+        mcp_server_id: int,
+        commenter_user_id: int
+    ) -> Optional[Notification]:
+        """댓글 알림을 생성합니다."""
+        # MCP 서버 정보 조회
+        mcp_server = await self.db.get(MCPServer, mcp_server_id)
+        if not mcp_server:
+            return None
+
+        # 자기 자신의 댓글은 알림 생성하지 않음
+        owner_id = mcp_server.owner_id
+        if owner_id == commenter_user_id:
+            return None
+
+        # 댓글 작성자 정보 조회
+        commenter = await self.db.get(User, commenter_user_id)
+        if not commenter:
+            return None
+
+        message = f"{commenter.nickname} left a comment on your MCP '{mcp_server.name}'."
+
+        return await self.notification_dao.create_notification(
+            user_id=owner_id,
+            notification_type='comment',
+            message=message,
+            mcp_server_id=mcp_server_id,
+            related_user_id=commenter_user_id
+        )
+
+    async def get_user_notifications(
+        self,
+        user_id: int,
+        limit: int = 20,
+        offset: int = 0,
+        unread_only: bool = False
+    ) -> List[Notification]:
+        """사용자의 알림 목록을 조회합니다."""
+        return await self.notification_dao.get_user_notifications(user_id, limit, offset, unread_only)
+
+    async def get_unread_count(self, user_id: int) -> int:
+        """읽지 않은 알림 개수를 조회합니다."""
+        return await self.notification_dao.get_unread_count(user_id)
+
+    async def mark_as_read(self, notification_id: int, user_id: int) -> bool:
+        """알림을 읽음으로 표시합니다."""
+        return await self.notification_dao.mark_as_read(notification_id, user_id)
+
+    async def mark_all_as_read(self, user_id: int) -> int:
+        """사용자의 모든 알림을 읽음으로 표시합니다."""
+        return await self.notification_dao.mark_all_as_read(user_id)
+
+    async def delete_notification(self, notification_id: int, user_id: int) -> bool:
+        """알림을 삭제합니다."""
+        return await self.notification_dao.delete_notification(notification_id, user_id)
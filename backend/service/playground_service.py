@@ -10,13 +10,16 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 import pytz
 from sqlalchemy.orm import Session
-from openai import OpenAI
 
 from backend.database.model.playground_usage import PlaygroundUsage
 from backend.service.mcp_proxy_service import MCPProxyService
+from backend.utils.lazy_import import lazy_attribute
 
 logger = logging.getLogger(__name__)
 
+# The OpenAI SDK (~0.7s to import) is loaded when the first client is created
+OpenAI = lazy_attribute("openai", "OpenAI")
+
 # KST timezone
 KST = pytz.timezone('Asia/Seoul')
 
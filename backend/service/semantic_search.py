@@ -0,0 +1,687 @@
+"""
+로컬 임베딩 기반 시맨틱 검색
+
+서버(이름, 설명, 태그)와 각 도구(이름, 설명)를 문서 단위로 임베딩하여
+"read my calendar" 같은 자연어 질의가 `list_events` 같은 도구와 매칭되도록 합니다.
+
+- 임베더: SEMANTIC_MODEL_PATH에 로컬 sentence-transformers 모델이 있으면 사용,
+  없으면 TF-IDF + 랜덤화 SVD(LSI) 폴백 (네트워크 접근 없음)
+- 저장소: float32 NumPy 행렬(.npy)을 디스크에 저장하고 mmap으로 로딩
+  (세대별 디렉터리에 전체를 쓴 뒤 CURRENT 포인터 rename 한 번으로 교체하므로
+  여러 워커가 같은 디렉터리를 공유해도 서로 다른 세대의 파일을 섞어 읽지 않음)
+- 조회: 청크 단위 행렬-벡터 곱 + argpartition top-k (여러 질의를 한 번에 처리 가능)
+- 갱신: 변경된 서버/도구만 기존 모델로 fold-in 하여 증분 반영,
+  변경량이 많아지면 다음 조회 시 전체 재학습
+
+numpy가 설치되어 있지 않으면 비활성화되며 키워드 검색으로 동작합니다.
+"""
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.service.catalog_search_index import CatalogFreshness, refresh_if_catalog_changed, version_of
+from backend.utils.lazy_import import lazy_module, module_available
+
+# numpy는 첫 인덱스 구축/검색 시 import (앱 시작 시간에 포함되지 않음)
+NUMPY_AVAILABLE = module_available("numpy")
+np = lazy_module("numpy")
+
+logger = logging.getLogger(__name__)
+
+# 로컬 sentence-transformers 모델 경로 (없으면 LSI 폴백)
+SEMANTIC_MODEL_PATH = os.getenv("SEMANTIC_MODEL_PATH")
+
+# 벡터/모델 저장 디렉터리
+SEMANTIC_INDEX_DIR = os.getenv(
+    "SEMANTIC_INDEX_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "semantic_index")
+)
+
+# LSI 차원 수
+LSI_DIMENSIONS = int(os.getenv("SEMANTIC_LSI_DIMENSIONS", "128"))
+
+# 한 번에 스캔할 벡터 행 수 (mmap 청크)
+SCAN_CHUNK_ROWS = 8192
+
+# 증분 갱신량이 전체의 이 비율을 넘으면 전체 재학습
+REFIT_CHANGE_RATIO = 0.2
+
+# 증분 행이 이 수를 넘으면 디스크 행렬로 병합(compact)
+MAX_DELTA_ROWS = 1024
+
+# 교체된 세대 디렉터리를 삭제하기 전 유예 시간 (초). 다른 워커가 아직 게시 전인 세대는 지우지 않음
+GENERATION_GRACE_SECONDS = 600
+
+# 서버 단위 결과를 만들기 위해 먼저 가져올 문서 후보 수 (limit 배수)
+CANDIDATE_MULTIPLIER = 8
+
+_TOKEN_PATTERN = re.compile(r'[^\W_]+', re.UNICODE)
+_CAMEL_BOUNDARY = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+
+_STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it',
+    'my', 'of', 'on', 'or', 'the', 'this', 'to', 'with', 'your', 'me', 'i',
+})
+
+
+def is_semantic_search_available() -> bool:
+    """시맨틱 검색 사용 가능 여부 (numpy 필요)"""
+    return NUMPY_AVAILABLE
+
+
+def semantic_tokens(text: Optional[str]) -> List[str]:
+    """snake_case / camelCase를 분리하고 불용어를 제거한 토큰 목록"""
+    text = _CAMEL_BOUNDARY.sub(' ', text or '')
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in _STOP_WORDS]
+
+
+# ==================== Sparse Linear Algebra ====================
+
+class _Csr:
+    """최소 CSR 희소 행렬 (scipy 의존성 없이 TF-IDF/SVD 계산용)"""
+
+    def __init__(self, indptr, indices, data, n_cols: int):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.n_rows = len(indptr) - 1
+        self.n_cols = n_cols
+        self._row_ids = None
+
+    def dot(self, dense):
+        """self @ dense (출력 열마다 1차원 gather + bincount 누적, 큰 임시 행렬 없음)"""
+        dense = np.asfortranarray(dense, dtype=np.float32)
+        out = np.empty((dense.shape[1], self.n_rows), dtype=np.float32)
+        if self._row_ids is None:
+            self._row_ids = np.repeat(np.arange(self.n_rows), np.diff(self.indptr))
+        for column in range(dense.shape[1]):
+            weights = self.data * dense[:, column][self.indices]
+            out[column] = np.bincount(self._row_ids, weights=weights, minlength=self.n_rows)
+        return out.T
+
+    def transpose(self) -> "_Csr":
+        row_ids = np.repeat(np.arange(self.n_rows), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind='stable')
+        counts = np.bincount(self.indices, minlength=self.n_cols)
+        indptr = np.concatenate(([0], np.cumsum(counts)))
+        return _Csr(indptr, row_ids[order], self.data[order], self.n_rows)
+
+
+def _tfidf_matrix(token_lists: List[List[str]], vocabulary: Dict[str, int], idf) -> _Csr:
+    """L2 정규화된 sublinear TF-IDF CSR 행렬"""
+    indptr = [0]
+    indices = []
+    data = []
+    for tokens in token_lists:
+        counts: Dict[int, int] = {}
+        for token in tokens:
+            column = vocabulary.get(token)
+            if column is not None:
+                counts[column] = counts.get(column, 0) + 1
+        if counts:
+            columns = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+            tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+            values = (1.0 + np.log(tf)) * idf[columns]
+            norm = np.linalg.norm(values)
+            if norm:
+                values /= norm
+            indices.append(columns)
+            data.append(values.astype(np.float32))
+        indptr.append(indptr[-1] + len(counts))
+
+    return _Csr(
+        np.asarray(indptr, dtype=np.int64),
+        np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64),
+        np.concatenate(data) if data else np.zeros(0, dtype=np.float32),
+        len(vocabulary)
+    )
+
+
+def _randomized_svd(matrix: _Csr, k: int, oversamples: int = 10, power_iterations: int = 2, seed: int = 0):
+    """
+    랜덤화 SVD (Halko et al.)로 상위 k개 오른쪽 특이벡터를 계산합니다.
+
+    Returns:
+        components (n_cols x k, float32)
+    """
+    rank = min(k + oversamples, matrix.n_rows, matrix.n_cols)
+    if rank <= 0:
+        return np.zeros((matrix.n_cols, 0), dtype=np.float32)
+
+    transposed = matrix.transpose()
+    rng = np.random.default_rng(seed)
+    q, _ = np.linalg.qr(matrix.dot(rng.standard_normal((matrix.n_cols, rank)).astype(np.float32)))
+    for _ in range(power_iterations):
+        z, _ = np.linalg.qr(transposed.dot(q))
+        q, _ = np.linalg.qr(matrix.dot(z))
+
+    # B = Q^T X (rank x n_cols)
+    b = transposed.dot(q).T
+    _, _, vt = np.linalg.svd(b, full_matrices=False)
+    return vt[:min(k, vt.shape[0])].T.astype(np.float32)
+
+
+def _normalize_rows(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32)
+
+
+# ==================== Embedders ====================
+
+class LsiEmbedder:
+    """TF-IDF + 랜덤화 SVD 잠재 의미 임베더 (기본 폴백)"""
+
+    kind = 'lsi'
+
+    def __init__(self, dimensions: int = LSI_DIMENSIONS):
+        self.dimensions = dimensions
+        self.vocabulary: Dict[str, int] = {}
+        self.idf = None
+        self.components = None
+
+    def fit(self, texts: List[str]):
+        token_lists = [semantic_tokens(text) for text in texts]
+        document_frequency: Dict[str, int] = {}
+        for tokens in token_lists:
+            for token in set(tokens):
+                document_frequency[token] = document_frequency.get(token, 0) + 1
+
+        terms = sorted(document_frequency)
+        self.vocabulary = {term: column for column, term in enumerate(terms)}
+        n_docs = max(len(texts), 1)
+        df = np.array([document_frequency[term] for term in terms], dtype=np.float32)
+        self.idf = (np.log((1.0 + n_docs) / (1.0 + df)) + 1.0).astype(np.float32)
+
+        matrix = _tfidf_matrix(token_lists, self.vocabulary, self.idf)
+        self.components = _randomized_svd(matrix, self.dimensions)
+        return _normalize_rows(matrix.dot(self.components))
+
+    def embed(self, texts: List[str]):
+        matrix = _tfidf_matrix([semantic_tokens(text) for text in texts], self.vocabulary, self.idf)
+        return _normalize_rows(matrix.dot(self.components))
+
+    def save(self, directory: str) -> None:
+        np.save(os.path.join(directory, 'lsi_components.npy'), self.components)
+        np.save(os.path.join(directory, 'lsi_idf.npy'), self.idf)
+        with open(os.path.join(directory, 'lsi_vocabulary.json'), 'w', encoding='utf-8') as f:
+            json.dump(sorted(self.vocabulary, key=self.vocabulary.get), f, ensure_ascii=False)
+
+    def load(self, directory: str) -> None:
+        self.components = np.load(os.path.join(directory, 'lsi_components.npy'))
+        self.idf = np.load(os.path.join(directory, 'lsi_idf.npy'))
+        with open(os.path.join(directory, 'lsi_vocabulary.json'), encoding='utf-8') as f:
+            self.vocabulary = {term: column for column, term in enumerate(json.load(f))}
+
+
+class SentenceTransformerEmbedder:
+    """로컬 디스크의 sentence-transformers 모델 임베더 (네트워크 접근 없음)"""
+
+    kind = 'sentence-transformers'
+
+    def __init__(self, model_path: str):
+        os.environ.setdefault("HF_HUB_OFFLINE", "1")
+        from sentence_transformers import SentenceTransformer
+        self.model = SentenceTransformer(model_path, device='cpu')
+
+    def fit(self, texts: List[str]):
+        return self.embed(texts)
+
+    def embed(self, texts: List[str]):
+        vectors = self.model.encode(
+            texts, batch_size=64, normalize_embeddings=True, convert_to_numpy=True, show_progress_bar=False
+        )
+        return np.asarray(vectors, dtype=np.float32)
+
+    def save(self, directory: str) -> None:
+        pass
+
+    def load(self, directory: str) -> None:
+        pass
+
+
+def create_embedder():
+    """로컬 모델이 있으면 sentence-transformers, 없으면 LSI 임베더를 생성합니다."""
+    if SEMANTIC_MODEL_PATH and os.path.isdir(SEMANTIC_MODEL_PATH):
+        try:
+            return SentenceTransformerEmbedder(SEMANTIC_MODEL_PATH)
+        except Exception as e:
+            logger.warning(f"Failed to load local embedding model, falling back to LSI: {e}")
+    return LsiEmbedder()
+
+
+# ==================== Vector Store ====================
+
+class VectorStore:
+    """
+    mmap float32 벡터 행렬 + 메모리 내 증분 행
+
+    디스크 행렬은 읽기 전용으로 매핑하고, 변경된 행은 삭제 마스크 + 증분 행으로 관리합니다.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.base = None
+        self.base_keys: List[str] = []
+        self.base_rows: Dict[str, int] = {}
+        self.deleted = None
+        self.delta_keys: List[str] = []
+        self.delta_vectors: List[Any] = []
+        self.delta_rows: Dict[str, int] = {}
+
+    @property
+    def vectors_path(self) -> str:
+        return os.path.join(self.directory, 'vectors.npy')
+
+    @property
+    def keys_path(self) -> str:
+        return os.path.join(self.directory, 'vector_keys.json')
+
+    def __len__(self) -> int:
+        live_base = 0 if self.deleted is None else int((~self.deleted).sum())
+        return live_base + len(self.delta_rows)
+
+    def replace_all(self, keys: List[str], vectors) -> None:
+        """
+        전체 행렬을 쓰고 mmap으로 다시 엽니다.
+        (새 세대 디렉터리에만 쓰며, 게시는 SemanticSearchIndex의 CURRENT 교체로 이루어짐)
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        np.save(self.vectors_path, np.ascontiguousarray(vectors, dtype=np.float32))
+        with open(self.keys_path, 'w', encoding='utf-8') as f:
+            json.dump(keys, f)
+        self.open()
+
+    def open(self) -> bool:
+        if not (os.path.exists(self.vectors_path) and os.path.exists(self.keys_path)):
+            return False
+        self.base = np.load(self.vectors_path, mmap_mode='r')
+        with open(self.keys_path, encoding='utf-8') as f:
+            self.base_keys = json.load(f)
+        self.base_rows = {key: row for row, key in enumerate(self.base_keys)}
+        self.deleted = np.zeros(len(self.base_keys), dtype=bool)
+        self.delta_keys, self.delta_vectors, self.delta_rows = [], [], {}
+        return True
+
+    def remove(self, key: str) -> None:
+        row = self.base_rows.get(key)
+        if row is not None:
+            self.deleted[row] = True
+        if key in self.delta_rows:
+            index = self.delta_rows.pop(key)
+            self.delta_keys[index] = None
+
+    def upsert(self, key: str, vector) -> None:
+        self.remove(key)
+        self.delta_rows[key] = len(self.delta_keys)
+        self.delta_keys.append(key)
+        self.delta_vectors.append(np.asarray(vector, dtype=np.float32))
+
+    def live_items(self):
+        """(key, vector) 순회 (compact 용)"""
+        if self.base is not None:
+            for row, key in enumerate(self.base_keys):
+                if not self.deleted[row]:
+                    yield key, self.base[row]
+        for index, key in enumerate(self.delta_keys):
+            if key is not None:
+                yield key, self.delta_vectors[index]
+
+    def top_k(self, queries, k: int) -> List[List[Tuple[str, float]]]:
+        """
+        여러 질의 벡터에 대해 코사인 유사도 상위 k개 (key, score)를 반환합니다.
+
+        mmap 행렬을 SCAN_CHUNK_ROWS 단위로 읽어 (chunk @ queries.T)를 계산하고,
+        청크마다 argpartition으로 후보를 좁혀 메모리 사용량을 제한합니다.
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        n_queries = queries.shape[0]
+        best_scores = [np.zeros(0, dtype=np.float32) for _ in range(n_queries)]
+        best_keys: List[List[str]] = [[] for _ in range(n_queries)]
+
+        def merge(scores, keys):
+            for q in range(n_queries):
+                candidate_scores = np.concatenate((best_scores[q], scores[:, q]))
+                candidate_keys = best_keys[q] + keys
+                if len(candidate_scores) > k:
+                    keep = np.argpartition(-candidate_scores, k - 1)[:k]
+                    candidate_scores = candidate_scores[keep]
+                    candidate_keys = [candidate_keys[i] for i in keep]
+                best_scores[q] = candidate_scores
+                best_keys[q] = candidate_keys
+
+        if self.base is not None and len(self.base_keys):
+            for start in range(0, len(self.base_keys), SCAN_CHUNK_ROWS):
+                end = min(len(self.base_keys), start + SCAN_CHUNK_ROWS)
+                scores = np.asarray(self.base[start:end]) @ queries.T
+                live = ~self.deleted[start:end]
+                if not live.all():
+                    rows = np.nonzero(live)[0]
+                    scores = scores[rows]
+                    keys = [self.base_keys[start + row] for row in rows]
+                else:
+                    keys = self.base_keys[start:end]
+                if len(keys):
+                    merge(scores, keys)
+
+        live_delta = [(key, self.delta_vectors[index]) for index, key in enumerate(self.delta_keys) if key is not None]
+        if live_delta:
+            matrix = np.vstack([vector for _, vector in live_delta])
+            merge(matrix @ queries.T, [key for key, _ in live_delta])
+
+        results = []
+        for q in range(n_queries):
+            order = np.argsort(-best_scores[q], kind='stable')
+            results.append([(best_keys[q][i], float(best_scores[q][i])) for i in order])
+        return results
+
+
+# ==================== Semantic Index ====================
+
+def _server_documents(mcp_server) -> List[Tuple[str, Dict[str, Any], str]]:
+    """서버 1개 + 도구별 문서 (key, meta, text)"""
+    tags = ' '.join(tag.name for tag in mcp_server.tags)
+    documents = [(
+        f"s:{mcp_server.id}",
+        {"mcp_server_id": mcp_server.id, "tool": None},
+        f"{mcp_server.name} {mcp_server.name} {tags} {mcp_server.description or ''}"
+    )]
+    for tool in mcp_server.tools:
+        documents.append((
+            f"t:{mcp_server.id}:{tool.id}",
+            {"mcp_server_id": mcp_server.id, "tool": tool.name},
+            f"{tool.name} {tool.name} {tool.description or ''} {mcp_server.name}"
+        ))
+    return documents
+
+
+def _server_version(mcp_server) -> List[Optional[str]]:
+    """DB와 인덱스를 대조할 서버 버전 (JSON 저장 가능한 형태)"""
+    return [value.isoformat() if value is not None else None for value in version_of(mcp_server)]
+
+
+class SemanticSearchIndex:
+    """서버/도구 임베딩 인덱스"""
+
+    def __init__(self, directory: str = SEMANTIC_INDEX_DIR, embedder_factory: Callable[[], Any] = create_embedder):
+        self.directory = directory
+        self.embedder_factory = embedder_factory
+        self._lock = threading.RLock()
+        self.embedder = None
+        self.store = VectorStore(directory)
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.server_keys: Dict[int, List[str]] = {}
+        # 서버별 임베딩 시점의 버전 (DB 대조용)
+        self.server_versions: Dict[int, List[Optional[str]]] = {}
+        self.freshness = CatalogFreshness()
+        self.changes_since_fit = 0
+        self.ready = False
+
+    @property
+    def current_path(self) -> str:
+        """게시된 세대 디렉터리 이름을 담은 포인터 파일"""
+        return os.path.join(self.directory, 'CURRENT')
+
+    def _read_current(self) -> Optional[str]:
+        try:
+            with open(self.current_path, encoding='utf-8') as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    @property
+    def needs_refit(self) -> bool:
+        return self.changes_since_fit > max(REFIT_CHANGE_RATIO * len(self.documents), 50)
+
+    def _index_documents(self, documents: Dict[str, Dict[str, Any]]) -> None:
+        self.documents = documents
+        self.server_keys = {}
+        for key, meta in documents.items():
+            self.server_keys.setdefault(meta["mcp_server_id"], []).append(key)
+
+    def _save_meta(self, generation_dir: str) -> None:
+        with open(os.path.join(generation_dir, 'documents.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                "embedder": self.embedder.kind,
+                "documents": self.documents,
+                "server_versions": self.server_versions,
+            }, f, ensure_ascii=False)
+
+    def _publish_generation(self, keys: List[str], vectors) -> None:
+        """
+        벡터, 임베더 모델, 문서 메타를 새 세대 디렉터리에 모두 쓴 뒤
+        CURRENT 포인터를 한 번의 rename으로 교체합니다. (호출자가 _lock 보유)
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"gen-{time.time_ns()}-{os.getpid()}"
+        generation_dir = os.path.join(self.directory, name)
+        os.makedirs(generation_dir)
+
+        store = VectorStore(generation_dir)
+        if keys:
+            store.replace_all(keys, vectors)
+            self.embedder.save(generation_dir)
+        self._save_meta(generation_dir)
+
+        previous = self._read_current()
+        tmp_current = f"{self.current_path}.tmp-{os.getpid()}"
+        with open(tmp_current, 'w', encoding='utf-8') as f:
+            f.write(name)
+        os.replace(tmp_current, self.current_path)
+        self.store = store
+        self._prune_generations(keep={name, previous})
+
+    def _prune_generations(self, keep: set) -> None:
+        """현재/직전 세대와 유예 시간 내의 디렉터리를 제외한 이전 세대를 삭제합니다."""
+        cutoff = time.time() - GENERATION_GRACE_SECONDS
+        for entry in os.listdir(self.directory):
+            path = os.path.join(self.directory, entry)
+            if entry in keep or not entry.startswith('gen-'):
+                continue
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    shutil.rmtree(path, ignore_errors=True)
+            except OSError:
+                continue
+
+    def build(self, mcp_servers: Iterable[Any]) -> int:
+        """전체 문서를 임베딩하고 디스크에 저장합니다."""
+        mcp_servers = list(mcp_servers)
+        documents = [doc for mcp_server in mcp_servers for doc in _server_documents(mcp_server)]
+        embedder = self.embedder_factory()
+        vectors = embedder.fit([text for _, _, text in documents]) if documents else None
+
+        with self._lock:
+            self.embedder = embedder
+            self._index_documents({key: meta for key, meta, _ in documents})
+            self.server_versions = {mcp_server.id: _server_version(mcp_server) for mcp_server in mcp_servers}
+            self._publish_generation([key for key, _, _ in documents], vectors)
+            self.changes_since_fit = 0
+            self.ready = True
+            return len(documents)
+
+    def load(self) -> bool:
+        """CURRENT가 가리키는 세대의 인덱스를 mmap으로 엽니다."""
+        name = self._read_current()
+        if name is None:
+            return False
+        generation_dir = os.path.join(self.directory, name)
+        try:
+            with open(os.path.join(generation_dir, 'documents.json'), encoding='utf-8') as f:
+                meta = json.load(f)
+            embedder = self.embedder_factory()
+            if embedder.kind != meta.get("embedder"):
+                return False
+            embedder.load(generation_dir)
+            store = VectorStore(generation_dir)
+            if meta["documents"] and not store.open():
+                return False
+            with self._lock:
+                self.store = store
+                self.embedder = embedder
+                self._index_documents(meta["documents"])
+                self.server_versions = {
+                    int(mcp_server_id): version
+                    for mcp_server_id, version in meta.get("server_versions", {}).items()
+                }
+                self.changes_since_fit = 0
+                self.ready = True
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to load semantic index from {self.directory}: {e}")
+            return False
+
+    def sync_servers(self, mcp_servers: Iterable[Any], removed_ids: Iterable[int]) -> None:
+        """변경된 서버/도구 문서를 기존 모델로 fold-in 하여 갱신합니다."""
+        with self._lock:
+            if not self.ready:
+                return
+            for mcp_server_id in removed_ids:
+                self.server_versions.pop(mcp_server_id, None)
+                for key in self.server_keys.pop(mcp_server_id, []):
+                    self.store.remove(key)
+                    self.documents.pop(key, None)
+                    self.changes_since_fit += 1
+
+            documents = []
+            for mcp_server in mcp_servers:
+                for key in self.server_keys.pop(mcp_server.id, []):
+                    self.store.remove(key)
+                    self.documents.pop(key, None)
+                self.server_versions[mcp_server.id] = _server_version(mcp_server)
+                documents.extend(_server_documents(mcp_server))
+
+            if documents and self.embedder is not None and (
+                    not isinstance(self.embedder, LsiEmbedder) or self.embedder.components is not None):
+                vectors = self.embedder.embed([text for _, _, text in documents])
+                for (key, meta, _), vector in zip(documents, vectors):
+                    self.store.upsert(key, vector)
+                    self.documents[key] = meta
+                    self.server_keys.setdefault(meta["mcp_server_id"], []).append(key)
+                self.changes_since_fit += len(documents)
+            elif documents:
+                # 학습된 모델이 없으면 (빈 카탈로그에서 시작) 다음 조회 시 재학습
+                self.changes_since_fit += len(documents) + 10 ** 6
+
+            if len(self.store.delta_rows) > MAX_DELTA_ROWS:
+                # 증분 행을 병합한 새 세대를 게시 (현재 세대 파일은 다른 워커가 읽고 있을 수 있어 수정하지 않음)
+                items = list(self.store.live_items())
+                if items:
+                    self._publish_generation([key for key, _ in items], np.vstack([vector for _, vector in items]))
+
+    def search_many(self, queries: List[str], limit: int = 10) -> List[List[Dict[str, Any]]]:
+        """여러 질의를 한 번의 스캔으로 처리하여 서버 단위 결과를 반환합니다."""
+        with self._lock:
+            if not self.ready or not self.documents or self.embedder is None:
+                return [[] for _ in queries]
+            query_vectors = self.embedder.embed(queries)
+            hits_per_query = self.store.top_k(query_vectors, max(limit * CANDIDATE_MULTIPLIER, limit))
+
+            results = []
+            for hits in hits_per_query:
+                servers: Dict[int, Dict[str, Any]] = {}
+                for key, score in hits:
+                    meta = self.documents.get(key)
+                    if meta is None or score <= 0:
+                        continue
+                    entry = servers.setdefault(
+                        meta["mcp_server_id"],
+                        {"mcp_server_id": meta["mcp_server_id"], "score": score, "matched_tools": []}
+                    )
+                    entry["score"] = max(entry["score"], score)
+                    if meta["tool"] and len(entry["matched_tools"]) < 3:
+                        entry["matched_tools"].append(meta["tool"])
+                ranked = sorted(servers.values(), key=lambda item: -item["score"])
+                results.append(ranked[:limit])
+            return results
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        return self.search_many([query], limit)[0]
+
+
+# 프로세스 전역 인덱스
+semantic_index = SemanticSearchIndex()
+
+
+def _load_servers(db: Session, mcp_server_ids: Optional[List[int]] = None):
+    from backend.database.dao.mcp_server_dao import MCPServerDAO
+    return MCPServerDAO(db).get_mcp_servers_with_tags_and_tools(status='approved', mcp_server_ids=mcp_server_ids)
+
+
+def reconcile_semantic_index(db: Session, index: SemanticSearchIndex = semantic_index) -> Dict[str, List[int]]:
+    """
+    인덱스의 서버 목록/버전을 DB의 승인 서버와 대조하여 차이나는 서버만 다시 동기화합니다.
+    (디스크에서 연 인덱스는 저장 이후의 승인/거절/삭제/수정을 모르므로 load 직후 호출)
+
+    Returns:
+        missing(인덱스에 없는 승인 서버), extra(미승인/삭제 서버), stale(버전 불일치)
+    """
+    from backend.database.dao.mcp_server_dao import MCPServerDAO
+
+    db_versions = {
+        row.id: _server_version(row)
+        for row in MCPServerDAO(db).get_mcp_servers_versions(status='approved', sort='created_at', limit=None)
+    }
+    indexed = set(index.server_keys) | set(index.server_versions)
+    missing = sorted(set(db_versions) - indexed)
+    extra = sorted(indexed - set(db_versions))
+    stale = sorted(
+        mcp_server_id for mcp_server_id in set(db_versions) & indexed
+        if index.server_versions.get(mcp_server_id) != db_versions[mcp_server_id]
+    )
+    if missing or extra or stale:
+        changed = _load_servers(db, missing + stale) if missing or stale else []
+        index.sync_servers(changed, extra)
+        logger.info(
+            f"Semantic index reconciled with DB: missing={len(missing)}, extra={len(extra)}, stale={len(stale)}"
+        )
+    return {"missing": missing, "extra": extra, "stale": stale}
+
+
+def ensure_semantic_index(db: Session, index: SemanticSearchIndex = semantic_index,
+                          interval: Optional[float] = None) -> SemanticSearchIndex:
+    """
+    인덱스를 디스크에서 열거나(DB와 대조), 없거나 재학습이 필요하면 DB에서 구축합니다.
+    준비된 인덱스는 카탈로그 버전이 바뀌었을 때만 DB와 다시 대조합니다. (다른 워커의 변경 반영)
+    """
+    from backend.database.dao.mcp_server_dao import MCPServerDAO
+
+    if index.ready and not index.needs_refit:
+        refresh_if_catalog_changed(
+            db, index.freshness, lambda: any(reconcile_semantic_index(db, index).values()), interval
+        )
+        if not index.needs_refit:
+            return index
+
+    catalog_version = MCPServerDAO(db).get_catalog_version()
+    if not index.ready:
+        if index.load():
+            reconcile_semantic_index(db, index)
+        else:
+            count = index.build(_load_servers(db))
+            logger.info(f"Semantic index built: {count} documents ({index.embedder.kind})")
+    if index.needs_refit:
+        count = index.build(_load_servers(db))
+        logger.info(f"Semantic index refitted: {count} documents ({index.embedder.kind})")
+    index.freshness.mark(catalog_version)
+    return index
+
+
+def sync_semantic_index(db: Session, mcp_server_ids: Iterable[int],
+                        index: SemanticSearchIndex = semantic_index) -> None:
+    """변경된 서버들의 임베딩을 갱신합니다. (인덱스가 준비되지 않았으면 무시)"""
+    if not NUMPY_AVAILABLE or not index.ready:
+        return
+    ids = list(mcp_server_ids)
+    if not ids:
+        return
+    mcp_servers = _load_servers(db, ids)
+    approved = {mcp_server.id for mcp_server in mcp_servers}
+    index.sync_servers(mcp_servers, [mcp_server_id for mcp_server_id in ids if mcp_server_id not in approved])
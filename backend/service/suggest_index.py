@@ -0,0 +1,403 @@
+"""
+검색어 자동완성(Search-as-you-type) 인덱스
+
+서버 이름, 태그, 도구 이름, 인기 검색어를 정렬된 배열에 저장하고 이진 탐색으로 접두사 범위를 찾습니다.
+- 각 텍스트의 단어 시작 위치마다 키를 등록하여 중간 단어로도 매칭 ("mcp" → "Weather MCP")
+- 가중치: 즐겨찾기 수, 조회 수(daily_server_views), 태그 사용 수, 검색 횟수(daily_search_keywords)
+- 접두사별 결과 LRU 캐시, 서버 변경 시 증분 갱신
+- TTL이 지나면 기존 인덱스로 계속 응답하면서 백그라운드 스레드 하나만 재구축 (stale-while-revalidate)
+- 다른 워커의 서버 변경은 조회 전 카탈로그 버전 확인으로 바뀐 서버만 다시 반영
+"""
+import bisect
+import heapq
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.service.catalog_search_index import (
+    CatalogFreshness, diff_catalog_versions, refresh_if_catalog_changed, version_of
+)
+
+logger = logging.getLogger(__name__)
+
+# 전체 재구축 주기 (초)
+SUGGEST_INDEX_TTL_SECONDS = int(os.getenv("SUGGEST_INDEX_TTL_SECONDS", "300"))
+
+# 접두사 결과 캐시 크기
+SUGGEST_CACHE_SIZE = 1024
+
+# 텍스트 하나당 등록할 최대 단어 시작 키 수
+MAX_KEYS_PER_TEXT = 8
+
+# 인기 검색어 집계 기간 및 개수
+POPULAR_QUERY_DAYS = 30
+POPULAR_QUERY_LIMIT = 500
+
+# 종류별 기본 가중치
+KIND_BASE_WEIGHTS = {
+    'server': 3.0,
+    'tag': 2.0,
+    'query': 1.5,
+    'tool': 1.0,
+}
+
+# 텍스트 맨 앞에서 일치한 경우 가산점
+LEADING_MATCH_BONUS = 0.5
+
+_WORD_PATTERN = re.compile(r'[^\W_]+', re.UNICODE)
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """소문자 변환 및 공백 정리"""
+    return ' '.join((text or '').lower().split())
+
+
+def prefix_keys(text: str) -> List[str]:
+    """정규화된 텍스트의 단어 시작 위치별 키 목록을 생성합니다."""
+    keys = []
+    for match in _WORD_PATTERN.finditer(text):
+        keys.append(text[match.start():])
+        if len(keys) >= MAX_KEYS_PER_TEXT:
+            break
+    return keys or ([text] if text else [])
+
+
+def server_popularity(favorites: int, views: int) -> float:
+    """즐겨찾기/조회 수 기반 인기도"""
+    return 2.0 * math.log1p(favorites) + math.log1p(views)
+
+
+class Suggestion:
+    __slots__ = ('text', 'kind', 'mcp_server_id', 'weight', 'normalized')
+
+    def __init__(self, text: str, kind: str, weight: float, mcp_server_id: Optional[int] = None):
+        self.text = text
+        self.kind = kind
+        self.weight = weight
+        self.mcp_server_id = mcp_server_id
+        self.normalized = normalize_text(text)
+
+    def to_dict(self, score: float) -> Dict[str, Any]:
+        return {
+            "text": self.text,
+            "kind": self.kind,
+            "mcp_server_id": self.mcp_server_id,
+            "score": round(score, 4),
+        }
+
+
+class SuggestIndex:
+    """
+    정렬 배열 기반 자동완성 인덱스
+
+    _items: (key, entry_id) 정렬 목록 → bisect로 접두사 범위 탐색
+    """
+
+    def __init__(self, ttl_seconds: int = SUGGEST_INDEX_TTL_SECONDS, cache_size: int = SUGGEST_CACHE_SIZE):
+        self.ttl_seconds = ttl_seconds
+        self.cache_size = cache_size
+        self._lock = threading.RLock()
+        # 전체 재구축은 한 번에 하나만 실행 (최초 구축은 대기, TTL 재구축은 이미 실행 중이면 건너뜀)
+        self.rebuild_lock = threading.Lock()
+        self._reset()
+        self.built_at: Optional[float] = None
+        self.freshness = CatalogFreshness()
+
+    def _reset(self) -> None:
+        self._items: List[Tuple[str, int]] = []
+        self._server_versions: Dict[int, Any] = {}
+        self._entries: Dict[int, Suggestion] = {}
+        self._entry_keys: Dict[int, List[str]] = {}
+        self._server_entries: Dict[int, List[int]] = {}
+        self._tag_entries: Dict[str, int] = {}
+        self._view_counts: Dict[int, int] = {}
+        self._cache: "OrderedDict[Tuple[str, int], List[Dict[str, Any]]]" = OrderedDict()
+        self._next_id = 0
+
+    # ==================== Maintenance ====================
+
+    def is_stale(self) -> bool:
+        return self.built_at is None or time.monotonic() - self.built_at > self.ttl_seconds
+
+    def _add_entry(self, suggestion: Suggestion) -> int:
+        entry_id = self._next_id
+        self._next_id += 1
+        keys = prefix_keys(suggestion.normalized)
+        self._entries[entry_id] = suggestion
+        self._entry_keys[entry_id] = keys
+        for key in keys:
+            bisect.insort(self._items, (key, entry_id))
+        return entry_id
+
+    def _remove_entry(self, entry_id: int) -> None:
+        self._entries.pop(entry_id, None)
+        for key in self._entry_keys.pop(entry_id, []):
+            index = bisect.bisect_left(self._items, (key, entry_id))
+            if index < len(self._items) and self._items[index] == (key, entry_id):
+                del self._items[index]
+
+    def _add_server(self, mcp_server, popularity: float) -> None:
+        entry_ids = [self._add_entry(Suggestion(
+            mcp_server.name, 'server', KIND_BASE_WEIGHTS['server'] + popularity, mcp_server.id
+        ))]
+        seen_tools = set()
+        for tool in mcp_server.tools:
+            if tool.name in seen_tools:
+                continue
+            seen_tools.add(tool.name)
+            entry_ids.append(self._add_entry(Suggestion(
+                tool.name, 'tool', KIND_BASE_WEIGHTS['tool'] + 0.5 * popularity, mcp_server.id
+            )))
+        for tag in mcp_server.tags:
+            if tag.name not in self._tag_entries:
+                self._tag_entries[tag.name] = self._add_entry(Suggestion(
+                    tag.name, 'tag', KIND_BASE_WEIGHTS['tag'] + math.log1p(1)
+                ))
+        self._server_entries[mcp_server.id] = entry_ids
+        self._server_versions[mcp_server.id] = version_of(mcp_server)
+
+    def _remove_server(self, mcp_server_id: int) -> None:
+        self._server_versions.pop(mcp_server_id, None)
+        for entry_id in self._server_entries.pop(mcp_server_id, []):
+            self._remove_entry(entry_id)
+
+    def build(
+        self,
+        mcp_servers: Iterable[Any],
+        favorites_counts: Dict[int, int],
+        view_counts: Dict[int, int],
+        tag_usage_counts: Dict[str, int],
+        popular_queries: Iterable[Dict[str, Any]]
+    ) -> int:
+        """인덱스를 새로 구축합니다. (bisect.insort 대신 한 번에 정렬)"""
+        with self._lock:
+            self._reset()
+            self._view_counts = dict(view_counts)
+
+            # 태그는 사용 수 가중치로 먼저 등록 (서버 등록 시 중복 생성 방지)
+            for tag_name, usage in tag_usage_counts.items():
+                self._tag_entries[tag_name] = self._register(Suggestion(
+                    tag_name, 'tag', KIND_BASE_WEIGHTS['tag'] + math.log1p(usage)
+                ))
+
+            for mcp_server in mcp_servers:
+                popularity = server_popularity(
+                    favorites_counts.get(mcp_server.id, 0), self._view_counts.get(mcp_server.id, 0)
+                )
+                entry_ids = [self._register(Suggestion(
+                    mcp_server.name, 'server', KIND_BASE_WEIGHTS['server'] + popularity, mcp_server.id
+                ))]
+                for tool_name in dict.fromkeys(tool.name for tool in mcp_server.tools):
+                    entry_ids.append(self._register(Suggestion(
+                        tool_name, 'tool', KIND_BASE_WEIGHTS['tool'] + 0.5 * popularity, mcp_server.id
+                    )))
+                self._server_entries[mcp_server.id] = entry_ids
+                self._server_versions[mcp_server.id] = version_of(mcp_server)
+
+            for row in popular_queries:
+                keyword = normalize_text(row.get("keyword"))
+                if keyword:
+                    self._register(Suggestion(
+                        keyword, 'query', KIND_BASE_WEIGHTS['query'] + math.log1p(row.get("count") or 0)
+                    ))
+
+            self._items.sort()
+            self.built_at = time.monotonic()
+            return len(self._entries)
+
+    def _register(self, suggestion: Suggestion) -> int:
+        """build 전용: 정렬 없이 항목을 추가합니다."""
+        entry_id = self._next_id
+        self._next_id += 1
+        keys = prefix_keys(suggestion.normalized)
+        self._entries[entry_id] = suggestion
+        self._entry_keys[entry_id] = keys
+        self._items.extend((key, entry_id) for key in keys)
+        return entry_id
+
+    def update_servers(self, mcp_servers: Iterable[Any], removed_ids: Iterable[int],
+                       favorites_counts: Dict[int, int]) -> None:
+        """서버 항목을 증분 갱신합니다. (조회 수는 마지막 재구축 값을 유지)"""
+        with self._lock:
+            for mcp_server_id in removed_ids:
+                self._remove_server(mcp_server_id)
+            for mcp_server in mcp_servers:
+                self._remove_server(mcp_server.id)
+                self._add_server(mcp_server, server_popularity(
+                    favorites_counts.get(mcp_server.id, 0), self._view_counts.get(mcp_server.id, 0)
+                ))
+            self._cache.clear()
+
+    def versions(self) -> Dict[int, Any]:
+        with self._lock:
+            return dict(self._server_versions)
+
+    # ==================== Query ====================
+
+    def suggest(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """접두사와 일치하는 자동완성 후보를 가중치 순으로 반환합니다."""
+        prefix = normalize_text(query)
+        if not prefix:
+            return []
+
+        cache_key = (prefix, limit)
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return cached
+
+            candidates: Dict[int, float] = {}
+            index = bisect.bisect_left(self._items, (prefix, -1))
+            while index < len(self._items):
+                key, entry_id = self._items[index]
+                if not key.startswith(prefix):
+                    break
+                suggestion = self._entries[entry_id]
+                score = suggestion.weight
+                if suggestion.normalized.startswith(prefix):
+                    score += LEADING_MATCH_BONUS
+                if score > candidates.get(entry_id, 0.0):
+                    candidates[entry_id] = score
+                index += 1
+
+            # 같은 종류의 같은 텍스트(예: 여러 서버의 동일 도구 이름)는 최고 점수 하나만 유지
+            best: Dict[Tuple[str, str], Tuple[float, int]] = {}
+            for entry_id, score in candidates.items():
+                suggestion = self._entries[entry_id]
+                dedupe_key = (suggestion.kind, suggestion.normalized)
+                if dedupe_key not in best or score > best[dedupe_key][0]:
+                    best[dedupe_key] = (score, entry_id)
+
+            top = heapq.nlargest(limit, best.values(), key=lambda item: (item[0], -item[1]))
+            results = [self._entries[entry_id].to_dict(score) for score, entry_id in top]
+
+            self._cache[cache_key] = results
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return results
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "keys": len(self._items),
+                "cached_prefixes": len(self._cache),
+                "age_seconds": None if self.built_at is None else round(time.monotonic() - self.built_at, 1),
+            }
+
+
+# 프로세스 전역 인덱스
+suggest_index = SuggestIndex()
+
+
+def _load_analytics_sources(db: Session) -> Tuple[Dict[int, int], List[Dict[str, Any]]]:
+    """조회 수/인기 검색어 집계를 조회합니다. (집계 뷰가 없으면 빈 값)"""
+    from backend.database.dao.analytics_dao import AnalyticsDAO
+
+    analytics_dao = AnalyticsDAO(db)
+    try:
+        views = analytics_dao.get_most_viewed_servers(limit=10000, days=POPULAR_QUERY_DAYS)
+        queries = analytics_dao.get_top_search_keywords(limit=POPULAR_QUERY_LIMIT, days=POPULAR_QUERY_DAYS)
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Suggest index: analytics aggregates unavailable ({e})")
+        return {}, []
+    return {row["mcp_server_id"]: int(row["view_count"] or 0) for row in views}, queries
+
+
+def rebuild_suggest_index(db: Session, index: SuggestIndex = suggest_index) -> int:
+    """DB에서 전체 자동완성 인덱스를 재구축합니다."""
+    from backend.database.dao.mcp_server_dao import MCPServerDAO
+
+    mcp_server_dao = MCPServerDAO(db)
+    catalog_version = mcp_server_dao.get_catalog_version()
+    view_counts, popular_queries = _load_analytics_sources(db)
+    count = index.build(
+        mcp_servers=mcp_server_dao.get_mcp_servers_with_tags_and_tools(status='approved'),
+        favorites_counts=mcp_server_dao.get_favorites_counts(),
+        view_counts=view_counts,
+        tag_usage_counts=mcp_server_dao.get_tag_usage_counts(status='approved'),
+        popular_queries=popular_queries
+    )
+    index.freshness.mark(catalog_version)
+    logger.info(f"Suggest index rebuilt: {index.stats()}")
+    return count
+
+
+def start_background_rebuild(db: Session, index: SuggestIndex = suggest_index) -> bool:
+    """
+    별도 세션으로 인덱스를 재구축하는 스레드를 시작합니다.
+
+    Returns:
+        이미 재구축 중이면 False
+    """
+    if not index.rebuild_lock.acquire(blocking=False):
+        return False
+    bind = db.get_bind()
+
+    def run() -> None:
+        try:
+            with Session(bind=bind) as session:
+                rebuild_suggest_index(session, index=index)
+        except Exception as e:
+            logger.error(f"Suggest index background rebuild failed: {e}")
+        finally:
+            index.rebuild_lock.release()
+
+    threading.Thread(target=run, name="suggest-index-rebuild", daemon=True).start()
+    return True
+
+
+def get_suggestions(db: Session, query: str, limit: int = 10,
+                    index: SuggestIndex = suggest_index, interval: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    자동완성 후보를 반환합니다.
+
+    아직 구축되지 않았으면 구축될 때까지 기다리고, TTL이 지났으면 기존 인덱스로 응답하면서
+    백그라운드 재구축을 시작합니다. 그 사이 다른 워커의 카탈로그 변경은 바뀐 서버만 반영합니다.
+    """
+    if index.built_at is None:
+        with index.rebuild_lock:
+            if index.built_at is None:
+                rebuild_suggest_index(db, index=index)
+    elif index.is_stale():
+        start_background_rebuild(db, index=index)
+
+    def repair() -> bool:
+        diff = diff_catalog_versions(db, index.versions())
+        changed_ids = diff["missing"] + diff["extra"] + diff["stale"]
+        sync_suggest_index(db, changed_ids, index=index)
+        return bool(changed_ids)
+
+    refresh_if_catalog_changed(db, index.freshness, repair, interval)
+    return index.suggest(query, limit)
+
+
+def sync_suggest_index(db: Session, mcp_server_ids: Iterable[int],
+                       index: SuggestIndex = suggest_index) -> None:
+    """변경된 서버들의 자동완성 항목을 갱신합니다. (아직 구축되지 않았으면 무시)"""
+    if index.built_at is None:
+        return
+
+    from backend.database.dao.mcp_server_dao import MCPServerDAO
+
+    ids = list(mcp_server_ids)
+    if not ids:
+        return
+
+    mcp_server_dao = MCPServerDAO(db)
+    mcp_servers = mcp_server_dao.get_mcp_servers_with_tags_and_tools(status='approved', mcp_server_ids=ids)
+    approved = {mcp_server.id for mcp_server in mcp_servers}
+    index.update_servers(
+        mcp_servers,
+        removed_ids=[mcp_server_id for mcp_server_id in ids if mcp_server_id not in approved],
+        favorites_counts=mcp_server_dao.get_favorites_counts(ids)
+    )
@@ -0,0 +1,129 @@
+"""
+급상승(trending) 서버 순위 엔진
+
+- 최근 기간(window) + 비교 기간(comparison)의 서버별/일별 조회수를 한 번의 GROUP BY 쿼리로 가져와
+  모든 서버를 대상으로 점수를 계산 (상위 N개만 비교하던 방식의 누락 문제 해결)
+- 점수 = 시간 감쇠 조회수(반감기 TRENDING_HALF_LIFE_DAYS) × log2(1 + 증가율)
+  → 최근 조회가 많을수록, 이전 기간 대비 증가폭이 클수록 높은 순위
+- 기본 기간 조합(TRENDING_WINDOWS)은 롤업 워커가 주기적으로 계산해
+  analytics_trending_servers 테이블에 저장하고, 조회 API는 이 테이블을 읽기만 함
+"""
+import logging
+import math
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.database.dao.analytics_dao import AnalyticsDAO
+from backend.database.dao.analytics_rollup_dao import AnalyticsRollupDAO
+
+logger = logging.getLogger(__name__)
+
+# 조회수 가중치 반감기 (일)
+TRENDING_HALF_LIFE_DAYS = float(os.getenv("TRENDING_HALF_LIFE_DAYS", "2"))
+
+# 사전 계산 주기 (초)
+TRENDING_REFRESH_SECONDS = int(os.getenv("TRENDING_REFRESH_SECONDS", "300"))
+
+# 사전 계산할 (최근 기간, 비교 기간) 조합. 예: "7:7,1:7"
+TRENDING_WINDOWS: List[Tuple[int, int]] = [
+    tuple(int(part) for part in window.split(':'))
+    for window in os.getenv("TRENDING_WINDOWS", "7:7").split(',')
+    if window.strip()
+]
+
+# 기간 조합별 저장할 최대 서버 수
+MAX_TRENDING_SERVERS = 100
+
+
+def compute_trending(
+    db: Session,
+    days: int = 7,
+    comparison_days: int = 7,
+    now: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """
+    급상승 점수를 계산합니다. (일 단위 버킷 기준, 오늘 포함 최근 days일 vs 그 이전 comparison_days일)
+
+    Returns:
+        점수 내림차순 [{"mcp_server_id", "recent_views", "previous_views", "growth_rate", "score"}, ...]
+    """
+    now = now or datetime.utcnow()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    recent_start = today - timedelta(days=days - 1)
+    previous_start = recent_start - timedelta(days=comparison_days)
+
+    servers: Dict[int, Dict[str, float]] = {}
+    for row in AnalyticsDAO(db).get_daily_server_views(previous_start):
+        stats = servers.setdefault(row["mcp_server_id"], {"recent": 0, "previous": 0, "decayed": 0.0})
+        views = int(row["view_count"] or 0)
+        if row["day"] >= recent_start:
+            stats["recent"] += views
+            # 버킷 중앙 시각 기준 경과 일수
+            age_days = max(0.0, (now - (row["day"] + timedelta(hours=12))).total_seconds() / 86400)
+            stats["decayed"] += views * 0.5 ** (age_days / TRENDING_HALF_LIFE_DAYS)
+        else:
+            stats["previous"] += views
+
+    trending = []
+    for mcp_server_id, stats in servers.items():
+        if not stats["recent"]:
+            continue
+        # 기간 길이가 다를 수 있으므로 일 평균으로 비교
+        growth_rate = (stats["recent"] / days) / (max(stats["previous"], 1) / comparison_days)
+        trending.append({
+            "mcp_server_id": mcp_server_id,
+            "recent_views": int(stats["recent"]),
+            "previous_views": int(stats["previous"]),
+            "growth_rate": round(growth_rate, 2),
+            "score": round(stats["decayed"] * math.log2(1 + growth_rate), 4),
+        })
+
+    trending.sort(key=lambda item: (-item["score"], -item["recent_views"], item["mcp_server_id"]))
+    return trending
+
+
+def refresh_trending_rankings(db: Session, now: Optional[datetime] = None) -> Dict[str, int]:
+    """TRENDING_WINDOWS 조합별 순위를 다시 계산해 저장합니다."""
+    dao = AnalyticsRollupDAO(db)
+    counts = {}
+    try:
+        for days, comparison_days in TRENDING_WINDOWS:
+            rankings = compute_trending(db, days, comparison_days, now)[:MAX_TRENDING_SERVERS]
+            dao.replace_trending_servers(days, comparison_days, rankings)
+            counts[f"{days}:{comparison_days}"] = len(rankings)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return counts
+
+
+def get_trending(
+    db: Session,
+    limit: int = 10,
+    days: int = 7,
+    comparison_days: int = 7
+) -> List[Dict[str, Any]]:
+    """
+    급상승 서버를 조회합니다.
+
+    사전 계산된 순위가 있으면 그대로 반환하고, 없으면 (비기본 기간, 첫 계산 전) 즉석에서 계산합니다.
+    """
+    if (days, comparison_days) in TRENDING_WINDOWS and limit <= MAX_TRENDING_SERVERS:
+        rows = AnalyticsRollupDAO(db).get_trending_servers(days, comparison_days, limit)
+        if rows:
+            return [
+                {
+                    "mcp_server_id": row.mcp_server_id,
+                    "recent_views": row.recent_views,
+                    "previous_views": row.previous_views,
+                    "growth_rate": row.growth_rate,
+                    "score": row.score,
+                }
+                for row in rows
+            ]
+
+    return compute_trending(db, days, comparison_days)[:limit]
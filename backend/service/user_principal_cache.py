@@ -0,0 +1,187 @@
+"""
+인증 사용자(principal) 캐시
+
+get_current_user가 매 요청마다 사용자 테이블을 조회하지 않도록, 사용자 정보 스냅샷을
+user_id 키로 짧은 시간 동안 보관합니다.
+
+- 크기 제한 LRU + TTL (USER_PRINCIPAL_CACHE_SIZE / USER_PRINCIPAL_CACHE_TTL_SECONDS)
+- User 행이 ORM으로 수정/삭제되면 (프로필 수정, 권한 변경 등) 해당 사용자 항목 제거
+- 캐시된 값은 ORM 객체가 아닌 읽기 전용 스냅샷이므로 세션과 무관하게 안전하게 공유됨
+
+다른 워커 프로세스의 변경은 shared_state로 전달됩니다. 커밋된 사용자 변경마다 사용자별 세대 값을
+갱신하고, 캐시 항목은 저장 시점의 세대 값이 현재 값과 같을 때만 사용합니다.
+(SHARED_STATE_BACKEND=local에서는 프로세스 내부 무효화만 동작하며, 다른 워커에는 TTL 이내에 반영)
+공유 백엔드 오류 시에는 캐시를 건너뛰고 DB에서 조회하며, 무효화 전파 실패는 로그만 남깁니다.
+"""
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from backend.database.model import User
+from backend.utils.shared_state import shared_state
+
+logger = logging.getLogger(__name__)
+
+# 캐시 유효 시간 (초)
+USER_PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("USER_PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+# 최대 캐시 항목 수
+USER_PRINCIPAL_CACHE_SIZE = int(os.getenv("USER_PRINCIPAL_CACHE_SIZE", "10000"))
+
+# 사용자별 세대 값 shared_state 키
+_GENERATION_KEY = "user_principal:generation:{}"
+# 커밋 시 무효화를 전파할 사용자 ID (Session.info 키)
+_PENDING_INVALIDATIONS = "user_principal_invalidations"
+# 공유 백엔드 오류로 세대 값을 알 수 없음 (캐시를 사용하지 않음)
+_UNKNOWN_GENERATION = object()
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """인증된 사용자 스냅샷 (UserResponse와 같은 필드)"""
+    id: int
+    username: str
+    email: str
+    nickname: str
+    is_admin: str
+    avatar_url: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserPrincipal":
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            nickname=user.nickname,
+            is_admin=user.is_admin,
+            avatar_url=user.avatar_url,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+class UserPrincipalCache:
+    """user_id별 UserPrincipal TTL + LRU 캐시"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = USER_PRINCIPAL_CACHE_TTL_SECONDS,
+        max_size: int = USER_PRINCIPAL_CACHE_SIZE,
+        state: Any = None
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.state = state or shared_state
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, Tuple[float, Optional[str], UserPrincipal]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _generation(self, user_id: int) -> Any:
+        """
+        다른 워커가 기록한 사용자 세대 값 (공유 백엔드가 아니면 항상 None)
+        공유 백엔드 조회에 실패하면 _UNKNOWN_GENERATION을 반환합니다.
+        """
+        if not self.state.is_shared:
+            return None
+        try:
+            return self.state.cache_get(_GENERATION_KEY.format(user_id))
+        except Exception as e:
+            logger.error(f"Reading user principal generation failed, skipping cache: {e}")
+            return _UNKNOWN_GENERATION
+
+    def get(self, user_id: int, loader: Callable[[int], Optional[User]]) -> Optional[UserPrincipal]:
+        """
+        캐시된 사용자 정보를 반환하고, 없거나 만료/무효화되었으면 loader(user_id)로 조회해 저장합니다.
+
+        존재하지 않는 사용자는 캐시하지 않습니다.
+        """
+        # 조회 전에 세대를 읽어 두므로, 조회 도중 무효화되면 저장된 항목은 다음 요청에서 버려짐
+        generation = self._generation(user_id)
+        if generation is _UNKNOWN_GENERATION:
+            # 다른 워커의 무효화를 확인할 수 없으므로 캐시를 읽지도 저장하지도 않음
+            user = loader(user_id)
+            return UserPrincipal.from_user(user) if user is not None else None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and now - entry[0] <= self.ttl_seconds and entry[1] == generation:
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        user = loader(user_id)
+        if user is None:
+            self.invalidate(user_id, publish=False)
+            return None
+
+        principal = UserPrincipal.from_user(user)
+        with self._lock:
+            self._entries[user_id] = (time.monotonic(), generation, principal)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return principal
+
+    def invalidate(self, user_id: int, publish: bool = True) -> None:
+        """사용자 항목을 제거하고, publish이면 다른 워커에도 무효화를 알립니다."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+        if publish and self.state.is_shared:
+            # 세대 값은 캐시 항목보다 오래 유지되어야 만료 전 항목이 다시 유효해지지 않음
+            try:
+                self.state.cache_set(_GENERATION_KEY.format(user_id), uuid.uuid4().hex, 2 * self.ttl_seconds + 1)
+            except Exception as e:
+                # 이미 커밋된 변경이므로 요청은 성공시키고, 다른 워커에는 TTL 이내에 반영
+                logger.error(f"Publishing user principal invalidation for user {user_id} failed: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# 프로세스 전역 캐시
+user_principal_cache = UserPrincipalCache()
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user_principal(mapper, connection, target: User) -> None:
+    """사용자 정보/권한 변경 및 삭제 시 로컬 캐시 무효화 (다른 워커에는 커밋 후 전파)"""
+    if target.id is None:
+        return
+    user_principal_cache.invalidate(target.id, publish=False)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_user_principal_invalidations(session: Session) -> None:
+    """
+    커밋된 사용자 변경을 모든 워커에 알립니다.
+    (커밋 전에 알리면 다른 워커가 아직 커밋되지 않은 이전 값을 다시 캐시할 수 있음)
+    """
+    for user_id in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        user_principal_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_user_principal_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
@@ -1,8 +1,11 @@
+import logging
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict, Any
 from backend.database.dao.user_dao import UserDAO
 from backend.database.model import User, MCPServer
 
+logger = logging.getLogger(__name__)
+
 class UserService:
     def __init__(self, db: Session):
         self.db = db
@@ -20,24 +23,23 @@ class UserService:
         return self.user_dao.create_user(username, email, password, is_admin)
     
     def authenticate_user(self, username: str, password: str) -> Optional[User]:
-        """사용자 인증을 수행합니다."""
-        print(f"UserService.authenticate_user called with username: {username}")  # 디버깅 로그
-        
+        """
+        사용자 인증을 수행합니다.
+
+        비밀번호 검증은 password_hasher 작업 풀에서 실행되며, 대기열이 가득 차면
+        PasswordHasherBusy가 발생합니다.
+        """
         user = self.user_dao.get_user_by_username(username)
-        print(f"User found in DAO: {user is not None}")  # 디버깅 로그
-        
-        if user:
-            print(f"Stored password hash: {user.password_hash}")  # 디버깅 로그
-            print(f"Input password: {password}")  # 디버깅 로그
-            
-            is_valid = self.user_dao.verify_password(password, user.password_hash)
-            print(f"Password verification result: {is_valid}")  # 디버깅 로그
-            
-            if is_valid:
-                return user
-        
+        if user is None:
+            logger.info(f"Login failed: unknown username {username}")
+            return None
+
+        if self.user_dao.verify_and_upgrade_password(user, password):
+            return user
+
+        logger.info(f"Login failed: invalid password for {username}")
         return None
-    
+
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """ID로 사용자를 조회합니다."""
         return self.user_dao.get_user_by_id(user_id)
@@ -0,0 +1,111 @@
+"""
+Lazy Import Utility
+Defer importing heavy optional SDKs (openai, mcp, bs4, cryptography, redis) until first use
+
+    openai = lazy_module("openai")                      # imported on first attribute access
+    sse_client = lazy_attribute("mcp.client.sse", "sse_client")  # imported on first call
+    MCP_SDK_AVAILABLE = module_available("mcp")         # checked without importing
+
+The first real import of each lazy module is timed and reported by
+backend.utils.startup_profiler, so a slow first request is attributable.
+"""
+
+import importlib
+import importlib.util
+import threading
+import time
+from typing import Any, Dict
+import logging
+
+logger = logging.getLogger(__name__)
+
+_timings_lock = threading.Lock()
+_import_timings: Dict[str, float] = {}
+
+
+def module_available(name: str) -> bool:
+    """True if the top-level package of `name` is installed (does not import it)"""
+    try:
+        return importlib.util.find_spec(name.partition(".")[0]) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _import(name: str):
+    started = time.perf_counter()
+    module = importlib.import_module(name)
+    elapsed = time.perf_counter() - started
+    with _timings_lock:
+        first = name not in _import_timings
+        if first:
+            _import_timings[name] = elapsed
+    if first:
+        logger.debug(f"Lazy import of {name} took {elapsed * 1000:.1f}ms")
+    return module
+
+
+def import_timings() -> Dict[str, float]:
+    """Seconds spent importing each lazy module so far (first import only)"""
+    with _timings_lock:
+        return dict(_import_timings)
+
+
+class LazyModule:
+    """Module proxy importing the real module on first attribute access"""
+
+    def __init__(self, name: str):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            module = _import(self.__dict__["_name"])
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module {self.__dict__['_name']!r} ({state})>"
+
+
+class LazyAttribute:
+    """Proxy for `from module import attr` resolving on first call or attribute access"""
+
+    def __init__(self, module_name: str, attr: str):
+        self._module_name = module_name
+        self._attr = attr
+        self._value = None
+
+    def resolve(self) -> Any:
+        if self._value is None:
+            self._value = getattr(_import(self._module_name), self._attr)
+        return self._value
+
+    def available(self) -> bool:
+        """True if the attribute can be imported (imports the module)"""
+        try:
+            self.resolve()
+            return True
+        except (ImportError, AttributeError):
+            return False
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._module_name}.{self._attr}>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    return LazyModule(name)
+
+
+def lazy_attribute(module_name: str, attr: str) -> LazyAttribute:
+    return LazyAttribute(module_name, attr)
@@ -0,0 +1,442 @@
+"""
+Metrics Utility
+Minimal Prometheus text-format metrics with lock-free recording
+
+Counters and histograms write into a per-thread shard (only the owning thread
+mutates it), so recording on the request path never takes a lock. A scrape sums
+all shards. Point-in-time values (pool size, queue depth, cache stats) are read
+by collectors registered with register_collector, only when /metrics is scraped.
+
+With a shared state backend (SHARED_STATE_BACKEND=redis) every worker publishes
+its snapshot through SharedMetricsPublisher, so a scrape that lands on any
+worker returns the series of all live workers, labelled worker="<token>".
+"""
+
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+from backend.utils.shared_state import process_token, shared_state
+
+logger = logging.getLogger(__name__)
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[str, Dict[str, str], float]
+Family = Tuple[str, str, str, List[Sample]]  # (name, type, documentation, samples)
+
+# Latency buckets in seconds (HTTP requests, pool waits, MCP calls)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# How often each worker publishes its snapshot to the shared state backend
+METRICS_PUBLISH_INTERVAL_SECONDS = float(os.getenv("METRICS_PUBLISH_INTERVAL_SECONDS", "5"))
+
+
+class _Sharded:
+    """Per-thread dicts; the owning thread writes, the scraper reads snapshots"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._register_lock = threading.Lock()
+
+    def shard(self) -> dict:
+        try:
+            return self._local.values
+        except AttributeError:
+            values: dict = {}
+            with self._register_lock:  # once per thread
+                self._shards.append(values)
+            self._local.values = values
+            return values
+
+    def snapshots(self) -> List[dict]:
+        with self._register_lock:
+            shards = list(self._shards)
+        return [dict(shard) for shard in shards]
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonic counter with optional labels"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = _Sharded()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        shard = self._values.shard()
+        shard[labelvalues] = shard.get(labelvalues, 0.0) + amount
+
+    def collect(self) -> List[Sample]:
+        totals: Dict[LabelValues, float] = {}
+        for snapshot in self._values.snapshots():
+            for labelvalues, value in snapshot.items():
+                totals[labelvalues] = totals.get(labelvalues, 0.0) + value
+        return [
+            (self.name, dict(zip(self.labelnames, labelvalues)), value)
+            for labelvalues, value in sorted(totals.items())
+        ]
+
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = _Sharded()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        shard = self._values.shard()
+        entry = shard.get(labelvalues)
+        if entry is None:
+            # [bucket counts..., +Inf count, sum]
+            entry = [0] * (len(self.buckets) + 1) + [0.0]
+            shard[labelvalues] = entry
+        entry[bisect_left(self.buckets, value)] += 1
+        entry[-1] += value
+
+    def time(self, *labelvalues: str) -> "_Timer":
+        """Context manager observing the elapsed time in seconds"""
+        return _Timer(self, labelvalues)
+
+    def collect(self) -> List[Sample]:
+        totals: Dict[LabelValues, List[float]] = {}
+        for snapshot in self._values.snapshots():
+            for labelvalues, entry in snapshot.items():
+                entry = list(entry)
+                total = totals.get(labelvalues)
+                if total is None:
+                    totals[labelvalues] = entry
+                else:
+                    for index, value in enumerate(entry):
+                        total[index] += value
+
+        samples: List[Sample] = []
+        for labelvalues, entry in sorted(totals.items()):
+            labels = dict(zip(self.labelnames, labelvalues))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), entry[:-1]):
+                cumulative += count
+                samples.append((f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+            samples.append((f"{self.name}_count", labels, cumulative))
+            samples.append((f"{self.name}_sum", labels, entry[-1]))
+        return samples
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labelvalues: LabelValues):
+        self.histogram = histogram
+        self.labelvalues = labelvalues
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.started, *self.labelvalues)
+        return False
+
+
+class GaugeFamily:
+    """Point-in-time values produced by a collector at scrape time"""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, samples: Iterable[Tuple[Dict[str, str], float]]):
+        self.name = name
+        self.documentation = documentation
+        self._samples = list(samples)
+
+    def collect(self) -> List[Sample]:
+        return [(self.name, labels, value) for labels, value in self._samples]
+
+
+class MetricsRegistry:
+    """Holds metrics and scrape-time collectors, renders Prometheus text format"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], Iterable[object]]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(name, lambda: Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(name, lambda: Histogram(name, documentation, labelnames, buckets))
+
+    def _get_or_create(self, name: str, factory):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = factory()
+                self._metrics[name] = metric
+            return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[object]]) -> None:
+        """
+        Register a callable returning metric families (e.g. GaugeFamily) at scrape time
+        Collectors must not block; failures are logged and skipped
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def collect(self) -> List[Family]:
+        """Snapshot of all metrics and collector families (plain data, picklable)"""
+        with self._lock:
+            families = list(self._metrics.values())
+            collectors = list(self._collectors)
+
+        for collector in collectors:
+            try:
+                families.extend(collector())
+            except Exception as e:
+                logger.error(f"Metrics collector failed: {e}")
+
+        return [(family.name, family.type_name, family.documentation, family.collect()) for family in families]
+
+    def render(self) -> str:
+        return render_families(self.collect())
+
+
+def render_families(families: Iterable[Family]) -> str:
+    """Prometheus text format; families sharing a name are rendered as one"""
+    merged: Dict[str, Family] = {}
+    for name, type_name, documentation, samples in families:
+        family = merged.get(name)
+        if family is None:
+            merged[name] = (name, type_name, documentation, list(samples))
+        else:
+            family[3].extend(samples)
+
+    lines: List[str] = []
+    for name, type_name, documentation, samples in merged.values():
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} {type_name}")
+        for sample_name, labels, value in samples:
+            lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+class SharedMetricsPublisher:
+    """
+    Makes /metrics cover all worker processes
+
+    Each worker stores its registry snapshot under metrics:worker:<process token>
+    every interval seconds (and on every scrape it serves). Snapshots expire after
+    three intervals, so the series of a stopped worker disappear. A scrape renders
+    every live snapshot with a worker label, keeping each counter monotonic per worker.
+    With a non-shared backend it renders this process's registry unchanged.
+    """
+
+    KEY_PREFIX = "metrics:worker:"
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        state: Any = None,
+        interval: float = METRICS_PUBLISH_INTERVAL_SECONDS
+    ):
+        self.registry = registry
+        self.state = state or shared_state
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def publish(self) -> List[Family]:
+        families = self.registry.collect()
+        self.state.cache_set(self.KEY_PREFIX + process_token(), families, self.interval * 3)
+        return families
+
+    def render(self) -> str:
+        if not self.state.is_shared:
+            return self.registry.render()
+
+        own_token = process_token()
+        snapshots = {self.KEY_PREFIX + own_token: self.publish()}
+        try:
+            snapshots.update(
+                (key, families) for key, families in self.state.cache_scan(self.KEY_PREFIX).items()
+                if key != self.KEY_PREFIX + own_token
+            )
+        except Exception as e:
+            logger.error(f"Reading worker metrics failed, rendering this worker only: {e}")
+
+        labelled: List[Family] = []
+        for key in sorted(snapshots):
+            worker = key[len(self.KEY_PREFIX):]
+            for name, type_name, documentation, samples in snapshots[key]:
+                labelled.append((name, type_name, documentation, [
+                    (sample_name, {**labels, "worker": worker}, value)
+                    for sample_name, labels, value in samples
+                ]))
+        return render_families(labelled)
+
+    def start(self) -> None:
+        if not self.state.is_shared or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-publisher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.publish()
+            except Exception as e:
+                logger.error(f"Publishing worker metrics failed: {e}")
+            self._stop_event.wait(self.interval)
+
+
+# Process-wide registry
+metrics_registry = MetricsRegistry()
+metrics_publisher = SharedMetricsPublisher(metrics_registry)
+
+http_request_duration = metrics_registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status")
+)
+db_pool_checkouts = metrics_registry.counter(
+    "db_pool_checkouts_total",
+    "Connections checked out from the SQLAlchemy pool"
+)
+db_pool_connects = metrics_registry.counter(
+    "db_pool_connects_total",
+    "New DBAPI connections opened by the SQLAlchemy pool"
+)
+db_pool_wait = metrics_registry.histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection"
+)
+mcp_proxy_duration = metrics_registry.histogram(
+    "mcp_proxy_call_duration_seconds",
+    "Latency of calls to remote MCP servers",
+    ("operation", "outcome")
+)
+
+
+def observe_mcp_call(operation: str):
+    """
+    Decorator recording the latency of an async MCP call in mcp_proxy_call_duration_seconds
+    Outcome is "success"/"error" from the result dict ("success" or "healthy" key), or "exception"
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            outcome = "exception"
+            try:
+                result = await func(*args, **kwargs)
+                ok = result.get("success", result.get("healthy")) if isinstance(result, dict) else True
+                outcome = "success" if ok else "error"
+                return result
+            finally:
+                mcp_proxy_duration.observe(time.perf_counter() - started, operation, outcome)
+        return wrapper
+    return decorator
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request latency per route template
+    (e.g. /api/v1/mcp-servers/{mcp_server_id}, so label cardinality stays bounded)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_code[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            http_request_duration.observe(
+                time.perf_counter() - started,
+                scope.get("method", ""),
+                route_path,
+                str(status_code[0])
+            )
+
+
+def cache_families(caches: Dict[str, Callable[[], Optional[dict]]]) -> List[GaugeFamily]:
+    """
+    Build cache hit/miss/ratio families from {cache name: stats() callable}
+    stats() must return a dict with "hits" and "misses"
+    """
+    hits, misses, ratios = [], [], []
+    for name, stats in caches.items():
+        values = stats() or {}
+        hit_count = values.get("hits", 0)
+        miss_count = values.get("misses", 0)
+        labels = {"cache": name}
+        hits.append((labels, hit_count))
+        misses.append((labels, miss_count))
+        total = hit_count + miss_count
+        ratios.append((labels, hit_count / total if total else 0.0))
+    return [
+        GaugeFamily("cache_hits", "Cache hits since process start", hits),
+        GaugeFamily("cache_misses", "Cache misses since process start", misses),
+        GaugeFamily("cache_hit_ratio", "Cache hit ratio since process start", ratios),
+    ]
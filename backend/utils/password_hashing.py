@@ -0,0 +1,171 @@
+"""
+Password Hashing Utility
+Runs password hashing and verification on a dedicated, bounded worker pool
+
+bcrypt is intentionally slow. Running it directly on request threads lets a burst
+of logins occupy the threadpool shared by every sync endpoint. Work is submitted
+to a small executor instead, and requests beyond the queue limit are rejected
+immediately with PasswordHasherBusy rather than waiting.
+
+The request thread still waits for its job, so at most workers + queue limit
+request threads are held by hashing. The defaults keep that well below the
+40-thread pool that Starlette runs sync endpoints on.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Optional, Tuple, TypeVar
+from passlib.context import CryptContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Hash parameters (existing hashes with other parameters are upgraded on login)
+PASSWORD_HASH_SCHEME = os.getenv("PASSWORD_HASH_SCHEME", "bcrypt")
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))
+
+# Worker pool size and number of requests allowed to wait for a worker
+# (each running or waiting job holds one request thread of the 40-thread endpoint pool)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "4"))
+PASSWORD_HASH_TIMEOUT_SECONDS = float(os.getenv("PASSWORD_HASH_TIMEOUT_SECONDS", "10"))
+
+
+def build_crypt_context(scheme: str = PASSWORD_HASH_SCHEME, bcrypt_rounds: int = PASSWORD_BCRYPT_ROUNDS) -> CryptContext:
+    """
+    Build the passlib context for the configured scheme
+    bcrypt stays accepted for verification so hashes can migrate to another scheme
+    """
+    schemes = [scheme] if scheme == "bcrypt" else [scheme, "bcrypt"]
+    return CryptContext(
+        schemes=schemes,
+        deprecated="auto",
+        bcrypt__default_rounds=bcrypt_rounds,
+        bcrypt__min_rounds=bcrypt_rounds,
+    )
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the password hashing queue is full or a job does not finish in time"""
+
+
+class PasswordHasher:
+    """
+    Bounded executor for password hashing
+
+    At most `workers` hashes run concurrently and at most `queue_limit` more wait;
+    any further request fails fast with PasswordHasherBusy. A job that does not
+    finish within `timeout_seconds` also raises PasswordHasherBusy.
+    """
+
+    def __init__(
+        self,
+        context: Optional[CryptContext] = None,
+        workers: int = PASSWORD_HASH_WORKERS,
+        queue_limit: int = PASSWORD_HASH_QUEUE_LIMIT,
+        timeout_seconds: float = PASSWORD_HASH_TIMEOUT_SECONDS
+    ):
+        self.context = context or build_crypt_context()
+        self.workers = max(1, workers)
+        self.queue_limit = max(0, queue_limit)
+        self.timeout_seconds = timeout_seconds
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_limit)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.rejected_total = 0
+        self.timeouts_total = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers,
+                        thread_name_prefix="password-hash"
+                    )
+        return self._executor
+
+    def _run(self, func: Callable[..., T], *args) -> T:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected_total += 1
+            logger.warning("Password hashing queue full, rejecting request")
+            raise PasswordHasherBusy("Password hashing queue is full")
+
+        with self._lock:
+            self.in_flight += 1
+        try:
+            future = self._get_executor().submit(func, *args)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        try:
+            return future.result(timeout=self.timeout_seconds)
+        except FutureTimeoutError:
+            # A queued job is dropped; a running one keeps its slot until it finishes
+            future.cancel()
+            with self._lock:
+                self.timeouts_total += 1
+            logger.warning(f"Password hashing did not finish within {self.timeout_seconds}s")
+            raise PasswordHasherBusy("Password hashing timed out")
+
+    def _release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+    def hash(self, password: str) -> str:
+        """
+        Hash a password with the configured scheme and parameters
+
+        Raises:
+            PasswordHasherBusy: If the queue is full or the job times out
+        """
+        return self._run(self.context.hash, password)
+
+    def verify_and_update(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and compute a replacement hash if the stored one is outdated
+
+        Returns:
+            (is_valid, new_hash) - new_hash is None unless the stored hash should be replaced
+
+        Raises:
+            PasswordHasherBusy: If the queue is full or the job times out
+        """
+        return self._run(self._verify_and_update, password, password_hash)
+
+    def _verify_and_update(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        try:
+            return self.context.verify_and_update(password, password_hash)
+        except (ValueError, TypeError):
+            # Unrecognized stored value (legacy plain text from development): compare and upgrade
+            if password_hash == password:
+                return True, self.context.hash(password)
+            return False, None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "in_flight": self.in_flight,
+                "rejected_total": self.rejected_total,
+                "timeouts_total": self.timeouts_total,
+            }
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+# Process-wide password hasher
+password_hasher = PasswordHasher()
@@ -0,0 +1,384 @@
+"""
+Profiling Utility
+Opt-in per-request profiling: SQL count/time, handler time and sampled stacks
+
+Enable with PROFILING_ENABLED=true, then select requests by path prefix
+(PROFILING_ROUTES), by sampling rate (PROFILING_SAMPLE_RATE) or per request
+with the X-Profile: 1 header. Profiled responses carry a Server-Timing header
+and an X-Profile-Id; the full profile (slowest statements, collapsed stacks,
+speedscope JSON) is kept in a bounded in-memory store for admins. With a shared
+state backend (SHARED_STATE_BACKEND=redis) finished profiles are also stored there,
+so the admin endpoints list and serve the profiles of every worker.
+
+Stack sampling (PROFILING_STACK_SAMPLING=true) is statistical: one shared
+sampler thread reads sys._current_frames() every PROFILING_SAMPLE_INTERVAL_MS.
+It samples the event loop thread and every worker thread that has executed SQL
+for the request, so sync handlers are covered from their first query onwards.
+"""
+
+import itertools
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from backend.utils.shared_state import process_token, shared_state
+
+logger = logging.getLogger(__name__)
+
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_ROUTES = tuple(route.strip() for route in os.getenv("PROFILING_ROUTES", "").split(",") if route.strip())
+PROFILING_STACK_SAMPLING = os.getenv("PROFILING_STACK_SAMPLING", "false").lower() == "true"
+PROFILING_SAMPLE_INTERVAL_MS = float(os.getenv("PROFILING_SAMPLE_INTERVAL_MS", "5"))
+PROFILING_MAX_PROFILES = int(os.getenv("PROFILING_MAX_PROFILES", "50"))
+# How long profiles stay downloadable from other workers (shared state backend only)
+PROFILING_SHARED_TTL_SECONDS = float(os.getenv("PROFILING_SHARED_TTL_SECONDS", "3600"))
+
+# Slowest statements kept per profile
+MAX_RECORDED_STATEMENTS = 10
+MAX_STATEMENT_LENGTH = 300
+# Innermost frames kept per stack sample
+MAX_STACK_DEPTH = 64
+
+Frame = Tuple[str, str, int]  # (function, file, first line)
+
+_current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar("current_profile", default=None)
+_profile_ids = itertools.count(1)
+
+
+class RequestProfile:
+    """Measurements collected for one profiled request"""
+
+    def __init__(self, method: str, path: str, sample_stacks: bool = False):
+        # process token keeps ids unique across workers
+        self.id = f"{int(time.time())}-{process_token()}-{next(_profile_ids)}"
+        self.method = method
+        self.path = path
+        self.route: Optional[str] = None
+        self.status: Optional[int] = None
+        self.started_at = time.time()
+        self.started = time.perf_counter()
+        self.total_seconds: Optional[float] = None
+        self.sql_count = 0
+        self.sql_seconds = 0.0
+        self.statements: List[Tuple[float, str]] = []
+        self.sample_stacks = sample_stacks
+        self.sample_interval_ms = PROFILING_SAMPLE_INTERVAL_MS
+        self.thread_ids = {threading.get_ident()}
+        self.stack_counts: Dict[Tuple[Frame, ...], int] = {}
+
+    def record_sql(self, statement: str, seconds: float) -> None:
+        self.sql_count += 1
+        self.sql_seconds += seconds
+        self.thread_ids.add(threading.get_ident())
+        if len(self.statements) < MAX_RECORDED_STATEMENTS or seconds > self.statements[-1][0]:
+            self.statements.append((seconds, statement[:MAX_STATEMENT_LENGTH]))
+            self.statements.sort(key=lambda item: -item[0])
+            del self.statements[MAX_RECORDED_STATEMENTS:]
+
+    def finish(self, status: int) -> None:
+        self.status = status
+        self.total_seconds = time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """Server-Timing header value (durations in milliseconds)"""
+        total_ms = (self.total_seconds if self.total_seconds is not None else time.perf_counter() - self.started) * 1000
+        db_ms = self.sql_seconds * 1000
+        return (
+            f'db;dur={db_ms:.1f};desc="{self.sql_count} queries", '
+            f"app;dur={max(total_ms - db_ms, 0.0):.1f}, "
+            f"total;dur={total_ms:.1f}"
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "started_at": self.started_at,
+            "total_ms": round((self.total_seconds or 0.0) * 1000, 2),
+            "sql_count": self.sql_count,
+            "sql_ms": round(self.sql_seconds * 1000, 2),
+            "stack_samples": sum(self.stack_counts.values()),
+        }
+
+    def detail(self) -> Dict[str, Any]:
+        return {
+            **self.summary(),
+            "slowest_statements": [
+                {"ms": round(seconds * 1000, 3), "statement": statement}
+                for seconds, statement in self.statements
+            ],
+        }
+
+    def collapsed(self) -> str:
+        """Collapsed-stack text (one "root;...;leaf count" line per distinct stack)"""
+        lines = [
+            ";".join(_frame_label(frame) for frame in stack) + f" {count}"
+            for stack, count in sorted(self.stack_counts.items(), key=lambda item: -item[1])
+        ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def speedscope(self) -> Dict[str, Any]:
+        """speedscope file format (sampled profile, weights in milliseconds)"""
+        frame_index: Dict[Frame, int] = {}
+        frames: List[Dict[str, Any]] = []
+        samples: List[List[int]] = []
+        weights: List[float] = []
+        for stack, count in self.stack_counts.items():
+            indexes = []
+            for frame in stack:
+                if frame not in frame_index:
+                    frame_index[frame] = len(frames)
+                    frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+                indexes.append(frame_index[frame])
+            samples.append(indexes)
+            weights.append(count * self.sample_interval_ms)
+
+        name = f"{self.method} {self.route or self.path}"
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "smithery-profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+
+
+def _frame_label(frame: Frame) -> str:
+    return f"{frame[0]} ({os.path.basename(frame[1])}:{frame[2]})"
+
+
+def _stack(frame) -> Tuple[Frame, ...]:
+    stack: List[Frame] = []
+    while frame is not None and len(stack) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
+
+
+class _StackSampler:
+    """Single background thread sampling the threads of all active profiles"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active: List[RequestProfile] = []
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._active.append(profile)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="profiling-sampler", daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def remove(self, profile: RequestProfile) -> None:
+        with self._lock:
+            if profile in self._active:
+                self._active.remove(profile)
+
+    def _run(self) -> None:
+        sampler_id = threading.get_ident()
+        while True:
+            with self._lock:
+                active = list(self._active)
+                if not active:
+                    self._wakeup.clear()
+            if not active:
+                self._wakeup.wait()
+                continue
+
+            frames = sys._current_frames()
+            for profile in active:
+                for thread_id in list(profile.thread_ids):
+                    frame = frames.get(thread_id)
+                    if frame is None or thread_id == sampler_id:
+                        continue
+                    stack = _stack(frame)
+                    profile.stack_counts[stack] = profile.stack_counts.get(stack, 0) + 1
+            del frames
+            time.sleep(PROFILING_SAMPLE_INTERVAL_MS / 1000)
+
+
+class ProfileStore:
+    """
+    Bounded in-memory store of finished profiles (oldest dropped first)
+
+    With a shared state backend each profile is also written under profiles:profile:<id>
+    and this worker's summaries under profiles:worker:<process token>, both expiring
+    after ttl_seconds, so list() and get() see the profiles of all workers.
+    """
+
+    PROFILE_KEY = "profiles:profile:"
+    WORKER_KEY = "profiles:worker:"
+
+    def __init__(
+        self,
+        max_profiles: int = PROFILING_MAX_PROFILES,
+        state: Any = None,
+        ttl_seconds: float = PROFILING_SHARED_TTL_SECONDS
+    ):
+        self._lock = threading.Lock()
+        self._profiles: Deque[RequestProfile] = deque(maxlen=max_profiles)
+        self.state = state or shared_state
+        self.ttl_seconds = ttl_seconds
+
+    def add(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._profiles.append(profile)
+            summaries = [stored.summary() for stored in self._profiles]
+        if not self.state.is_shared:
+            return
+        try:
+            self.state.cache_set(self.PROFILE_KEY + profile.id, profile, self.ttl_seconds)
+            self.state.cache_set(self.WORKER_KEY + process_token(), summaries, self.ttl_seconds)
+        except Exception as e:
+            logger.error(f"Sharing profile {profile.id} failed: {e}")
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Summaries, newest first (all workers with a shared backend)"""
+        with self._lock:
+            profiles = list(self._profiles)
+        summaries = [profile.summary() for profile in profiles]
+        if self.state.is_shared:
+            own_key = self.WORKER_KEY + process_token()
+            try:
+                for key, worker_summaries in self.state.cache_scan(self.WORKER_KEY).items():
+                    if key != own_key:
+                        summaries.extend(worker_summaries)
+            except Exception as e:
+                logger.error(f"Reading worker profiles failed, listing this worker only: {e}")
+        summaries.sort(key=lambda summary: summary["started_at"], reverse=True)
+        return summaries
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        with self._lock:
+            for profile in self._profiles:
+                if profile.id == profile_id:
+                    return profile
+        if self.state.is_shared:
+            try:
+                return self.state.cache_get(self.PROFILE_KEY + profile_id)
+            except Exception as e:
+                logger.error(f"Reading shared profile {profile_id} failed: {e}")
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+
+# Process-wide store and sampler
+profile_store = ProfileStore()
+_stack_sampler = _StackSampler()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None:
+        conn.info.setdefault("profiling_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    if profile is None:
+        return
+    started = conn.info.get("profiling_started")
+    if started:
+        profile.record_sql(statement, time.perf_counter() - started.pop())
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling selected requests
+
+    Selection: PROFILING_ROUTES path prefixes, PROFILING_SAMPLE_RATE, or the X-Profile: 1 header.
+    Does nothing unless enabled.
+    """
+
+    def __init__(
+        self,
+        app,
+        enabled: bool = PROFILING_ENABLED,
+        sample_rate: float = PROFILING_SAMPLE_RATE,
+        routes: Sequence[str] = PROFILING_ROUTES,
+        stack_sampling: bool = PROFILING_STACK_SAMPLING,
+        store: Optional[ProfileStore] = None
+    ):
+        self.app = app
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.routes = tuple(routes)
+        self.stack_sampling = stack_sampling
+        self.store = store or profile_store
+
+    def _should_profile(self, scope) -> bool:
+        path = scope.get("path", "")
+        if self.routes and path.startswith(self.routes):
+            return True
+        if any(name == b"x-profile" and value == b"1" for name, value in scope.get("headers", [])):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if not self.enabled or scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope.get("method", ""), scope.get("path", ""), self.stack_sampling)
+        token = _current_profile.set(profile)
+        if profile.sample_stacks:
+            _stack_sampler.add(profile)
+        status_code = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_code[0] = message["status"]
+                profile.finish(message["status"])
+                message = {
+                    **message,
+                    "headers": list(message.get("headers", [])) + [
+                        (b"server-timing", profile.server_timing().encode("latin-1")),
+                        (b"x-profile-id", profile.id.encode("latin-1")),
+                    ],
+                }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_profile.reset(token)
+            _stack_sampler.remove(profile)
+            route = scope.get("route")
+            profile.route = getattr(route, "path", None)
+            profile.finish(status_code[0])
+            self.store.add(profile)
+            logger.info(
+                f"Profiled {profile.method} {profile.route or profile.path}: "
+                f"{profile.summary()['total_ms']}ms, {profile.sql_count} queries ({profile.summary()['sql_ms']}ms)"
+            )
@@ -0,0 +1,177 @@
+"""
+Query Budget Utility
+Count SQL statements per block, function call or request and flag calls over budget
+
+    with count_queries() as counter:
+        service.create_mcp_server(...)
+    counter.count, counter.statements
+
+    @query_budget(5)
+    def get_user_favorites(...): ...
+
+Counting is scoped by a contextvar (Engine-level cursor events), so it follows
+the caller into FastAPI's threadpool and only sees statements issued by that
+call. Nested counters all receive the statement.
+
+In dev mode (QUERY_BUDGET_ENABLED=true) QueryBudgetMiddleware logs a warning
+when a request issues more statements than its budget: the endpoint's
+@query_budget value, or QUERY_BUDGET_DEFAULT otherwise. With
+QUERY_BUDGET_STRICT=true an exceeded @query_budget raises QueryBudgetExceeded
+instead of logging (intended for tests and CI).
+"""
+
+import asyncio
+import functools
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+QUERY_BUDGET_ENABLED = os.getenv("QUERY_BUDGET_ENABLED", "false").lower() == "true"
+QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "false").lower() == "true"
+QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT", "20"))
+
+_active_counters: ContextVar[Tuple["QueryCounter", ...]] = ContextVar("active_query_counters", default=())
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a strict budget is exceeded"""
+
+    def __init__(self, name: str, count: int, budget: int, statements: List[str]):
+        self.name = name
+        self.count = count
+        self.budget = budget
+        self.statements = statements
+        listing = "\n".join(f"  {index}. {statement}" for index, statement in enumerate(statements, 1))
+        super().__init__(f"{name} issued {count} queries (budget {budget}):\n{listing}")
+
+
+class QueryCounter:
+    """SQL statements executed while active (optionally only those on one engine)"""
+
+    def __init__(self, engine: Optional[Engine] = None):
+        self.engine = engine
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: List[str] = []
+
+    def record(self, conn, statement: str, seconds: float) -> None:
+        if self.engine is not None and conn.engine is not self.engine:
+            return
+        self.count += 1
+        self.seconds += seconds
+        self.statements.append(" ".join(statement.split()))
+
+    def check(self, budget: int, name: str, strict: bool) -> bool:
+        """True if within budget; otherwise raise (strict) or log a warning"""
+        if self.count <= budget:
+            return True
+        if strict:
+            raise QueryBudgetExceeded(name, self.count, budget, self.statements)
+        logger.warning(
+            f"Query budget exceeded: {name} issued {self.count} queries "
+            f"({self.seconds * 1000:.1f}ms, budget {budget})"
+        )
+        return False
+
+
+@contextmanager
+def count_queries(engine: Optional[Engine] = None) -> Iterator[QueryCounter]:
+    """Count statements executed inside the block (in this context)"""
+    counter = QueryCounter(engine)
+    token = _active_counters.set(_active_counters.get() + (counter,))
+    try:
+        yield counter
+    finally:
+        _active_counters.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _active_counters.get():
+        conn.info.setdefault("query_budget_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    counters = _active_counters.get()
+    if not counters:
+        return
+    started = conn.info.get("query_budget_started")
+    seconds = time.perf_counter() - started.pop() if started else 0.0
+    for counter in counters:
+        counter.record(conn, statement, seconds)
+
+
+def query_budget(max_queries: int, strict: Optional[bool] = None):
+    """
+    Decorator limiting the statements a sync or async function may issue per call
+    Checked only in dev mode (QUERY_BUDGET_ENABLED) or strict mode; the budget is
+    also exposed as __query_budget__ so QueryBudgetMiddleware uses it for endpoints.
+    """
+    def decorator(func):
+        name = func.__qualname__
+
+        def enforced() -> Tuple[bool, bool]:
+            is_strict = QUERY_BUDGET_STRICT if strict is None else strict
+            return QUERY_BUDGET_ENABLED or is_strict, is_strict
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                enabled, is_strict = enforced()
+                if not enabled:
+                    return await func(*args, **kwargs)
+                with count_queries() as counter:
+                    result = await func(*args, **kwargs)
+                counter.check(max_queries, name, is_strict)
+                return result
+            wrapper = async_wrapper
+        else:
+            @functools.wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                enabled, is_strict = enforced()
+                if not enabled:
+                    return func(*args, **kwargs)
+                with count_queries() as counter:
+                    result = func(*args, **kwargs)
+                counter.check(max_queries, name, is_strict)
+                return result
+            wrapper = sync_wrapper
+
+        wrapper.__query_budget__ = max_queries
+        return wrapper
+    return decorator
+
+
+class QueryBudgetMiddleware:
+    """
+    ASGI middleware warning about requests over their query budget (dev mode only)
+    Endpoints decorated with @query_budget are checked by the decorator itself.
+    """
+
+    def __init__(self, app, enabled: bool = QUERY_BUDGET_ENABLED, default_budget: int = QUERY_BUDGET_DEFAULT):
+        self.app = app
+        self.enabled = enabled
+        self.default_budget = default_budget
+
+    async def __call__(self, scope, receive, send):
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as counter:
+            await self.app(scope, receive, send)
+
+        route = scope.get("route")
+        if hasattr(getattr(route, "endpoint", None), "__query_budget__"):
+            return
+        route_path = getattr(route, "path", None) or scope.get("path", "")
+        counter.check(self.default_budget, f"{scope.get('method', '')} {route_path}", strict=False)
@@ -0,0 +1,203 @@
+"""
+Shared State Utility
+Process-shared state for multi-worker deployments (slots, leader locks, caches, rate-limit storage)
+
+SHARED_STATE_BACKEND selects the implementation:
+- local (default): in-process stand-in. Correct for a single worker and for tests;
+  with several workers every limit and cache becomes per-worker.
+- redis: state lives in Redis (REDIS_URL), so limits hold across all
+  gunicorn/uvicorn workers and hosts. Requires the redis package.
+
+Slots are leases: a holder that dies without releasing frees its slot after
+lease_seconds, so a crashed worker cannot leak playground capacity or keep a
+leader lock forever.
+
+Redis is called synchronously on request threads (auth, caches, slots), so the
+client uses short socket timeouts (REDIS_SOCKET_TIMEOUT_SECONDS,
+REDIS_CONNECT_TIMEOUT_SECONDS): an unreachable Redis fails fast instead of
+hanging the threadpool.
+"""
+
+import os
+import pickle
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+from backend.utils.lazy_import import lazy_module, module_available
+
+# redis is only imported when the redis backend is actually built
+REDIS_AVAILABLE = module_available("redis")
+redis = lazy_module("redis")
+
+logger = logging.getLogger(__name__)
+
+SHARED_STATE_BACKEND = os.getenv("SHARED_STATE_BACKEND", "local").lower()
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+SHARED_STATE_PREFIX = os.getenv("SHARED_STATE_PREFIX", "smithery:")
+REDIS_SOCKET_TIMEOUT_SECONDS = float(os.getenv("REDIS_SOCKET_TIMEOUT_SECONDS", "0.5"))
+REDIS_CONNECT_TIMEOUT_SECONDS = float(os.getenv("REDIS_CONNECT_TIMEOUT_SECONDS", "0.5"))
+
+_process_token: Optional[Tuple[int, str]] = None
+
+
+def process_token() -> str:
+    """Identifies this worker process as a slot/lock holder (recomputed after fork)"""
+    global _process_token
+    pid = os.getpid()
+    if _process_token is None or _process_token[0] != pid:
+        _process_token = (pid, f"{pid}-{uuid.uuid4().hex[:8]}")
+    return _process_token[1]
+
+
+class LocalStateBackend:
+    """In-process implementation (single worker, tests)"""
+
+    is_shared = False
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[str, Tuple[float, Any]] = {}
+        self._slots: Dict[str, Dict[str, float]] = {}
+
+    def cache_get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._values[key]
+                return None
+            return entry[1]
+
+    def cache_set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        with self._lock:
+            self._values[key] = (time.monotonic() + ttl_seconds, value)
+
+    def cache_scan(self, prefix: str) -> Dict[str, Any]:
+        """All unexpired cache values whose key starts with prefix"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                key: value for key, (expires_at, value) in self._values.items()
+                if key.startswith(prefix) and expires_at >= now
+            }
+
+    def acquire_slot(self, name: str, token: str, limit: int, lease_seconds: float) -> bool:
+        """Take (or renew) one of `limit` slots under `name`; False if all are held"""
+        now = time.monotonic()
+        with self._lock:
+            holders = self._slots.setdefault(name, {})
+            for holder, expires_at in list(holders.items()):
+                if expires_at < now:
+                    del holders[holder]
+            if token not in holders and len(holders) >= limit:
+                return False
+            holders[token] = now + lease_seconds
+            return True
+
+    def release_slot(self, name: str, token: str) -> None:
+        with self._lock:
+            self._slots.get(name, {}).pop(token, None)
+
+    def slot_count(self, name: str) -> int:
+        now = time.monotonic()
+        with self._lock:
+            return sum(1 for expires_at in self._slots.get(name, {}).values() if expires_at >= now)
+
+    def rate_limit_storage_uri(self) -> str:
+        return "memory://"
+
+    def rate_limit_storage_options(self) -> Dict[str, Any]:
+        return {}
+
+
+# KEYS[1] = slot sorted set, ARGV = token, limit, now, lease seconds
+_ACQUIRE_SLOT_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[3])
+if redis.call('ZSCORE', KEYS[1], ARGV[1]) or redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[1], tonumber(ARGV[3]) + tonumber(ARGV[4]), ARGV[1])
+    redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[4])) + 1)
+    return 1
+end
+return 0
+"""
+
+
+class RedisStateBackend:
+    """Redis implementation shared by all worker processes"""
+
+    is_shared = True
+
+    def __init__(
+        self,
+        url: str = REDIS_URL,
+        prefix: str = SHARED_STATE_PREFIX,
+        socket_timeout: float = REDIS_SOCKET_TIMEOUT_SECONDS,
+        connect_timeout: float = REDIS_CONNECT_TIMEOUT_SECONDS
+    ):
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis package is required for SHARED_STATE_BACKEND=redis (pip install redis)")
+        self.url = url
+        self.prefix = prefix
+        self.socket_timeout = socket_timeout
+        self.connect_timeout = connect_timeout
+        self._client = redis.Redis.from_url(url, **self.rate_limit_storage_options())
+        self._acquire_slot = self._client.register_script(_ACQUIRE_SLOT_SCRIPT)
+
+    def cache_get(self, key: str) -> Optional[Any]:
+        raw = self._client.get(self.prefix + "cache:" + key)
+        return pickle.loads(raw) if raw is not None else None
+
+    def cache_set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self._client.set(self.prefix + "cache:" + key, pickle.dumps(value), px=max(int(ttl_seconds * 1000), 1))
+
+    def cache_scan(self, prefix: str) -> Dict[str, Any]:
+        """All cache values whose key starts with prefix (SCAN, so keep the key space per prefix small)"""
+        namespace = self.prefix + "cache:"
+        names = list(self._client.scan_iter(match=namespace + prefix + "*", count=500))
+        if not names:
+            return {}
+        values = {}
+        for name, raw in zip(names, self._client.mget(names)):
+            if raw is not None:
+                key = name.decode() if isinstance(name, bytes) else name
+                values[key[len(namespace):]] = pickle.loads(raw)
+        return values
+
+    def acquire_slot(self, name: str, token: str, limit: int, lease_seconds: float) -> bool:
+        # Redis server time keeps lease expiry consistent across hosts
+        seconds, micros = self._client.time()
+        now = seconds + micros / 1_000_000
+        return bool(self._acquire_slot(keys=[self.prefix + "slots:" + name], args=[token, limit, now, lease_seconds]))
+
+    def release_slot(self, name: str, token: str) -> None:
+        self._client.zrem(self.prefix + "slots:" + name, token)
+
+    def slot_count(self, name: str) -> int:
+        seconds, micros = self._client.time()
+        return self._client.zcount(self.prefix + "slots:" + name, seconds + micros / 1_000_000, "+inf")
+
+    def rate_limit_storage_uri(self) -> str:
+        return self.url
+
+    def rate_limit_storage_options(self) -> Dict[str, Any]:
+        """Client options shared with the limits Redis storage (same fail-fast timeouts)"""
+        return {"socket_timeout": self.socket_timeout, "socket_connect_timeout": self.connect_timeout}
+
+
+def create_shared_state(backend: str = SHARED_STATE_BACKEND):
+    """Build the configured backend; falls back to local if redis is unavailable"""
+    if backend == "redis":
+        if REDIS_AVAILABLE:
+            return RedisStateBackend()
+        logger.warning("SHARED_STATE_BACKEND=redis but redis is not installed; using per-process local state")
+    elif backend != "local":
+        logger.warning(f"Unknown SHARED_STATE_BACKEND={backend!r}; using per-process local state")
+    return LocalStateBackend()
+
+
+# Process-wide backend
+shared_state = create_shared_state()
@@ -0,0 +1,104 @@
+"""
+Startup Profiler
+Measure where cold-start time goes: module imports vs. startup phases
+
+    startup_profiler.checkpoint("imports")       # time since process start
+    with startup_profiler.phase("init_database"):
+        init_database()
+    startup_profiler.log_report()
+
+The report also lists which heavy SDKs were already imported at startup
+(they should be loaded lazily, see backend.utils.lazy_import) and how long
+each lazy import took when it was first used.
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+import logging
+
+from backend.utils.lazy_import import import_timings
+
+logger = logging.getLogger(__name__)
+
+# SDKs that should not be imported until a request actually needs them
+HEAVY_MODULES = ("openai", "mcp", "bs4", "cryptography", "psutil", "numpy", "pyarrow", "zstandard", "redis")
+
+
+def _process_start_time() -> Optional[float]:
+    """Wall-clock process start time (Linux /proc), None where unavailable"""
+    try:
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return time.time() - uptime + start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class StartupProfiler:
+    """Records named checkpoints and timed phases during application startup"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started_wall = _process_start_time() or time.time()
+        self._started = time.perf_counter() - max(time.time() - self._started_wall, 0.0)
+        self._phases: List[Dict[str, Any]] = []
+        self._finished: Optional[float] = None
+
+    def checkpoint(self, name: str) -> float:
+        """Record the time elapsed since process start under `name`"""
+        elapsed = time.perf_counter() - self._started
+        with self._lock:
+            self._phases.append({"name": name, "kind": "checkpoint", "at_seconds": round(elapsed, 4)})
+        return elapsed
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a startup step"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self._phases.append({
+                    "name": name,
+                    "kind": "phase",
+                    "at_seconds": round(finished - self._started, 4),
+                    "duration_seconds": round(finished - started, 4),
+                })
+
+    def finish(self) -> float:
+        """Mark startup as complete; returns the total startup time"""
+        self._finished = time.perf_counter()
+        return self._finished - self._started
+
+    def report(self) -> Dict[str, Any]:
+        finished = self._finished if self._finished is not None else time.perf_counter()
+        with self._lock:
+            phases = list(self._phases)
+        return {
+            "total_seconds": round(finished - self._started, 4),
+            "complete": self._finished is not None,
+            "phases": phases,
+            "heavy_modules_loaded": [name for name in HEAVY_MODULES if name in sys.modules],
+            "lazy_imports": {name: round(seconds, 4) for name, seconds in import_timings().items()},
+        }
+
+    def log_report(self) -> None:
+        report = self.report()
+        steps = ", ".join(
+            f"{phase['name']}={phase.get('duration_seconds', phase['at_seconds']):.2f}s"
+            for phase in report["phases"]
+        )
+        logger.info(f"Startup finished in {report['total_seconds']:.2f}s ({steps})")
+        if report["heavy_modules_loaded"]:
+            logger.info(f"Heavy modules imported at startup: {', '.join(report['heavy_modules_loaded'])}")
+
+
+startup_profiler = StartupProfiler()
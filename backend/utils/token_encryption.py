@@ -5,44 +5,115 @@ Encrypts and decrypts MCP authentication tokens for secure storage
 
 import os
 import base64
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2
-from cryptography.hazmat.backends import default_backend
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 import logging
 
+from backend.utils.lazy_import import lazy_attribute, lazy_module
+
+if TYPE_CHECKING:
+    from cryptography.fernet import MultiFernet as MultiFernetType
+
 logger = logging.getLogger(__name__)
 
+# cryptography is imported on the first encrypt/decrypt, not at app start
+_fernet = lazy_module("cryptography.fernet")
+Fernet = lazy_attribute("cryptography.fernet", "Fernet")
+MultiFernet = lazy_attribute("cryptography.fernet", "MultiFernet")
+hashes = lazy_module("cryptography.hazmat.primitives.hashes")
+PBKDF2HMAC = lazy_attribute("cryptography.hazmat.primitives.kdf.pbkdf2", "PBKDF2HMAC")
+default_backend = lazy_attribute("cryptography.hazmat.backends", "default_backend")
+
+DEFAULT_DEV_SECRET = "default-dev-secret-change-in-production"
+
+
+@lru_cache(maxsize=16)
+def _derive_key(secret: str) -> bytes:
+    """
+    Derive a Fernet key from a secret with PBKDF2 (100,000 iterations)
+    Cached per secret, so the expensive derivation runs once per secret version
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b"mcp-token-salt",  # In production, use a random salt stored separately
+        iterations=100000,
+        backend=default_backend()
+    )
+    return base64.urlsafe_b64encode(kdf.derive(secret.encode()))
+
+
+def _configured_secrets() -> Tuple[str, ...]:
+    """
+    Active secrets, newest first
+
+    TOKEN_ENCRYPTION_SECRET is the primary secret used for encryption.
+    TOKEN_ENCRYPTION_PREVIOUS_SECRETS (comma-separated) are still accepted for decryption
+    during key rotation until all stored tokens are re-encrypted.
+    """
+    secret = os.getenv("TOKEN_ENCRYPTION_SECRET")
+    if not secret:
+        # For development, use a default (NOT for production!)
+        secret = DEFAULT_DEV_SECRET
+
+    previous = os.getenv("TOKEN_ENCRYPTION_PREVIOUS_SECRETS", "")
+    secrets = [secret] + [item.strip() for item in previous.split(",") if item.strip()]
+    return tuple(dict.fromkeys(secrets))
+
+
+class TokenKeyManager:
+    """
+    Caches the MultiFernet instance for the currently configured secrets
+
+    The primary key encrypts, every active key decrypts. Changing the environment
+    (rotation) builds a new instance on the next call; unchanged secrets reuse
+    their cached derived keys.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._secrets: Optional[Tuple[str, ...]] = None
+        self._fernet: Optional["MultiFernetType"] = None
+
+    def get_fernet(self) -> "MultiFernetType":
+        secrets = _configured_secrets()
+        fernet = self._fernet
+        if fernet is not None and secrets == self._secrets:
+            return fernet
+
+        with self._lock:
+            if self._fernet is None or secrets != self._secrets:
+                if secrets[0] == DEFAULT_DEV_SECRET:
+                    logger.warning("TOKEN_ENCRYPTION_SECRET not set, using default (UNSAFE for production)")
+                self._fernet = MultiFernet([Fernet(_derive_key(secret)) for secret in secrets])
+                self._secrets = secrets
+            return self._fernet
+
+    def clear(self) -> None:
+        with self._lock:
+            self._secrets = None
+            self._fernet = None
+        _derive_key.cache_clear()
+
+
+# Process-wide key manager
+token_key_manager = TokenKeyManager()
+
 
 class TokenEncryption:
     """
     Handles encryption and decryption of authentication tokens
-    Uses Fernet (symmetric encryption) with a key derived from environment variable
+    Uses Fernet (symmetric encryption) with keys derived from environment variables
     """
 
     @staticmethod
     def _get_encryption_key() -> bytes:
         """
-        Get or generate encryption key from environment variable
+        Get the primary encryption key (cached per secret)
         In production, this should be a strong secret stored securely
         """
-        secret = os.getenv("TOKEN_ENCRYPTION_SECRET")
-
-        if not secret:
-            # For development, use a default (NOT for production!)
-            logger.warning("TOKEN_ENCRYPTION_SECRET not set, using default (UNSAFE for production)")
-            secret = "default-dev-secret-change-in-production"
-
-        # Derive a proper key using PBKDF2
-        kdf = PBKDF2(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b"mcp-token-salt",  # In production, use a random salt stored separately
-            iterations=100000,
-            backend=default_backend()
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(secret.encode()))
-        return key
+        return _derive_key(_configured_secrets()[0])
 
     @staticmethod
     def encrypt_token(token: str) -> str:
@@ -56,9 +127,7 @@ class TokenEncryption:
             Encrypted token as base64 string
         """
         try:
-            key = TokenEncryption._get_encryption_key()
-            f = Fernet(key)
-            encrypted = f.encrypt(token.encode())
+            encrypted = token_key_manager.get_fernet().encrypt(token.encode())
             return encrypted.decode()
         except Exception as e:
             logger.error(f"Failed to encrypt token: {str(e)}")
@@ -76,14 +145,46 @@ class TokenEncryption:
             Plain text token
         """
         try:
-            key = TokenEncryption._get_encryption_key()
-            f = Fernet(key)
-            decrypted = f.decrypt(encrypted_token.encode())
+            decrypted = token_key_manager.get_fernet().decrypt(encrypted_token.encode())
             return decrypted.decode()
         except Exception as e:
             logger.error(f"Failed to decrypt token: {str(e)}")
             raise
 
+    @staticmethod
+    def decrypt_tokens(encrypted_tokens: Iterable[str]) -> List[Optional[str]]:
+        """
+        Decrypt several stored tokens with a single key lookup
+
+        Args:
+            encrypted_tokens: Encrypted tokens as base64 strings
+
+        Returns:
+            Plain text tokens in the same order (None for tokens that cannot be decrypted)
+        """
+        fernet = token_key_manager.get_fernet()
+        decrypted: List[Optional[str]] = []
+        for encrypted_token in encrypted_tokens:
+            try:
+                decrypted.append(fernet.decrypt(encrypted_token.encode()).decode())
+            except (_fernet.InvalidToken, AttributeError, ValueError):
+                logger.error("Failed to decrypt token: invalid token or unknown key")
+                decrypted.append(None)
+        return decrypted
+
+    @staticmethod
+    def rotate_token(encrypted_token: str) -> str:
+        """
+        Re-encrypt a stored token with the primary key
+
+        Args:
+            encrypted_token: Token encrypted with any active key
+
+        Returns:
+            Token encrypted with the primary key
+        """
+        return token_key_manager.get_fernet().rotate(encrypted_token.encode()).decode()
+
     @staticmethod
     def get_token_hint(token: str) -> str:
         """
@@ -54,4 +54,47 @@ def user_service(db_session):
 @pytest.fixture(scope="function")
 def mcp_server_service(db_session):
     """MCPServerService 인스턴스를 생성합니다."""
-    return MCPServerService(db_session) 
\ No newline at end of file
+    return MCPServerService(db_session) 
+
+@pytest.fixture(scope="function")
+def create_approved_mcp_server(mcp_server_service):
+    """
+    MCP 서버를 등록하고 승인하는 팩토리를 반환합니다.
+
+    사용 예:
+        create_approved_mcp_server(user.id, "Weather", "forecast", tags=["api"], category="data")
+    """
+    def _create(owner_id, name, description=None, tags=None, tools=None, **fields):
+        mcp_server = mcp_server_service.create_mcp_server({
+            "name": name,
+            "github_link": f"https://github.com/test/{name.lower().replace(' ', '-')}",
+            "description": description if description is not None else f"{name} description",
+            "tags": tags or [],
+            "tools": tools or [],
+            **fields
+        }, owner_id)
+        mcp_server_service.approve_mcp_server(mcp_server.id)
+        return mcp_server
+
+    return _create
+
+@pytest.fixture(scope="function")
+def assert_max_queries(db_session):
+    """
+    db_session 엔진에서 실행된 쿼리 수가 예산 이하인지 검사하는 컨텍스트 매니저를 반환합니다.
+
+    사용 예:
+        with assert_max_queries(3):
+            mcp_server_service.create_mcp_server(...)
+    """
+    from contextlib import contextmanager
+    from backend.utils.query_budget import QueryBudgetExceeded, count_queries
+
+    @contextmanager
+    def _assert_max_queries(max_queries: int):
+        with count_queries(db_session.get_bind()) as counter:
+            yield counter
+        if counter.count > max_queries:
+            raise QueryBudgetExceeded("block", counter.count, max_queries, counter.statements)
+
+    return _assert_max_queries
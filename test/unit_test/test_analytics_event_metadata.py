@@ -0,0 +1,51 @@
+import pytest
+from sqlalchemy import text
+
+from backend.database.dao.analytics_dao import AnalyticsDAO
+from backend.database.model import AnalyticsEvent, EventType
+from backend.service.analytics_ingest import build_event_row, write_event_rows
+
+
+class TestAnalyticsEventMetadata:
+    """분석 이벤트 메타데이터 컬럼 테스트 클래스"""
+
+    def test_query_events_by_metadata(self, db_session):
+        """메타데이터 값(mcp_server_id, keyword)으로 원본 이벤트를 조회하는지 테스트"""
+        # Arrange
+        write_event_rows(db_session, [
+            build_event_row(EventType.SERVER_VIEW, metadata={"mcp_server_id": 7}),
+            build_event_row(EventType.FAVORITE_ADD, metadata={"mcp_server_id": 7}),
+            build_event_row(EventType.SERVER_VIEW, metadata={"mcp_server_id": 8}),
+            build_event_row(EventType.SEARCH, metadata={"keyword": "weather", "results_count": 3}),
+        ])
+        dao = AnalyticsDAO(db_session)
+
+        # Act
+        server_events = dao.get_events_by_metadata("mcp_server_id", 7)
+        server_views = dao.get_events_by_metadata("mcp_server_id", 7, event_types=[EventType.SERVER_VIEW])
+        searches = dao.get_events_by_metadata("keyword", "weather")
+
+        # Assert
+        assert len(server_events) == 2
+        assert len(server_views) == 1
+        assert searches[0].event_metadata == {"keyword": "weather", "results_count": 3}
+        with pytest.raises(ValueError):
+            dao.get_events_by_metadata("referrer", "x")
+
+    def test_legacy_text_metadata_is_decoded(self, db_session):
+        """기존 JSON 문자열 행은 dict로, 잘못된 JSON은 빈 메타데이터로 읽는지 테스트"""
+        # Arrange
+        db_session.execute(text(
+            "INSERT INTO analytics_events (event_type, event_metadata, created_at) VALUES "
+            "('search', '{\"keyword\": \"slack\"}', CURRENT_TIMESTAMP), "
+            "('search', 'not-json', CURRENT_TIMESTAMP)"
+        ))
+        db_session.commit()
+
+        # Act
+        events = db_session.query(AnalyticsEvent).order_by(AnalyticsEvent.id).all()
+
+        # Assert
+        assert events[0].get_metadata() == {"keyword": "slack"}
+        assert events[1].event_metadata is None
+        assert events[1].get_metadata() == {}
@@ -0,0 +1,82 @@
+import pytest
+import csv
+import gzip
+import io
+from datetime import datetime, timedelta
+
+from backend.database.dao.analytics_dao import AnalyticsDAO
+from backend.database.model import EventType
+from backend.service.analytics_export import (
+    PYARROW_AVAILABLE,
+    iter_export,
+    validate_export_options
+)
+from backend.service.analytics_ingest import build_event_row, write_event_rows
+
+
+class TestAnalyticsExport:
+    """분석 이벤트 내보내기 테스트 클래스"""
+
+    def test_csv_gzip_export_streams_in_chunks(self, db_session):
+        """청크 단위 CSV 생성, gzip 압축, 기간/타입 필터 테스트"""
+        # Arrange
+        now = datetime(2026, 10, 19, 12, 0)
+        write_event_rows(db_session, [
+            build_event_row(EventType.SEARCH, user_id=1, metadata={"keyword": f"k{i}"}, created_at=now - timedelta(minutes=i))
+            for i in range(5)
+        ] + [
+            build_event_row(EventType.SERVER_VIEW, metadata={"mcp_server_id": 3}, created_at=now),
+            build_event_row(EventType.SEARCH, metadata={"keyword": "old"}, created_at=now - timedelta(days=30)),
+        ])
+
+        # Act
+        chunk_sizes = [len(rows) for rows in AnalyticsDAO(db_session).iter_event_chunks(
+            now - timedelta(days=1), now + timedelta(minutes=1), [EventType.SEARCH], chunk_size=2
+        )]
+        chunks = list(iter_export(
+            db_session, now - timedelta(days=1), now + timedelta(minutes=1),
+            format='csv', compression='gzip', event_types=[EventType.SEARCH], chunk_size=2
+        ))
+
+        # Assert
+        rows = list(csv.DictReader(io.StringIO(gzip.decompress(b''.join(chunks)).decode('utf-8'))))
+        assert chunk_sizes == [2, 2, 1]
+        assert [row["event_metadata"] for row in rows] == [
+            '{"keyword": "k4"}', '{"keyword": "k3"}', '{"keyword": "k2"}', '{"keyword": "k1"}', '{"keyword": "k0"}'
+        ]
+        assert {row["event_type"] for row in rows} == {"search"}
+        assert rows[0]["user_id"] == "1"
+
+    def test_invalid_options_rejected(self):
+        """지원하지 않는 형식/압축 조합 거부 테스트"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            validate_export_options('xlsx', 'none')
+        with pytest.raises(ValueError):
+            validate_export_options('csv', 'brotli')
+        with pytest.raises(ValueError):
+            validate_export_options('arrow', 'gzip')
+        if not PYARROW_AVAILABLE:
+            with pytest.raises(ValueError):
+                validate_export_options('parquet', 'zstd')
+
+    def test_parquet_zstd_export_round_trip(self, db_session):
+        """Parquet(zstd) 내보내기를 pyarrow로 다시 읽을 수 있는지 테스트"""
+        # Arrange
+        pq = pytest.importorskip("pyarrow.parquet")
+        now = datetime(2026, 10, 19, 12, 0)
+        write_event_rows(db_session, [
+            build_event_row(EventType.SEARCH, metadata={"keyword": f"k{i}"}, created_at=now - timedelta(minutes=i))
+            for i in range(3)
+        ])
+
+        # Act
+        chunks = list(iter_export(
+            db_session, now - timedelta(days=1), now + timedelta(minutes=1),
+            format='parquet', compression='zstd', chunk_size=2
+        ))
+
+        # Assert
+        table = pq.read_table(io.BytesIO(b''.join(chunks)))
+        assert table.num_rows == 3
+        assert table.column("event_type").to_pylist() == ["search"] * 3
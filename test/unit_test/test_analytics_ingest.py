@@ -0,0 +1,93 @@
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from backend.database.model import AnalyticsEvent, EventType
+from backend.service.analytics_ingest import AnalyticsIngestQueue, _copy_buffer, build_event_row
+from backend.service.analytics_service import AnalyticsService
+
+
+class TestAnalyticsIngest:
+    """분석 이벤트 배치 적재 큐 테스트 클래스"""
+
+    def test_batch_flush_and_overflow_policy(self, db_session):
+        """배치 적재, 큐 초과 시 오래된 이벤트 드롭 및 지표 테스트"""
+        # Arrange
+        queue = AnalyticsIngestQueue(
+            session_factory=sessionmaker(bind=db_session.get_bind()),
+            max_size=3,
+            batch_size=2,
+            overflow_policy='drop_oldest'
+        )
+        for keyword in ["a", "b", "c", "d"]:
+            queue.enqueue(build_event_row(EventType.SEARCH, metadata={"keyword": keyword}))
+
+        # Act
+        written = queue.flush()
+        stats = queue.stats()
+
+        # Assert
+        events = db_session.query(AnalyticsEvent).order_by(AnalyticsEvent.id).all()
+        assert written == 3
+        assert [event.get_metadata()["keyword"] for event in events] == ["b", "c", "d"]
+        assert stats["dropped_total"] == 1
+        assert stats["batches_total"] == 2
+        assert stats["queued"] == 0
+
+    def test_worker_flushes_on_stop(self, db_session, monkeypatch):
+        """워커 실행 중 track_event는 큐에만 넣고, 종료 시 남은 이벤트를 플러시하는지 테스트"""
+        # Arrange
+        queue = AnalyticsIngestQueue(
+            session_factory=sessionmaker(bind=db_session.get_bind()),
+            batch_size=100,
+            flush_interval=60
+        )
+        monkeypatch.setattr("backend.service.analytics_service.analytics_ingest_queue", queue)
+        queue.start()
+        analytics = AnalyticsService(db_session)
+
+        # Act
+        analytics.track_search(keyword="weather", results_count=0)
+        queued_before_stop = db_session.query(AnalyticsEvent).count()
+        queue.stop()
+
+        # Assert
+        events = db_session.query(AnalyticsEvent).all()
+        assert queued_before_stop == 0
+        assert len(events) == 1
+        assert events[0].event_type == EventType.SEARCH_NO_RESULTS
+        assert queue.stats()["running"] is False
+
+    def test_sync_fallback_uses_separate_session(self, db_session):
+        """워커가 없으면 요청 세션과 분리된 세션으로 즉시 기록하는지 테스트"""
+        # Arrange
+        analytics = AnalyticsService(db_session)
+
+        # Act
+        analytics.track_server_view(mcp_server_id=1, source="search")
+
+        # Assert
+        event = db_session.query(AnalyticsEvent).one()
+        assert event.event_type == EventType.SERVER_VIEW_FROM_SEARCH
+        assert event.get_metadata() == {"mcp_server_id": 1, "source": "search"}
+        assert not db_session.new
+
+    def test_copy_buffer_encodes_metadata_once(self):
+        """COPY 버퍼의 메타데이터가 한 번만 JSON 인코딩되고, NULL은 \\N으로 빈 문자열과 구분되는지 테스트"""
+        # Arrange
+        created_at = datetime(2026, 10, 1)
+        row = build_event_row(EventType.SEARCH, metadata={"keyword": "we\tather"}, created_at=created_at)
+        serialized = dict(row, event_metadata=json.dumps({"keyword": "weather"}))
+        anonymous = dict(row, event_metadata=None)
+        empty_referrer = dict(row, user_id=7, referrer="", event_metadata=None)
+
+        # Act
+        lines = _copy_buffer([row, serialized, anonymous, empty_referrer]).getvalue().splitlines()
+
+        # Assert
+        assert lines[0] == 'search\t\\N\t\\N\t{"keyword": "we\\\\tather"}\t2026-10-01 00:00:00'
+        assert json.loads(lines[1].split("\t")[3]) == {"keyword": "weather"}
+        assert lines[2] == "search\t\\N\t\\N\t\\N\t2026-10-01 00:00:00"
+        assert lines[3] == "search\t7\t\t\\N\t2026-10-01 00:00:00"
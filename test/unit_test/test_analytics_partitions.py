@@ -0,0 +1,73 @@
+import pytest
+from datetime import datetime
+
+from backend.database.dao.analytics_partition_dao import partition_name
+from backend.service import analytics_partitions
+from backend.service.analytics_partitions import add_months, maintain_analytics_partitions
+
+
+class _FakePartitionDAO:
+    """파티션 테이블로 전환된 PostgreSQL을 흉내 내는 DAO"""
+
+    def __init__(self, db):
+        self.partitions = {
+            "analytics_events_legacy": datetime(2025, 8, 1),
+            "analytics_events_p2025_08": datetime(2025, 9, 1),
+            "analytics_events_p2025_09": datetime(2025, 10, 1),
+            "analytics_events_p2026_10": datetime(2026, 11, 1),
+            "analytics_events_default": None,
+        }
+
+    def is_partitioned(self):
+        return True
+
+    def list_partitions(self):
+        return sorted(self.partitions.items())
+
+    def create_month_partition(self, month_start, month_end):
+        name = partition_name(month_start)
+        self.partitions.setdefault(name, month_end)
+        return name
+
+    def drop_partition(self, name):
+        del self.partitions[name]
+
+
+class TestAnalyticsPartitions:
+    """analytics_events 월별 파티션 유지 관리 테스트 클래스"""
+
+    def test_add_months_crosses_year(self):
+        """월 단위 계산이 연도 경계를 넘는지 테스트"""
+        # Arrange
+        start = datetime(2026, 11, 1)
+
+        # Act & Assert
+        assert add_months(start, 2) == datetime(2027, 1, 1)
+        assert add_months(start, -12) == datetime(2025, 11, 1)
+        assert partition_name(add_months(start, 2)) == "analytics_events_p2027_01"
+
+    def test_premake_and_retention(self, db_session, monkeypatch):
+        """미래 파티션 생성 및 보관 기간이 지난 파티션만 삭제하는지 테스트"""
+        # Arrange
+        dao = _FakePartitionDAO(db_session)
+        monkeypatch.setattr(analytics_partitions, "AnalyticsPartitionDAO", lambda db: dao)
+
+        # Act
+        result = maintain_analytics_partitions(
+            db_session, now=datetime(2026, 10, 19, 12, 0), premake_months=2, retention_months=12
+        )
+
+        # Assert
+        assert result["created"] == ["analytics_events_p2026_11", "analytics_events_p2026_12"]
+        assert sorted(result["dropped"]) == [
+            "analytics_events_legacy", "analytics_events_p2025_08", "analytics_events_p2025_09"
+        ]
+        assert "analytics_events_default" in dao.partitions
+
+    def test_not_partitioned_is_noop(self, db_session):
+        """파티션 테이블이 아니면 (SQLite) 아무 작업도 하지 않는지 테스트"""
+        # Act
+        result = maintain_analytics_partitions(db_session)
+
+        # Assert
+        assert result == {"partitioned": False, "created": [], "dropped": []}
@@ -0,0 +1,95 @@
+import pytest
+from datetime import datetime, timedelta
+
+from backend.database.dao.analytics_dao import AnalyticsDAO
+from backend.database.model import AnalyticsHourlyEvents, EventType
+from backend.service.analytics_ingest import build_event_row, write_event_rows
+from backend.service.analytics_rollup import run_rollup_once
+
+
+def _write_events(db_session, events):
+    write_event_rows(db_session, [
+        build_event_row(event_type, user_id=user_id, metadata=metadata, created_at=created_at)
+        for event_type, user_id, metadata, created_at in events
+    ])
+
+
+class TestAnalyticsRollup:
+    """분석 집계 테이블 증분 롤업 테스트 클래스"""
+
+    def test_rollup_feeds_dao_aggregates(self, db_session):
+        """롤업 후 DAO 집계 쿼리가 롤업 테이블에서 결과를 반환하는지 테스트"""
+        # Arrange
+        past = datetime.utcnow() - timedelta(hours=3)
+        _write_events(db_session, [
+            (EventType.SEARCH, 1, {"keyword": "weather", "results_count": 2}, past),
+            (EventType.SEARCH_NO_RESULTS, None, {"keyword": "weather", "results_count": 0}, past),
+            (EventType.SEARCH, None, {"keyword": "slack", "results_count": 1}, past),
+            (EventType.SERVER_VIEW_FROM_SEARCH, 1, {"mcp_server_id": 7}, past),
+            (EventType.SERVER_VIEW, 2, {"mcp_server_id": 7}, past),
+            (EventType.SERVER_VIEW_DIRECT, None, {"mcp_server_id": 9}, past),
+        ])
+        dao = AnalyticsDAO(db_session)
+
+        # Act
+        processed = run_rollup_once(db_session)
+
+        # Assert
+        assert dao.backend == 'rollup'
+        assert processed == 6
+        assert dao.get_top_search_keywords(limit=5) == [
+            {"keyword": "weather", "count": 2}, {"keyword": "slack", "count": 1}
+        ]
+        assert dao.get_most_viewed_servers(limit=5) == [
+            {"mcp_server_id": 7, "view_count": 2}, {"mcp_server_id": 9, "view_count": 1}
+        ]
+        assert dao.count_events_by_type(EventType.SEARCH) == 2
+        assert dao.get_unique_visitors_count() == {
+            "logged_in_users": 2, "anonymous_users": 0, "total_visitors": 2
+        }
+
+    def test_rollup_is_incremental_and_idempotent(self, db_session):
+        """재실행 시 중복 집계 없음, 새 이벤트만 누적, 안전 지연 이내 이벤트 보류 테스트"""
+        # Arrange
+        past = datetime.utcnow() - timedelta(hours=1)
+        _write_events(db_session, [(EventType.FAVORITE_ADD, 1, {"mcp_server_id": 1}, past)])
+        run_rollup_once(db_session)
+
+        # Act
+        rerun = run_rollup_once(db_session)
+        _write_events(db_session, [
+            (EventType.FAVORITE_ADD, 1, {"mcp_server_id": 2}, past),
+            (EventType.FAVORITE_ADD, 1, {"mcp_server_id": 3}, datetime.utcnow()),
+        ])
+        incremental = run_rollup_once(db_session)
+        later = run_rollup_once(db_session, now=datetime.utcnow() + timedelta(hours=1))
+
+        # Assert
+        rows = db_session.query(AnalyticsHourlyEvents).filter(
+            AnalyticsHourlyEvents.event_type == EventType.FAVORITE_ADD.value
+        ).all()
+        assert rerun == 0
+        assert incremental == 1
+        assert later == 1
+        assert sum(row.event_count for row in rows) == 3
+
+    def test_visitor_sketches_count_anonymous_fingerprints(self, db_session):
+        """비로그인 방문자 지문 포함 고유 방문자 스케치 및 재반영 멱등성 테스트"""
+        # Arrange
+        past = datetime.utcnow() - timedelta(hours=2)
+        events = [(EventType.SEARCH, None, {"keyword": "k", "visitor_id": f"visitor-{i % 30}"}, past)
+                  for i in range(90)]
+        events += [(EventType.SERVER_VIEW, user_id, {"mcp_server_id": 1}, past) for user_id in (1, 2, 3)]
+        _write_events(db_session, events)
+        dao = AnalyticsDAO(db_session)
+
+        # Act
+        run_rollup_once(db_session)
+        first = dao.get_unique_visitors_count()
+        # TimescaleDB 백엔드용 워터마크로 같은 이벤트를 다시 스케치에 반영해도 결과 불변
+        run_rollup_once(db_session, aggregate_tables=False)
+        second = dao.get_unique_visitors_count()
+
+        # Assert
+        assert first == {"logged_in_users": 3, "anonymous_users": 30, "total_visitors": 33}
+        assert second == first
@@ -0,0 +1,57 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event
+
+from backend.database.model import EventType
+from backend.service.analytics_ingest import build_event_row, write_event_rows
+from backend.service.analytics_rollup import run_rollup_once
+from backend.service.analytics_service import AnalyticsService
+from backend.service.analytics_summary import AnalyticsSummaryCache
+
+
+class TestAnalyticsSummary:
+    """분석 요약 엔진 테스트 클래스"""
+
+    def test_summary_uses_few_queries_and_is_cached(self, db_session):
+        """타입별 건수 단일 쿼리 집계, 전환율 재사용, 기간별 캐시 테스트"""
+        # Arrange
+        past = datetime.utcnow() - timedelta(hours=2)
+        write_event_rows(db_session, [
+            build_event_row(event_type, user_id=1, metadata=metadata, created_at=past)
+            for event_type, metadata in [
+                (EventType.SEARCH, {"keyword": "weather"}),
+                (EventType.SEARCH, {"keyword": "slack"}),
+                (EventType.SERVER_VIEW_FROM_SEARCH, {"mcp_server_id": 3}),
+                (EventType.SERVER_VIEW_DIRECT, {"mcp_server_id": 3}),
+                (EventType.SERVER_VIEW, {"mcp_server_id": 4}),
+                (EventType.FAVORITE_ADD, {"mcp_server_id": 3}),
+            ]
+        ])
+        run_rollup_once(db_session)
+        cache = AnalyticsSummaryCache(ttl_seconds=60)
+        statements = []
+        engine = db_session.get_bind()
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        # Act
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            summary = cache.get(db_session, days=7)
+            queries_cold = len(statements)
+            cached = cache.get(db_session, days=7)
+            queries_cached = len(statements) - queries_cold
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        # Assert
+        assert queries_cold <= 4
+        assert queries_cached == 0
+        assert cached == summary
+        assert summary["events"] == {
+            "searches": 2, "server_views": 3, "favorites": 1, "comments": 0, "playground_queries": 0
+        }
+        assert summary["conversion_rate"] == {"searches": 2, "views": 3, "conversion_rate": 1.5}
+        assert summary["top_servers"][0] == {"mcp_server_id": 3, "view_count": 2}
+        assert AnalyticsService(db_session).get_search_to_view_conversion_rate(7) == summary["conversion_rate"]
@@ -0,0 +1,93 @@
+import pytest
+import asyncio
+
+from sqlalchemy.pool import StaticPool
+
+from backend.database.model import Base, User, MCPServer
+from backend.database.dao.comment_dao import AsyncCommentDAO
+from backend.service.notification_service import AsyncNotificationService
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+
+async def _run_with_session(scenario):
+    """In-memory aiosqlite 데이터베이스에서 시나리오를 실행합니다."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    try:
+        async with session_factory() as db:
+            owner = User(username="owner", email="owner@example.com", password_hash="x", nickname="owner")
+            commenter = User(username="commenter", email="commenter@example.com", password_hash="x", nickname="commenter")
+            db.add_all([owner, commenter])
+            await db.flush()
+            server = MCPServer(
+                name="weather", github_link="https://github.com/a/b", description="d",
+                protocol="stdio", owner_id=owner.id
+            )
+            db.add(server)
+            await db.commit()
+            return await scenario(db, owner, commenter, server)
+    finally:
+        await engine.dispose()
+
+
+class TestAsyncDAO:
+    """비동기 DAO / 서비스 테스트 클래스"""
+
+    def test_comment_lifecycle(self):
+        """비동기 댓글 생성, 조회, 수정, 삭제 테스트"""
+        # Arrange
+        async def scenario(db, owner, commenter, server):
+            comment_dao = AsyncCommentDAO(db)
+
+            # Act
+            created = await comment_dao.create_comment(server.id, commenter.id, "great", 4.5)
+            updated_content = (await comment_dao.update_comment(created.id, "updated", commenter.id)).content
+            not_owner = await comment_dao.update_comment(created.id, "hijack", owner.id)
+            comments = await comment_dao.get_comments_by_mcp_server(server.id, limit=10)
+            deleted = await comment_dao.delete_comment(created.id, commenter.id)
+            count = await comment_dao.get_comment_count_by_mcp_server(server.id)
+            fetched = await comment_dao.get_comment_by_id(created.id)
+            return updated_content, not_owner, comments, deleted, count, fetched
+
+        updated_content, not_owner, comments, deleted, count, fetched = asyncio.run(_run_with_session(scenario))
+
+        # Assert
+        assert updated_content == "updated"
+        assert not_owner is None
+        assert [comment.user.nickname for comment in comments] == ["commenter"]
+        assert deleted is True
+        assert count == 1
+        assert fetched.is_deleted is True and fetched.content is None
+
+    def test_comment_notification_and_read_state(self):
+        """비동기 댓글 알림 생성 및 읽음 처리 테스트"""
+        # Arrange
+        async def scenario(db, owner, commenter, server):
+            service = AsyncNotificationService(db)
+
+            # Act
+            notification = await service.create_comment_notification(server.id, commenter.id)
+            self_comment = await service.create_comment_notification(server.id, owner.id)
+            unread_before = await service.get_unread_count(owner.id)
+            marked = await service.mark_all_as_read(owner.id)
+            unread_after = await service.get_unread_count(owner.id)
+            notifications = await service.get_user_notifications(owner.id)
+            deleted = await service.delete_notification(notification.id, commenter.id)
+            return notification, self_comment, unread_before, marked, unread_after, notifications, deleted
+
+        notification, self_comment, unread_before, marked, unread_after, notifications, deleted = asyncio.run(
+            _run_with_session(scenario)
+        )
+
+        # Assert
+        assert notification.message == "commenter left a comment on your MCP 'weather'."
+        assert self_comment is None
+        assert (unread_before, marked, unread_after) == (1, 1, 0)
+        assert [item.is_read for item in notifications] == [True]
+        assert deleted is False
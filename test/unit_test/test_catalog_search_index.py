@@ -0,0 +1,205 @@
+import pytest
+from backend.api.schemas import SearchResponse
+from backend.service.catalog_search_index import (
+    CatalogSearchIndex, build_catalog_search_index, check_catalog_search_index,
+    ensure_catalog_search_index_fresh, sync_catalog_search_index, tokenize
+)
+
+
+def _fields(name, description="", tags="", tool_names="", tool_descriptions=""):
+    return {
+        "name": name,
+        "description": description,
+        "tags": tags,
+        "tool_names": tool_names,
+        "tool_descriptions": tool_descriptions,
+    }
+
+
+class TestCatalogSearchIndex:
+    """인메모리 카탈로그 검색 인덱스 테스트 클래스"""
+
+    def test_tokenize_splits_snake_case(self):
+        """snake_case 도구 이름 토큰화 테스트"""
+        # Act & Assert
+        assert tokenize("get_weather Forecast-API") == ["get", "weather", "forecast", "api"]
+
+    def test_bm25_field_weights_and_prefix(self):
+        """필드 가중치, 접두사 매칭, AND 조건 테스트"""
+        # Arrange
+        index = CatalogSearchIndex()
+        index.build([
+            (1, _fields("Weather Server", "forecast data"), None, None),
+            (2, _fields("Alpha", "weather information"), None, None),
+            (3, _fields("Beta", "unrelated", tool_names="weather_lookup"), None, None),
+        ])
+
+        # Act
+        ranked = [doc_id for doc_id, _ in index.search("weather")]
+        prefixed = [doc_id for doc_id, _ in index.search("weath")]
+        both_terms = [doc_id for doc_id, _ in index.search("weather forecast")]
+
+        # Assert
+        assert ranked == [1, 2, 3]
+        assert prefixed == [1, 2, 3]
+        assert both_terms == [1]
+
+    def test_incremental_upsert_and_remove(self):
+        """증분 추가/교체/삭제 시 어휘 목록이 갱신되는지 테스트"""
+        # Arrange
+        index = CatalogSearchIndex()
+        index.build([(1, _fields("Github Tools"), None, None)])
+
+        # Act
+        index.upsert(2, _fields("Gitlab Tools"))
+        index.upsert(1, _fields("Slack Bot"))
+        after_upsert = [doc_id for doc_id, _ in index.search("git")]
+        index.remove(2)
+
+        # Assert
+        assert after_upsert == [2]
+        assert index.search("git") == []
+        assert index.stats()["terms"] == 2
+
+    def test_service_hooks_keep_index_in_sync(self, mcp_server_service, user_service, db_session, monkeypatch):
+        """승인/수정/삭제 시 인덱스가 DB와 일치하도록 갱신되는지 테스트"""
+        # Arrange
+        index = CatalogSearchIndex()
+        monkeypatch.setattr(
+            "backend.service.mcp_server_service.sync_catalog_search_index",
+            lambda db, ids: sync_catalog_search_index(db, ids, index=index)
+        )
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        build_catalog_search_index(db_session, index=index)
+        mcp_server = mcp_server_service.create_mcp_server({
+            "name": "Weather MCP",
+            "github_link": "https://github.com/test/weather",
+            "description": "forecast",
+            "tools": [{"name": "get_forecast", "parameters": [{"name": "city", "type": "string"}]}]
+        }, user.id)
+
+        # Act
+        pending_results = index.search("weather")
+        mcp_server_service.approve_mcp_server(mcp_server.id)
+        approved_results = index.search("forecast")
+        payload = index.get_payloads([mcp_server.id])
+        consistency = check_catalog_search_index(db_session, index=index)
+        mcp_server_service.delete_mcp_server(mcp_server.id)
+
+        # Assert
+        assert pending_results == []
+        assert [doc_id for doc_id, _ in approved_results] == [mcp_server.id]
+        response = SearchResponse(mcp_servers=payload, total_count=len(payload))
+        assert response.mcp_servers[0].tools[0].parameters[0].name == "city"
+        assert consistency["consistent"] is True
+        assert index.search("weather") == []
+
+    def test_consistency_check_repairs_index(self, mcp_server_service, user_service, db_session):
+        """일관성 검사가 누락된 항목을 찾아 복구하는지 테스트"""
+        # Arrange
+        index = CatalogSearchIndex()
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        mcp_server = mcp_server_service.create_mcp_server({
+            "name": "Missing Server",
+            "github_link": "https://github.com/test/missing",
+            "description": "desc"
+        }, user.id)
+        mcp_server_service.approve_mcp_server(mcp_server.id)
+        index.build([])
+
+        # Act
+        result = check_catalog_search_index(db_session, repair=True, index=index)
+
+        # Assert
+        assert result["missing"] == [mcp_server.id]
+        assert result["repaired"] is True
+        assert check_catalog_search_index(db_session, index=index)["consistent"] is True
+
+    def test_freshness_check_applies_changes_from_other_workers(self, mcp_server_service, user_service, db_session):
+        """다른 프로세스에서 거절/삭제된 서버가 카탈로그 버전 확인 후 인덱스에서 제거되는지 테스트"""
+        # Arrange
+        index = CatalogSearchIndex()
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        servers = []
+        for name in ("Weather One", "Weather Two"):
+            mcp_server = mcp_server_service.create_mcp_server({
+                "name": name,
+                "github_link": f"https://github.com/test/{name.replace(' ', '-')}",
+                "description": "forecast"
+            }, user.id)
+            mcp_server_service.approve_mcp_server(mcp_server.id)
+            servers.append(mcp_server)
+        build_catalog_search_index(db_session, index=index)
+
+        # Act: 인덱스 동기화 훅 없이 DB만 변경 (다른 워커의 쓰기)
+        unchanged = ensure_catalog_search_index_fresh(db_session, index=index, interval=0)
+        servers[0].status = 'rejected'
+        db_session.delete(servers[1])
+        db_session.commit()
+        throttled = ensure_catalog_search_index_fresh(db_session, index=index, interval=3600)
+        refreshed = ensure_catalog_search_index_fresh(db_session, index=index, interval=0)
+
+        # Assert
+        assert unchanged is False
+        assert throttled is False
+        assert refreshed is True
+        assert index.search("weather") == []
+        assert check_catalog_search_index(db_session, index=index)["consistent"] is True
+
+    def test_blank_keyword_lists_all_approved_servers(self, mcp_server_service, user_service, db_session, monkeypatch):
+        """인메모리 모드에서도 빈 검색어는 DB 경로와 같이 승인된 전체 서버를 반환하는지 테스트"""
+        # Arrange
+        from starlette.requests import Request
+        from backend.api.endpoints import mcp_servers as endpoint_module
+        from backend.api.schemas import SearchRequest
+
+        index = CatalogSearchIndex()
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        for name in ("Weather MCP", "Calendar MCP"):
+            mcp_server = mcp_server_service.create_mcp_server({
+                "name": name,
+                "github_link": f"https://github.com/test/{name.replace(' ', '-')}",
+                "description": "tools"
+            }, user.id)
+            mcp_server_service.approve_mcp_server(mcp_server.id)
+        build_catalog_search_index(db_session, index=index)
+        monkeypatch.setattr(endpoint_module, "is_memory_search_enabled", lambda: True)
+        monkeypatch.setattr(endpoint_module, "catalog_search_index", index)
+        monkeypatch.setattr(endpoint_module, "ensure_catalog_search_index_fresh", lambda db: False)
+        request = Request({"type": "http", "method": "POST", "path": "/", "headers": [], "client": ("127.0.0.1", 0)})
+
+        # Act
+        results = {
+            keyword: endpoint_module.search_mcp_servers(SearchRequest(keyword=keyword), request, db_session)
+            for keyword in ("", "   ", "weather")
+        }
+
+        # Assert
+        assert results[""].total_count == 2
+        assert results["   "].total_count == 2
+        assert [server.name for server in results["weather"].mcp_servers] == ["Weather MCP"]
+
+    def test_owner_profile_change_refreshes_snapshot(self, mcp_server_service, user_service, db_session):
+        """소유자 프로필 변경 시 인메모리 검색 결과의 소유자 정보가 갱신되고 일관성 검사가 이를 감지하는지 테스트"""
+        # Arrange
+        index = CatalogSearchIndex()
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        mcp_server = mcp_server_service.create_mcp_server({
+            "name": "Weather MCP",
+            "github_link": "https://github.com/test/weather",
+            "description": "forecast"
+        }, user.id)
+        mcp_server_service.approve_mcp_server(mcp_server.id)
+        build_catalog_search_index(db_session, index=index)
+
+        # Act: 인덱스 동기화 훅 없이 소유자 프로필만 변경
+        user_service.update_user_profile(user.id, nickname="renamed")
+        before_refresh = check_catalog_search_index(db_session, index=index)
+        refreshed = ensure_catalog_search_index_fresh(db_session, index=index, interval=0)
+        payload = index.get_payloads([mcp_server.id])[0]
+
+        # Assert
+        assert before_refresh["consistent"] is False
+        assert refreshed is True
+        assert payload["owner"]["nickname"] == "renamed"
+        assert check_catalog_search_index(db_session, index=index)["consistent"] is True
@@ -0,0 +1,71 @@
+import pytest
+from starlette.requests import Request
+from backend.api.etag import compute_etag, compute_rows_etag, if_none_match
+
+
+def _request_with_header(value):
+    headers = [(b"if-none-match", value.encode())] if value is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestETag:
+    """ETag / 조건부 GET 테스트 클래스"""
+
+    def test_if_none_match(self):
+        """If-None-Match 헤더 비교 테스트 (weak 접두사, 목록, * 처리)"""
+        # Arrange
+        etag = compute_etag("detail", 1, "2024-01-01")
+
+        # Act & Assert
+        assert if_none_match(_request_with_header(etag), etag)
+        assert if_none_match(_request_with_header(f'"other", W/{etag}'), etag)
+        assert if_none_match(_request_with_header("*"), etag)
+        assert not if_none_match(_request_with_header('"other"'), etag)
+        assert not if_none_match(_request_with_header(None), etag)
+
+    def test_version_changes_on_favorite_and_update(self, mcp_server_service, user_service):
+        """즐겨찾기 추가 및 서버 수정 시 버전(ETag)이 변경되는지 테스트"""
+        # Arrange
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        mcp_server = mcp_server_service.create_mcp_server({
+            "name": "Test MCP Server",
+            "github_link": "https://github.com/test/mcp-server",
+            "description": "Test MCP server description",
+            "tags": ["test"]
+        }, user.id)
+        mcp_server_service.approve_mcp_server(mcp_server.id)
+        initial = compute_etag("detail", *mcp_server_service.get_mcp_server_version(mcp_server.id))
+
+        # Act
+        user_service.add_favorite(user.id, mcp_server.id)
+        version = mcp_server_service.get_mcp_server_version(mcp_server.id)
+        after_favorite = compute_etag("detail", *version)
+        mcp_server_service.update_mcp_server(mcp_server.id, {"tools": [{"name": "new_tool"}]})
+        after_update = compute_etag("detail", *mcp_server_service.get_mcp_server_version(mcp_server.id))
+
+        # Assert
+        assert version.favorites_count == 1
+        assert initial != after_favorite
+        assert after_favorite != after_update
+
+    def test_list_versions_match_list_query(self, mcp_server_service, user_service):
+        """목록 버전 조회가 목록 조회와 같은 순서/개수를 반환하는지 테스트"""
+        # Arrange
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        for i in range(3):
+            created = mcp_server_service.create_mcp_server({
+                "name": f"Server {i}",
+                "github_link": f"https://github.com/test/server-{i}",
+                "description": "desc"
+            }, user.id)
+            mcp_server_service.approve_mcp_server(created.id)
+        user_service.add_favorite(user.id, created.id)
+
+        # Act
+        servers = mcp_server_service.get_mcp_servers(sort="favorites", limit=2)
+        versions = mcp_server_service.get_mcp_servers_versions(sort="favorites", limit=2)
+
+        # Assert
+        assert [s.id for s in servers] == [v.id for v in versions]
+        assert versions[0].favorites_count == 1
+        assert compute_rows_etag(("list",), versions) != compute_rows_etag(("list",), versions[:1])
@@ -0,0 +1,94 @@
+import pytest
+from backend.service.facet_index import FacetIndex, ensure_facet_index, rebuild_facet_index, sync_facet_index
+
+
+def _counts(facets, facet):
+    return {item["value"]: item["count"] for item in facets[facet]}
+
+
+class TestFacetIndex:
+    """패싯 검색 비트맵 인덱스 테스트 클래스"""
+
+    def test_disjunctive_facet_counts(self, create_approved_mcp_server, user_service, db_session):
+        """패싯 내 OR, 패싯 간 AND 및 분리 카운트 계산 테스트"""
+        # Arrange
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        a = create_approved_mcp_server(user.id, "Server A", category="dev", protocol="http", tags=["git", "api"])
+        b = create_approved_mcp_server(user.id, "Server B", category="dev", protocol="stdio", tags=["git"])
+        c = create_approved_mcp_server(user.id, "Server C", category="data", protocol="http", tags=["api"])
+        index = FacetIndex()
+        rebuild_facet_index(db_session, index=index)
+
+        # Act
+        result = index.search({"category": ["dev"], "protocol": ["http", "stdio"]})
+        narrowed = index.search({"category": ["dev"], "tags": ["api"]})
+
+        # Assert
+        assert sorted(result["ids"]) == sorted([a.id, b.id])
+        # category 카운트는 category 선택을 제외하고 계산
+        assert _counts(result["facets"], "category") == {"dev": 2, "data": 1}
+        assert _counts(result["facets"], "tags") == {"git": 2, "api": 1}
+        assert narrowed["ids"] == [a.id]
+        assert _counts(narrowed["facets"], "tags") == {"git": 2, "api": 1}
+        assert _counts(narrowed["facets"], "health_status") == {"unknown": 1}
+
+    def test_faceted_search_with_keyword_and_sync(self, mcp_server_service, create_approved_mcp_server, user_service, monkeypatch):
+        """키워드 후보 순서 유지 및 서버 변경 시 증분 갱신 테스트"""
+        # Arrange
+        index = FacetIndex()
+        monkeypatch.setattr("backend.service.mcp_server_service.ensure_facet_index", lambda db: index)
+        monkeypatch.setattr(
+            "backend.service.mcp_server_service.sync_facet_index",
+            lambda db, ids: sync_facet_index(db, ids, index=index)
+        )
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        index.build([])
+        weather = create_approved_mcp_server(user.id, "Weather", category="data", protocol="http", tags=["api"])
+        create_approved_mcp_server(user.id, "Stocks", category="data", protocol="http", tags=["api"])
+
+        # Act
+        result = mcp_server_service.faceted_search(keyword="weather", filters={"tags": ["api"]})
+        mcp_server_service.reject_mcp_server(weather.id)
+        after_reject = mcp_server_service.faceted_search(filters={"tags": ["api"]})
+
+        # Assert
+        assert [s.id for s in result["mcp_servers"]] == [weather.id]
+        assert result["total_count"] == 1
+        assert after_reject["total_count"] == 1
+        assert weather.id not in [s.id for s in after_reject["mcp_servers"]]
+
+    def test_faceted_page_excludes_unapproved_when_bitmap_lags(self, mcp_server_service, create_approved_mcp_server, user_service, db_session, monkeypatch):
+        """비트맵이 거절을 반영하지 못했어도 (다른 워커의 변경) 페이지에 미승인 서버가 없는지 테스트"""
+        # Arrange
+        index = FacetIndex()
+        monkeypatch.setattr("backend.service.mcp_server_service.ensure_facet_index", lambda db: index)
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        weather = create_approved_mcp_server(user.id, "Weather", category="data", protocol="http", tags=["api"])
+        stocks = create_approved_mcp_server(user.id, "Stocks", category="data", protocol="http", tags=["api"])
+        rebuild_facet_index(db_session, index=index)
+
+        # Act: 인덱스 동기화 없이 DB만 변경
+        monkeypatch.setattr("backend.service.mcp_server_service.sync_facet_index", lambda db, ids: None)
+        mcp_server_service.reject_mcp_server(weather.id)
+        result = mcp_server_service.faceted_search(filters={"tags": ["api"]})
+
+        # Assert
+        assert [s.id for s in result["mcp_servers"]] == [stocks.id]
+
+    def test_catalog_changes_from_other_workers(self, mcp_server_service, create_approved_mcp_server, user_service, db_session):
+        """동기화 훅 없이 (다른 워커에서) 삭제/수정된 서버가 TTL 전에 카탈로그 버전 확인으로 반영되는지 테스트"""
+        # Arrange
+        index = FacetIndex(ttl_seconds=3600)
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        weather = create_approved_mcp_server(user.id, "Weather", category="data", protocol="http", tags=["api"])
+        stocks = create_approved_mcp_server(user.id, "Stocks", category="data", protocol="http", tags=["api"])
+        ensure_facet_index(db_session, index=index)
+
+        # Act
+        mcp_server_service.delete_mcp_server(weather.id)
+        mcp_server_service.update_mcp_server(stocks.id, {"category": "finance"})
+        result = ensure_facet_index(db_session, index=index, interval=0).search({})
+
+        # Assert
+        assert result["ids"] == [stocks.id]
+        assert _counts(result["facets"], "category") == {"finance": 1}
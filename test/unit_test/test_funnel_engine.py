@@ -0,0 +1,65 @@
+import pytest
+from datetime import datetime, timedelta
+
+from backend.database.model import EventType
+from backend.service.analytics_ingest import build_event_row, write_event_rows
+from backend.service.funnel_engine import compute_funnel, funnel_levels_numpy, funnel_levels_python, NUMPY_AVAILABLE
+
+
+NOW = datetime(2026, 10, 19, 12, 0)
+
+
+class TestFunnelEngine:
+    """사용자 단위 퍼널 엔진 테스트 클래스"""
+
+    def test_ordered_conversion_within_window(self, db_session):
+        """순서, 전환 창, 비로그인 제외가 반영된 퍼널 및 코호트 테스트"""
+        # Arrange
+        base = NOW - timedelta(days=3)
+        events = [
+            # 사용자 1: 검색 → 조회 → 즐겨찾기 → 플레이그라운드
+            (EventType.SEARCH, 1, base),
+            (EventType.SERVER_VIEW_FROM_SEARCH, 1, base + timedelta(minutes=1)),
+            (EventType.FAVORITE_ADD, 1, base + timedelta(minutes=2)),
+            (EventType.PLAYGROUND_QUERY, 1, base + timedelta(minutes=3)),
+            # 사용자 2: 조회가 검색보다 먼저 → 검색 단계에서 멈춤
+            (EventType.SERVER_VIEW, 2, base),
+            (EventType.SEARCH, 2, base + timedelta(minutes=1)),
+            # 사용자 3: 첫 검색은 창 밖이지만 두 번째 검색 이후 조회 → 조회 단계까지
+            (EventType.SEARCH, 3, base - timedelta(days=2)),
+            (EventType.SEARCH_NO_RESULTS, 3, base),
+            (EventType.SERVER_VIEW_DIRECT, 3, base + timedelta(hours=2)),
+            # 비로그인 이벤트는 제외
+            (EventType.SEARCH, None, base),
+        ]
+        write_event_rows(db_session, [
+            build_event_row(event_type, user_id=user_id, created_at=created_at)
+            for event_type, user_id, created_at in events
+        ])
+
+        # Act
+        funnel = compute_funnel(db_session, days=30, window_hours=24, by_cohort=True, now=NOW)
+
+        # Assert
+        assert [(step["step"], step["users"]) for step in funnel["steps"]] == [
+            ("search", 3), ("view", 2), ("favorite", 1), ("playground", 1)
+        ]
+        assert funnel["steps"][1]["conversion_from_previous"] == round(2 / 3, 4)
+        assert [cohort["cohort"] for cohort in funnel["cohorts"]] == ["2026-10-12"]
+        assert funnel["cohorts"][0]["steps"][0]["users"] == 3
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+    def test_numpy_matches_sequential_scan(self):
+        """벡터 연산 결과가 사용자별 순차 스캔과 같은지 테스트 (동일 시각 이벤트 포함)"""
+        # Arrange
+        users = [1, 1, 1, 1, 2, 2, 2, 3, 3, 3, 3]
+        steps = [0, 1, 1, 2, 0, 1, 0, 0, 1, 2, 3]
+        times = [0, 0, 5, 30, 10, 12, 14, 0, 40, 41, 42]
+
+        # Act
+        vectorized = funnel_levels_numpy(users, steps, times, window_ms=20)
+        sequential = funnel_levels_python(users, steps, times, window_ms=20)
+
+        # Assert
+        assert vectorized == sequential
+        assert vectorized == {1: (1, 0), 2: (1, 10), 3: (0, 0)}
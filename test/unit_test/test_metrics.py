@@ -0,0 +1,101 @@
+import pytest
+import threading
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.utils.metrics import (
+    GaugeFamily, MetricsMiddleware, MetricsRegistry, SharedMetricsPublisher, http_request_duration, metrics_registry
+)
+from backend.utils.shared_state import LocalStateBackend
+
+
+class _SharedLocalBackend(LocalStateBackend):
+    """여러 워커가 공유하는 백엔드처럼 동작하는 local 구현"""
+
+    is_shared = True
+
+
+class TestMetrics:
+    """Prometheus 지표 테스트 클래스"""
+
+    def test_thread_shards_are_summed_on_render(self):
+        """여러 스레드에서 기록한 카운터/히스토그램이 합산되어 출력되는지 테스트"""
+        # Arrange
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs", ("kind",))
+        histogram = registry.histogram("job_seconds", "Job latency", buckets=(0.1, 1.0))
+        registry.register_collector(lambda: [GaugeFamily("queue_depth", "Queue depth", [({}, 3)])])
+
+        def work():
+            for _ in range(1000):
+                counter.inc("a")
+            histogram.observe(0.05)
+            histogram.observe(0.5)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.inc("b", amount=2)
+        output = registry.render()
+
+        # Assert
+        assert 'jobs_total{kind="a"} 4000' in output
+        assert 'jobs_total{kind="b"} 2' in output
+        assert 'job_seconds_bucket{le="0.1"} 4' in output
+        assert 'job_seconds_bucket{le="+Inf"} 8' in output
+        assert "job_seconds_count 8" in output
+        assert "# TYPE job_seconds histogram" in output
+        assert "queue_depth 3" in output
+
+    def test_middleware_labels_by_route_template(self):
+        """경로 파라미터 대신 라우트 템플릿으로 응답 시간이 기록되는지 테스트"""
+        # Arrange
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/items/{item_id}")
+        def get_item(item_id: int):
+            return {"id": item_id}
+
+        client = TestClient(app)
+
+        # Act
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/missing")
+        samples = {
+            (labels["route"], labels["status"]): value
+            for name, labels, value in http_request_duration.collect()
+            if name == "http_request_duration_seconds_count"
+        }
+
+        # Assert
+        assert samples[("/items/{item_id}", "200")] >= 2
+        assert samples[("unmatched", "404")] >= 1
+        assert "http_request_duration_seconds_bucket" in metrics_registry.render()
+
+    def test_shared_scrape_includes_other_workers(self):
+        """공유 백엔드에서는 어느 워커가 스크레이프를 받아도 모든 워커의 지표가 worker 레이블로 출력되는지 테스트"""
+        # Arrange
+        state = _SharedLocalBackend()
+        this_worker = MetricsRegistry()
+        other_worker = MetricsRegistry()
+        this_worker.counter("jobs_total", "Jobs").inc(amount=3)
+        other_worker.counter("jobs_total", "Jobs").inc(amount=5)
+        state.cache_set(SharedMetricsPublisher.KEY_PREFIX + "other", other_worker.collect(), 60)
+        publisher = SharedMetricsPublisher(this_worker, state=state)
+
+        # Act
+        output = publisher.render()
+        local_output = SharedMetricsPublisher(this_worker, state=LocalStateBackend()).render()
+
+        # Assert
+        assert output.count("# TYPE jobs_total counter") == 1
+        assert 'jobs_total{worker="other"} 5' in output
+        assert sum(1 for line in output.splitlines() if line.startswith("jobs_total{worker=")) == 2
+        assert "jobs_total 3" in local_output
@@ -0,0 +1,78 @@
+import pytest
+import threading
+
+from backend.database.dao import user_dao as user_dao_module
+from backend.utils.password_hashing import PasswordHasher, PasswordHasherBusy, build_crypt_context
+
+
+class TestPasswordHashing:
+    """비밀번호 해시 작업 풀 테스트 클래스"""
+
+    def test_full_queue_rejects_immediately(self):
+        """작업자와 대기열이 가득 차면 즉시 거부하는지 테스트"""
+        # Arrange
+        hasher = PasswordHasher(context=build_crypt_context(bcrypt_rounds=4), workers=1, queue_limit=0)
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_work():
+            started.set()
+            release.wait(5)
+            return "done"
+
+        worker = threading.Thread(target=hasher._run, args=(blocking_work,))
+        worker.start()
+        started.wait(5)
+
+        # Act & Assert
+        try:
+            with pytest.raises(PasswordHasherBusy):
+                hasher.hash("password123")
+            assert hasher.stats()["rejected_total"] == 1
+        finally:
+            release.set()
+            worker.join()
+            hasher.shutdown()
+
+        assert hasher.stats()["in_flight"] == 0
+
+    def test_slow_job_times_out_as_busy(self):
+        """제한 시간 안에 끝나지 않은 작업이 500 대신 PasswordHasherBusy(503)로 변환되는지 테스트"""
+        # Arrange
+        hasher = PasswordHasher(context=build_crypt_context(bcrypt_rounds=4), workers=1, queue_limit=0,
+                                timeout_seconds=0.05)
+        release = threading.Event()
+
+        # Act & Assert
+        try:
+            with pytest.raises(PasswordHasherBusy):
+                hasher._run(release.wait, 5)
+            assert hasher.stats()["timeouts_total"] == 1
+        finally:
+            release.set()
+            hasher.shutdown()
+
+    def test_login_upgrades_outdated_hash(self, db_session, user_dao, monkeypatch):
+        """로그인 시 이전 설정의 해시와 평문 비밀번호가 새 해시로 교체되는지 테스트"""
+        # Arrange
+        old_hasher = PasswordHasher(context=build_crypt_context(bcrypt_rounds=4))
+        new_hasher = PasswordHasher(context=build_crypt_context(bcrypt_rounds=5))
+        monkeypatch.setattr(user_dao_module, "password_hasher", old_hasher)
+        user = user_dao.create_user("hashuser", "hash@example.com", "password123", nickname="hash")
+        legacy = user_dao.create_user("legacyuser", "legacy@example.com", "password123", nickname="legacy")
+        legacy.password_hash = "plain-secret"
+        db_session.commit()
+        monkeypatch.setattr(user_dao_module, "password_hasher", new_hasher)
+
+        # Act
+        wrong = user_dao.verify_and_upgrade_password(user, "wrong-password")
+        valid = user_dao.verify_and_upgrade_password(user, "password123")
+        legacy_valid = user_dao.verify_and_upgrade_password(legacy, "plain-secret")
+
+        # Assert
+        assert wrong is False
+        assert valid is True
+        assert user.password_hash.startswith("$2b$05$")
+        assert legacy_valid is True
+        assert legacy.password_hash.startswith("$2b$05$")
+        assert user_dao.verify_password("plain-secret", legacy.password_hash)
@@ -0,0 +1,111 @@
+import pytest
+import json
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+import backend.utils.profiling as profiling_module
+from backend.utils.profiling import ProfileStore, ProfilingMiddleware, RequestProfile
+from backend.utils.shared_state import LocalStateBackend
+
+
+class _SharedLocalBackend(LocalStateBackend):
+    """여러 워커가 공유하는 백엔드처럼 동작하는 local 구현"""
+
+    is_shared = True
+
+
+@pytest.fixture
+def profiled_app():
+    """SQL을 실행하는 동기 엔드포인트를 가진 프로파일링 대상 앱"""
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    store = ProfileStore(max_profiles=2)
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, enabled=True, routes=("/slow",), stack_sampling=True, store=store)
+
+    @app.get("/slow/{item_id}")
+    def slow(item_id: int):
+        with engine.connect() as conn:
+            for _ in range(3):
+                conn.execute(text("SELECT 1"))
+        time.sleep(0.05)
+        return {"id": item_id}
+
+    @app.get("/fast")
+    def fast():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return {}
+
+    yield TestClient(app), store
+    engine.dispose()
+
+
+class TestProfiling:
+    """요청 단위 프로파일링 테스트 클래스"""
+
+    def test_profiled_route_reports_sql_and_stacks(self, profiled_app):
+        """선택된 라우트는 SQL 수/시간 헤더와 스택 샘플을 남기는지 테스트"""
+        # Arrange
+        client, store = profiled_app
+
+        # Act
+        response = client.get("/slow/1")
+        profile = store.get(response.headers["x-profile-id"])
+        speedscope = profile.speedscope()
+
+        # Assert
+        assert 'db;dur=' in response.headers["server-timing"]
+        assert 'desc="3 queries"' in response.headers["server-timing"]
+        assert profile.route == "/slow/{item_id}"
+        assert profile.sql_count == 3
+        assert profile.total_seconds >= 0.05
+        assert profile.summary()["stack_samples"] > 0
+        assert any(" (test_profiling.py:" in line and "slow" in line for line in profile.collapsed().splitlines())
+        assert speedscope["profiles"][0]["type"] == "sampled"
+        assert len(speedscope["profiles"][0]["samples"]) == len(speedscope["profiles"][0]["weights"])
+        json.dumps(speedscope)
+
+    def test_unselected_requests_are_not_profiled(self, profiled_app):
+        """선택되지 않은 요청은 헤더 없이 통과하고, X-Profile 헤더로 개별 요청을 선택할 수 있는지 테스트"""
+        # Arrange
+        client, store = profiled_app
+
+        # Act
+        plain = client.get("/fast")
+        forced = client.get("/fast", headers={"X-Profile": "1"})
+        for item_id in range(3):
+            client.get(f"/slow/{item_id}")
+
+        # Assert
+        assert "server-timing" not in plain.headers
+        assert 'desc="1 queries"' in forced.headers["server-timing"]
+        assert len(store.list()) == 2
+
+    def test_shared_store_serves_other_workers_profiles(self, monkeypatch):
+        """공유 백엔드에서는 다른 워커가 기록한 프로파일도 목록과 다운로드에 나타나는지 테스트"""
+        # Arrange
+        state = _SharedLocalBackend()
+        other_worker = ProfileStore(state=state)
+        this_worker = ProfileStore(state=state)
+        monkeypatch.setattr(profiling_module, "process_token", lambda: "worker-a")
+        other_profile = RequestProfile("GET", "/slow/1")
+        other_profile.finish(200)
+        other_worker.add(other_profile)
+        monkeypatch.setattr(profiling_module, "process_token", lambda: "worker-b")
+        own_profile = RequestProfile("GET", "/slow/2")
+        own_profile.finish(200)
+        this_worker.add(own_profile)
+
+        # Act
+        listed = this_worker.list()
+        fetched = this_worker.get(other_profile.id)
+
+        # Assert
+        assert other_profile.id != own_profile.id
+        assert [summary["id"] for summary in listed] == [own_profile.id, other_profile.id]
+        assert fetched is not None and fetched.path == "/slow/1"
+        assert ProfileStore(state=LocalStateBackend()).get(other_profile.id) is None
@@ -0,0 +1,103 @@
+import pytest
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.schemas import MCPServerResponse
+from backend.utils.query_budget import QueryBudgetExceeded, QueryBudgetMiddleware, count_queries, query_budget
+
+
+def _server_data(name, tags):
+    return {
+        "name": name,
+        "github_link": f"https://github.com/test/{name}",
+        "description": "budget test server",
+        "tags": tags
+    }
+
+
+class TestQueryBudget:
+    """쿼리 수 예산 테스트 클래스"""
+
+    def test_tag_lookup_is_batched(self, mcp_server_service, user_dao, assert_max_queries):
+        """서버 생성/수정 시 태그 조회가 태그 수와 무관하게 한 번만 실행되는지 테스트"""
+        # Arrange
+        owner = user_dao.create_user("owner", "owner@example.com", "password123", nickname="owner")
+        tags = [f"tag-{index}" for index in range(6)]
+
+        # Act
+        with assert_max_queries(30) as created:
+            mcp_server = mcp_server_service.create_mcp_server(_server_data("batched", tags), owner.id)
+        with assert_max_queries(30) as updated:
+            mcp_server_service.update_mcp_server(mcp_server.id, {"tags": ["tag-0", "new-tag", "tag-0"]})
+
+        def tag_lookups(counter):
+            return [s for s in counter.statements if s.startswith("SELECT tags.") and "mcp_server_tags" not in s]
+
+        # Assert
+        assert len(tag_lookups(created)) == 1
+        assert len(tag_lookups(updated)) == 1
+        assert sorted(tag.name for tag in mcp_server.tags) == ["new-tag", "tag-0"]
+
+    def test_favorites_listing_is_constant(self, db_session, user_dao, mcp_server_service, user_service, assert_max_queries):
+        """즐겨찾기 목록 직렬화 쿼리 수가 즐겨찾기 개수와 무관한지 테스트"""
+        # Arrange
+        owner = user_dao.create_user("owner", "owner@example.com", "password123", nickname="owner")
+        for index in range(4):
+            mcp_server = mcp_server_service.create_mcp_server(_server_data(f"fav-{index}", [f"tag-{index}"]), owner.id)
+            user_dao.add_favorite(owner.id, mcp_server.id)
+
+        def list_favorites():
+            db_session.expire_all()
+            return [MCPServerResponse.model_validate(server) for server in user_service.get_user_favorites(owner.id)]
+
+        # Act
+        with count_queries() as four:
+            four_favorites = list_favorites()
+        extra = mcp_server_service.create_mcp_server(_server_data("fav-4", ["tag-4"]), owner.id)
+        user_dao.add_favorite(owner.id, extra.id)
+        with assert_max_queries(four.count):
+            five_favorites = list_favorites()
+
+        # Assert
+        assert len(four_favorites) == 4
+        assert len(five_favorites) == 5
+        with pytest.raises(QueryBudgetExceeded):
+            with assert_max_queries(four.count - 1):
+                list_favorites()
+
+    def test_decorator_raises_in_strict_mode(self, user_dao):
+        """strict 모드에서 예산을 넘긴 함수 호출이 QueryBudgetExceeded를 발생시키는지 테스트"""
+        # Arrange
+        @query_budget(1, strict=True)
+        def two_queries():
+            user_dao.get_user_by_username("nobody")
+            user_dao.get_user_by_email("nobody@example.com")
+
+        # Act / Assert
+        with pytest.raises(QueryBudgetExceeded) as exc_info:
+            two_queries()
+        assert exc_info.value.count == 2
+        assert two_queries.__query_budget__ == 1
+
+    def test_middleware_warns_over_budget(self, user_dao, caplog):
+        """개발 모드 미들웨어가 예산을 넘긴 요청에 경고 로그를 남기는지 테스트"""
+        # Arrange
+        app = FastAPI()
+        app.add_middleware(QueryBudgetMiddleware, enabled=True, default_budget=2)
+
+        @app.get("/users/{username}")
+        def get_user(username: str):
+            for _ in range(3):
+                user_dao.get_user_by_username(username)
+            return {}
+
+        client = TestClient(app)
+
+        # Act
+        with caplog.at_level(logging.WARNING, logger="backend.utils.query_budget"):
+            client.get("/users/alice")
+
+        # Assert
+        assert "GET /users/{username} issued 3 queries" in caplog.text
@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.database.database import RequestSession, optional_write, release_connection, run_after_commit
+from backend.database.dao.user_dao import UserDAO
+from backend.database.model import Base, User
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    """세션 간 커밋 가시성을 확인하기 위한 파일 SQLite 엔진"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'request_session.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+class TestRequestSession:
+    """요청 단위 세션 테스트 클래스"""
+
+    def test_single_commit_per_request(self, file_engine):
+        """DAO의 중간 커밋은 미뤄지고 요청 종료 시 한 번만 커밋되는지 테스트"""
+        # Arrange
+        RequestSessionLocal = sessionmaker(class_=RequestSession, bind=file_engine, autoflush=False, expire_on_commit=False)
+        commits = []
+        event.listen(file_engine, "commit", lambda conn: commits.append(1))
+        db = RequestSessionLocal()
+        synced = []
+
+        # Act
+        user_dao = UserDAO(db)
+        user = user_dao.create_user("uow", "uow@example.com", "password123", nickname="uow")
+        user_dao.update_user(user.id, nickname="renamed")
+        run_after_commit(db, lambda: synced.append(user.nickname))
+
+        with sessionmaker(bind=file_engine)() as other:
+            visible_before = other.query(User).count()
+
+        commits_before = len(commits)
+        db.commit_request()
+        db.close()
+
+        with sessionmaker(bind=file_engine)() as other:
+            stored = other.query(User).one()
+
+        # Assert
+        assert visible_before == 0
+        assert commits_before == 0
+        assert len(commits) == 1
+        assert stored.nickname == "renamed"
+        assert synced == ["renamed"]
+
+    def test_release_returns_connection_and_rollback_discards(self, file_engine):
+        """release()는 커밋 후 커넥션을 반환하고, 이후 롤백은 release 이후 변경만 취소하는지 테스트"""
+        # Arrange
+        RequestSessionLocal = sessionmaker(class_=RequestSession, bind=file_engine, autoflush=False, expire_on_commit=False)
+        db = RequestSessionLocal()
+        user_dao = UserDAO(db)
+        user_dao.create_user("kept", "kept@example.com", "password123", nickname="kept")
+
+        # Act
+        release_connection(db)
+        checked_out = file_engine.pool.checkedout()
+        user_dao.create_user("dropped", "dropped@example.com", "password123", nickname="dropped")
+        db.rollback()
+        db.close()
+
+        with sessionmaker(bind=file_engine)() as other:
+            usernames = [user.username for user in other.query(User).all()]
+
+        # Assert
+        assert checked_out == 0
+        assert usernames == ["kept"]
+
+    def test_failed_optional_write_keeps_main_write(self, file_engine):
+        """부가 쓰기가 실패해도 SAVEPOINT만 롤백되고 메인 쓰기는 요청 종료 시 커밋되는지 테스트"""
+        # Arrange
+        RequestSessionLocal = sessionmaker(class_=RequestSession, bind=file_engine, autoflush=False, expire_on_commit=False)
+        db = RequestSessionLocal()
+        user_dao = UserDAO(db)
+        user_dao.create_user("main", "main@example.com", "password123", nickname="main")
+
+        # Act: 같은 username으로 생성해 flush 시 무결성 오류 발생
+        with optional_write(db, "Duplicate user"):
+            user_dao.create_user("main", "other@example.com", "password123", nickname="other")
+        with optional_write(db, "Second user"):
+            user_dao.create_user("side", "side@example.com", "password123", nickname="side")
+        db.commit_request()
+        db.close()
+
+        with sessionmaker(bind=file_engine)() as other:
+            usernames = sorted(user.username for user in other.query(User).all())
+
+        # Assert
+        assert usernames == ["main", "side"]
@@ -0,0 +1,82 @@
+import pytest
+from backend.database.model import MCPServerSearchIndex
+from backend.database.dao.mcp_server_search_dao import MCPServerSearchDAO, tokenize_query
+
+
+class TestSearch:
+    """MCP 서버 전문 검색 테스트 클래스"""
+
+    def test_tokenize_query(self):
+        """검색어 토큰화 테스트"""
+        # Act & Assert
+        assert tokenize_query("GitHub  api-tools") == ["github", "api", "tools"]
+        assert tokenize_query("  ") == []
+        assert tokenize_query(None) == []
+
+    def test_search_ranked_by_field_weight(self, mcp_server_service, create_approved_mcp_server, user_service):
+        """이름 > 태그 > 설명 > 도구 이름 순으로 정렬되는지 테스트"""
+        # Arrange
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        by_tool = create_approved_mcp_server(user.id, "Alpha", "alpha server",
+                                             tools=[{"name": "weather_lookup"}])
+        by_description = create_approved_mcp_server(user.id, "Beta", "weather data provider")
+        by_tag = create_approved_mcp_server(user.id, "Gamma", "gamma server", tags=["weather"])
+        by_name = create_approved_mcp_server(user.id, "Weather MCP", "forecast server")
+
+        # Act
+        results = mcp_server_service.search_mcp_servers("weather")
+
+        # Assert
+        assert [s.id for s in results] == [by_name.id, by_tag.id, by_description.id, by_tool.id]
+
+    def test_search_requires_all_terms(self, mcp_server_service, create_approved_mcp_server, user_service):
+        """여러 검색어는 모두 일치해야 하는지(AND) 테스트"""
+        # Arrange
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        both = create_approved_mcp_server(user.id, "GitHub Issues", "issue tracker", tags=["git"])
+        create_approved_mcp_server(user.id, "GitHub Stars", "star counter")
+
+        # Act
+        results = mcp_server_service.search_mcp_servers("github issue")
+
+        # Assert
+        assert [s.id for s in results] == [both.id]
+
+    def test_search_index_follows_update_and_delete(self, mcp_server_service, create_approved_mcp_server, user_service, db_session):
+        """수정/삭제 시 검색 인덱스가 갱신되는지 테스트"""
+        # Arrange
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        mcp_server = create_approved_mcp_server(user.id, "Old Name", "description")
+
+        # Act
+        mcp_server_service.update_mcp_server(mcp_server.id, {"name": "Renamed Server", "tags": ["newtag"]})
+        renamed = mcp_server_service.search_mcp_servers("renamed")
+        by_new_tag = mcp_server_service.search_mcp_servers("newtag")
+        old = mcp_server_service.search_mcp_servers("old")
+        mcp_server_service.delete_mcp_server(mcp_server.id)
+
+        # Assert
+        assert [s.id for s in renamed] == [mcp_server.id]
+        assert [s.id for s in by_new_tag] == [mcp_server.id]
+        assert old == []
+        assert db_session.query(MCPServerSearchIndex).count() == 0
+
+    def test_rebuild_index(self, create_approved_mcp_server, user_service, db_session):
+        """검색 인덱스 재구성(백필) 테스트"""
+        # Arrange
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        create_approved_mcp_server(user.id, "Server One", "first")
+        create_approved_mcp_server(user.id, "Server Two", "second")
+        db_session.query(MCPServerSearchIndex).delete()
+        db_session.commit()
+        search_dao = MCPServerSearchDAO(db_session)
+
+        # Act
+        stale = search_dao.is_index_stale()
+        indexed = search_dao.rebuild_index()
+
+        # Assert
+        assert stale is True
+        assert indexed == 2
+        assert search_dao.is_index_stale() is False
+        assert len(search_dao.search_ids("server")) == 2
@@ -0,0 +1,110 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.service.semantic_search import (
+    SemanticSearchIndex, LsiEmbedder, semantic_tokens, ensure_semantic_index, sync_semantic_index
+)
+
+
+class TestSemanticSearch:
+    """로컬 임베딩 시맨틱 검색 테스트 클래스"""
+
+    def test_semantic_tokens_split_identifiers(self):
+        """snake_case/camelCase 분리 및 불용어 제거 테스트"""
+        # Act & Assert
+        assert semantic_tokens("list_events") == ["list", "events"]
+        assert semantic_tokens("readMyCalendar") == ["read", "calendar"]
+
+    def test_tool_description_match_and_incremental_sync(self, mcp_server_service, create_approved_mcp_server, user_service, db_session, tmp_path):
+        """도구 설명 기반 매칭, mmap 저장/로딩, 도구 변경 증분 반영 테스트"""
+        # Arrange
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        calendar = create_approved_mcp_server(user.id, "Workspace", "Productivity integrations", tools=[
+            {"name": "list_events", "description": "Read calendar events for a date range"},
+        ])
+        weather = create_approved_mcp_server(user.id, "Forecaster", "Weather data", tools=[
+            {"name": "get_forecast", "description": "Weather forecast for a city"},
+        ])
+        index = ensure_semantic_index(db_session, index=SemanticSearchIndex(str(tmp_path), LsiEmbedder))
+
+        # Act
+        results = index.search("read my calendar")
+        reloaded = SemanticSearchIndex(str(tmp_path), LsiEmbedder)
+        loaded = reloaded.load()
+        mcp_server_service.mcp_server_dao.add_tools_to_mcp_server(weather.id, [
+            {"name": "calendar_sync", "description": "Read calendar events and sync"},
+        ])
+        sync_semantic_index(db_session, [weather.id], index=index)
+        after_sync = index.search("calendar events", limit=5)
+
+        # Assert
+        assert results[0]["mcp_server_id"] == calendar.id
+        assert results[0]["matched_tools"] == ["list_events"]
+        assert loaded and reloaded.search("read my calendar")[0]["mcp_server_id"] == calendar.id
+        assert isinstance(reloaded.store.base, np.memmap)
+        assert "calendar_sync" in next(r for r in after_sync if r["mcp_server_id"] == weather.id)["matched_tools"]
+
+    def test_load_reconciles_with_db_and_filters_unapproved(self, mcp_server_service, create_approved_mcp_server, user_service, db_session, tmp_path):
+        """저장 이후 거절/삭제된 서버가 다시 연 인덱스와 검색 결과에서 제외되는지 테스트"""
+        # Arrange
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        rejected = create_approved_mcp_server(user.id, "Calendar One", "Calendar events", tools=[
+            {"name": "list_events", "description": "Read calendar events"},
+        ])
+        deleted = create_approved_mcp_server(user.id, "Calendar Two", "Calendar sync")
+        kept = create_approved_mcp_server(user.id, "Calendar Three", "Calendar agenda")
+        ensure_semantic_index(db_session, index=SemanticSearchIndex(str(tmp_path), LsiEmbedder))
+
+        # Act: 디스크 인덱스를 모르는 상태에서 DB만 변경 (다른 워커의 쓰기)
+        mcp_server_service.reject_mcp_server(rejected.id)
+        mcp_server_service.delete_mcp_server(deleted.id)
+        reloaded = ensure_semantic_index(db_session, index=SemanticSearchIndex(str(tmp_path), LsiEmbedder))
+        hit_ids = {hit["mcp_server_id"] for hit in reloaded.search("calendar events", limit=10)}
+        loaded = mcp_server_service.mcp_server_dao.get_mcp_servers_by_ids(
+            [rejected.id, kept.id], status='approved'
+        )
+
+        # Assert
+        assert hit_ids == {kept.id}
+        assert set(reloaded.server_versions) == {kept.id}
+        assert [mcp_server.id for mcp_server in loaded] == [kept.id]
+
+    def test_rebuild_publishes_new_generation_atomically(self, create_approved_mcp_server, user_service, db_session, tmp_path):
+        """재구축이 새 세대 디렉터리에 쓰고 CURRENT만 교체하여 기존 로더가 영향받지 않는지 테스트"""
+        # Arrange
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        calendar = create_approved_mcp_server(user.id, "Workspace", "Calendar events")
+        writer = ensure_semantic_index(db_session, index=SemanticSearchIndex(str(tmp_path), LsiEmbedder))
+        reader = SemanticSearchIndex(str(tmp_path), LsiEmbedder)
+        reader.load()
+        first_generation = (tmp_path / "CURRENT").read_text()
+
+        # Act
+        weather = create_approved_mcp_server(user.id, "Forecaster", "Weather forecast")
+        writer.build([calendar, weather])
+        second_generation = (tmp_path / "CURRENT").read_text()
+        fresh = SemanticSearchIndex(str(tmp_path), LsiEmbedder)
+        fresh.load()
+
+        # Assert
+        assert second_generation != first_generation
+        assert not (tmp_path / "vectors.npy").exists()
+        assert (tmp_path / first_generation / "vectors.npy").exists()
+        assert reader.search("calendar")[0]["mcp_server_id"] == calendar.id
+        assert fresh.search("weather forecast")[0]["mcp_server_id"] == weather.id
+
+    def test_ready_index_follows_catalog_version(self, mcp_server_service, create_approved_mcp_server, user_service, db_session, tmp_path):
+        """이미 준비된 인덱스가 다른 워커의 거절을 카탈로그 버전 확인 후 반영하는지 테스트"""
+        # Arrange
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        rejected = create_approved_mcp_server(user.id, "Calendar One", "Calendar events")
+        kept = create_approved_mcp_server(user.id, "Calendar Two", "Calendar agenda")
+        index = ensure_semantic_index(db_session, index=SemanticSearchIndex(str(tmp_path), LsiEmbedder))
+
+        # Act
+        mcp_server_service.reject_mcp_server(rejected.id)
+        ensure_semantic_index(db_session, index=index, interval=0)
+
+        # Assert
+        assert {hit["mcp_server_id"] for hit in index.search("calendar", limit=10)} == {kept.id}
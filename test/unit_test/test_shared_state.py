@@ -0,0 +1,97 @@
+import pytest
+import asyncio
+import time
+
+from backend.api.endpoints.playground import _PlaygroundSlots
+from backend.utils.shared_state import LocalStateBackend, create_shared_state
+
+
+class _SharedLocalBackend(LocalStateBackend):
+    """여러 워커가 공유하는 백엔드처럼 동작하는 local 구현 (슬롯 대기 경로 검증용)"""
+
+    is_shared = True
+
+
+class TestSharedState:
+    """프로세스 공유 상태 백엔드 테스트 클래스"""
+
+    def test_slots_limit_renew_and_expire(self):
+        """슬롯 수 제한, 같은 토큰의 임대 갱신, 만료된 임대 회수가 동작하는지 테스트"""
+        # Arrange
+        state = LocalStateBackend()
+
+        # Act
+        first = state.acquire_slot("leader", "worker-1", 1, 60)
+        renewed = state.acquire_slot("leader", "worker-1", 1, 60)
+        blocked = state.acquire_slot("leader", "worker-2", 1, 60)
+        state.release_slot("leader", "worker-1")
+        after_release = state.acquire_slot("leader", "worker-2", 1, 0.01)
+        time.sleep(0.02)
+        after_expiry = state.acquire_slot("leader", "worker-3", 1, 60)
+
+        # Assert
+        assert (first, renewed, blocked) == (True, True, False)
+        assert after_release is True
+        assert after_expiry is True
+        assert state.slot_count("leader") == 1
+
+    def test_cache_ttl_and_fallback(self):
+        """캐시 값이 TTL 이후 사라지고, 알 수 없는 백엔드 설정은 local로 대체되는지 테스트"""
+        # Arrange
+        state = LocalStateBackend()
+
+        # Act
+        state.cache_set("summary", {"events": 3}, 0.01)
+        cached = state.cache_get("summary")
+        time.sleep(0.02)
+        expired = state.cache_get("summary")
+        fallback = create_shared_state("memcached")
+
+        # Assert
+        assert cached == {"events": 3}
+        assert expired is None
+        assert isinstance(fallback, LocalStateBackend)
+        assert fallback.rate_limit_storage_uri() == "memory://"
+
+    def test_playground_slots_enforce_shared_limit(self, monkeypatch):
+        """공유 백엔드에서는 워커별 세마포어와 별개로 전체 동시 실행 수가 제한되는지 테스트"""
+        # Arrange
+        import backend.api.endpoints.playground as playground_module
+        monkeypatch.setattr(playground_module, "PLAYGROUND_SLOT_POLL_SECONDS", 0.01)
+        state = _SharedLocalBackend()
+        worker_a = _PlaygroundSlots(2, state)
+        worker_b = _PlaygroundSlots(2, state)
+        peak = []
+
+        async def chat(slots):
+            async with slots.slot():
+                peak.append(state.slot_count("playground"))
+                await asyncio.sleep(0.02)
+
+        async def run():
+            await asyncio.gather(*(chat(worker_a) for _ in range(3)), *(chat(worker_b) for _ in range(3)))
+
+        # Act
+        asyncio.run(run())
+
+        # Assert
+        assert len(peak) == 6
+        assert max(peak) == 2
+        assert state.slot_count("playground") == 0
+        assert worker_a.active == worker_a.waiting == 0
+
+    def test_redis_client_uses_fail_fast_timeouts(self):
+        """Redis 클라이언트와 rate limit 스토리지가 짧은 소켓 타임아웃으로 생성되는지 테스트"""
+        # Arrange
+        pytest.importorskip("redis")
+        from backend.utils.shared_state import RedisStateBackend
+
+        # Act
+        state = RedisStateBackend("redis://localhost:6379/0", socket_timeout=0.2, connect_timeout=0.1)
+        connection_kwargs = state._client.connection_pool.connection_kwargs
+
+        # Assert
+        assert connection_kwargs["socket_timeout"] == 0.2
+        assert connection_kwargs["socket_connect_timeout"] == 0.1
+        assert state.rate_limit_storage_options() == {"socket_timeout": 0.2, "socket_connect_timeout": 0.1}
+        assert LocalStateBackend().rate_limit_storage_options() == {}
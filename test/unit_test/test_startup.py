@@ -0,0 +1,99 @@
+import pytest
+import os
+import subprocess
+import sys
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import init_db
+from backend.database.model import SchemaVersion, Tag
+from backend.utils.lazy_import import lazy_attribute, lazy_module, import_timings
+
+
+@pytest.fixture(scope="function")
+def file_database(tmp_path, monkeypatch):
+    """init_database가 임시 SQLite 파일을 사용하도록 전역 database를 교체합니다."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'boot.db'}", connect_args={"check_same_thread": False})
+    monkeypatch.setattr(init_db.database, "engine", engine)
+    monkeypatch.setattr(init_db.database, "SessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=engine))
+    try:
+        yield init_db.database
+    finally:
+        engine.dispose()
+
+
+class TestStartup:
+    """콜드 스타트 최적화(지연 import, FAST_BOOT) 테스트 클래스"""
+
+    def test_lazy_proxy_defers_import(self):
+        """지연 프록시가 첫 사용 시점에만 모듈을 import 하고 소요 시간을 기록하는지 테스트"""
+        # Arrange
+        module = lazy_module("colorsys")
+        attribute = lazy_attribute("colorsys", "rgb_to_hsv")
+        missing = lazy_attribute("colorsys", "does_not_exist")
+
+        # Act
+        before = "not loaded" in repr(module)
+        hsv = attribute(1.0, 0.0, 0.0)
+        hls = module.rgb_to_hls(1.0, 0.0, 0.0)
+
+        # Assert
+        assert before is True
+        assert hsv == (0.0, 1.0, 1.0)
+        assert hls[0] == 0.0
+        assert "colorsys" in import_timings()
+        assert missing.available() is False
+
+    def test_fast_boot_skips_when_fingerprint_matches(self, file_database, capsys):
+        """전체 초기화 후 지문이 기록되고, 다음 FAST_BOOT 부팅은 초기화를 건너뛰는지 테스트"""
+        # Act
+        first = init_db.init_database(fast_boot=True)
+        second = init_db.init_database(fast_boot=True)
+        without_fast_boot = init_db.init_database(fast_boot=False)
+
+        # Assert
+        assert (first, second, without_fast_boot) == (True, False, True)
+        assert "FAST_BOOT" in capsys.readouterr().out
+        db = file_database.SessionLocal()
+        try:
+            stored = db.get(SchemaVersion, init_db.SCHEMA_VERSION_NAME)
+            assert stored.fingerprint == init_db.schema_fingerprint()
+            assert db.query(Tag).count() == len(init_db.DEFAULT_TAGS)
+        finally:
+            db.close()
+
+    def test_fast_boot_reruns_when_fingerprint_changes(self, file_database, monkeypatch):
+        """시드 데이터(지문)가 바뀌면 FAST_BOOT여도 전체 초기화를 다시 실행하는지 테스트"""
+        # Arrange
+        init_db.init_database(fast_boot=True)
+        monkeypatch.setattr(init_db, "DEFAULT_TAGS", init_db.DEFAULT_TAGS + ["Search"])
+
+        # Act
+        rerun = init_db.init_database(fast_boot=True)
+
+        # Assert
+        assert rerun is True
+        db = file_database.SessionLocal()
+        try:
+            assert db.query(Tag).filter(Tag.name == "Search").count() == 1
+        finally:
+            db.close()
+
+    def test_app_import_does_not_load_heavy_sdks(self):
+        """앱 모듈 import 시 openai / mcp / bs4 SDK와 numpy / pyarrow / zstandard가 로드되지 않는지 테스트"""
+        # Arrange
+        script = (
+            "import sys, backend.main; "
+            "print(','.join(m for m in ('openai', 'mcp', 'bs4', 'numpy', 'pyarrow', 'zstandard') if m in sys.modules))"
+        )
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, timeout=120,
+            cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        )
+
+        # Assert
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().splitlines()[-1:] in ([], [""])
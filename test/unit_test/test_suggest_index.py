@@ -0,0 +1,136 @@
+import pytest
+import threading
+import time
+
+import backend.service.suggest_index as suggest_module
+from backend.service.suggest_index import (
+    SuggestIndex, prefix_keys, get_suggestions, sync_suggest_index
+)
+
+
+class TestSuggestIndex:
+    """검색어 자동완성 인덱스 테스트 클래스"""
+
+    def test_prefix_keys_word_starts(self):
+        """단어 시작 위치별 키 생성 테스트"""
+        # Act & Assert
+        assert prefix_keys("weather mcp") == ["weather mcp", "mcp"]
+        assert prefix_keys("get_forecast") == ["get_forecast", "forecast"]
+
+    def test_suggest_weighted_by_popularity(self, mcp_server_service, user_service, db_session):
+        """즐겨찾기/태그/검색어 가중치 순 정렬 및 중간 단어 매칭 테스트"""
+        # Arrange
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        popular = mcp_server_service.create_mcp_server({
+            "name": "Weather Pro",
+            "github_link": "https://github.com/test/weather-pro",
+            "description": "desc",
+            "tags": ["weather"],
+            "tools": [{"name": "get_weather"}]
+        }, user.id)
+        plain = mcp_server_service.create_mcp_server({
+            "name": "Weather Lite",
+            "github_link": "https://github.com/test/weather-lite",
+            "description": "desc",
+            "tools": [{"name": "get_weather"}]
+        }, user.id)
+        mcp_server_service.approve_mcp_server(popular.id)
+        mcp_server_service.approve_mcp_server(plain.id)
+        user_service.add_favorite(user.id, popular.id)
+        index = SuggestIndex()
+
+        # Act
+        results = get_suggestions(db_session, "wea", limit=10, index=index)
+        by_inner_word = index.suggest("lite")
+
+        # Assert
+        servers = [r for r in results if r["kind"] == "server"]
+        assert servers[0]["mcp_server_id"] == popular.id
+        assert [r["kind"] for r in results].count("tool") == 1
+        assert any(r["kind"] == "tag" and r["text"] == "weather" for r in results)
+        assert by_inner_word[0]["mcp_server_id"] == plain.id
+
+    def test_incremental_sync(self, mcp_server_service, user_service, db_session):
+        """서버 승인/삭제 시 증분 갱신 및 캐시 무효화 테스트"""
+        # Arrange
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        index = SuggestIndex()
+        get_suggestions(db_session, "x", index=index)
+        mcp_server = mcp_server_service.create_mcp_server({
+            "name": "Slack Bridge",
+            "github_link": "https://github.com/test/slack",
+            "description": "desc"
+        }, user.id)
+
+        # Act
+        before = index.suggest("sla")
+        mcp_server_service.approve_mcp_server(mcp_server.id)
+        sync_suggest_index(db_session, [mcp_server.id], index=index)
+        after_approve = index.suggest("sla")
+        mcp_server_service.delete_mcp_server(mcp_server.id)
+        sync_suggest_index(db_session, [mcp_server.id], index=index)
+
+        # Assert
+        assert before == []
+        assert after_approve[0]["text"] == "Slack Bridge"
+        assert index.suggest("sla") == []
+
+    def test_catalog_changes_from_other_workers(self, mcp_server_service, user_service, db_session):
+        """동기화 훅 없이 (다른 워커에서) 거절된 서버가 카탈로그 버전 확인 후 후보에서 빠지는지 테스트"""
+        # Arrange
+        index = SuggestIndex()
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        mcp_server = mcp_server_service.create_mcp_server({
+            "name": "Weather Pro",
+            "github_link": "https://github.com/test/weather-pro",
+            "description": "desc"
+        }, user.id)
+        mcp_server_service.approve_mcp_server(mcp_server.id)
+        before = get_suggestions(db_session, "weather", index=index)
+
+        # Act
+        mcp_server_service.reject_mcp_server(mcp_server.id)
+        throttled = get_suggestions(db_session, "weather", index=index, interval=3600)
+        after = get_suggestions(db_session, "weather", index=index, interval=0)
+
+        # Assert
+        assert [s["text"] for s in before if s["kind"] == "server"] == ["Weather Pro"]
+        assert [s["text"] for s in throttled if s["kind"] == "server"] == ["Weather Pro"]
+        assert [s for s in after if s["kind"] == "server"] == []
+
+    def test_stale_index_is_served_while_one_rebuild_runs(self, mcp_server_service, user_service, db_session, monkeypatch):
+        """TTL이 지난 인덱스는 그대로 응답하고, 재구축은 백그라운드에서 한 번만 실행되는지 테스트"""
+        # Arrange
+        index = SuggestIndex()
+        user = user_service.create_user("testuser", "test@example.com", "password")
+        mcp_server = mcp_server_service.create_mcp_server({
+            "name": "Weather Pro",
+            "github_link": "https://github.com/test/weather-pro",
+            "description": "desc"
+        }, user.id)
+        mcp_server_service.approve_mcp_server(mcp_server.id)
+        get_suggestions(db_session, "weather", index=index)
+        index.built_at = time.monotonic() - index.ttl_seconds - 1
+
+        release = threading.Event()
+        rebuilds = []
+
+        def slow_rebuild(db, index):
+            rebuilds.append(threading.current_thread().name)
+            release.wait(5)
+            index.built_at = time.monotonic()
+            return 0
+
+        monkeypatch.setattr(suggest_module, "rebuild_suggest_index", slow_rebuild)
+
+        # Act
+        served = [get_suggestions(db_session, "weather", index=index) for _ in range(3)]
+        release.set()
+        finished = index.rebuild_lock.acquire(timeout=5)
+        index.rebuild_lock.release()
+
+        # Assert
+        assert finished is True
+        assert rebuilds == ["suggest-index-rebuild"]
+        assert all([s["text"] for s in result if s["kind"] == "server"] == ["Weather Pro"] for result in served)
+        assert index.is_stale() is False
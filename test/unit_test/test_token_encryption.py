@@ -0,0 +1,67 @@
+import pytest
+
+from backend.database.dao.mcp_auth_token_dao import MCPAuthTokenDAO
+from backend.utils import token_encryption
+from backend.utils.token_encryption import TokenEncryption, token_key_manager
+
+
+@pytest.fixture(autouse=True)
+def reset_key_manager(monkeypatch):
+    """각 테스트마다 키 캐시 초기화"""
+    monkeypatch.setenv("TOKEN_ENCRYPTION_SECRET", "secret-v1")
+    monkeypatch.delenv("TOKEN_ENCRYPTION_PREVIOUS_SECRETS", raising=False)
+    token_key_manager.clear()
+    yield
+    token_key_manager.clear()
+
+
+class TestTokenEncryption:
+    """토큰 암호화 키 관리 테스트 클래스"""
+
+    def test_key_derived_once_per_secret(self, monkeypatch):
+        """여러 번 암복호화해도 PBKDF2 파생은 한 번만 수행되는지 테스트"""
+        # Arrange
+        calls = []
+        original_pbkdf2 = token_encryption.PBKDF2HMAC
+
+        def counting_pbkdf2(*args, **kwargs):
+            calls.append(1)
+            return original_pbkdf2(*args, **kwargs)
+
+        monkeypatch.setattr(token_encryption, "PBKDF2HMAC", counting_pbkdf2)
+
+        # Act
+        for i in range(5):
+            assert TokenEncryption.decrypt_token(TokenEncryption.encrypt_token(f"token-{i}")) == f"token-{i}"
+
+        # Assert
+        assert len(calls) == 1
+
+    def test_rotation_keeps_old_tokens_readable(self, monkeypatch):
+        """시크릿 교체 후 이전 토큰 복호화 및 재암호화 테스트"""
+        # Arrange
+        old_encrypted = TokenEncryption.encrypt_token("ghp_abcd1234")
+        monkeypatch.setenv("TOKEN_ENCRYPTION_SECRET", "secret-v2")
+        monkeypatch.setenv("TOKEN_ENCRYPTION_PREVIOUS_SECRETS", "secret-v1")
+
+        # Act
+        rotated = TokenEncryption.rotate_token(old_encrypted)
+        monkeypatch.delenv("TOKEN_ENCRYPTION_PREVIOUS_SECRETS")
+
+        # Assert
+        assert TokenEncryption.decrypt_token(rotated) == "ghp_abcd1234"
+        assert TokenEncryption.decrypt_tokens([old_encrypted]) == [None]
+
+    def test_batch_decrypt_user_tokens(self, db_session):
+        """사용자 토큰 일괄 복호화 테스트"""
+        # Arrange
+        dao = MCPAuthTokenDAO(db_session)
+        dao.save_token(1, 10, "token-value")
+        dao.save_token(1, 11, "other-value")
+
+        # Act
+        tokens = dao.get_user_tokens_decrypted(1)
+
+        # Assert
+        assert tokens == {10: "token-value", 11: "other-value"}
+        assert TokenEncryption.decrypt_tokens(["not-a-token"]) == [None]
@@ -0,0 +1,65 @@
+import pytest
+from datetime import datetime, timedelta
+
+from backend.database.model import EventType
+from backend.service.analytics_ingest import build_event_row, write_event_rows
+from backend.service.analytics_rollup import run_rollup_once
+from backend.service.trending_engine import compute_trending, get_trending, refresh_trending_rankings
+
+
+NOW = datetime(2025, 3, 20, 12, 0, 0)
+
+
+def _write_views(db_session, views):
+    write_event_rows(db_session, [
+        build_event_row(EventType.SERVER_VIEW, metadata={"mcp_server_id": mcp_server_id}, created_at=created_at)
+        for mcp_server_id, count, created_at in views
+        for _ in range(count)
+    ])
+
+
+class TestTrendingEngine:
+    """급상승 서버 순위 엔진 테스트 클래스"""
+
+    def test_growth_outside_top_viewed_is_ranked(self, db_session):
+        """조회수 상위 100개 밖의 급상승 서버도 순위에 포함되고 사전 계산 순위가 조회되는지 테스트"""
+        # Arrange
+        recent = NOW - timedelta(days=1)
+        previous = NOW - timedelta(days=10)
+        views = []
+        for mcp_server_id in range(1, 121):
+            views.append((mcp_server_id, 5, recent))
+            views.append((mcp_server_id, 5, previous))
+        views.append((999, 4, recent))
+        _write_views(db_session, views)
+        run_rollup_once(db_session, now=NOW)
+
+        # Act
+        refreshed = refresh_trending_rankings(db_session, now=NOW)
+        trending = get_trending(db_session, limit=3)
+
+        # Assert
+        assert refreshed == {"7:7": 100}
+        assert trending[0]["mcp_server_id"] == 999
+        assert trending[0]["recent_views"] == 4
+        assert trending[0]["previous_views"] == 0
+        assert trending[0]["growth_rate"] == 4.0
+        assert [item["mcp_server_id"] for item in trending[1:]] == [1, 2]
+
+    def test_recent_views_weigh_more(self, db_session):
+        """같은 조회수라도 최근 조회가 더 높은 점수를 받는지 테스트"""
+        # Arrange
+        _write_views(db_session, [
+            (1, 10, NOW - timedelta(days=6)),
+            (2, 10, NOW - timedelta(hours=1)),
+            (3, 3, NOW - timedelta(days=20)),
+        ])
+        run_rollup_once(db_session, now=NOW)
+
+        # Act
+        trending = compute_trending(db_session, days=7, comparison_days=7, now=NOW)
+
+        # Assert
+        assert [item["mcp_server_id"] for item in trending] == [2, 1]
+        assert trending[0]["growth_rate"] == trending[1]["growth_rate"]
+        assert trending[0]["score"] > trending[1]["score"]
@@ -0,0 +1,129 @@
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import event
+
+from backend.api.auth import create_access_token, get_current_user
+from backend.service.user_principal_cache import UserPrincipalCache, user_principal_cache
+from backend.utils.shared_state import LocalStateBackend
+
+
+@pytest.fixture(autouse=True)
+def clear_principal_cache():
+    """각 테스트마다 인증 사용자 캐시 초기화"""
+    user_principal_cache.clear()
+    yield
+    user_principal_cache.clear()
+
+
+def _credentials(user_id: int) -> HTTPAuthorizationCredentials:
+    token = create_access_token(data={"sub": str(user_id)})
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class TestUserPrincipalCache:
+    """인증 사용자 캐시 테스트 클래스"""
+
+    def test_cached_auth_skips_user_query(self, db_session, user_service):
+        """두 번째 인증부터 사용자 조회 없이 캐시를 사용하는지 테스트"""
+        # Arrange
+        user = user_service.create_user("cacheuser", "cache@example.com", "password123")
+        credentials = _credentials(user.id)
+        get_current_user(credentials, db_session)
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", count)
+
+        # Act
+        try:
+            principal = get_current_user(credentials, db_session)
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+        # Assert
+        assert statements == []
+        assert principal.id == user.id
+        assert principal.username == "cacheuser"
+
+    def test_role_change_invalidates_cache(self, db_session, user_service):
+        """권한 변경 시 캐시가 무효화되는지 테스트"""
+        # Arrange
+        user = user_service.create_user("roleuser", "role@example.com", "password123")
+        credentials = _credentials(user.id)
+        assert get_current_user(credentials, db_session).is_admin == "user"
+
+        # Act
+        user_service.update_user_profile(user.id, is_admin="admin")
+        principal = get_current_user(credentials, db_session)
+
+        # Assert
+        assert principal.is_admin == "admin"
+
+    def test_size_bound_evicts_oldest(self, db_session, user_dao):
+        """최대 크기를 넘으면 가장 오래된 항목이 제거되는지 테스트"""
+        # Arrange
+        users = [
+            user_dao.create_user(f"user{i}", f"user{i}@example.com", "password123", nickname=f"nick{i}")
+            for i in range(3)
+        ]
+        original_size = user_principal_cache.max_size
+        user_principal_cache.max_size = 2
+
+        # Act
+        try:
+            for user in users:
+                get_current_user(_credentials(user.id), db_session)
+            stats = user_principal_cache.stats()
+        finally:
+            user_principal_cache.max_size = original_size
+
+        # Assert
+        assert stats["size"] == 2
+
+    def test_role_change_invalidates_other_workers(self, db_session, user_service, monkeypatch):
+        """권한 변경 커밋이 shared_state를 통해 다른 워커의 캐시도 무효화하는지 테스트"""
+        # Arrange: 두 워커가 같은 공유 백엔드를 사용
+        state = LocalStateBackend()
+        state.is_shared = True
+        monkeypatch.setattr(user_principal_cache, "state", state)
+        other_worker = UserPrincipalCache(state=state)
+        user = user_service.create_user("adminuser", "admin@example.com", "password123")
+        user_service.update_user_profile(user.id, is_admin="admin")
+        loader = user_service.get_user_by_id
+        assert other_worker.get(user.id, loader).is_admin == "admin"
+
+        # Act
+        user_service.update_user_profile(user.id, is_admin="user")
+        principal = other_worker.get(user.id, loader)
+
+        # Assert
+        assert principal.is_admin == "user"
+        assert other_worker.stats()["misses"] == 2
+
+    def test_shared_state_errors_degrade_to_database(self, db_session, user_service, monkeypatch):
+        """공유 백엔드 오류 시 인증은 DB 조회로 동작하고, 커밋된 변경은 무효화 전파 실패와 무관하게 성공하는지 테스트"""
+        # Arrange
+        class _BrokenSharedBackend(LocalStateBackend):
+            is_shared = True
+
+            def cache_get(self, key):
+                raise ConnectionError("redis unavailable")
+
+            def cache_set(self, key, value, ttl_seconds):
+                raise ConnectionError("redis unavailable")
+
+        monkeypatch.setattr(user_principal_cache, "state", _BrokenSharedBackend())
+        user = user_service.create_user("testuser", "test@example.com", "password123")
+
+        # Act
+        first = get_current_user(_credentials(user.id), db_session)
+        user_service.update_user_profile(user.id, nickname="renamed")
+        second = get_current_user(_credentials(user.id), db_session)
+
+        # Assert
+        assert first.id == user.id
+        assert second.nickname == "renamed"
+        assert user_principal_cache.stats()["size"] == 0